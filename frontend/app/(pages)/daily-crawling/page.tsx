@@ -18,7 +18,7 @@ export default function DailyCrawlingPage() {
   // Options state
   const [mode, setMode] = useState<'parallel' | 'sequential'>('parallel');
   const [concurrency, setConcurrency] = useState<string>('3');
-  const [forceRecrawl, setForceRecrawl] = useState(true);
+  const [forceRecrawl, setForceRecrawl] = useState(false);
   const [updateMenuLinks, setUpdateMenuLinks] = useState(true);
   const [limit, setLimit] = useState<string>('');
   const [urlIds, setUrlIds] = useState<string>('');
@@ -313,8 +313,9 @@ export default function DailyCrawlingPage() {
                 onChange={(e) => setForceRecrawl(e.target.checked)}
                 disabled={isRunning}
               />
-              <span className="checkbox-text">이미 성공한 URL도 재크롤링</span>
+              <span className="checkbox-text">재방문 주기와 관계없이 전체 재크롤링</span>
             </label>
+            <span className="option-hint">선택하지 않으면 재방문 시각이 된 URL만 크롤링합니다 (처음/실패한 URL은 항상 포함)</span>
           </div>
 
           <div className="option-group checkbox-group">
@@ -1,12 +1,15 @@
 """ARI HTML Processing Service"""
+import asyncio
+import copy
 import logging
-import tempfile
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, AsyncIterator, Set
 import re
 try:
-    from markdownify import markdownify as md_convert
+    from markdownify import MarkdownConverter
 except Exception:  # 런타임 환경에 따라 미설치 가능
-    md_convert = None  # graceful fallback
+    MarkdownConverter = None  # graceful fallback
 
 try:
     import pymupdf4llm
@@ -21,10 +24,49 @@ import os
 import json
 from datetime import datetime
 from bs4 import BeautifulSoup
+from app.config import settings
 from app.infrastructure.mcp.mcp_service import mcp_service
 
 logger = logging.getLogger(__name__)
 
+# 제거할 요소들 (header, footer, sidebar, nav 등 + Confluence 특화)
+# 단, 페이지 제목과 브레드크럼은 유지
+ELEMENTS_TO_REMOVE = [
+    'header', 'footer', 'nav', 'aside', 'sidebar',
+    '.header', '.footer', '.nav', '.aside', '.sidebar',
+    '.navigation', '.menu',
+    
+    # Confluence 특화 UI 요소들 (제목/브레드크럼 제외)
+    'div.aui-page-header-actions',     # 페이지 액션 버튼들
+    'div.page-actions',               # 페이지 액션들
+    'div.aui-toolbar2',               # 툴바
+    'div.comment-container',          # 댓글 컨테이너
+    'div.like-button-container',      # 좋아요 버튼
+    'div.page-labels',                # 페이지 라벨
+    'div.comment-actions',            # 댓글 액션
+    'span.st-table-filter',           # 스마트 테이블 필터
+    'svg',                            # SVG 아이콘들
+    'div.confluence-information-macro', # 정보 매크로
+    'div.aui-message',                # 메시지
+    'div.page-metadata-modification-info', # 수정 정보
+    '.aui-page-header-actions',       # 페이지 헤더 액션
+    '.like-button-container',         # 좋아요 버튼 (클래스)
+    '.page-labels',                   # 페이지 라벨 (클래스)
+    
+    # 메타데이터 배너는 제거하되 제목/브레드크럼은 유지
+    'div#page-metadata-banner',       # 메타데이터 배너
+    'ul.banner',                      # 배너 리스트
+]
+
+# 셀렉터를 하나로 합쳐 트리를 한 번만 순회
+ELEMENTS_TO_REMOVE_SELECTOR = ', '.join(ELEMENTS_TO_REMOVE)
+
+
+def _process_html_file_worker(file_path: str, json_path: str) -> Dict[str, Any]:
+    """프로세스 풀 워커 (pickle 가능하도록 모듈 수준 함수로 정의, HTML 본문 대신 파일 경로만 전달)"""
+    return ari_service.process_html_file(file_path, json_path)
+
+
 class AriService:
     """ARI HTML 파일 처리 서비스"""
     
@@ -33,6 +75,98 @@ class AriService:
         self.output_dir = "/tmp/ari_json"
         os.makedirs(self.temp_dir, exist_ok=True)
         os.makedirs(self.output_dir, exist_ok=True)
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """다중 파일 처리용 프로세스 풀 (지연 생성)"""
+        if self._process_pool is None:
+            max_workers = settings.ari_process_workers or None
+            self._process_pool = ProcessPoolExecutor(max_workers=max_workers)
+            logger.info(f"ARI 프로세스 풀 생성: max_workers={self._process_pool._max_workers}")
+        return self._process_pool
+    
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+    
+    def _new_upload_info(self, filename: str) -> Dict[str, Any]:
+        """업로드 파일의 고유 ID와 임시 HTML/JSON 저장 경로 생성"""
+        # 고유한 파일명 생성 (경로 구분자가 포함된 파일명은 이름만 사용)
+        file_id = str(uuid.uuid4())
+        safe_name = os.path.basename(filename or 'unknown.html')
+        return {
+            'original_filename': filename,
+            'file_id': file_id,
+            'file_path': os.path.join(self.temp_dir, f"{file_id}_{safe_name}"),
+            'json_path': os.path.join(self.output_dir, f"{file_id}.json"),
+            'size': 0
+        }
+    
+    async def _iter_upload_chunks(self, file: UploadFile) -> AsyncIterator[bytes]:
+        """UploadFile을 청크 단위로 읽기 (전체 내용을 메모리에 올리지 않음)"""
+        while True:
+            chunk = await file.read(settings.ari_upload_chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    
+    async def _spool_to_disk(self, chunks: AsyncIterator[bytes], file_path: str) -> int:
+        """청크 스트림을 임시 파일로 저장하고 저장된 바이트 수 반환"""
+        size = 0
+        with open(file_path, 'wb') as f:
+            async for chunk in chunks:
+                f.write(chunk)
+                size += len(chunk)
+        return size
+    
+    async def save_upload(self, file: UploadFile) -> Dict[str, Any]:
+        """multipart 업로드 파일을 청크 단위로 임시 디렉토리에 저장"""
+        info = self._new_upload_info(file.filename)
+        info['size'] = await self._spool_to_disk(self._iter_upload_chunks(file), info['file_path'])
+        return info
+    
+    async def save_upload_stream(self, filename: str, chunks: AsyncIterator[bytes]) -> Dict[str, Any]:
+        """요청 본문(raw bytes) 스트림을 그대로 임시 디렉토리에 저장"""
+        info = self._new_upload_info(filename)
+        info['size'] = await self._spool_to_disk(chunks, info['file_path'])
+        return info
+    
+    async def process_saved_file(self, info: Dict[str, Any], use_pool: bool = True) -> Dict[str, Any]:
+        """
+        임시 저장된 HTML 파일 한 건을 완전 처리 (본문 추출 + 마크다운 + 구조화 JSON)
+        
+        Args:
+            info: save_upload/save_upload_stream 결과
+            use_pool: 프로세스 풀 사용 여부 (False면 현재 프로세스에서 처리)
+            
+        Returns:
+            업로드 정보 + processed_data/contents/markdown
+        """
+        if use_pool:
+            loop = asyncio.get_running_loop()
+            try:
+                document = await loop.run_in_executor(
+                    self._get_process_pool(), _process_html_file_worker, info['file_path'], info['json_path']
+                )
+            except BrokenProcessPool as e:
+                # 워커 비정상 종료 시 풀을 재생성하도록 초기화하고 현재 프로세스에서 처리
+                logger.error(f"ARI 프로세스 풀 오류, 현재 프로세스에서 처리: {e}")
+                self.shutdown()
+                document = self.process_html_file(info['file_path'], info['json_path'])
+        else:
+            document = self.process_html_file(info['file_path'], info['json_path'])
+        
+        logger.info(f"HTML 파일 완전 처리 완료: {info['original_filename']} ({info['size']} bytes)")
+        
+        return {
+            **info,
+            'processed_data': document['processed_data'],
+            'contents': document['contents'],
+            'markdown': document['markdown'],
+            'upload_time': datetime.now().isoformat()
+        }
     
     async def process_html_files(self, files: List[UploadFile]) -> Dict[str, Any]:
         """
@@ -57,36 +191,24 @@ class AriService:
                     logger.warning(f"HTML이 아닌 파일 무시: {file.filename}")
                     continue
                 
-                # 고유한 파일명 생성
-                file_id = str(uuid.uuid4())
-                file_path = os.path.join(self.temp_dir, f"{file_id}_{file.filename}")
-                json_path = os.path.join(self.output_dir, f"{file_id}.json")
-                
-                # 파일 저장
-                content = await file.read()
-                total_size += len(content)
-                
-                with open(file_path, 'wb') as f:
-                    f.write(content)
+                # 파일 저장 (청크 단위 스트리밍)
+                info = await self.save_upload(file)
+                total_size += info['size']
                 
                 # HTML에서 header, footer, sidebar 제외하여 JSON으로 변환
-                processed_data = await self._extract_main_content(content.decode('utf-8', errors='ignore'))
+                processed_data = await self._extract_main_content(self._read_html_file(info['file_path']))
                 
                 # JSON 파일로 저장
-                with open(json_path, 'w', encoding='utf-8') as f:
+                with open(info['json_path'], 'w', encoding='utf-8') as f:
                     json.dump(processed_data, f, ensure_ascii=False, indent=2)
                 
                 processed_files.append({
-                    'original_filename': file.filename,
-                    'file_id': file_id,
-                    'file_path': file_path,
-                    'json_path': json_path,
-                    'size': len(content),
+                    **info,
                     'processed_data': processed_data,
                     'upload_time': datetime.now().isoformat()
                 })
                 
-                logger.info(f"HTML 파일 처리 완료: {file.filename} ({len(content)} bytes)")
+                logger.info(f"HTML 파일 처리 완료: {file.filename} ({info['size']} bytes)")
             
             return {
                 'success': True,
@@ -118,83 +240,44 @@ class AriService:
             if not files:
                 raise ValueError("업로드된 파일이 없습니다")
             
-            processed_files = []
-            total_size = 0
-            
+            uploaded_files = []
             for file in files:
                 if not file.filename.endswith('.html'):
                     logger.warning(f"HTML이 아닌 파일 무시: {file.filename}")
                     continue
                 
-                # 고유한 파일명 생성
-                file_id = str(uuid.uuid4())
-                file_path = os.path.join(self.temp_dir, f"{file_id}_{file.filename}")
-                json_path = os.path.join(self.output_dir, f"{file_id}.json")
-                
-                # 파일 저장
-                content = await file.read()
-                total_size += len(content)
-                
-                with open(file_path, 'wb') as f:
-                    f.write(content)
-                
-                # HTML 콘텐츠 디코딩
-                html_content = content.decode('utf-8', errors='ignore')
-                
-                # 1단계: 기본 메타데이터 추출 (개선된 버전)
-                basic_data = await self._extract_main_content(html_content)
-                
-                # 2단계: 마크다운 변환 (개선된 버전 사용)
-                markdown_content = self.extract_markdown(html_content)
-                
-                # 3단계: 마크다운을 구조화된 JSON으로 변환
-                json_result = self.ari_markdown_to_json(markdown_content)
-                contents = json_result.get('contents', []) if json_result.get('success') else []
-                
-                # 폴백: 마크다운을 텍스트 단락으로 반환
-                if not contents:
-                    contents = [{"id": 1, "type": "text", "title": "", "data": markdown_content}]
-                
-                # 새로운 구조로 통합된 데이터 구성
-                processed_data = {
-                    'title': basic_data.get('title', ''),
-                    'breadcrumbs': basic_data.get('breadcrumbs', []),
-                    'content': {
-                        'text': basic_data['content']['text'],
-                        'markdown': markdown_content,
-                        'contents': contents
-                    },
-                    'metadata': {
-                        **basic_data.get('metadata', {}),
-                        'markdown_length': len(markdown_content),
-                        'contents_count': len(contents)
-                    }
-                }
-                
-                # JSON 파일로 저장
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(processed_data, f, ensure_ascii=False, indent=2)
-                
-                processed_files.append({
-                    'original_filename': file.filename,
-                    'file_id': file_id,
-                    'file_path': file_path,
-                    'json_path': json_path,
-                    'size': len(content),
-                    'processed_data': processed_data,
-                    'contents': contents,
-                    'markdown': markdown_content,
-                    'upload_time': datetime.now().isoformat()
-                })
-                
-                logger.info(f"HTML 파일 완전 처리 완료: {file.filename} ({len(content)} bytes)")
+                # 파일 저장 (청크 단위 스트리밍)
+                uploaded_files.append(await self.save_upload(file))
+            
+            # 본문 추출 + 마크다운 + 구조화 JSON (파일별 1회 파싱, 다중 파일은 프로세스 풀에서 병렬 처리)
+            # 파일 하나의 처리 실패가 나머지 파일 결과를 버리지 않도록 파일별로 오류를 수집
+            use_pool = len(uploaded_files) > 1
+            outcomes = await asyncio.gather(*[
+                self.process_saved_file(info, use_pool=use_pool) for info in uploaded_files
+            ], return_exceptions=True)
+            
+            processed_files = []
+            failed_files = []
+            for info, outcome in zip(uploaded_files, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"HTML 파일 처리 실패 {info['original_filename']}: {outcome}")
+                    failed_files.append({'original_filename': info['original_filename'], 'success': False, 'error': str(outcome)})
+                else:
+                    processed_files.append(outcome)
+            if uploaded_files and not processed_files:
+                raise ValueError(f"모든 HTML 파일 처리에 실패했습니다: {failed_files[0]['error']}")
+            total_size = sum(info['size'] for info in processed_files)
             
+            message = f"{len(processed_files)}개의 HTML 파일이 성공적으로 완전 처리되었습니다"
+            if failed_files:
+                message += f" ({len(failed_files)}개 파일 처리 실패)"
             return {
                 'success': True,
                 'processed_files': processed_files,
+                'failed_files': failed_files,
                 'total_files': len(processed_files),
                 'total_size': total_size,
-                'message': f"{len(processed_files)}개의 HTML 파일이 성공적으로 완전 처리되었습니다"
+                'message': message
             }
             
         except Exception as e:
@@ -205,6 +288,112 @@ class AriService:
                 'message': f"HTML 파일 완전 처리 중 오류가 발생했습니다: {str(e)}"
             }
     
+    async def iter_html_files_complete(self, files: List[UploadFile]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        업로드 파일을 하나씩 디스크로 저장하면서 곧바로 처리를 시작하고, 완료되는 순서대로 결과를 반환
+        
+        파일별 처리 실패는 전체를 중단하지 않고 {'original_filename', 'success': False, 'error'}로 반환
+        """
+        pending: Set[asyncio.Task] = set()
+        
+        async def process(info: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return {**await self.process_saved_file(info), 'success': True}
+            except Exception as e:
+                logger.error(f"HTML 파일 처리 실패 {info['original_filename']}: {e}")
+                return {'original_filename': info['original_filename'], 'success': False, 'error': str(e)}
+        
+        try:
+            for file in files:
+                if not file.filename.endswith('.html'):
+                    logger.warning(f"HTML이 아닌 파일 무시: {file.filename}")
+                    continue
+                
+                pending.add(asyncio.create_task(process(await self.save_upload(file))))
+                
+                # 다음 파일을 저장하기 전에 이미 끝난 결과부터 내보냄
+                for task in [t for t in pending if t.done()]:
+                    pending.discard(task)
+                    yield task.result()
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # 클라이언트 연결 종료 등으로 스트림이 중단되면 남은 작업 취소
+            for task in pending:
+                task.cancel()
+    
+    def _read_html_file(self, file_path: str) -> str:
+        """임시 저장된 HTML 파일을 UTF-8로 디코딩하여 읽기"""
+        with open(file_path, 'rb') as f:
+            return f.read().decode('utf-8', errors='ignore')
+    
+    def process_html_file(self, file_path: str, json_path: str) -> Dict[str, Any]:
+        """임시 저장된 HTML 파일을 처리하고 processed_data를 JSON 파일로 저장"""
+        document = self.process_html_document(self._read_html_file(file_path))
+        
+        # JSON 파일로 저장
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(document['processed_data'], f, ensure_ascii=False, indent=2)
+        
+        return document
+    
+    def process_html_document(self, html_content: str) -> Dict[str, Any]:
+        """
+        HTML 한 건을 한 번만 파싱하여 본문 메타데이터, 마크다운, 구조화된 JSON을 생성
+        
+        Args:
+            html_content: 원본 HTML 내용
+            
+        Returns:
+            {'processed_data', 'contents', 'markdown'}
+        """
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # 1단계: 기본 메타데이터 추출 (exclude 요소도 함께 제거됨)
+        try:
+            basic_data = self._extract_document_info(soup)
+        except Exception as e:
+            logger.error(f"HTML 콘텐츠 추출 중 오류: {e}")
+            basic_data = self._build_error_content(e)
+            soup = BeautifulSoup(html_content, 'html.parser')
+            self._remove_excluded_elements(soup)
+        
+        # 2단계: 같은 DOM에서 마크다운 변환
+        markdown_content = self._clean_fragment_to_markdown(self._build_clean_fragment(soup))
+        
+        # 3단계: 마크다운을 구조화된 JSON으로 변환
+        json_result = self.ari_markdown_to_json(markdown_content)
+        contents = json_result.get('contents', []) if json_result.get('success') else []
+        
+        # 폴백: 마크다운을 텍스트 단락으로 반환
+        if not contents:
+            contents = [{"id": 1, "type": "text", "title": "", "data": markdown_content}]
+        
+        # 새로운 구조로 통합된 데이터 구성
+        processed_data = {
+            'title': basic_data.get('title', ''),
+            'breadcrumbs': basic_data.get('breadcrumbs', []),
+            'content': {
+                'text': basic_data['content']['text'],
+                'markdown': markdown_content,
+                'contents': contents
+            },
+            'metadata': {
+                **basic_data.get('metadata', {}),
+                'markdown_length': len(markdown_content),
+                'contents_count': len(contents)
+            }
+        }
+        
+        return {
+            'processed_data': processed_data,
+            'contents': contents,
+            'markdown': markdown_content
+        }
+    
     async def _extract_main_content(self, html_content: str) -> Dict[str, Any]:
         """
         HTML에서 header, footer, sidebar를 제외한 메인 콘텐츠를 추출하여 JSON으로 변환
@@ -217,238 +406,215 @@ class AriService:
         """
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # 페이지 제목과 브레드크럼 추출 (요소 제거 전에 먼저 수행)
-            page_title = ""
-            breadcrumbs = []
-            urls = []
-            pagetree = []
-            
-            # 1. 페이지 제목 추출 (h1#title-text)
-            title_element = soup.find('h1', {'id': 'title-text'})
-            if title_element:
-                page_title = title_element.get_text(strip=True)
-            
-            # 2. 브레드크럼 추출 (ol#breadcrumbs)
-            breadcrumb_element = soup.find('ol', {'id': 'breadcrumbs'})
-            if breadcrumb_element:
-                for li in breadcrumb_element.find_all('li'):
-                    # ellipsis 버튼 제외
-                    if li.get('id') == 'ellipsis':
-                        continue
-                        
-                    link = li.find('a')
-                    if link:
-                        breadcrumbs.append({
-                            'text': link.get_text(strip=True),
-                            'href': link.get('href', '')
-                        })
-                    else:
-                        # 링크가 없는 경우 (예: 현재 페이지)
-                        span = li.find('span')
-                        if span:
-                            breadcrumbs.append({
-                                'text': span.get_text(strip=True),
-                                'href': ''
-                            })
-            
-            # 3. 페이지 트리 추출 (ia-secondary-content)
-            pagetree_element = soup.find('div', {'class': 'ia-secondary-content'})
-            if pagetree_element:
-                pagetree = self._extract_pagetree(pagetree_element)
-            
-            # 4. 메인 콘텐츠에서 URL 추출 (요소 제거 전에 수행)
-            main_content = soup.find('div', {'id': 'main-content'})
-            if not main_content:
-                main_content = soup.find('div', {'class': 'wiki-content'})
-            if not main_content:
-                main_content = soup.find('main') or soup.find('body') or soup
-                
-            if main_content:
-                urls = self._extract_urls(main_content)
-            
-            # 제거할 요소들 (header, footer, sidebar, nav 등 + Confluence 특화)
-            # 단, 페이지 제목과 브레드크럼은 유지
-            elements_to_remove = [
-                'header', 'footer', 'nav', 'aside', 'sidebar',
-                '.header', '.footer', '.nav', '.aside', '.sidebar',
-                '.navigation', '.menu',
-                
-                # Confluence 특화 UI 요소들 (제목/브레드크럼 제외)
-                'div.aui-page-header-actions',     # 페이지 액션 버튼들
-                'div.page-actions',               # 페이지 액션들
-                'div.aui-toolbar2',               # 툴바
-                'div.comment-container',          # 댓글 컨테이너
-                'div.like-button-container',      # 좋아요 버튼
-                'div.page-labels',                # 페이지 라벨
-                'div.comment-actions',            # 댓글 액션
-                'span.st-table-filter',           # 스마트 테이블 필터
-                'svg',                            # SVG 아이콘들
-                'div.confluence-information-macro', # 정보 매크로
-                'div.aui-message',                # 메시지
-                'div.page-metadata-modification-info', # 수정 정보
-                '.aui-page-header-actions',       # 페이지 헤더 액션
-                '.like-button-container',         # 좋아요 버튼 (클래스)
-                '.page-labels',                   # 페이지 라벨 (클래스)
-                
-                # 메타데이터 배너는 제거하되 제목/브레드크럼은 유지
-                'div#page-metadata-banner',       # 메타데이터 배너
-                'ul.banner',                      # 배너 리스트
-            ]
-            
-            # 요소 제거
-            for selector in elements_to_remove:
-                for element in soup.select(selector):
-                    element.decompose()
-            
-            # 메인 콘텐츠 추출 - Confluence 특화
-            main_content = None
-            
-            # 1. Confluence의 main-content 영역 우선 찾기
-            main_content = soup.find('div', {'id': 'main-content'})
-            
-            # 2. wiki-content 클래스가 있는 div 찾기
-            if not main_content:
-                main_content = soup.find('div', {'class': 'wiki-content'})
-            
-            # 3. 일반적인 main 태그 찾기
-            if not main_content:
-                main_content = soup.find('main')
-            
-            # 4. body 태그 찾기
-            if not main_content:
-                main_content = soup.find('body')
-            
-            # 5. 최후의 수단으로 전체 soup 사용
-            if not main_content:
-                main_content = soup
-            
-            # 텍스트 추출
-            text_content = main_content.get_text(separator=' ', strip=True)
-            
-            # HTML 제목 추출 (fallback)
-            title = soup.find('title')
-            title_text = title.get_text(strip=True) if title else ""
-            
-            # 페이지 제목이 없으면 HTML 제목 사용
-            if not page_title:
-                page_title = title_text
-            
-            # 원복: 메인 콘텐츠만 추출하도록 간소화 (이미지/첨부/댓글/테이블 비활성화)
-            images: List[Dict[str, Any]] = []
-            structured_tables: List[Dict[str, Any]] = []
-            tables_markdown: List[str] = []
-            attachments: List[Dict[str, Any]] = []
-            comments: List[Dict[str, Any]] = []
-            
-            # 위에서 파싱한 결과 사용
-
-            # 새로운 JSON 구조로 구성
-            result = {
-                'title': page_title or title_text,  # html-title 사용 (중복 제거)
-                'breadcrumbs': breadcrumbs,
-                'content': {
-                    'text': text_content
-                },
-                'metadata': {
-                    'img': images,
-                    'urls': urls,
-                    'pagetree': pagetree,
-                    'extracted_at': datetime.now().isoformat(),
-                    'content_length': len(text_content),
-                    'tables_markdown': tables_markdown,
-                    'structured_tables': structured_tables,
-                    'attachments': attachments,
-                    'comments': comments
-                }
-            }
-            
-            return result
-            
+            return self._extract_document_info(soup)
         except Exception as e:
             logger.error(f"HTML 콘텐츠 추출 중 오류: {e}")
-            return {
-                'content': {
-                    'text': '콘텐츠 추출 중 오류가 발생했습니다.'
-                },
-                'metadata': {
-                    'title': 'Error',
-                    'extracted_at': datetime.now().isoformat(),
-                    'content_length': 0,
-                    'error': str(e),
-                    'tables_markdown': [],
-                    'images': [],
-                    'attachments': [],
-                    'comments': []
-                }
+            return self._build_error_content(e)
+    
+    def _build_error_content(self, error: Exception) -> Dict[str, Any]:
+        """콘텐츠 추출 실패 시 반환할 기본 구조"""
+        return {
+            'content': {
+                'text': '콘텐츠 추출 중 오류가 발생했습니다.'
+            },
+            'metadata': {
+                'title': 'Error',
+                'extracted_at': datetime.now().isoformat(),
+                'content_length': 0,
+                'error': str(error),
+                'tables_markdown': [],
+                'images': [],
+                'attachments': [],
+                'comments': []
             }
+        }
+    
+    def _remove_excluded_elements(self, soup: BeautifulSoup) -> None:
+        """header, footer, sidebar 등 exclude 요소를 한 번의 순회로 제거"""
+        for element in soup.select(ELEMENTS_TO_REMOVE_SELECTOR):
+            # 이미 제거된 상위 요소에 포함된 경우 건너뜀
+            if not element.decomposed:
+                element.decompose()
+    
+    def _find_main_content(self, soup: BeautifulSoup):
+        """Confluence main-content → wiki-content → main → body → 전체 순으로 메인 콘텐츠 탐색"""
+        main_content = soup.find('div', {'id': 'main-content'})
+        if not main_content:
+            main_content = soup.find('div', {'class': 'wiki-content'})
+        if not main_content:
+            main_content = soup.find('main') or soup.find('body') or soup
+        return main_content
+    
+    def _extract_document_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        파싱된 soup에서 제목, 브레드크럼, 페이지 트리, URL, 본문 텍스트를 추출
+        
+        exclude 요소를 제거하므로 soup이 변경되며, 이후 _build_clean_fragment에 그대로 사용할 수 있음
+        """
+        # 페이지 제목과 브레드크럼 추출 (요소 제거 전에 먼저 수행)
+        page_title = ""
+        breadcrumbs = []
+        urls = []
+        pagetree = []
+        
+        # 1. 페이지 제목 추출 (h1#title-text)
+        title_element = soup.find('h1', {'id': 'title-text'})
+        if title_element:
+            page_title = title_element.get_text(strip=True)
+        
+        # 2. 브레드크럼 추출 (ol#breadcrumbs)
+        breadcrumb_element = soup.find('ol', {'id': 'breadcrumbs'})
+        if breadcrumb_element:
+            for li in breadcrumb_element.find_all('li'):
+                # ellipsis 버튼 제외
+                if li.get('id') == 'ellipsis':
+                    continue
+                    
+                link = li.find('a')
+                if link:
+                    breadcrumbs.append({
+                        'text': link.get_text(strip=True),
+                        'href': link.get('href', '')
+                    })
+                else:
+                    # 링크가 없는 경우 (예: 현재 페이지)
+                    span = li.find('span')
+                    if span:
+                        breadcrumbs.append({
+                            'text': span.get_text(strip=True),
+                            'href': ''
+                        })
+        
+        # 3. 페이지 트리 추출 (ia-secondary-content)
+        pagetree_element = soup.find('div', {'class': 'ia-secondary-content'})
+        if pagetree_element:
+            pagetree = self._extract_pagetree(pagetree_element)
+        
+        # 4. 메인 콘텐츠에서 URL 추출 (요소 제거 전에 수행)
+        main_content = self._find_main_content(soup)
+        if main_content:
+            urls = self._extract_urls(main_content)
+        
+        # 요소 제거
+        self._remove_excluded_elements(soup)
+        
+        # 메인 콘텐츠 추출 - Confluence 특화 (main-content → wiki-content → main → body → 전체)
+        main_content = self._find_main_content(soup)
+        
+        # 텍스트 추출
+        text_content = main_content.get_text(separator=' ', strip=True)
+        
+        # HTML 제목 추출 (fallback)
+        title = soup.find('title')
+        title_text = title.get_text(strip=True) if title else ""
+        
+        # 페이지 제목이 없으면 HTML 제목 사용
+        if not page_title:
+            page_title = title_text
+        
+        # 원복: 메인 콘텐츠만 추출하도록 간소화 (이미지/첨부/댓글/테이블 비활성화)
+        images: List[Dict[str, Any]] = []
+        structured_tables: List[Dict[str, Any]] = []
+        tables_markdown: List[str] = []
+        attachments: List[Dict[str, Any]] = []
+        comments: List[Dict[str, Any]] = []
+        
+        # 위에서 파싱한 결과 사용
 
+        # 새로운 JSON 구조로 구성
+        result = {
+            'title': page_title or title_text,  # html-title 사용 (중복 제거)
+            'breadcrumbs': breadcrumbs,
+            'content': {
+                'text': text_content
+            },
+            'metadata': {
+                'img': images,
+                'urls': urls,
+                'pagetree': pagetree,
+                'extracted_at': datetime.now().isoformat(),
+                'content_length': len(text_content),
+                'tables_markdown': tables_markdown,
+                'structured_tables': structured_tables,
+                'attachments': attachments,
+                'comments': comments
+            }
+        }
+        
+        return result
 
     def extract_clean_html(self, html_content: str) -> str:
         """exclude 요소 제거 후 페이지 제목, 브레드크럼, main-content 원문 HTML을 그대로 반환"""
         soup = BeautifulSoup(html_content, 'html.parser')
-        elements_to_remove = [
-            'header', 'footer', 'nav', 'aside', 'sidebar',
-            '.header', '.footer', '.nav', '.aside', '.sidebar',
-            '.navigation', '.menu',
-            'div.aui-page-header-actions', 'div.page-actions', 'div.aui-toolbar2', 
-            'div.comment-container', 'div.like-button-container', 'div.page-labels', 
-            'div.comment-actions', 'span.st-table-filter', 'svg',
-            'div.confluence-information-macro', 'div.aui-message', 'div.page-metadata-modification-info',
-            '.aui-page-header-actions', '.like-button-container', '.page-labels',
-            'div#page-metadata-banner', 'ul.banner',
-        ]
-        for selector in elements_to_remove:
-            for el in soup.select(selector):
-                el.decompose()
-
-        # 페이지 제목과 브레드크럼을 포함한 컨테이너 생성
-        result_parts = []
+        self._remove_excluded_elements(soup)
+        return self._build_clean_fragment(soup).decode()
+    
+    def _build_clean_fragment(self, soup: BeautifulSoup) -> BeautifulSoup:
+        """
+        exclude 요소가 제거된 soup에서 페이지 제목, 브레드크럼, main-content로 구성된 정제 DOM 생성
+        
+        직렬화 후 재파싱하지 않도록 main-content의 자식 노드를 그대로 옮기므로 soup이 변경됨
+        """
+        fragment = BeautifulSoup('', 'html.parser')
+        parts = []
         
         # 1. 페이지 제목 추가
         title_element = soup.find('h1', {'id': 'title-text'})
         if title_element:
-            result_parts.append(f"<h1>{title_element.decode_contents()}</h1>")
+            h1 = fragment.new_tag('h1')
+            h1.extend(list(copy.copy(title_element).contents))
+            parts.append(h1)
         
         # 2. 브레드크럼 추가
         breadcrumb_element = soup.find('ol', {'id': 'breadcrumbs'})
-        if breadcrumb_element:
-            result_parts.append(f"<nav aria-label='이동 경로'>{breadcrumb_element.decode_contents()}</nav>")
-        else:
+        if not breadcrumb_element:
             # 대안: breadcrumbs 클래스가 있는 요소 찾기
-            breadcrumb_alt = soup.find('div', class_='breadcrumbs')
-            if breadcrumb_alt:
-                result_parts.append(f"<nav aria-label='이동 경로'>{breadcrumb_alt.decode_contents()}</nav>")
+            breadcrumb_element = soup.find('div', class_='breadcrumbs')
+        if breadcrumb_element:
+            nav = fragment.new_tag('nav', attrs={'aria-label': '이동 경로'})
+            nav.extend(list(copy.copy(breadcrumb_element).contents))
+            parts.append(nav)
         
-        # 3. 메인 콘텐츠 추가
-        main_content = soup.find('div', {'id': 'main-content'})
-        if not main_content:
-            main_content = soup.find('div', {'class': 'wiki-content'})
-        if not main_content:
-            main_content = soup.find('main') or soup.find('body') or soup
-
-        if main_content:
-            try:
-                main_html = main_content.decode_contents() if hasattr(main_content, 'decode_contents') else str(main_content)
-                result_parts.append(main_html)
-            except Exception:
-                result_parts.append(str(main_content))
-
-        return '\n'.join(result_parts)
+        for part in parts:
+            fragment.append(part)
+            fragment.append('\n')
+        
+        # 3. 메인 콘텐츠 추가 (자식 노드 이동)
+        main_content = self._find_main_content(soup)
+        for child in list(main_content.contents):
+            fragment.append(child)
+        
+        return fragment
 
     def _parse_tables(self, root: BeautifulSoup) -> Dict[str, Any]:
-        """중첩/병합 테이블을 처리하여 구조화 + 마크다운 생성"""
+        """
+        중첩/병합 테이블을 처리하여 구조화 + 마크다운 생성
+        
+        셀마다 텍스트와 rowspan/colspan을 한 번만 읽어 배열 기반 그리드를 만들고,
+        헤더 판정도 같은 셀 캐시를 재사용하며, 마크다운/JSON은 테이블 단위로 한 번에 생성
+        """
         structured: List[Dict[str, Any]] = []
         markdowns: List[str] = []
+        
+        # 셀 id → (텍스트, rowspan, colspan) / 헤더 셀 여부 캐시
+        cell_cache: Dict[int, tuple] = {}
+        header_cell_cache: Dict[int, bool] = {}
 
         def extract_text(el) -> str:
             # 줄바꿈 로직 제거 - 원본 텍스트 유지
             text = el.get_text(separator=' ', strip=True) or ''
             return text.strip()
 
-        def limit_text(text: str, limit: int = None) -> str:
-            # 내용 생략 문제 해결 - 제한 없이 모든 내용 표시
-            return text if text else ""
+        def read_cell(cell) -> tuple:
+            info = cell_cache.get(id(cell))
+            if info is None:
+                info = (
+                    extract_text(cell),
+                    int(cell.get('rowspan', 1) or 1),
+                    int(cell.get('colspan', 1) or 1),
+                )
+                cell_cache[id(cell)] = info
+            return info
 
         def get_table_rows(table_el) -> List[Any]:
             rows: List[Any] = []
@@ -458,102 +624,104 @@ class AriService:
             rows.extend(table_el.find_all('tr', recursive=False))
             return rows
 
-        def build_grid(table_el) -> Dict[str, Any]:
-            rows = get_table_rows(table_el)
+        def build_grid(rows: List[Any]) -> Dict[str, Any]:
             grid: List[List[str]] = []
-            span_map: Dict[tuple, Dict[str, int]] = {}
+            # 열별로 이전 행의 rowspan이 덮는 마지막 행 인덱스
+            cover_until: List[int] = []
             max_cols = 0
             
             for r_idx, tr in enumerate(rows):
-                if len(grid) <= r_idx:
-                    grid.append([])
-                c_idx = 0
+                row: List[str] = []
+                
+                # 행 앞쪽에서 rowspan으로 덮인 열은 빈 칸으로 채움
+                while len(row) < len(cover_until) and cover_until[len(row)] >= r_idx:
+                    row.append('')
                 
-                while (r_idx, c_idx) in span_map:
-                    grid[r_idx].append('')
-                    span_map[(r_idx, c_idx)]['remaining_rowspan'] -= 1
-                    if span_map[(r_idx, c_idx)]['remaining_rowspan'] > 0:
-                        span_map[(r_idx + 1, c_idx)] = span_map[(r_idx, c_idx)].copy()
-                    del span_map[(r_idx, c_idx)]
-                    c_idx += 1
-
                 for cell in tr.find_all(['td', 'th'], recursive=False):
-                    cell_text = extract_text(cell)
-                    rowspan = int(cell.get('rowspan', 1) or 1)
-                    colspan = int(cell.get('colspan', 1) or 1)
-
-                    grid[r_idx].append(cell_text)
-                    c_idx += 1
-                    for _ in range(colspan - 1):
-                        grid[r_idx].append('')
-                        c_idx += 1
-
-                    if rowspan > 1:
-                        for rs in range(1, rowspan):
-                            for cs in range(colspan):
-                                span_map[(r_idx + rs, (c_idx - colspan) + cs)] = {
-                                    'text': cell_text,
-                                    'remaining_rowspan': rowspan - rs
-                                }
-                max_cols = max(max_cols, len(grid[r_idx]))
-
-            for r in grid:
-                if len(r) < max_cols:
-                    r.extend([''] * (max_cols - len(r)))
-
-            # 빈 열 제거
-            col_count = max_cols
-            used: List[bool] = [False] * col_count
+                    cell_text, rowspan, colspan = read_cell(cell)
+                    start = len(row)
+                    row.append(cell_text)
+                    if colspan > 1:
+                        row.extend([''] * (colspan - 1))
+                    
+                    if rowspan > 1 and colspan > 0:
+                        last_row = r_idx + rowspan - 1
+                        end = start + colspan
+                        if len(cover_until) < end:
+                            cover_until.extend([-1] * (end - len(cover_until)))
+                        for c in range(start, end):
+                            if cover_until[c] < last_row:
+                                cover_until[c] = last_row
+                
+                grid.append(row)
+                if len(row) > max_cols:
+                    max_cols = len(row)
+
             for row in grid:
-                for idx, val in enumerate(row):
-                    if idx < col_count and (val or '').strip():
-                        used[idx] = True
-            keep_indices = [i for i, u in enumerate(used) if u]
-            if keep_indices:
-                grid = [[row[i] for i in keep_indices] for row in grid]
+                if len(row) < max_cols:
+                    row.extend([''] * (max_cols - len(row)))
+
+            # 빈 열 제거 (셀 텍스트는 이미 strip되어 있으므로 빈 문자열 여부만 확인)
+            columns = list(zip(*grid))
+            keep_indices = [i for i, column in enumerate(columns) if any(column)]
+            if keep_indices and len(keep_indices) < max_cols:
+                grid = [list(row) for row in zip(*[columns[i] for i in keep_indices])]
                 max_cols = len(keep_indices)
 
             return {'grid': grid, 'cols': max_cols}
 
         def is_header_cell(cell) -> bool:
-            """셀이 헤더인지 판단"""
+            """셀이 헤더인지 판단 (셀별 캐시)"""
+            cached = header_cell_cache.get(id(cell))
+            if cached is not None:
+                return cached
+            
+            result = False
             # 1. th 태그인 경우
             if cell.name == 'th':
-                return True
+                result = True
             
             # 2. td 태그지만 내부에 strong/b 태그가 있는 경우
-            if cell.name == 'td':
-                # p > strong 또는 직접 strong/b 태그 확인
+            elif cell.name == 'td':
                 strong_tags = cell.find_all(['strong', 'b'])
                 if strong_tags:
                     # strong 태그의 텍스트가 셀 전체 텍스트의 대부분을 차지하는지 확인
-                    cell_text = extract_text(cell).strip()
-                    strong_text = ' '.join(extract_text(tag).strip() for tag in strong_tags)
+                    cell_text = read_cell(cell)[0]
+                    strong_text = ' '.join(extract_text(tag) for tag in strong_tags)
                     if strong_text and len(strong_text) >= len(cell_text) * 0.7:  # 70% 이상
-                        return True
+                        result = True
                 
                 # 3. CSS 클래스 기반 헤더 감지 (Confluence 테이블)
-                cell_classes = cell.get('class', [])
-                if any('highlight' in str(cls) for cls in cell_classes):  # highlight-grey 등
-                    return True
+                if not result:
+                    cell_classes = cell.get('class', [])
+                    result = any('highlight' in str(cls) for cls in cell_classes)  # highlight-grey 등
             
-            return False
+            header_cell_cache[id(cell)] = result
+            return result
+
+        def expand_header_row(cells) -> List[str]:
+            expanded: List[str] = []
+            for cell in cells:
+                # 그리드에 포함되지 않은 셀(중첩 테이블의 thead 등)은 colspan만 읽음
+                info = cell_cache.get(id(cell))
+                if info is not None:
+                    txt, span = info[0], info[2]
+                else:
+                    txt, span = extract_text(cell), int(cell.get('colspan', 1) or 1)
+                # 빈 셀이나 전각 공백은 빈 문자열로 처리
+                if txt == '　':
+                    txt = ''
+                expanded.extend([txt] * max(1, span))
+            return expanded
 
-        def detect_headers(table_el, grid_obj) -> Dict[str, Any]:
+        def detect_headers(table_el, thead, grid_obj) -> Dict[str, Any]:
             header_rows: List[List[str]] = []
-            thead = table_el.find('thead')
             
-            if thead and thead.find_all('tr'):
+            if thead is not None and thead.find('tr') is not None:
                 for tr in thead.find_all('tr', recursive=False):
-                    if tr.find_all(['th', 'td']):
-                        expanded: List[str] = []
-                        for cell in tr.find_all(['th', 'td'], recursive=False):
-                            txt = extract_text(cell)
-                            span = int(cell.get('colspan', 1) or 1)
-                            expanded.extend([txt] * max(1, span))
-                        header_rows.append(expanded)
+                    if tr.find(['th', 'td']) is not None:
+                        header_rows.append(expand_header_row(tr.find_all(['th', 'td'], recursive=False)))
             else:
-                # 복잡한 테이블 헤더 감지 개선
                 body_rows: List[Any] = []
                 for tbody in table_el.find_all('tbody', recursive=False):
                     body_rows.extend(tbody.find_all('tr', recursive=False))
@@ -561,38 +729,20 @@ class AriService:
                     body_rows = table_el.find_all('tr', recursive=False)
                 
                 # 상위 2-3행에서 헤더 패턴 찾기
-                max_scan = min(3, len(body_rows))
                 collected = 0
-                
-                for i, tr in enumerate(body_rows[:max_scan]):
+                for i, tr in enumerate(body_rows[:3]):
                     cells = tr.find_all(['th', 'td'], recursive=False)
                     if not cells:
                         continue
                     
-                    # 헤더 가능성 체크 - 엄격한 조건만 사용
-                    is_likely_header = False
-                    
                     # 1. th 태그 또는 strong 태그가 있는 경우
-                    if any(is_header_cell(c) for c in cells):
-                        is_likely_header = True
-                    
                     # 2. rowspan/colspan이 있는 첫 번째 행인 경우 (복잡한 헤더 구조)
-                    elif i == 0 and any(  # 첫 번째 행만 체크
-                        int(c.get('rowspan', 1) or 1) > 1 or int(c.get('colspan', 1) or 1) > 1 
-                        for c in cells
-                    ):
-                        is_likely_header = True
+                    is_likely_header = any(is_header_cell(c) for c in cells) or (
+                        i == 0 and any(read_cell(c)[1] > 1 or read_cell(c)[2] > 1 for c in cells)
+                    )
                     
                     if is_likely_header and collected < 3:  # 최대 3행까지 헤더로 인식
-                        expanded: List[str] = []
-                        for cell in cells:
-                            txt = extract_text(cell).strip()
-                            # 빈 셀이나 전각 공백은 빈 문자열로 처리
-                            if txt == '　' or not txt:
-                                txt = ''
-                            span = int(cell.get('colspan', 1) or 1)
-                            expanded.extend([txt] * max(1, span))
-                        header_rows.append(expanded)
+                        header_rows.append(expand_header_row(cells))
                         collected += 1
                     elif collected > 0:
                         # 헤더 행 이후 일반 데이터 행이 나오면 중단
@@ -600,104 +750,77 @@ class AriService:
 
             cols = grid_obj['cols']
             
-            # 휴리스틱 방법 제거 - thead, th 태그만 사용
             if not header_rows:
                 # 헤더가 없으면 기본 컬럼명 생성
-                headers = [f"컬럼{i+1}" for i in range(cols)]
-                return {'headers': headers, 'header_rows_count': 0}
-
-            # 헤더 행 길이 보정
-            norm_rows: List[List[str]] = []
-            for row in header_rows:
-                row = row[:cols] + [''] * max(0, cols - len(row))
-                norm_rows.append(row)
+                return {'headers': [f"컬럼{i+1}" for i in range(cols)], 'header_rows_count': 0}
 
-            # 다중 헤더 행 병합 - 계층적 헤더명 생성
+            # 헤더 행 길이 보정 후 열 단위로 계층적 헤더명 생성 ("상위헤더 > 하위헤더")
+            norm_rows = [row[:cols] + [''] * max(0, cols - len(row)) for row in header_rows]
             headers = []
-            for c in range(cols):
-                name_parts = []
-                for r in range(len(norm_rows)):
-                    if norm_rows[r][c] and norm_rows[r][c].strip():
-                        name_parts.append(norm_rows[r][c].strip())
-                
-                if name_parts:
-                    # 중복 제거하면서 계층 구조 유지
-                    unique_parts = []
-                    for part in name_parts:
-                        if part not in unique_parts:
-                            unique_parts.append(part)
-                    
-                    if len(unique_parts) == 1:
-                        name = unique_parts[0]
-                    else:
-                        # 계층적 헤더명: "상위헤더 > 하위헤더"
-                        name = ' > '.join(unique_parts)
-                else:
-                    name = f"컬럼{c+1}"
-                
-                headers.append(name)
+            for c, column in enumerate(zip(*norm_rows)):
+                unique_parts = list(dict.fromkeys(part.strip() for part in column if part and part.strip()))
+                headers.append(' > '.join(unique_parts) if unique_parts else f"컬럼{c+1}")
                 
             return {'headers': headers, 'header_rows_count': len(norm_rows)}
 
-        def preprocess_markdown_text(text: str) -> str:
-            """마크다운 문법 전처리"""
-            if not text:
-                return text
-            
-            # 마크다운 특수문자 이스케이프
-            text = text.replace('|', '\\|')  # 테이블 구분자
-            text = text.replace('*', '\\*')  # 볼드/이탤릭
-            text = text.replace('_', '\\_')  # 언더스코어
-            text = text.replace('#', '\\#')  # 헤더
-            text = text.replace('[', '\\[')  # 링크
-            text = text.replace(']', '\\]')  # 링크
-            text = text.replace('`', '\\`')  # 코드
-            
-            return text
+        # 마크다운 특수문자 이스케이프 (테이블 구분자, 볼드/이탤릭, 언더스코어, 헤더, 링크, 코드)
+        markdown_escape = str.maketrans({
+            '|': '\\|', '*': '\\*', '_': '\\_', '#': '\\#',
+            '[': '\\[', ']': '\\]', '`': '\\`',
+        })
 
-        def grid_to_markdown(grid_obj, headers: List[str], header_rows_count: int, title: Optional[str]) -> str:
+        def emit_table(grid_obj, headers: List[str], header_rows_count: int, title: Optional[str]) -> tuple:
+            """마크다운 문자열과 구조화 JSON을 한 번에 생성"""
             lines = []
             if title:
                 lines.append(f"### {title}")
                 lines.append("")  # 제목 후 빈 줄
-                
-            # 헤더 - 마크다운 전처리 적용
-            processed_headers = [preprocess_markdown_text(h) for h in headers]
-            lines.append('|' + '|'.join(processed_headers) + '|')
-            lines.append('|' + '|'.join(' --- ' for _ in headers) + '|')
             
-            # 데이터 행 - 마크다운 전처리 적용
-            data_rows = grid_obj['grid'][header_rows_count if header_rows_count > 0 else 1:]
-            for row in data_rows:
-                preview_vals = [preprocess_markdown_text(limit_text(str(v))) for v in row[:len(headers)]]
-                if all(v.strip() == '' for v in preview_vals):
-                    continue
-                lines.append('|' + '|'.join(preview_vals) + '|')
+            width = len(headers)
+            lines.append('|' + '|'.join([h.translate(markdown_escape) for h in headers]) + '|')
+            lines.append('|' + '|'.join([' --- '] * width) + '|')
+            
+            # 데이터 행 (모든 값이 빈 행은 제외)
+            data_rows = [row[:width] for row in grid_obj['grid'][header_rows_count if header_rows_count > 0 else 1:]]
+            data_rows = [row for row in data_rows if any(row)]
+            lines.extend(['|' + '|'.join([v.translate(markdown_escape) for v in row]) + '|' for row in data_rows])
             
             lines.append("")  # 테이블 후 빈 줄
-            return '\n'.join(lines)
+            return '\n'.join(lines), {'title': title, 'headers': headers, 'rows': data_rows}
+
+        # 테이블, thead, caption을 한 번의 순회로 수집하고
+        # 각 테이블의 첫 번째 하위 thead/caption(중첩 테이블 포함)을 미리 연결
+        tables: List[Any] = []
+        first_descendant: Dict[str, Dict[int, Any]] = {'thead': {}, 'caption': {}}
+        for el in root.find_all(['table', 'thead', 'caption']):
+            if el.name == 'table':
+                tables.append(el)
+                continue
+            owners = first_descendant[el.name]
+            for parent in el.parents:
+                if parent.name == 'table' and id(parent) not in owners:
+                    owners[id(parent)] = el
 
         # 테이블 파싱 실행
         table_index = 0
-        for tbl in root.find_all('table'):
+        for tbl in tables:
             try:
                 table_index += 1
-                grid_obj = build_grid(tbl)
-                header_info = detect_headers(tbl, grid_obj)
-                headers = header_info['headers']
-                header_rows_count = header_info['header_rows_count']
+                grid_obj = build_grid(get_table_rows(tbl))
+                header_info = detect_headers(tbl, first_descendant['thead'].get(id(tbl)), grid_obj)
                 
-                # 마크다운 생성
                 table_name = f"테이블 {table_index}"
-                caption = tbl.find('caption')
+                caption = first_descendant['caption'].get(id(tbl))
                 if caption:
                     cap = extract_text(caption)
                     if cap:
                         table_name = cap
-                        
-                markdowns.append(grid_to_markdown(
-                    grid_obj, headers, header_rows_count, table_name
-                ))
+                
+                table_markdown, table_json = emit_table(
+                    grid_obj, header_info['headers'], header_info['header_rows_count'], table_name
+                )
+                markdowns.append(table_markdown)
+                structured.append(table_json)
                 
             except Exception as e:
                 logger.warning(f"Table parse failed at index {table_index}: {e}")
@@ -707,30 +830,36 @@ class AriService:
 
     def extract_markdown(self, html_content: str) -> str:
         """하이브리드 방식: 테이블은 기존 로직으로, 나머지는 pymupdf4llm/markdownify로 처리"""
-        cleaned_html = self.extract_clean_html(html_content)
-        soup = BeautifulSoup(cleaned_html, 'html.parser')
-        
+        soup = BeautifulSoup(html_content, 'html.parser')
+        self._remove_excluded_elements(soup)
+        return self._clean_fragment_to_markdown(self._build_clean_fragment(soup))
+    
+    def _clean_fragment_to_markdown(self, fragment: BeautifulSoup) -> str:
+        """정제 DOM을 마크다운으로 변환 (테이블 노드는 제거되어 fragment가 변경됨)"""
         # 1. 테이블을 별도로 파싱하여 마크다운 생성
         table_markdowns = []
         try:
-            parsed_tables = self._parse_tables(soup)
+            parsed_tables = self._parse_tables(fragment)
             table_markdowns = parsed_tables.get('markdown', [])
         except Exception as e:
             logger.warning(f"Table parsing failed: {e}")
         
-        # 2. 테이블을 제거한 HTML에서 나머지 텍스트 추출
-        for table in soup.find_all('table'):
-            table.decompose()
-        
-        remaining_html = str(soup)
+        # 2. 테이블을 제거한 DOM에서 나머지 텍스트 추출
+        for table in fragment.find_all('table'):
+            # 중첩 테이블은 상위 테이블과 함께 이미 제거됨
+            if not table.decomposed:
+                table.decompose()
+        # 직렬화 후 재파싱한 결과와 동일하도록 인접 텍스트 노드 병합
+        fragment.smooth()
         
         # 3. 나머지 내용을 마크다운으로 변환
         remaining_markdown = ""
         
-        # 3-1. pymupdf4llm 시도
-        if pymupdf4llm is not None and remaining_html.strip():
-            try:
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_html:
+        # 3-1. pymupdf4llm 시도 (임시 파일 없이 메모리 스트림으로 문서 생성)
+        if pymupdf4llm is not None and fitz is not None:
+            remaining_html = fragment.decode()
+            if remaining_html.strip():
+                try:
                     full_html = f"""<!DOCTYPE html>
 <html>
 <head>
@@ -740,45 +869,34 @@ class AriService:
     {remaining_html}
 </body>
 </html>"""
-                    temp_html.write(full_html)
-                    temp_html_path = temp_html.name
-                
-                markdown_result = pymupdf4llm.to_markdown(temp_html_path)
-                
-                try:
-                    os.unlink(temp_html_path)
-                except:
-                    pass
-                
-                if markdown_result and markdown_result.strip():
-                    remaining_markdown = markdown_result
+                    doc = fitz.open(stream=full_html.encode('utf-8'), filetype='html')
+                    try:
+                        markdown_result = pymupdf4llm.to_markdown(doc)
+                    finally:
+                        doc.close()
                     
-            except Exception as e:
-                logger.warning(f"pymupdf4llm conversion failed: {e}")
-                try:
-                    if 'temp_html_path' in locals():
-                        os.unlink(temp_html_path)
-                except:
-                    pass
+                    if markdown_result and markdown_result.strip():
+                        remaining_markdown = markdown_result
+                        
+                except Exception as e:
+                    logger.warning(f"pymupdf4llm conversion failed: {e}")
         
-        # 3-2. markdownify 폴백
-        if not remaining_markdown and md_convert is not None:
+        # 3-2. markdownify 폴백 (재파싱 없이 DOM을 직접 변환)
+        if not remaining_markdown and MarkdownConverter is not None:
             try:
-                remaining_markdown = md_convert(
-                    remaining_html,
+                remaining_markdown = MarkdownConverter(
                     heading_style="ATX",
                     strip=['style', 'script']
-                )
+                ).convert_soup(fragment)
             except Exception as e:
                 logger.warning(f"markdownify failed: {e}")
         
         # 3-3. 최종 폴백
         if not remaining_markdown:
             try:
-                soup_remaining = BeautifulSoup(remaining_html, 'html.parser')
-                remaining_markdown = soup_remaining.get_text('\n', strip=True)
+                remaining_markdown = fragment.get_text('\n', strip=True)
             except Exception:
-                remaining_markdown = remaining_html
+                remaining_markdown = fragment.decode()
         
         # 4. 결과 조합 - 테이블 간 적절한 줄바꿈 추가
         result_parts = []
@@ -0,0 +1,386 @@
+"""
+ARI 테이블 파서 벤치마크
+
+ARI(Confluence) HTML 내보내기 코퍼스에 대해 기존 테이블 파서와 현재
+AriService._parse_tables 구현의 처리 시간을 비교하고, 테이블 마크다운 출력이
+완전히 동일한지 검증합니다.
+
+사용 예시:
+  python -m app.application.ari.table_benchmark ./ari_exports
+  python -m app.application.ari.table_benchmark ./ari_exports -r 5 --show-diff
+"""
+import argparse
+import difflib
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from bs4 import BeautifulSoup
+
+from app.application.ari.ari_service import ari_service
+
+logger = logging.getLogger(__name__)
+
+
+def reference_parse_tables(root: BeautifulSoup) -> Dict[str, Any]:
+    """기존(레거시) 테이블 파서 - 출력 동일성 비교 기준으로만 사용"""
+    structured: List[Dict[str, Any]] = []
+    markdowns: List[str] = []
+
+    def extract_text(el) -> str:
+        # 줄바꿈 로직 제거 - 원본 텍스트 유지
+        text = el.get_text(separator=' ', strip=True) or ''
+        return text.strip()
+
+    def limit_text(text: str, limit: int = None) -> str:
+        # 내용 생략 문제 해결 - 제한 없이 모든 내용 표시
+        return text if text else ""
+
+    def get_table_rows(table_el) -> List[Any]:
+        rows: List[Any] = []
+        for sec_name in ['thead', 'tbody', 'tfoot']:
+            for sec in table_el.find_all(sec_name, recursive=False):
+                rows.extend(sec.find_all('tr', recursive=False))
+        rows.extend(table_el.find_all('tr', recursive=False))
+        return rows
+
+    def build_grid(table_el) -> Dict[str, Any]:
+        rows = get_table_rows(table_el)
+        grid: List[List[str]] = []
+        span_map: Dict[tuple, Dict[str, int]] = {}
+        max_cols = 0
+
+        for r_idx, tr in enumerate(rows):
+            if len(grid) <= r_idx:
+                grid.append([])
+            c_idx = 0
+
+            while (r_idx, c_idx) in span_map:
+                grid[r_idx].append('')
+                span_map[(r_idx, c_idx)]['remaining_rowspan'] -= 1
+                if span_map[(r_idx, c_idx)]['remaining_rowspan'] > 0:
+                    span_map[(r_idx + 1, c_idx)] = span_map[(r_idx, c_idx)].copy()
+                del span_map[(r_idx, c_idx)]
+                c_idx += 1
+
+            for cell in tr.find_all(['td', 'th'], recursive=False):
+                cell_text = extract_text(cell)
+                rowspan = int(cell.get('rowspan', 1) or 1)
+                colspan = int(cell.get('colspan', 1) or 1)
+
+                grid[r_idx].append(cell_text)
+                c_idx += 1
+                for _ in range(colspan - 1):
+                    grid[r_idx].append('')
+                    c_idx += 1
+
+                if rowspan > 1:
+                    for rs in range(1, rowspan):
+                        for cs in range(colspan):
+                            span_map[(r_idx + rs, (c_idx - colspan) + cs)] = {
+                                'text': cell_text,
+                                'remaining_rowspan': rowspan - rs
+                            }
+            max_cols = max(max_cols, len(grid[r_idx]))
+
+        for r in grid:
+            if len(r) < max_cols:
+                r.extend([''] * (max_cols - len(r)))
+
+        # 빈 열 제거
+        col_count = max_cols
+        used: List[bool] = [False] * col_count
+        for row in grid:
+            for idx, val in enumerate(row):
+                if idx < col_count and (val or '').strip():
+                    used[idx] = True
+        keep_indices = [i for i, u in enumerate(used) if u]
+        if keep_indices:
+            grid = [[row[i] for i in keep_indices] for row in grid]
+            max_cols = len(keep_indices)
+
+        return {'grid': grid, 'cols': max_cols}
+
+    def is_header_cell(cell) -> bool:
+        """셀이 헤더인지 판단"""
+        # 1. th 태그인 경우
+        if cell.name == 'th':
+            return True
+
+        # 2. td 태그지만 내부에 strong/b 태그가 있는 경우
+        if cell.name == 'td':
+            # p > strong 또는 직접 strong/b 태그 확인
+            strong_tags = cell.find_all(['strong', 'b'])
+            if strong_tags:
+                # strong 태그의 텍스트가 셀 전체 텍스트의 대부분을 차지하는지 확인
+                cell_text = extract_text(cell).strip()
+                strong_text = ' '.join(extract_text(tag).strip() for tag in strong_tags)
+                if strong_text and len(strong_text) >= len(cell_text) * 0.7:  # 70% 이상
+                    return True
+
+            # 3. CSS 클래스 기반 헤더 감지 (Confluence 테이블)
+            cell_classes = cell.get('class', [])
+            if any('highlight' in str(cls) for cls in cell_classes):  # highlight-grey 등
+                return True
+
+        return False
+
+    def detect_headers(table_el, grid_obj) -> Dict[str, Any]:
+        header_rows: List[List[str]] = []
+        thead = table_el.find('thead')
+
+        if thead and thead.find_all('tr'):
+            for tr in thead.find_all('tr', recursive=False):
+                if tr.find_all(['th', 'td']):
+                    expanded: List[str] = []
+                    for cell in tr.find_all(['th', 'td'], recursive=False):
+                        txt = extract_text(cell)
+                        span = int(cell.get('colspan', 1) or 1)
+                        expanded.extend([txt] * max(1, span))
+                    header_rows.append(expanded)
+        else:
+            # 복잡한 테이블 헤더 감지 개선
+            body_rows: List[Any] = []
+            for tbody in table_el.find_all('tbody', recursive=False):
+                body_rows.extend(tbody.find_all('tr', recursive=False))
+            if not body_rows:
+                body_rows = table_el.find_all('tr', recursive=False)
+
+            # 상위 2-3행에서 헤더 패턴 찾기
+            max_scan = min(3, len(body_rows))
+            collected = 0
+
+            for i, tr in enumerate(body_rows[:max_scan]):
+                cells = tr.find_all(['th', 'td'], recursive=False)
+                if not cells:
+                    continue
+
+                # 헤더 가능성 체크 - 엄격한 조건만 사용
+                is_likely_header = False
+
+                # 1. th 태그 또는 strong 태그가 있는 경우
+                if any(is_header_cell(c) for c in cells):
+                    is_likely_header = True
+
+                # 2. rowspan/colspan이 있는 첫 번째 행인 경우 (복잡한 헤더 구조)
+                elif i == 0 and any(  # 첫 번째 행만 체크
+                    int(c.get('rowspan', 1) or 1) > 1 or int(c.get('colspan', 1) or 1) > 1 
+                    for c in cells
+                ):
+                    is_likely_header = True
+
+                if is_likely_header and collected < 3:  # 최대 3행까지 헤더로 인식
+                    expanded: List[str] = []
+                    for cell in cells:
+                        txt = extract_text(cell).strip()
+                        # 빈 셀이나 전각 공백은 빈 문자열로 처리
+                        if txt == '　' or not txt:
+                            txt = ''
+                        span = int(cell.get('colspan', 1) or 1)
+                        expanded.extend([txt] * max(1, span))
+                    header_rows.append(expanded)
+                    collected += 1
+                elif collected > 0:
+                    # 헤더 행 이후 일반 데이터 행이 나오면 중단
+                    break
+
+        cols = grid_obj['cols']
+
+        # 휴리스틱 방법 제거 - thead, th 태그만 사용
+        if not header_rows:
+            # 헤더가 없으면 기본 컬럼명 생성
+            headers = [f"컬럼{i+1}" for i in range(cols)]
+            return {'headers': headers, 'header_rows_count': 0}
+
+        # 헤더 행 길이 보정
+        norm_rows: List[List[str]] = []
+        for row in header_rows:
+            row = row[:cols] + [''] * max(0, cols - len(row))
+            norm_rows.append(row)
+
+        # 다중 헤더 행 병합 - 계층적 헤더명 생성
+        headers = []
+        for c in range(cols):
+            name_parts = []
+            for r in range(len(norm_rows)):
+                if norm_rows[r][c] and norm_rows[r][c].strip():
+                    name_parts.append(norm_rows[r][c].strip())
+
+            if name_parts:
+                # 중복 제거하면서 계층 구조 유지
+                unique_parts = []
+                for part in name_parts:
+                    if part not in unique_parts:
+                        unique_parts.append(part)
+
+                if len(unique_parts) == 1:
+                    name = unique_parts[0]
+                else:
+                    # 계층적 헤더명: "상위헤더 > 하위헤더"
+                    name = ' > '.join(unique_parts)
+            else:
+                name = f"컬럼{c+1}"
+
+            headers.append(name)
+
+        return {'headers': headers, 'header_rows_count': len(norm_rows)}
+
+    def preprocess_markdown_text(text: str) -> str:
+        """마크다운 문법 전처리"""
+        if not text:
+            return text
+
+        # 마크다운 특수문자 이스케이프
+        text = text.replace('|', '\\|')  # 테이블 구분자
+        text = text.replace('*', '\\*')  # 볼드/이탤릭
+        text = text.replace('_', '\\_')  # 언더스코어
+        text = text.replace('#', '\\#')  # 헤더
+        text = text.replace('[', '\\[')  # 링크
+        text = text.replace(']', '\\]')  # 링크
+        text = text.replace('`', '\\`')  # 코드
+
+        return text
+
+    def grid_to_markdown(grid_obj, headers: List[str], header_rows_count: int, title: Optional[str]) -> str:
+        lines = []
+        if title:
+            lines.append(f"### {title}")
+            lines.append("")  # 제목 후 빈 줄
+
+        # 헤더 - 마크다운 전처리 적용
+        processed_headers = [preprocess_markdown_text(h) for h in headers]
+        lines.append('|' + '|'.join(processed_headers) + '|')
+        lines.append('|' + '|'.join(' --- ' for _ in headers) + '|')
+
+        # 데이터 행 - 마크다운 전처리 적용
+        data_rows = grid_obj['grid'][header_rows_count if header_rows_count > 0 else 1:]
+        for row in data_rows:
+            preview_vals = [preprocess_markdown_text(limit_text(str(v))) for v in row[:len(headers)]]
+            if all(v.strip() == '' for v in preview_vals):
+                continue
+            lines.append('|' + '|'.join(preview_vals) + '|')
+
+        lines.append("")  # 테이블 후 빈 줄
+        return '\n'.join(lines)
+
+    # 테이블 파싱 실행
+    table_index = 0
+    for tbl in root.find_all('table'):
+        try:
+            table_index += 1
+            grid_obj = build_grid(tbl)
+            header_info = detect_headers(tbl, grid_obj)
+            headers = header_info['headers']
+            header_rows_count = header_info['header_rows_count']
+
+            # 마크다운 생성
+            table_name = f"테이블 {table_index}"
+            caption = tbl.find('caption')
+            if caption:
+                cap = extract_text(caption)
+                if cap:
+                    table_name = cap
+
+            markdowns.append(grid_to_markdown(
+                grid_obj, headers, header_rows_count, table_name
+            ))
+
+        except Exception as e:
+            logger.warning(f"Table parse failed at index {table_index}: {e}")
+            continue
+
+    return {'structured': structured, 'markdown': markdowns}
+
+
+def _load_fragment(html_content: str) -> BeautifulSoup:
+    """서비스와 동일하게 exclude 요소 제거 후 정제 DOM 생성"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    ari_service._remove_excluded_elements(soup)
+    return ari_service._build_clean_fragment(soup)
+
+
+def _time_parser(parse, fragment: BeautifulSoup, repeat: int) -> tuple:
+    """파서를 repeat회 실행하여 최소 소요 시간(초)과 마지막 결과 반환"""
+    best = float('inf')
+    result: Dict[str, Any] = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse(fragment)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_benchmark(corpus_dir: str, repeat: int = 3, show_diff: bool = False) -> Dict[str, Any]:
+    """코퍼스의 모든 HTML 파일에 대해 두 파서의 시간과 출력 동일성 비교"""
+    files = sorted(Path(corpus_dir).rglob('*.html'))
+    summary: Dict[str, Any] = {
+        'files': len(files),
+        'tables': 0,
+        'reference_seconds': 0.0,
+        'current_seconds': 0.0,
+        'mismatches': [],
+    }
+
+    for path in files:
+        html_content = path.read_text(encoding='utf-8', errors='ignore')
+        fragment = _load_fragment(html_content)
+
+        reference_time, reference = _time_parser(reference_parse_tables, fragment, repeat)
+        current_time, current = _time_parser(ari_service._parse_tables, fragment, repeat)
+
+        summary['tables'] += len(reference['markdown'])
+        summary['reference_seconds'] += reference_time
+        summary['current_seconds'] += current_time
+
+        if reference['markdown'] != current['markdown']:
+            summary['mismatches'].append(str(path))
+            if show_diff:
+                diff = difflib.unified_diff(
+                    '\n'.join(reference['markdown']).splitlines(),
+                    '\n'.join(current['markdown']).splitlines(),
+                    fromfile=f"{path.name} (reference)",
+                    tofile=f"{path.name} (current)",
+                    lineterm='',
+                )
+                print('\n'.join(diff))
+
+    return summary
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="ARI HTML 코퍼스에 대해 기존/현재 테이블 파서의 성능과 출력 동일성을 비교합니다."
+    )
+    parser.add_argument("corpus_dir", help="ARI HTML 내보내기 파일(*.html)이 있는 디렉토리")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="파일별 반복 실행 횟수 (최소 시간 사용, 기본값: 3)")
+    parser.add_argument("--show-diff", action="store_true", help="출력이 다른 파일의 마크다운 diff 출력")
+
+    args = parser.parse_args(argv)
+
+    if not Path(args.corpus_dir).is_dir():
+        print(f"오류: 디렉토리 '{args.corpus_dir}'를 찾을 수 없습니다.")
+        sys.exit(1)
+
+    summary = run_benchmark(args.corpus_dir, max(1, args.repeat), args.show_diff)
+
+    reference_seconds = summary['reference_seconds']
+    current_seconds = summary['current_seconds']
+    speedup = reference_seconds / current_seconds if current_seconds > 0 else 0.0
+
+    print("=" * 50)
+    print(f"파일: {summary['files']:,}개 / 테이블: {summary['tables']:,}개")
+    print(f"기존 파서: {reference_seconds * 1000:,.1f} ms")
+    print(f"현재 파서: {current_seconds * 1000:,.1f} ms (x{speedup:.2f})")
+    print(f"출력 불일치: {len(summary['mismatches'])}개")
+    for path in summary['mismatches']:
+        print(f"  - {path}")
+    print("=" * 50)
+
+    if summary['mismatches']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+크롤링 스케줄러 (모든 크롤링 경로가 공유하는 우선순위 기반 동시 실행 제어)
+
+RAG 크롤링, LLM 도구 크롤링, Daily Crawling이 같은 MCP 서버/브라우저 용량을 나눠 쓰도록
+전체 동시 실행 수(settings.crawl_scheduler_capacity)를 하나의 스케줄러가 관리합니다.
+
+- 우선순위 클래스: interactive(/rag-crawl) > llm_tool(LLM 도구 호출) > batch(/daily-crawling)
+- 슬롯이 비면 높은 클래스의 대기자부터 배정하고, 같은 클래스 안에서는 priority가 높은 순 → 먼저 온 순
+- 클래스별 상한(settings.crawl_scheduler_class_limits): batch 상한을 capacity보다 작게 두면
+  나머지 슬롯은 항상 interactive/llm_tool 몫으로 남아 대화형 요청이 야간 배치 뒤에 줄 서지 않음
+- 상위 클래스 대기자가 없으면 batch가 상한까지 남는 용량을 모두 사용
+
+사용 예:
+    async with crawl_scheduler.slot("batch", priority=input_url.priority or 0):
+        await crawl(...)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 클래스 (앞쪽일수록 우선)
+INTERACTIVE = "interactive"
+LLM_TOOL = "llm_tool"
+BATCH = "batch"
+PRIORITY_CLASSES = (INTERACTIVE, LLM_TOOL, BATCH)
+
+# 대기 시간 통계에 사용할 최근 표본 수
+_WAIT_SAMPLES = 512
+
+
+@dataclass(order=True)
+class _Waiter:
+    sort_key: Tuple[int, int]
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class _ClassState:
+    """우선순위 클래스별 대기열/실행 수/대기 시간 통계"""
+
+    def __init__(self) -> None:
+        self.waiters: List[_Waiter] = []
+        self.running = 0
+        self.completed = 0
+        self.waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self.max_wait = 0.0
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for w in self.waiters if not w.future.done())
+
+    def record_wait(self, seconds: float) -> None:
+        self.waits.append(seconds)
+        self.max_wait = max(self.max_wait, seconds)
+
+
+class CrawlScheduler:
+    """전역 크롤링 스케줄러 (프로세스당 하나)"""
+
+    def __init__(self) -> None:
+        self._classes: Dict[str, _ClassState] = {name: _ClassState() for name in PRIORITY_CLASSES}
+        self._running = 0
+        self._seq = itertools.count()
+
+    @property
+    def capacity(self) -> int:
+        return max(1, settings.crawl_scheduler_capacity)
+
+    def _limit(self, priority_class: str) -> int:
+        limit = settings.crawl_scheduler_class_limits.get(priority_class, self.capacity)
+        return max(1, min(self.capacity, limit))
+
+    def _state(self, priority_class: str) -> _ClassState:
+        state = self._classes.get(priority_class)
+        if state is None:
+            raise ValueError(f"Unknown crawl priority class: {priority_class}")
+        return state
+
+    def _has_slot(self, priority_class: str) -> bool:
+        return self._running < self.capacity and self._classes[priority_class].running < self._limit(priority_class)
+
+    def _grant(self, priority_class: str, waited: float) -> None:
+        state = self._classes[priority_class]
+        state.running += 1
+        self._running += 1
+        state.record_wait(waited)
+
+    def _dispatch(self) -> None:
+        """빈 슬롯을 높은 클래스의 대기자부터 배정"""
+        for priority_class in PRIORITY_CLASSES:
+            state = self._classes[priority_class]
+            while state.waiters and self._has_slot(priority_class):
+                waiter = heapq.heappop(state.waiters)
+                if waiter.future.done():  # 대기 중 취소됨
+                    continue
+                self._grant(priority_class, time.monotonic() - waiter.enqueued_at)
+                waiter.future.set_result(None)
+
+    def _must_queue(self, priority_class: str) -> bool:
+        """
+        빈 슬롯이 없거나 같은 클래스의 대기자가 있으면 줄을 섬
+
+        다른 클래스의 대기자는 release 때마다 _dispatch로 배정되므로,
+        남아 있는 상위 클래스 대기자는 클래스 상한에 걸린 경우뿐이라 하위 클래스가 빈 슬롯을 써도 됨
+        """
+        return not self._has_slot(priority_class) or self._classes[priority_class].queued > 0
+
+    async def acquire(self, priority_class: str, priority: int = 0) -> None:
+        """슬롯 획득 (priority는 같은 클래스 안에서의 순서, 높을수록 먼저)"""
+        state = self._state(priority_class)
+        if not self._must_queue(priority_class):
+            self._grant(priority_class, 0.0)
+            return
+
+        waiter = _Waiter(
+            sort_key=(-priority, next(self._seq)),
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        heapq.heappush(state.waiters, waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # 배정 직후 취소된 경우 슬롯 반환
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(priority_class)
+            raise
+
+    def release(self, priority_class: str) -> None:
+        state = self._state(priority_class)
+        state.running -= 1
+        state.completed += 1
+        self._running -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority_class: str, priority: int = 0) -> AsyncIterator[None]:
+        await self.acquire(priority_class, priority)
+        try:
+            yield
+        finally:
+            self.release(priority_class)
+
+    def stats(self) -> Dict[str, Any]:
+        """클래스별 실행 수/대기열 길이/대기 시간 (최근 표본 기준)"""
+        classes = {}
+        for priority_class, state in self._classes.items():
+            waits = sorted(state.waits)
+            classes[priority_class] = {
+                "limit": self._limit(priority_class),
+                "running": state.running,
+                "queued": state.queued,
+                "completed": state.completed,
+                "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "p95_wait_ms": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+                "max_wait_ms": round(state.max_wait * 1000, 1),
+            }
+        return {
+            "capacity": self.capacity,
+            "running": self._running,
+            "queued": sum(c["queued"] for c in classes.values()),
+            "classes": classes,
+        }
+
+
+# 싱글톤 인스턴스
+crawl_scheduler = CrawlScheduler()
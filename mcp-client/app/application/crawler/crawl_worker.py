@@ -0,0 +1,154 @@
+"""
+DB lease 기반 Daily Crawling 작업 큐 워커
+
+작업 큐 모드(mode="queue")의 Daily Crawling은 URL별 작업을 crawl_work_items 테이블에 넣고,
+각 프로세스/파드의 워커가 작업을 lease하여 크롤링 + 전처리한 결과를 다시 DB에 기록합니다.
+menu_links 반영과 JSON 출력은 실행을 만든 프로세스(코디네이터)가 모든 작업이 끝난 뒤 한 번에 수행합니다.
+
+- lease: settings.crawl_queue_lease_seconds 동안 유효, 처리 중에는 crawl_queue_heartbeat_interval 마다 연장
+- 워커가 죽으면 lease 만료 후 다른 워커가 다시 가져감 (최대 crawl_queue_max_attempts 회)
+- settings.crawl_queue_worker_enabled=True 인 인스턴스는 진행 중인 모든 실행을 폴링하며 작업에 참여
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import settings
+from app.domains.crawler.entities.crawl_work_item import CrawlWorkItem
+from app.domains.crawler.entities.input_url import InputUrl
+from app.domains.crawler.repositories.crawl_work_queue_repository import crawl_work_queue_repository
+from app.domains.crawler.repositories.input_url_repository import input_url_repository
+
+logger = logging.getLogger(__name__)
+
+# 작업 처리 함수: InputUrl → {"success": bool, "processed_result": dict} 또는 {"success": False, "error": str}
+ProcessItem = Callable[[InputUrl], Awaitable[Dict[str, Any]]]
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def _to_json_safe(value: Any) -> Any:
+    """JSON 컬럼에 저장할 수 있도록 변환 (datetime 등은 문자열로)"""
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+class CrawlQueueWorker:
+    """작업 큐 워커 (프로세스당 하나)"""
+
+    def __init__(self, process_item: ProcessItem, worker_id: Optional[str] = None) -> None:
+        self.process_item = process_item
+        self.worker_id = worker_id or _default_worker_id()
+        self._background: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    # ----------------------------------------------------------------------------------
+    # Item processing
+    # ----------------------------------------------------------------------------------
+    async def _heartbeat(self, item_id: int) -> None:
+        interval = settings.crawl_queue_heartbeat_interval
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                extended = await crawl_work_queue_repository.heartbeat(
+                    self.worker_id, [item_id], settings.crawl_queue_lease_seconds
+                )
+                if not extended:
+                    logger.warning(f"⚠️ Lease lost for work item {item_id} ({self.worker_id})")
+                    return
+            except Exception as e:
+                logger.debug(f"Heartbeat failed for work item {item_id}: {e}")
+
+    async def _run_item(self, item: CrawlWorkItem) -> bool:
+        """lease한 작업 하나 처리 후 결과 기록"""
+        heartbeat = asyncio.create_task(self._heartbeat(item.id))
+        try:
+            input_url = await input_url_repository.get_by_id(item.input_url_id)
+            if input_url is None:
+                outcome: Dict[str, Any] = {"success": False, "error": f"input_url {item.input_url_id} not found"}
+            else:
+                try:
+                    outcome = await self.process_item(input_url)
+                except Exception as exc:
+                    outcome = {"success": False, "error": str(exc)}
+        finally:
+            heartbeat.cancel()
+
+        if outcome.get("success"):
+            return await crawl_work_queue_repository.complete(
+                item.id, self.worker_id, True, result=_to_json_safe(outcome.get("processed_result"))
+            )
+        return await crawl_work_queue_repository.complete(
+            item.id, self.worker_id, False, error=outcome.get("error") or "알 수 없는 오류"
+        )
+
+    async def drain(self, run_id: str, concurrency: int) -> int:
+        """
+        실행의 작업을 lease할 수 없을 때까지 처리
+
+        다른 워커가 lease 중인 작업은 기다리지 않고 반환합니다.
+
+        Returns:
+            이 워커가 완료 기록한 작업 수
+        """
+        completed = 0
+
+        async def lane() -> None:
+            nonlocal completed
+            while not self._stopping.is_set():
+                items = await crawl_work_queue_repository.lease(
+                    run_id,
+                    self.worker_id,
+                    batch_size=1,
+                    lease_seconds=settings.crawl_queue_lease_seconds,
+                    max_attempts=settings.crawl_queue_max_attempts,
+                )
+                if not items:
+                    return
+                if await self._run_item(items[0]):
+                    completed += 1
+
+        await asyncio.gather(*(lane() for _ in range(max(1, concurrency))))
+        return completed
+
+    # ----------------------------------------------------------------------------------
+    # Background worker (다른 인스턴스가 만든 실행에 참여)
+    # ----------------------------------------------------------------------------------
+    async def run_forever(self) -> None:
+        logger.info(f"👷 Crawl queue worker started: {self.worker_id}")
+        while not self._stopping.is_set():
+            try:
+                for run_id in await crawl_work_queue_repository.list_open_run_ids():
+                    done = await self.drain(run_id, settings.crawl_queue_worker_concurrency)
+                    if done:
+                        logger.info(f"👷 {self.worker_id} processed {done} items of run {run_id}")
+            except Exception as e:
+                logger.error(f"❌ Crawl queue worker error: {e}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.crawl_queue_poll_interval)
+            except asyncio.TimeoutError:
+                pass
+        logger.info(f"👷 Crawl queue worker stopped: {self.worker_id}")
+
+    def start(self) -> None:
+        if self._background is None or self._background.done():
+            self._stopping.clear()
+            self._background = asyncio.create_task(self.run_forever())
+
+    async def stop(self, grace: float = 10.0) -> None:
+        """중지 (grace 초 안에 끝나지 않은 작업은 취소, 해당 lease는 만료 후 다른 워커가 재처리)"""
+        self._stopping.set()
+        if self._background is not None:
+            try:
+                await asyncio.wait_for(self._background, timeout=grace)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+            except Exception as e:
+                logger.debug(f"Crawl queue worker stop error: {e}")
+            self._background = None
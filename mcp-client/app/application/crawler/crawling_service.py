@@ -5,21 +5,24 @@ import logging
 import re
 import uuid
 from datetime import datetime
-from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from sqlalchemy import select
-
+from app.application.crawler.crawl_scheduler import INTERACTIVE, crawl_scheduler
+from app.application.crawler.snapshot_store import snapshot_store
 from app.application.crawler.tools_client import crawler_tools
+from app.application.crawler.url_canonicalizer import canonical_key, canonicalize_url, refresh_menu_link_index
+from app.application.crawler.task_events import TERMINAL_EVENT_TYPES, task_event_bus
+from app.application.crawler.task_store import TaskStore
 from app.application.crawler.page_handlers import (
+    fetch_context,
     route_url,
-    get_handler_for_url,
+    plan_url,
     page_handler_client,
 )
+from app.domains.crawler.repositories.canonical_url_repository import canonical_url_repository
 from app.domains.menu.entities.menu_link import MenuLink
 from app.models import CrawlingResult, TaskResult, TaskStatus
-from app.shared.database.base import get_database_session
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +33,16 @@ MENU_PATH_DELIMITER = "^"
 # convert_to_json_format 기본 날짜 값
 JSON_START_DATE = "1900-01-01"
 JSON_END_DATE = "2999-12-31"
-# 마크다운 저장 경로
-MARKDOWN_RESULT_DIR = Path(__file__).parent / "result"
+# 스냅샷 manifest에 한 번에 기록할 마크다운 항목 수 (URL마다 manifest 전체를 다시 쓰지 않도록 모아서 기록)
+SNAPSHOT_FLUSH_BATCH = 50
 
 
 class RAGCrawlingService:
     """RAG 스크래핑 서비스 - rag-scraping의 app.py 워크플로우 기반"""
     
     def __init__(self) -> None:
-        self.tasks: Dict[str, TaskResult] = {}
-        self.task_streams: Dict[str, asyncio.Queue] = {}
+        self.store = TaskStore("rag")
+        self._snapshot_entries: Dict[str, List[Dict[str, Any]]] = {}  # task_id → manifest에 아직 기록하지 않은 항목
         
     # ----------------------------------------------------------------------------------
     # Public APIs
@@ -51,60 +54,52 @@ class RAGCrawlingService:
             status=TaskStatus.PENDING,
             createdAt=datetime.now().isoformat(),
         )
-        self.tasks[task_id] = task_result
-        self.task_streams[task_id] = asyncio.Queue()
+        self.store.put(task_result)
+        task_event_bus.open(task_id)
         logger.info("✅ RAG Task created: %s", task_id)
         asyncio.create_task(self._process_rag_task(task_id, urls_input))
         return task_id
     
-    def get_task(self, task_id: str) -> Optional[TaskResult]:
-        return self.tasks.get(task_id)
+    async def get_task(self, task_id: str) -> Optional[TaskResult]:
+        return await self.store.get(task_id)
     
-    async def get_task_stream(self, task_id: str) -> AsyncGenerator[str, None]:
-        logger.info("🔍 RAG SSE stream requested for task: %s", task_id)
-        if task_id not in self.task_streams:
-            logger.error("❌ RAG Task stream not found: %s", task_id)
-            yield f"data: {json.dumps({'type': 'error', 'data': {'message': 'Task not found'}})}\n\n"
-            return
+    async def get_task_stream(self, task_id: str, last_event_id: Optional[int] = None) -> AsyncGenerator[str, None]:
+        logger.info("🔍 RAG SSE stream requested for task: %s (last_event_id=%s)", task_id, last_event_id)
+        if not task_event_bus.has_channel(task_id):
+            if self.store.is_live(task_id):
+                logger.info("🔄 Re-creating RAG event channel for active task: %s", task_id)
+                task_event_bus.open(task_id)
+            else:
+                # 종료/중단된 태스크는 종료 이벤트를 보내 클라이언트가 대기하지 않도록 함
+                logger.info("ℹ️ No active RAG stream for task: %s", task_id)
+                yield f"data: {json.dumps(await self.store.terminal_event(task_id), ensure_ascii=False)}\n\n"
+                return
             
         # 초기 연결 알림
         yield f"data: {json.dumps({'type': 'connected', 'data': {'message': 'RAG Stream connected'}})}\n\n"
-        queue = self.task_streams[task_id]
         try:
-            while True:
-                try:
-                    message = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield f"data: {message}\n\n"
-                    try:
-                        payload = json.loads(message)
-                        if payload.get("type") in {"final", "complete", "error"}:
-                            await asyncio.sleep(0.5)
-                            break
-                    except json.JSONDecodeError:
-                        logger.debug("SSE message is not JSON: %s", message)
-                    
-                    task = self.tasks.get(task_id)
-                    if task and task.status in {TaskStatus.COMPLETED, TaskStatus.FAILED}:
-                        break
-                except asyncio.TimeoutError:
-                    await self._send_update(task_id, "heartbeat", {})
-                    task = self.tasks.get(task_id)
-                    if task and task.status in {TaskStatus.COMPLETED, TaskStatus.FAILED}:
-                        await self._send_update(task_id, "complete", {"message": "RAG 작업 완료"})
-                        break
+            async for event in task_event_bus.subscribe(task_id, last_event_id, heartbeat=30.0):
+                if event is None:
+                    yield f"data: {json.dumps({'type': 'heartbeat', 'data': {}})}\n\n"
+                    continue
+                yield event.to_sse()
+                if event.type in TERMINAL_EVENT_TYPES:
+                    await asyncio.sleep(0.5)
+                    break
         except Exception as exc:  # pragma: no cover - SSE 에러 처리
             logger.error("RAG Task stream error %s: %s", task_id, exc)
-            await self._send_update(task_id, "error", {"message": str(exc)})
+            yield f"data: {json.dumps({'type': 'error', 'data': {'message': str(exc)}})}\n\n"
         finally:
-            logger.info("Cleaning up RAG task stream: %s", task_id)
-            self.task_streams.pop(task_id, None)
+            logger.info("RAG task stream closed: %s", task_id)
 
     # ----------------------------------------------------------------------------------
     # Core workflow
     # ----------------------------------------------------------------------------------
     async def _process_rag_task(self, task_id: str, urls_input: str) -> None:
         try:
-            self.tasks[task_id].status = TaskStatus.RUNNING
+            task = self.store.peek(task_id)
+            task.status = TaskStatus.RUNNING
+            await self.store.save(task)
             await self._send_update(task_id, "status", {"message": "RAG 크롤링 작업을 시작합니다...", "status": "active"})
 
             urls = await self._extract_urls_from_input(urls_input)
@@ -127,17 +122,24 @@ class RAGCrawlingService:
             json_results = await self._convert_to_json(task_id, processed_results, url_menu_map)
 
             result = CrawlingResult(json_data=json_results)
-            self.tasks[task_id].result = result
-            self.tasks[task_id].status = TaskStatus.COMPLETED
-            self.tasks[task_id].completedAt = datetime.now().isoformat()
+            task.result = result
+            task.status = TaskStatus.COMPLETED
+            task.completedAt = datetime.now().isoformat()
+            await self.store.save(task)
             await self._send_update(task_id, "final", result.model_dump())
             await self._send_update(task_id, "complete", {"message": f"RAG 크롤링 작업이 완료되었습니다. 각 URL마다 마크다운 파일이 개별 저장되었습니다"})
         except Exception as exc:  # pragma: no cover
             logger.error("RAG Task %s failed: %s", task_id, exc)
-            self.tasks[task_id].status = TaskStatus.FAILED
-            self.tasks[task_id].error = str(exc)
-            self.tasks[task_id].completedAt = datetime.now().isoformat()
+            task = self.store.peek(task_id)
+            if task is not None:
+                task.status = TaskStatus.FAILED
+                task.error = str(exc)
+                task.completedAt = datetime.now().isoformat()
+                await self.store.save(task)
             await self._send_update(task_id, "error", {"message": str(exc)})
+        finally:
+            await self._flush_snapshot_entries(task_id)
+            task_event_bus.close(task_id)
             
     # ----------------------------------------------------------------------------------
     # URL 처리
@@ -148,26 +150,30 @@ class RAGCrawlingService:
         ordered_unique: List[str] = []
         seen: set[str] = set()
 
+        # 표기만 다른 같은 페이지(쿼리 순서, 추적 파라미터, 끝 슬래시, 모바일 호스트)는 처음 나온 URL만 크롤링
         for url in cleaned_regex:
-            if url and url not in seen and url.startswith(("http://", "https://")):
-                ordered_unique.append(url)
-                seen.add(url)
+            if not url or not url.startswith(("http://", "https://")):
+                continue
+            canonical = canonicalize_url(url)
+            if canonical in seen:
+                logger.info("중복 URL 제외: %s (%s)", url, canonical)
+                continue
+            ordered_unique.append(url)
+            seen.add(canonical)
 
         return ordered_unique
             
     async def _build_url_menu_map(self, urls: List[str]) -> Dict[str, MenuLink]:
+        """정규 URL 기준 메뉴 매핑 (canonical_urls 색인의 해시로 조회, 키는 정규 URL)"""
         if not urls:
             return {}
-        unique_urls = list(dict.fromkeys(urls))
-        url_map: Dict[str, MenuLink] = {}
-        async for session in get_database_session():
-            stmt = select(MenuLink).where(MenuLink.pc_url.in_(unique_urls))
-            result = await session.execute(stmt)
-            for row in result.scalars().all():
-                if row.pc_url:
-                    url_map[row.pc_url] = row
-            break
-        logger.info("메뉴 매핑 완료: %s/%s", len(url_map), len(unique_urls))
+        canonical_urls = list(dict.fromkeys(canonicalize_url(url) for url in urls))
+        await refresh_menu_link_index()
+        links = await canonical_url_repository.find_menu_links([canonical_key(url) for url in canonical_urls])
+        url_map: Dict[str, MenuLink] = {
+            url: links[canonical_key(url)][0] for url in canonical_urls if canonical_key(url) in links
+        }
+        logger.info("메뉴 매핑 완료: %s/%s", len(url_map), len(canonical_urls))
         return url_map
 
     # ----------------------------------------------------------------------------------
@@ -180,62 +186,65 @@ class RAGCrawlingService:
         for idx, url in enumerate(urls, start=1):
             logger.info(f"📄 URL {idx}/{len(urls)} 처리 시작: {url}")
             await self._send_update(task_id, "status", {"message": f"크롤링 진행: {idx}/{len(urls)} - {url}", "status": "active"})
-            try:
-                # 1. 먼저 page_handlers에서 매칭되는 핸들러 확인
-                handler_info = get_handler_for_url(url)
-                
-                if handler_info:
-                    # 전용 핸들러가 있는 경우 route_url 사용
-                    pattern, handler_func = handler_info
-                    logger.info(f"🎯 전용 핸들러 발견: {handler_func.__name__} for {url}")
-                    await self._send_update(
-                        task_id, 
-                        "status", 
-                        {"message": f"전용 핸들러 실행: {handler_func.__name__}", "status": "active"}
-                    )
-                    
-                    handler_result = await route_url(url, page_handler_client)
+            # 핸들러와 기본 스크래핑이 같은 페이지 로드 결과를 공유 (핸들러 실패 시 재로드 방지)
+            with fetch_context(url):
+                try:
+                    # 1. 먼저 page_handlers에서 매칭되는 핸들러 확인
+                    plan = plan_url(url)
                     
-                    if handler_result:
-                        # 핸들러 결과 처리 - menus/datas 구조인 경우
-                        if "datas" in handler_result and handler_result.get("datas"):
-                            # 목록 핸들러 결과 (여러 항목 반환)
-                            for data_item in handler_result["datas"]:
+                    if plan.spec:
+                        # 전용 핸들러가 있는 경우 route_url 사용
+                        handler_name = plan.handler_name
+                        logger.info(f"🎯 전용 핸들러 발견: {handler_name} for {url}")
+                        await self._send_update(
+                            task_id, 
+                            "status", 
+                            {"message": f"전용 핸들러 실행: {handler_name}", "status": "active"}
+                        )
+                        
+                        async with crawl_scheduler.slot(INTERACTIVE):
+                            handler_result = await route_url(url, page_handler_client, plan=plan)
+                        
+                        if handler_result:
+                            # 핸들러 결과 처리 - menus/datas 구조인 경우
+                            if "datas" in handler_result and handler_result.get("datas"):
+                                # 목록 핸들러 결과 (여러 항목 반환)
+                                for data_item in handler_result["datas"]:
+                                    result_data = {
+                                        "url": data_item.get("url", url),
+                                        "title": data_item.get("title"),
+                                        "html_content": data_item.get("html", ""),
+                                        "markdown": data_item.get("markdown", ""),
+                                        "special_processed": True,
+                                        "handler_name": handler_name,
+                                    }
+                                    results.append(result_data)
+                                    await self._save_single_markdown_file(task_id, result_data, idx, len(urls))
+                                logger.info(f"✅ 핸들러 처리 완료: {len(handler_result['datas'])}개 항목")
+                            else:
+                                # 단일 결과 핸들러
                                 result_data = {
-                                    "url": data_item.get("url", url),
-                                    "title": data_item.get("title"),
-                                    "html_content": data_item.get("html", ""),
-                                    "markdown": data_item.get("markdown", ""),
+                                    "url": url,
+                                    "title": handler_result.get("title"),
+                                    "html_content": handler_result.get("html", ""),
+                                    "markdown": handler_result.get("markdown", ""),
                                     "special_processed": True,
-                                    "handler_name": handler_func.__name__,
+                                    "handler_name": handler_name,
                                 }
                                 results.append(result_data)
+                                logger.info(f"✅ URL {idx}/{len(urls)} 핸들러 처리 성공: {url}")
                                 await self._save_single_markdown_file(task_id, result_data, idx, len(urls))
-                            logger.info(f"✅ 핸들러 처리 완료: {len(handler_result['datas'])}개 항목")
                         else:
-                            # 단일 결과 핸들러
-                            result_data = {
-                                "url": url,
-                                "title": handler_result.get("title"),
-                                "html_content": handler_result.get("html", ""),
-                                "markdown": handler_result.get("markdown", ""),
-                                "special_processed": True,
-                                "handler_name": handler_func.__name__,
-                            }
-                            results.append(result_data)
-                            logger.info(f"✅ URL {idx}/{len(urls)} 핸들러 처리 성공: {url}")
-                            await self._save_single_markdown_file(task_id, result_data, idx, len(urls))
+                            # 핸들러 실패 시 기본 스크래핑으로 폴백
+                            logger.warning(f"⚠️ 핸들러 실패, 기본 스크래핑으로 폴백: {url}")
+                            await self._scrape_with_default_tool(task_id, url, idx, len(urls), results)
                     else:
-                        # 핸들러 실패 시 기본 스크래핑으로 폴백
-                        logger.warning(f"⚠️ 핸들러 실패, 기본 스크래핑으로 폴백: {url}")
+                        # 2. 전용 핸들러가 없는 경우 기본 MCP 스크래핑
                         await self._scrape_with_default_tool(task_id, url, idx, len(urls), results)
-                else:
-                    # 2. 전용 핸들러가 없는 경우 기본 MCP 스크래핑
-                    await self._scrape_with_default_tool(task_id, url, idx, len(urls), results)
-                    
-            except Exception as exc:  # pragma: no cover
-                logger.error(f"❌ URL {idx}/{len(urls)} 처리 실패: {url} - {exc}")
-                results.append({"url": url, "error": str(exc), "success": False})
+                        
+                except Exception as exc:  # pragma: no cover
+                    logger.error(f"❌ URL {idx}/{len(urls)} 처리 실패: {url} - {exc}")
+                    results.append({"url": url, "error": str(exc), "success": False})
         
         logger.info(f"✅ 스크래핑 완료: 총 {len(results)}개 결과 (성공: {len([r for r in results if not r.get('error')])}개)")
         return results
@@ -250,7 +259,8 @@ class RAGCrawlingService:
     ) -> None:
         """기본 MCP 스크래핑 도구를 사용하여 URL 처리"""
         try:
-            tool_result = await crawler_tools.scrape(url)
+            async with crawl_scheduler.slot(INTERACTIVE):
+                tool_result = await crawler_tools.scrape(url)
             if tool_result.get("success"):
                 result_data = {
                     "url": url,
@@ -318,7 +328,7 @@ class RAGCrawlingService:
                 )
                 continue
                 
-            menu = url_menu_map.get(result["url"])
+            menu = url_menu_map.get(canonicalize_url(result["url"]))
             hierarchy, title = await self._resolve_hierarchy_and_title(result, menu)
             markdown_content = result.get("processed_markdown", "")
             html_content = result.get("html_content", "")
@@ -437,14 +447,9 @@ class RAGCrawlingService:
     # SSE helper
     # ----------------------------------------------------------------------------------
     async def _send_update(self, task_id: str, event_type: str, data: Dict[str, Any]) -> None:
-        queue = self.task_streams.get(task_id)
-        if not queue:
-            return
-        message = json.dumps({"type": event_type, "data": data, "timestamp": datetime.now().isoformat()}, ensure_ascii=False)
-        try:
-            await queue.put(message)
-        except Exception as exc:  # pragma: no cover
-            logger.error("[RAG SSE] Failed to send update for task %s: %s", task_id, exc)
+        if event_type == "status":
+            await self.store.record_progress(task_id, data)
+        await task_event_bus.publish(task_id, event_type, data)
 
     # ----------------------------------------------------------------------------------
     # Markdown saving helpers
@@ -463,31 +468,60 @@ class RAGCrawlingService:
             name = re.sub(r"[^0-9A-Za-z._-]", "_", name)
         return name[:80] or "untitled"
 
-    def _save_markdown_file(self, url: str, title: Optional[str], markdown_content: str) -> Optional[str]:
-        """마크다운 파일 저장 후 경로 반환"""
+    async def _save_markdown_file(
+        self,
+        task_id: str,
+        url: str,
+        title: Optional[str],
+        markdown_content: str,
+        html_content: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        마크다운(원본 HTML 포함)을 스냅샷 저장소에 저장 후 해시 반환 (같은 내용은 다시 쓰지 않음)
+
+        압축/파일 쓰기는 이벤트 루프를 막지 않도록 스레드에서 수행하고,
+        manifest 항목은 모아 두었다가 SNAPSHOT_FLUSH_BATCH개마다 또는 태스크 종료 시 한 번에 기록합니다.
+        """
         if not markdown_content.strip():
             logger.warning("⚠️ 마크다운 내용이 비어있어 저장을 건너뜁니다: %s", url)
             return None
 
+        def write() -> Dict[str, Any]:
+            digest = snapshot_store.put(markdown_content)
+            entry = {
+                "url": url,
+                "title": title if title and title != "None" else None,
+                "name": f"{self._sanitize_filename(url, title)}.md",
+                "extracted_at": datetime.now().isoformat(),
+                "html": snapshot_store.put(html_content),
+                "markdown": digest,
+            }
+            return entry
+
         try:
-            MARKDOWN_RESULT_DIR.mkdir(parents=True, exist_ok=True)
-            filename = f"{self._sanitize_filename(url, title)}_{datetime.now():%Y%m%d_%H%M%S}.md"
-            file_path = MARKDOWN_RESULT_DIR / filename
-            heading = title if title and title != "None" else url
-            payload = (
-                f"# {heading}\n\n"
-                f"**URL:** {url}\n\n"
-                f"**추출 시간:** {datetime.now():%Y-%m-%d %H:%M:%S}\n\n"
-                "---\n\n"
-                f"{markdown_content}\n"
-            )
-            file_path.write_text(payload, encoding="utf-8")
-            logger.info("✅ 마크다운 파일 저장 완료: %s", file_path)
-            return str(file_path)
+            entry = await asyncio.to_thread(write)
+            digest = entry["markdown"]
+            logger.info("✅ 마크다운 스냅샷 저장 완료: %s (%s)", entry["name"], digest[:12])
         except Exception as exc:  # pragma: no cover
             logger.error("❌ 마크다운 파일 저장 실패 (%s): %s", url, exc)
             return None
 
+        pending = self._snapshot_entries.setdefault(task_id, [])
+        pending.append(entry)
+        if len(pending) >= SNAPSHOT_FLUSH_BATCH:
+            await self._flush_snapshot_entries(task_id)
+        return digest
+
+    async def _flush_snapshot_entries(self, task_id: str) -> None:
+        """모아 둔 마크다운 항목을 실행 manifest에 한 번에 기록 (배치가 찼을 때와 태스크 종료 시)"""
+        entries = self._snapshot_entries.pop(task_id, None)
+        if not entries:
+            return
+        try:
+            await asyncio.to_thread(snapshot_store.add_entries, task_id, "rag", entries)
+        except Exception as exc:  # pragma: no cover
+            logger.error("❌ 스냅샷 manifest 기록 실패 (%s, %d entries): %s", task_id, len(entries), exc)
+
     async def _save_single_markdown_file(self, task_id: str, result_data: Dict[str, Any], idx: int, total: int) -> None:
         """단일 결과를 즉시 저장"""
         url = result_data.get("url", "")
@@ -497,9 +531,9 @@ class RAGCrawlingService:
         status_prefix = f"{idx}/{total}"
         await self._send_update(task_id, "status", {"message": f"마크다운 저장 중: {status_prefix} - {title or url}", "status": "active"})
 
-        file_path = self._save_markdown_file(url, title, markdown_content)
-        if file_path:
-            logger.info("✅ %s 마크다운 저장 완료: %s", status_prefix, file_path)
+        digest = await self._save_markdown_file(task_id, url, title, markdown_content, result_data.get("html_content"))
+        if digest:
+            logger.info("✅ %s 마크다운 저장 완료: %s", status_prefix, digest[:12])
             await self._send_update(task_id, "status", {"message": f"✅ 저장 완료: {status_prefix}", "status": "active"})
         else:
             logger.warning("⚠️ %s 마크다운 저장 실패", status_prefix)
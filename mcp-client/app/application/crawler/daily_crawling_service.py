@@ -4,38 +4,69 @@ Daily Crawling Service
 input_urls 테이블에서 URL을 조회하여 크롤링하고,
 전처리 후 menu_links 테이블에 업데이트합니다.
 최종 결과는 data_*.json 형식으로 출력됩니다.
+원본 HTML/마크다운/전처리 텍스트와 JSON 출력은 스냅샷 저장소에 내용 해시 단위로 저장됩니다 (snapshot_store.py 참고).
+문서별 status(new/modified/unchanged/deleted)는 이전 실행의 문서 지문과 비교해 결정됩니다.
+재방문 시각 전이라 크롤링하지 않은 활성 URL의 문서는 이전 실행 결과를 unchanged로 출력에 포함합니다 (출력은 항상 전체 문서).
+같은 실행에서 정규 URL이 같은 input_urls는 한 번만 크롤링하고, menu_path가 다른 URL은 그 결과를 자기 menu_path로 다시 전처리해 사용합니다 (url_canonicalizer.py 참고).
 """
 import asyncio
 import json
 import logging
 import re
+import time
 import unicodedata
 import uuid
 from datetime import datetime
-from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import select, or_
 
+from app.config import settings
 from app.application.crawler.tools_client import crawler_tools
+from app.application.crawler.crawl_scheduler import BATCH, crawl_scheduler
+from app.application.crawler.crawl_worker import CrawlQueueWorker
+from app.application.crawler.revisit_policy import record_observations, url_fingerprint
+from app.application.crawler.run_checkpoint import RESUMABLE_STATUSES, RunCheckpoint, list_checkpoints
+from app.application.crawler.snapshot_store import content_hash, snapshot_store
+from app.application.crawler.task_events import TERMINAL_EVENT_TYPES, task_event_bus
+from app.application.crawler.task_store import TaskStore
+from app.application.crawler.url_canonicalizer import (
+    canonical_key,
+    canonicalize_url,
+    group_by_canonical,
+    index_entry,
+    mobile_url_for,
+    refresh_menu_link_index,
+)
 from app.application.crawler.page_handlers import (
+    HandlerPlan,
+    fetch_context,
     route_url,
-    get_handler_for_url,
+    plan_url,
+    plan_urls,
     page_handler_client,
+    start_resource_block_stats,
 )
 from app.application.crawler.preprocess import preprocess_content
+from app.domains.crawler.entities.canonical_url import CanonicalUrl
 from app.domains.crawler.entities.input_url import InputUrl
 from app.domains.crawler.repositories.input_url_repository import input_url_repository
+from app.domains.crawler.repositories.crawl_work_queue_repository import crawl_work_queue_repository
+from app.domains.crawler.repositories.canonical_url_repository import SOURCE_MENU_LINK
 from app.domains.menu.entities.menu_link import MenuLink
-from app.models import TaskResult, TaskStatus, CrawlingResult, FailedItem
+from app.models import TaskResult, TaskStatus, CrawlingResult, FailedItem, PartialItem
 from app.shared.database.base import get_database_session
 
 logger = logging.getLogger(__name__)
 
-# 결과 저장 경로
-RESULT_DIR = Path(__file__).parent / "result"
 JSON_START_DATE = "1900-01-01"
 JSON_END_DATE = "2999-12-31"
+# 문서 변경 상태 (JSON 출력의 status)
+STATUS_NEW = "new"
+STATUS_MODIFIED = "modified"
+STATUS_UNCHANGED = "unchanged"
+STATUS_DELETED = "deleted"
+CHANGE_STATUSES = (STATUS_NEW, STATUS_MODIFIED, STATUS_UNCHANGED, STATUS_DELETED)
 
 
 def _setup_asyncio_exception_handler():
@@ -75,10 +106,13 @@ class DailyCrawlingService:
     """
     
     def __init__(self) -> None:
-        self.tasks: Dict[str, TaskResult] = {}
-        self.task_streams: Dict[str, asyncio.Queue] = {}
+        self.store = TaskStore("daily")
         self._collected_results: Dict[str, List[Dict[str, Any]]] = {}  # task별 결과 수집
+        self._snapshot_entries: Dict[str, List[Dict[str, Any]]] = {}  # task별 스냅샷 저장 대상 (원본 내용)
         self._failed_items: Dict[str, List[FailedItem]] = {}  # task별 실패 내역 수집
+        self._checkpoints: Dict[str, RunCheckpoint] = {}  # 실행 중 task별 체크포인트
+        # 작업 큐 모드(mode="queue")에서 이 프로세스가 작업을 lease하여 처리하는 워커
+        self.queue_worker = CrawlQueueWorker(self._crawl_work_item)
     
     # ----------------------------------------------------------------------------------
     # Public APIs
@@ -96,11 +130,12 @@ class DailyCrawlingService:
         Daily Crawling 태스크 생성
         
         Args:
-            force_recrawl: 이미 성공한 URL도 재크롤링
+            force_recrawl: 재방문 주기와 관계없이 모든 활성 URL 크롤링 (False면 재방문 시각이 된 URL만)
             limit: 최대 URL 수 (url_ids가 있으면 무시)
             url_ids: 특정 input_urls ID 목록 (테스트용)
-            mode: 실행 모드 ("sequential" 또는 "parallel")
-            concurrency: 병렬 실행 시 동시 처리 수 (1~50, 기본값: 3)
+            mode: 실행 모드 ("sequential", "parallel" 또는 "queue")
+                - queue: URL별 작업을 DB 작업 큐에 넣고 여러 워커(프로세스/파드)가 lease하여 처리
+            concurrency: 병렬/큐 실행 시 이 프로세스의 동시 처리 수 (1~50, 기본값: 3)
             update_menu_links: menu_links DB 업데이트 여부 (기본값 True)
             
         Returns:
@@ -112,9 +147,10 @@ class DailyCrawlingService:
             status=TaskStatus.PENDING,
             createdAt=datetime.now().isoformat(),
         )
-        self.tasks[task_id] = task_result
-        self.task_streams[task_id] = asyncio.Queue()
+        self.store.put(task_result)
+        task_event_bus.open(task_id)
         self._collected_results[task_id] = []
+        self._snapshot_entries[task_id] = []
         self._failed_items[task_id] = []
         
         # concurrency 범위 제한
@@ -128,76 +164,120 @@ class DailyCrawlingService:
         
         return task_id
     
-    def get_task(self, task_id: str) -> Optional[TaskResult]:
-        """태스크 조회"""
-        return self.tasks.get(task_id)
+    async def get_task(self, task_id: str) -> Optional[TaskResult]:
+        """태스크 조회 (메모리 캐시 → 태스크 저장소)"""
+        return await self.store.get(task_id)
+    
+    async def get_tasks(self, limit: int = 10) -> List[TaskResult]:
+        """최근 태스크 목록 조회 (생성 시간 역순)"""
+        return await self.store.list_recent(limit)
     
-    def get_tasks(self, limit: int = 10) -> List[TaskResult]:
-        """최근 태스크 목록 조회"""
-        # 생성 시간 역순으로 정렬하여 반환
-        sorted_tasks = sorted(
-            self.tasks.values(), 
-            key=lambda x: x.createdAt, 
-            reverse=True
+    def get_resumable_runs(self) -> List[Dict[str, Any]]:
+        """재개 가능한(실패/중단된) 실행의 체크포인트 manifest 목록 (이 프로세스에서 실행 중인 태스크 제외)"""
+        return [
+            manifest for manifest in list_checkpoints(RESUMABLE_STATUSES)
+            if manifest.get("task_id") not in self._checkpoints
+        ]
+    
+    async def resume_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        실패했거나 프로세스 재시작으로 중단된 실행 재개
+        
+        같은 task_id로 다시 실행하며, 체크포인트에 결과가 있는 URL은 크롤링하지 않습니다.
+        최종 DB 업데이트와 JSON 출력은 처음부터 실행한 것과 같은 방식으로 수행됩니다.
+        
+        Returns:
+            {"task_id", "total_urls", "restored_urls"}
+            
+        Raises:
+            ValueError: 체크포인트가 없거나 재개할 수 없는 상태인 경우
+        """
+        if task_id in self._checkpoints:
+            raise ValueError("이미 실행 중인 태스크입니다")
+        
+        checkpoint = RunCheckpoint(task_id)
+        manifest = checkpoint.load_manifest()
+        if manifest is None:
+            raise ValueError("체크포인트를 찾을 수 없습니다")
+        if manifest.get("status") not in RESUMABLE_STATUSES:
+            raise ValueError(f"재개할 수 없는 상태입니다: {manifest.get('status')}")
+        
+        options = manifest.get("options", {})
+        restored = len(await asyncio.to_thread(checkpoint.load_results))
+        
+        task = await self.store.get(task_id) or TaskResult(
+            taskId=task_id,
+            status=TaskStatus.PENDING,
+            createdAt=manifest.get("created_at") or datetime.now().isoformat(),
         )
-        return sorted_tasks[:limit]
+        task.status = TaskStatus.PENDING
+        task.error = None
+        task.result = None
+        task.completedAt = None
+        self.store.put(task)
+        task_event_bus.open(task_id)
+        self._collected_results[task_id] = []
+        self._snapshot_entries[task_id] = []
+        self._failed_items[task_id] = []
+        # 재개 직후 중복 재개 요청 방지 (_process_daily_task에서 실제 체크포인트로 교체)
+        self._checkpoints[task_id] = checkpoint
+        
+        logger.info(f"🔁 Task resumed: {task_id} ({restored} URL results restored)")
+        asyncio.create_task(self._process_daily_task(
+            task_id,
+            options.get("force_recrawl", False),
+            options.get("limit"),
+            options.get("url_ids") or None,
+            options.get("mode", "sequential"),
+            options.get("concurrency", 3),
+            options.get("update_menu_links", True),
+            resume=True,
+        ))
+        
+        return {
+            "task_id": task_id,
+            "total_urls": len(manifest.get("url_ids", [])),
+            "restored_urls": restored,
+        }
     
-    async def get_task_stream(self, task_id: str) -> AsyncGenerator[str, None]:
-        """SSE 스트림 생성"""
-        logger.info(f"🔍 SSE stream requested: {task_id}")
-        
-        if task_id not in self.task_streams:
-            # 태스크가 아직 실행 중이라면 큐를 다시 생성 (복구/재연결 대응)
-            task = self.tasks.get(task_id)
-            if task and task.status in {TaskStatus.PENDING, TaskStatus.RUNNING}:
-                logger.info(f"🔄 Re-creating stream queue for active task: {task_id}")
-                self.task_streams[task_id] = asyncio.Queue()
+    async def get_task_stream(self, task_id: str, last_event_id: Optional[int] = None) -> AsyncGenerator[str, None]:
+        """
+        SSE 스트림 생성
+        
+        같은 태스크를 여러 클라이언트가 동시에 구독할 수 있으며,
+        재연결 시 last_event_id(Last-Event-ID 헤더) 이후 이벤트부터 다시 받습니다.
+        """
+        logger.info(f"🔍 SSE stream requested: {task_id} (last_event_id={last_event_id})")
+        
+        if not task_event_bus.has_channel(task_id):
+            # 이 프로세스에서 아직 실행 중이라면 채널을 다시 생성 (복구/재연결 대응)
+            if self.store.is_live(task_id):
+                logger.info(f"🔄 Re-creating event channel for active task: {task_id}")
+                task_event_bus.open(task_id)
             else:
-                logger.error(f"❌ Stream not found: {task_id}")
-                yield f"data: {json.dumps({'type': 'error', 'data': {'message': 'Task not found or already finished'}})}\n\n"
+                # 종료/중단된 태스크는 종료 이벤트를 보내 클라이언트가 대기하지 않도록 함
+                logger.info(f"ℹ️ No active stream for task: {task_id}")
+                yield f"data: {json.dumps(await self.store.terminal_event(task_id), ensure_ascii=False)}\n\n"
                 return
         
         yield f"data: {json.dumps({'type': 'connected', 'data': {'message': 'Daily Crawling Stream connected'}})}\n\n"
         
-        queue = self.task_streams[task_id]
         try:
-            while True:
-                try:
-                    message = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield f"data: {message}\n\n"
-                    
-                    try:
-                        payload = json.loads(message)
-                        if payload.get("type") in {"final", "complete", "error"}:
-                            # 클라이언트가 메시지를 받을 수 있도록 충분히 대기
-                            await asyncio.sleep(2.0)
-                            break
-                    except json.JSONDecodeError:
-                        pass
-                    
-                    task = self.tasks.get(task_id)
-                    if task and task.status in {TaskStatus.COMPLETED, TaskStatus.FAILED}:
-                        break
-                        
-                except asyncio.TimeoutError:
-                    await self._send_update(task_id, "heartbeat", {})
-                    task = self.tasks.get(task_id)
-                    if task and task.status in {TaskStatus.COMPLETED, TaskStatus.FAILED}:
-                        break
-                        
+            async for event in task_event_bus.subscribe(task_id, last_event_id, heartbeat=30.0):
+                if event is None:
+                    yield f"data: {json.dumps({'type': 'heartbeat', 'data': {}})}\n\n"
+                    continue
+                yield event.to_sse()
+                if event.type in TERMINAL_EVENT_TYPES:
+                    # 클라이언트가 메시지를 받을 수 있도록 충분히 대기
+                    await asyncio.sleep(2.0)
+                    break
         except Exception as exc:
             logger.error(f"❌ Stream error {task_id}: {exc}")
             # 이미 닫힌 스트림에 에러를 보낼 수 없으므로 로그만 남김
         finally:
+            # 연결 종료는 구독 해제만 수행 (채널은 태스크 종료 후 task_event_retention 경과 시 삭제)
             logger.info(f"SSE connection closed: {task_id}")
-            # 이 연결이 종료되었다고 해서 다른 클라이언트를 위한 큐를 삭제하지 않음
-            # 큐 삭제는 태스크가 완료된 후 _process_daily_task의 마지막이나 별도 관리 루틴에서 수행하는 것이 안전함
-            
-            task = self.tasks.get(task_id)
-            if task and task.status in {TaskStatus.COMPLETED, TaskStatus.FAILED}:
-                # 태스크가 이미 종료된 상태에서 연결이 끊긴 경우에만 정리 고려
-                # 단, 여러 클라이언트가 있을 수 있으므로 신중해야 함
-                pass
     
     # ----------------------------------------------------------------------------------
     # Core Workflow
@@ -210,15 +290,25 @@ class DailyCrawlingService:
         url_ids: Optional[List[int]] = None,
         mode: str = "sequential",
         concurrency: int = 5,
-        update_menu_links: bool = True
+        update_menu_links: bool = True,
+        resume: bool = False
     ) -> None:
-        """Daily Crawling 태스크 처리"""
+        """
+        Daily Crawling 태스크 처리
+        
+        resume=True면 체크포인트의 URL 목록으로 다시 실행하고, 이미 완료된 URL은 기록된 결과로 대체합니다.
+        """
         # 타임아웃 시 TargetClosedError 등 무시하도록 설정
         _setup_asyncio_exception_handler()
         
+        task = self.store.peek(task_id)
+        started_at = datetime.now()
         try:
-            self.tasks[task_id].status = TaskStatus.RUNNING
-            mode_text = "병렬" if mode == "parallel" else "순차"
+            task.status = TaskStatus.RUNNING
+            await self.store.save(task)
+            # 이 실행에서 생성되는 브라우저의 리소스 차단 통계 집계 시작
+            resource_stats = start_resource_block_stats()
+            mode_text = {"parallel": "병렬", "queue": "작업 큐"}.get(mode, "순차")
             await self._send_update(task_id, "status", {
                 "message": f"Daily Crawling 작업을 시작합니다... ({mode_text} 모드)",
                 "status": "active",
@@ -226,7 +316,13 @@ class DailyCrawlingService:
             })
             
             # 1. input_urls에서 URL 조회
-            if url_ids:
+            checkpoint = RunCheckpoint(task_id)
+            if resume:
+                # 재개: 최초 실행 시점의 URL 목록/순서 그대로 사용
+                manifest_ids = checkpoint.load_manifest()["url_ids"]
+                by_id = {url.id: url for url in await input_url_repository.get_by_ids(manifest_ids)}
+                urls = [by_id[url_id] for url_id in manifest_ids if url_id in by_id]
+            elif url_ids:
                 # 특정 ID 목록으로 조회 (테스트용)
                 urls = await input_url_repository.get_by_ids(url_ids)
                 logger.info(f"🔍 Test mode: {len(urls)} URLs (IDs: {url_ids})")
@@ -237,16 +333,54 @@ class DailyCrawlingService:
                     limit=limit
                 )
             
+            # 이번 실행에서 크롤링하지 않는 활성 URL (재방문 시각 전, limit 초과): 이전 실행 문서를 출력에 포함
+            carry_ids: Set[int] = set()
+            if not url_ids and (not force_recrawl or limit):
+                selected_ids = {url.id for url in urls}
+                carry_ids = {
+                    url.id for url in await input_url_repository.get_active_urls(force_recrawl=True)
+                    if url.id not in selected_ids
+                }
+            
+            # 정규 URL이 같은 URL은 우선순위가 높은(먼저 조회된) URL만 크롤링하고 나머지는 그 결과를 공유
+            urls, shared_urls = await self._dedupe_input_urls(task_id, urls)
+            
             if not urls:
                 await self._send_update(task_id, "status", {
                     "message": "크롤링할 URL이 없습니다.",
                     "status": "completed"
                 })
-                self.tasks[task_id].status = TaskStatus.COMPLETED
-                self.tasks[task_id].completedAt = datetime.now().isoformat()
+                task.status = TaskStatus.COMPLETED
+                task.completedAt = datetime.now().isoformat()
+                await self.store.save(task)
                 await self._send_update(task_id, "complete", {"message": "작업 완료 (크롤링 대상 없음)"})
+                self._checkpoints.pop(task_id, None)
+                task_event_bus.close(task_id)
                 return
             
+            # 체크포인트 시작 (재개면 완료된 URL 결과 로드)
+            self._checkpoints[task_id] = checkpoint
+            await checkpoint.start(
+                {
+                    "force_recrawl": force_recrawl,
+                    "limit": limit,
+                    "url_ids": url_ids or [],
+                    "mode": mode,
+                    "concurrency": concurrency,
+                    "update_menu_links": update_menu_links,
+                },
+                [url.id for url in urls] + [alias.id for aliases in shared_urls.values() for alias in aliases],
+            )
+            restored = await asyncio.to_thread(checkpoint.load_results) if resume and mode != "queue" else {}
+            all_urls = urls
+            if restored:
+                urls = [url for url in all_urls if url.id not in restored]
+                await self._send_update(task_id, "status", {
+                    "message": f"체크포인트에서 {len(all_urls) - len(urls)}개 URL 결과를 복원했습니다. 남은 {len(urls)}개 URL을 크롤링합니다.",
+                    "status": "active",
+                    "restored_urls": len(all_urls) - len(urls)
+                })
+            
             test_mode_text = " [테스트]" if url_ids else ""
             await self._send_update(task_id, "status", {
                 "message": f"{len(urls)}개 URL 크롤링을 시작합니다...{test_mode_text} ({mode_text} 모드, 동시성: {concurrency})",
@@ -261,11 +395,29 @@ class DailyCrawlingService:
                 crawl_results = await self._process_parallel(
                     task_id, urls, concurrency
                 )
+            elif mode == "queue":
+                crawl_results = await self._process_queue(
+                    task_id, urls, concurrency
+                )
             else:
                 crawl_results = await self._process_sequential(
                     task_id, urls
                 )
             
+            if restored:
+                # 체크포인트 결과와 이번 실행 결과를 최초 URL 순서대로 합침
+                new_results = {result["input_url"].id: result for result in crawl_results}
+                crawl_results = [
+                    new_results.get(url.id) or self._restore_checkpoint_result(url, restored[url.id])
+                    for url in all_urls
+                    if url.id in new_results or url.id in restored
+                ]
+                urls = all_urls
+            
+            if shared_urls:
+                crawl_results = self._expand_shared_results(crawl_results, shared_urls)
+                urls = urls + [alias for aliases in shared_urls.values() for alias in aliases]
+            
             # 3. 일괄 DB 업데이트
             db_update_msg = "DB 업데이트 중..." if update_menu_links else "결과 처리 중... (menu_links 업데이트 스킵)"
             await self._send_update(task_id, "status", {
@@ -273,30 +425,53 @@ class DailyCrawlingService:
                 "status": "active"
             })
             success_count, failed_count = await self._batch_update_db(task_id, crawl_results, update_menu_links)
+            partial_items = self._collect_partial_items(crawl_results)
             
             # 4. JSON 파일 저장
-            json_file_path = await self._save_json_output(task_id)
+            partial_ids = {item.id for item in partial_items}
+            changes = await self._apply_change_status(task_id, partial_ids)
+            carried_entries = await self._carry_forward(task_id, carry_ids, changes)
+            await self._record_revisits(task_id, crawl_results, partial_ids, started_at)
+            json_file, delta_file = await self._save_json_output(task_id, delta=changes is not None, carried_entries=carried_entries)
+            if mode == "queue":
+                await crawl_work_queue_repository.finish_run(task_id, "completed", output_path=json_file)
+            await checkpoint.finish(
+                "completed",
+                json_file=json_file,
+                delta_file=delta_file,
+                partial_url_ids=[item.id for item in partial_items]
+            )
             
             # 4. 완료 처리
-            self.tasks[task_id].status = TaskStatus.COMPLETED
-            self.tasks[task_id].completedAt = datetime.now().isoformat()
+            task.status = TaskStatus.COMPLETED
+            task.completedAt = datetime.now().isoformat()
             
             # 결과 저장 (API 조회용)
-            self.tasks[task_id].result = CrawlingResult(
-                json_file=str(json_file_path) if json_file_path else None,
+            task.result = CrawlingResult(
+                json_file=json_file,
+                delta_file=delta_file,
+                changes=changes,
                 success=success_count,
                 failed=failed_count,
                 total=len(urls),
-                failed_items=self._failed_items.get(task_id, [])
+                failed_items=self._failed_items.get(task_id, []),
+                partial=len(partial_items),
+                partial_items=partial_items
             )
+            await self.store.save(task)
             
             summary = {
                 "total": len(urls),
                 "success": success_count,
                 "failed": failed_count,
-                "json_file": str(json_file_path) if json_file_path else None,
+                "json_file": json_file,
+                "delta_file": delta_file,
+                "changes": changes,
                 "message": f"Daily Crawling 완료: {success_count}/{len(crawl_results)} 성공",
-                "failed_items": [item.model_dump() for item in self._failed_items.get(task_id, [])]
+                "failed_items": [item.model_dump() for item in self._failed_items.get(task_id, [])],
+                "partial": len(partial_items),
+                "partial_items": [item.model_dump() for item in partial_items],
+                "resource_blocking": resource_stats.to_dict()
             }
             
             await self._send_update(task_id, "final", summary)
@@ -305,30 +480,135 @@ class DailyCrawlingService:
             # 클라이언트가 완료 메시지를 받을 수 있도록 잠시 대기
             await asyncio.sleep(1.0)
             
-            logger.info(f"✅ Crawling done: {success_count}/{len(urls)} success, {failed_count} failed")
+            logger.info(
+                f"✅ Crawling done: {success_count}/{len(urls)} success "
+                f"({len(partial_items)} partial), {failed_count} failed"
+            )
+            logger.info(
+                f"🚫 Resource blocking: {resource_stats.blocked_requests} blocked, "
+                f"{resource_stats.allowed_requests} allowed ({resource_stats.transferred_bytes:,} bytes)"
+            )
             
-            # 정리 (충분한 대기 후 스트림 큐 삭제)
+            # 정리 (이벤트 채널은 보관 시간 경과 후 삭제)
             self._collected_results.pop(task_id, None)
+            self._snapshot_entries.pop(task_id, None)
             self._failed_items.pop(task_id, None)
-            asyncio.create_task(self._delayed_cleanup(task_id))
+            self._checkpoints.pop(task_id, None)
+            task_event_bus.close(task_id)
             
         except Exception as exc:
             logger.error(f"❌ Task {task_id} failed: {exc}")
-            self.tasks[task_id].status = TaskStatus.FAILED
-            self.tasks[task_id].error = str(exc)
-            self.tasks[task_id].completedAt = datetime.now().isoformat()
+            task.status = TaskStatus.FAILED
+            task.error = str(exc)
+            task.completedAt = datetime.now().isoformat()
+            await self.store.save(task)
+            if mode == "queue":
+                try:
+                    await crawl_work_queue_repository.finish_run(task_id, "failed", error=str(exc))
+                except Exception as e:
+                    logger.error(f"❌ Work queue run finish failed {task_id}: {e}")
+            checkpoint = self._checkpoints.pop(task_id, None)
+            if checkpoint is not None:
+                await checkpoint.finish("failed", error=str(exc))
             await self._send_update(task_id, "error", {"message": str(exc)})
             # 클라이언트가 에러 메시지를 받을 수 있도록 잠시 대기
             await asyncio.sleep(1.0)
             self._collected_results.pop(task_id, None)
+            self._snapshot_entries.pop(task_id, None)
             self._failed_items.pop(task_id, None)
-            asyncio.create_task(self._delayed_cleanup(task_id))
+            task_event_bus.close(task_id)
+    
+    async def _dedupe_input_urls(
+        self,
+        task_id: str,
+        urls: List[InputUrl]
+    ) -> Tuple[List[InputUrl], Dict[int, List[InputUrl]]]:
+        """
+        정규 URL이 같은 input_urls를 묶어 그룹마다 먼저 조회된 URL만 크롤링 대상으로 남김
+
+        menu_path가 다른 URL은 별도 문서이므로 크롤링 결과를 공유하고(_expand_shared_results),
+        정규 URL과 menu_path가 모두 같은 URL만 제외합니다.
+
+        Returns:
+            (크롤링할 URL, {크롤링할 URL id: 결과를 공유할 URL 목록})
+        """
+        kept: List[InputUrl] = []
+        shared: Dict[int, List[InputUrl]] = {}
+        duplicates = 0
+        for group in group_by_canonical(urls, lambda url: url.pc_url or ""):
+            primary = group[0]
+            menu_paths = {primary.menu_path or ""}
+            kept.append(primary)
+            for url in group[1:]:
+                if (url.menu_path or "") in menu_paths:
+                    duplicates += 1
+                    logger.info(f"🔗 Duplicate input URL skipped: id={url.id} {url.pc_url} ({canonicalize_url(url.pc_url or '')})")
+                    continue
+                menu_paths.add(url.menu_path or "")
+                shared.setdefault(primary.id, []).append(url)
+        
+        shared_count = sum(len(aliases) for aliases in shared.values())
+        if duplicates or shared_count:
+            await self._send_update(task_id, "status", {
+                "message": (
+                    f"정규 URL이 같은 {shared_count}개 URL은 크롤링 결과를 공유하고, "
+                    f"menu_path까지 같은 {duplicates}개 URL은 이번 실행에서 제외합니다."
+                ),
+                "status": "active",
+                "shared_urls": shared_count,
+                "duplicate_urls": duplicates
+            })
+        return kept, shared
+    
+    def _expand_shared_results(
+        self,
+        crawl_results: List[Dict[str, Any]],
+        shared_urls: Dict[int, List[InputUrl]]
+    ) -> List[Dict[str, Any]]:
+        """크롤링한 URL의 결과를 정규 URL이 같은 다른 menu_path의 URL에도 적용 (menu_path 기준으로 다시 전처리)"""
+        expanded = list(crawl_results)
+        for result in crawl_results:
+            source: InputUrl = result["input_url"]
+            for alias in shared_urls.get(source.id, []):
+                if not result.get("success"):
+                    expanded.append({"success": False, "input_url": alias, "error": result.get("error")})
+                    continue
+                processed = self._rebase_result(result.get("processed_result") or {}, source, alias)
+                expanded.append({
+                    "success": True,
+                    "input_url": alias,
+                    "processed_result": self._preprocess_result(processed, alias),
+                })
+        return expanded
+    
+    def _rebase_result(self, processed_result: Dict[str, Any], source: InputUrl, alias: InputUrl) -> Dict[str, Any]:
+        """
+        다른 input_url의 크롤링 결과를 alias의 URL/menu_path/모바일 URL 기준으로 변환
 
-    async def _delayed_cleanup(self, task_id: str, delay: float = 300.0) -> None:
-        """태스크 완료 후 지연된 정리 (스트림 큐 삭제 등)"""
-        await asyncio.sleep(delay)
-        logger.info(f"🧹 Delayed cleanup for task: {task_id}")
-        self.task_streams.pop(task_id, None)
+        핸들러 menus는 menu_path 접두사를 치환하고, 크롤링한 URL을 가리키는 항목은 alias의 pc_url로 바꿉니다
+        (문서 키가 url + hierarchy라 URL별로 따로 크롤링했을 때와 같은 키 유지).
+        """
+        rebased = {
+            **processed_result,
+            "url": alias.pc_url,
+            "mobile_url": alias.mobile_url or processed_result.get("mobile_url"),
+            "hierarchy": alias.get_hierarchy_list(),
+        }
+        source_menu = source.menu_path or ""
+        alias_menu = alias.menu_path or ""
+        if processed_result.get("menus"):
+            rebased["menus"] = [
+                {
+                    **menu,
+                    "menu": (
+                        alias_menu + menu["menu"][len(source_menu):]
+                        if source_menu and (menu.get("menu") or "").startswith(source_menu) else menu.get("menu")
+                    ),
+                    "url": alias.pc_url if menu.get("url") == source.pc_url else menu.get("url"),
+                }
+                for menu in processed_result["menus"]
+            ]
+        return rebased
     
     async def _process_sequential(
         self,
@@ -391,6 +671,9 @@ class DailyCrawlingService:
                     "input_url": input_url,
                     "error": str(exc),
                 })
+            
+            if results and results[-1]["input_url"] is input_url:
+                await self._checkpoint_result(task_id, results[-1])
         
         return results
     
@@ -485,9 +768,23 @@ class DailyCrawlingService:
                         "error": str(exc),
                     }
         
+        async def crawl_and_checkpoint(idx: int, input_url: InputUrl) -> Dict[str, Any]:
+            result = await crawl_with_semaphore(idx, input_url)
+            await self._checkpoint_result(task_id, result)
+            return result
+        
         # 모든 URL에 대해 병렬 실행
-        tasks = [crawl_with_semaphore(idx, url) for idx, url in enumerate(urls, start=1)]
-        task_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 같은 우선순위 안에서는 예상 소요 시간이 긴 핸들러부터 시작 (긴 작업이 마지막에 남아 전체 시간이 늘어나는 것 방지)
+        plans = plan_urls([url.pc_url for url in urls])
+        launch_order = sorted(
+            range(len(urls)),
+            key=lambda i: (-(urls[i].priority or 0), -plans[urls[i].pc_url].expected_duration, i)
+        )
+        tasks = [crawl_and_checkpoint(i + 1, urls[i]) for i in launch_order]
+        launched_results = await asyncio.gather(*tasks, return_exceptions=True)
+        task_results: List[Any] = [None] * len(urls)
+        for i, result in zip(launch_order, launched_results):
+            task_results[i] = result
         
         # 예외 처리 및 결과 수집
         for i, result in enumerate(task_results):
@@ -502,62 +799,153 @@ class DailyCrawlingService:
         
         return results
     
-    async def _crawl_single_url(self, input_url: InputUrl, timeout: int = 300) -> Dict[str, Any]:
+    async def _checkpoint_result(self, task_id: str, result: Dict[str, Any]) -> None:
+        """URL 하나의 결과를 체크포인트에 추가"""
+        checkpoint = self._checkpoints.get(task_id)
+        if checkpoint is None:
+            return
+        if result.get("success"):
+            entry = {"success": True, "processed_result": result.get("processed_result")}
+        else:
+            entry = {"success": False, "error": result.get("error")}
+        await checkpoint.append(result["input_url"].id, entry)
+    
+    def _collect_partial_items(self, crawl_results: List[Dict[str, Any]]) -> List[PartialItem]:
+        """
+        핸들러 실행 예산 만료로 부분 결과만 수집된 URL 목록
+
+        부분 결과도 성공으로 DB/JSON에 반영되며, 전처리 결과에 남은 partial/continuation 표시로 구분합니다.
+        (체크포인트 복원/작업 큐 결과도 같은 필드를 유지)
+        """
+        partial_items = []
+        for result in crawl_results:
+            processed = result.get("processed_result") or {}
+            if not result.get("success") or not processed.get("partial"):
+                continue
+            input_url = result["input_url"]
+            partial_items.append(PartialItem(
+                id=input_url.id,
+                url=input_url.pc_url,
+                collected=len(processed.get("datas") or []),
+                continuation=processed.get("continuation"),
+            ))
+        return partial_items
+    
+    def _restore_checkpoint_result(self, input_url: InputUrl, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """체크포인트 기록을 _batch_update_db 입력 형식으로 변환"""
+        if entry.get("success"):
+            return {"success": True, "input_url": input_url, "processed_result": entry.get("processed_result") or {}}
+        return {"success": False, "input_url": input_url, "error": entry.get("error")}
+    
+    async def _process_queue(
+        self,
+        task_id: str,
+        urls: List[InputUrl],
+        concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """
+        작업 큐 모드 처리 (결과만 수집, DB 업데이트 없음)
+        
+        URL별 작업을 crawl_work_items에 넣고 이 프로세스의 워커도 lease하여 처리합니다.
+        crawl_queue_worker_enabled가 켜진 다른 인스턴스의 워커도 같은 실행의 작업을 가져갑니다.
+        모든 작업이 끝나면 작업별 결과를 모아 _batch_update_db 입력 형식으로 반환합니다.
+        """
+        coordinator = self.queue_worker.worker_id
+        lease_seconds = settings.crawl_queue_coordinator_lease_seconds
+        if not await crawl_work_queue_repository.reopen_run(task_id, coordinator, lease_seconds):
+            await crawl_work_queue_repository.create_run(task_id, urls, coordinator, lease_seconds)
+        total = len(urls)
+        drain = asyncio.create_task(self.queue_worker.drain(task_id, concurrency))
+        last_done = -1
+        renewed_at = time.monotonic()
+        
+        try:
+            while True:
+                # 조정 프로세스 lease 연장 (이 프로세스가 죽으면 만료되어 워커가 실행을 실패 처리)
+                if time.monotonic() - renewed_at >= settings.crawl_queue_heartbeat_interval:
+                    if not await crawl_work_queue_repository.renew_coordinator(task_id, coordinator, lease_seconds):
+                        raise RuntimeError("작업 큐 실행의 조정 lease를 잃었습니다 (실행이 만료 처리됨)")
+                    renewed_at = time.monotonic()
+                
+                run = await crawl_work_queue_repository.get_run(task_id)
+                done = (run.success + run.failed) if run else 0
+                if done != last_done:
+                    last_done = done
+                    await self._send_update(task_id, "progress", {
+                        "current": done,
+                        "total": total,
+                        "success": run.success if run else 0,
+                        "failed": run.failed if run else 0,
+                        "message": f"크롤링 완료: {done}/{total} (작업 큐 처리 중)"
+                    })
+                
+                if await crawl_work_queue_repository.count_remaining(task_id) == 0:
+                    break
+                # 이 프로세스의 lease할 작업이 없어도 다른 워커의 lease가 만료되면 다시 가져가도록 재시작
+                if drain.done():
+                    drain = asyncio.create_task(self.queue_worker.drain(task_id, concurrency))
+                await asyncio.sleep(settings.crawl_queue_poll_interval if drain.done() else 1.0)
+        finally:
+            if not drain.done():
+                drain.cancel()
+            await asyncio.gather(drain, return_exceptions=True)
+        
+        url_map = {url.id: url for url in urls}
+        results: List[Dict[str, Any]] = []
+        for item in await crawl_work_queue_repository.get_items(task_id):
+            input_url = url_map.get(item.input_url_id)
+            if input_url is None:
+                continue
+            if item.status == "done" and item.result_json:
+                results.append({"success": True, "input_url": input_url, "processed_result": item.result_json})
+            else:
+                results.append({"success": False, "input_url": input_url, "error": item.error})
+        return results
+    
+    async def _crawl_work_item(self, input_url: InputUrl) -> Dict[str, Any]:
+        """작업 큐 워커가 lease한 URL 처리 (크롤링 + 전처리)"""
+        crawl_result = await self._crawl_single_url(input_url)
+        if not crawl_result.get("success"):
+            logger.warning(f"❌ [queue] Failed: {input_url.pc_url}")
+            return {"success": False, "error": crawl_result.get("error")}
+        logger.info(f"✅ [queue] Success: {input_url.pc_url}")
+        return {"success": True, "processed_result": self._preprocess_result(crawl_result, input_url)}
+    
+    async def _crawl_single_url(self, input_url: InputUrl, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         단일 URL 크롤링
         
         Args:
             input_url: InputUrl 엔티티
-            timeout: 타임아웃 (초, 기본값 5분)
+            timeout: 타임아웃 (초, 생략 시 핸들러에 선언된 값 - 기본 스크래핑 5분 / 단일 페이지 핸들러 3분 /
+                     다중 페이지 핸들러 실행 예산 + 유예 시간, 예산이 끝나면 핸들러가 부분 결과 반환)
         """
         url = input_url.pc_url
-        menu = input_url.menu_path
-        
-        # 핸들러 타입에 따라 타임아웃 조정
-        handler_info = get_handler_for_url(url)
-        skip_timeout = False
-        if handler_info:
-            _, handler_func = handler_info
-            handler_name = handler_func.__name__
-            
-            # 다중 페이지 순회 핸들러 패턴들
-            multi_page_patterns = [
-                "_main",  # 기존: 다중 결과 메인 핸들러
-                "_list",  # 목록 핸들러 (내부에서 상세 페이지 순회)
-                "gigagenie_faq",  # FAQ 전체 페이지 순회
-                "gigagenie_news",  # 뉴스 전체 페이지 순회
-                "winner_announcements",  # 당첨자발표 페이지네이션 + 상세 순회
-            ]
-            
-            # 패턴 매칭 확인
-            is_multi_page = any(pattern in handler_name for pattern in multi_page_patterns)
-            
-            if is_multi_page:
-                # 다중 페이지 순회 핸들러: 전체 타임아웃 미적용 (개별 페이지에 자체 타임아웃)
-                skip_timeout = True
-                logger.info(f"🔗 Multi-page handler detected, skipping global timeout: {handler_name}")
-            else:
-                # 일반 핸들러: 3분(180초) 타임아웃
-                timeout = 180
+        plan = plan_url(url)
+        if timeout is None:
+            timeout = plan.timeout
+        if timeout is None:
+            # 타임아웃 없이 등록된 핸들러: 전체 타임아웃 미적용 (개별 페이지에 자체 타임아웃)
+            logger.info(f"🔗 No handler timeout, skipping global timeout: {plan.handler_name}")
         
         try:
-            if skip_timeout:
-                # 다중 결과 핸들러는 타임아웃 없이 실행 (개별 페이지에 자체 타임아웃 있음)
-                return await self._do_crawl_single_url(input_url)
-            else:
-                # 일반 URL/핸들러는 타임아웃 적용
-                return await asyncio.wait_for(
-                    self._do_crawl_single_url(input_url),
-                    timeout=timeout
-                )
+            # 전역 스케줄러의 batch 슬롯에서 실행 (InputUrl.priority가 높은 URL부터 배정, 대기 시간은 타임아웃에 미포함)
+            async with crawl_scheduler.slot(BATCH, priority=input_url.priority or 0):
+                if timeout is None:
+                    return await self._do_crawl_single_url(input_url, plan)
+                else:
+                    return await asyncio.wait_for(
+                        self._do_crawl_single_url(input_url, plan),
+                        timeout=timeout
+                    )
         except asyncio.TimeoutError:
-            logger.error(f"❌ Timeout ({timeout}s): {url}")
+            logger.error(f"❌ Timeout ({timeout:g}s): {url}")
             # 타임아웃 후 잠시 대기하여 비동기 작업 정리 시간 확보
             await asyncio.sleep(0.5)
             return {
                 "success": False,
                 "url": url,
-                "error": f"크롤링 타임아웃 ({timeout}초)"
+                "error": f"크롤링 타임아웃 ({timeout:g}초)"
             }
         except asyncio.CancelledError:
             logger.warning(f"⚠️ Cancelled: {url}")
@@ -574,82 +962,90 @@ class DailyCrawlingService:
                 "error": str(exc)
             }
     
-    async def _do_crawl_single_url(self, input_url: InputUrl) -> Dict[str, Any]:
+    async def _do_crawl_single_url(self, input_url: InputUrl, plan: Optional[HandlerPlan] = None) -> Dict[str, Any]:
         """실제 크롤링 로직 (타임아웃 래퍼에서 호출)"""
         url = input_url.pc_url
         menu = input_url.menu_path
+        plan = plan or plan_url(url)
         
-        try:
-            # 1. 전용 핸들러 확인
-            handler_info = get_handler_for_url(url)
-            
-            if handler_info:
-                pattern, handler_func = handler_info
-                logger.info(f"🔗 Handler matched: {url} -> {handler_func.__name__}")
+        # 핸들러와 기본 스크래핑이 같은 페이지 로드 결과를 공유 (핸들러 실패 시 재로드 방지)
+        with fetch_context(url):
+            try:
+                # 1. 전용 핸들러 확인
+                if plan.spec:
+                    handler_name = plan.handler_name
+                    logger.info(f"🔗 Handler matched: {url} -> {handler_name}")
+                    
+                    handler_result = await route_url(url, page_handler_client, menu, plan=plan)
+                    
+                    if handler_result:
+                        # datas 배열이 있는 경우 모든 항목을 처리
+                        if "datas" in handler_result and handler_result.get("datas"):
+                            datas = handler_result["datas"]
+                            menus = handler_result.get("menus", [])  # menus 배열도 가져오기
+                            logger.info(f"✅ Handler result: {len(datas)} items, {len(menus)} menus ({url})")
+                            
+                            # 실행 예산 만료로 순회를 끝내지 못한 경우 부분 결과로 표시 (이어서 처리할 위치 포함)
+                            partial = handler_result.get("status") == "partial"
+                            if partial:
+                                logger.warning(f"⏱️ Partial handler result: {len(datas)} items, continuation={handler_result.get('continuation')} ({url})")
+                            
+                            # 여러 데이터를 포함한 결과 반환
+                            return {
+                                "success": True,
+                                "url": url,
+                                "mobile_url": input_url.mobile_url,
+                                "title": handler_result.get("title"),
+                                "markdown": handler_result.get("markdown", ""),
+                                "html_content": handler_result.get("html", ""),
+                                "hierarchy": input_url.get_hierarchy_list(),
+                                "handler_name": handler_name,
+                                "datas": datas,  # 모든 datas 포함
+                                "menus": menus,  # menus 배열 포함
+                                "is_multi_result": True,
+                                "partial": partial,
+                                "continuation": handler_result.get("continuation") if partial else None,
+                            }
+                        else:
+                            return {
+                                "success": True,
+                                "url": url,
+                                "mobile_url": input_url.mobile_url,
+                                "title": handler_result.get("title"),
+                                "markdown": handler_result.get("markdown", ""),
+                                "html_content": handler_result.get("html", ""),
+                                "hierarchy": input_url.get_hierarchy_list(),
+                                "handler_name": handler_name,
+                            }
                 
-                handler_result = await route_url(url, page_handler_client, menu)
+                # 2. 기본 MCP 스크래핑
+                logger.info(f"🔍 Default scraping: {url}")
+                tool_result = await crawler_tools.scrape(url)
                 
-                if handler_result:
-                    # datas 배열이 있는 경우 모든 항목을 처리
-                    if "datas" in handler_result and handler_result.get("datas"):
-                        datas = handler_result["datas"]
-                        menus = handler_result.get("menus", [])  # menus 배열도 가져오기
-                        logger.info(f"✅ Handler result: {len(datas)} items, {len(menus)} menus ({url})")
-                        
-                        # 여러 데이터를 포함한 결과 반환
-                        return {
-                            "success": True,
-                            "url": url,
-                            "mobile_url": input_url.mobile_url,
-                            "title": handler_result.get("title"),
-                            "markdown": handler_result.get("markdown", ""),
-                            "html_content": handler_result.get("html", ""),
-                            "hierarchy": input_url.get_hierarchy_list(),
-                            "handler_name": handler_func.__name__,
-                            "datas": datas,  # 모든 datas 포함
-                            "menus": menus,  # menus 배열 포함
-                            "is_multi_result": True,
-                        }
-                    else:
-                        return {
-                            "success": True,
-                            "url": url,
-                            "mobile_url": input_url.mobile_url,
-                            "title": handler_result.get("title"),
-                            "markdown": handler_result.get("markdown", ""),
-                            "html_content": handler_result.get("html", ""),
-                            "hierarchy": input_url.get_hierarchy_list(),
-                            "handler_name": handler_func.__name__,
-                        }
-            
-            # 2. 기본 MCP 스크래핑
-            logger.info(f"🔍 Default scraping: {url}")
-            tool_result = await crawler_tools.scrape(url)
-            
-            if tool_result.get("success"):
-                return {
-                    "success": True,
-                    "url": url,
-                    "mobile_url": input_url.mobile_url,
-                    "title": tool_result.get("title"),
-                    "markdown": tool_result.get("markdown", ""),
-                    "html_content": tool_result.get("html_content", ""),
-                    "hierarchy": input_url.get_hierarchy_list(),
-                }
-            else:
+                if tool_result.get("success"):
+                    return {
+                        "success": True,
+                        "url": url,
+                        "mobile_url": input_url.mobile_url,
+                        "title": tool_result.get("title"),
+                        "markdown": tool_result.get("markdown", ""),
+                        "html_content": tool_result.get("html_content", ""),
+                        "hierarchy": input_url.get_hierarchy_list(),
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "url": url,
+                        "error": tool_result.get("error", "스크래핑 실패")
+                    }
+                    
+            except Exception as exc:
+                logger.error(f"❌ Crawl failed {url}: {exc}")
                 return {
                     "success": False,
                     "url": url,
-                    "error": tool_result.get("error", "스크래핑 실패")
+                    "error": str(exc)
                 }
-                
-        except Exception as exc:
-            logger.error(f"❌ Crawl failed {url}: {exc}")
-            return {
-                "success": False,
-                "url": url,
-                "error": str(exc)
-            }
     
     # ----------------------------------------------------------------------------------
     # 전처리 및 JSON 변환
@@ -791,7 +1187,7 @@ class DailyCrawlingService:
             "startdate": JSON_START_DATE,
             "enddate": JSON_END_DATE,
             "metadata": metadata,
-            "status": "new",
+            "status": STATUS_NEW,  # 이전 실행과 비교 후 _apply_change_status에서 갱신
         }
         
         return json_data
@@ -857,25 +1253,15 @@ class DailyCrawlingService:
         return metadata
     
     def _pc_to_mobile_url(self, pc_url: str) -> str:
-        """PC URL을 모바일 URL로 변환"""
+        """PC URL을 모바일 URL로 변환 (settings.url_canonical_rules의 mobile_host 규칙 우선)"""
         if not pc_url:
             return ""
         
-        # KT 이벤트 URL 변환
-        if "event.kt.com" in pc_url:
-            return pc_url.replace("https://event.kt.com", "https://m.kt.com")
-        
-        # KT Shop URL 변환
-        if "shop.kt.com" in pc_url:
-            return pc_url.replace("https://shop.kt.com", "https://m.shop.kt.com")
-        
-        # product.kt.com 변환
-        if "product.kt.com" in pc_url:
-            mobile_url = pc_url.replace("https://product.kt.com", "https://m.product.kt.com")
-            mobile_url = mobile_url.replace("/wDic/", "/mDic/")
+        mobile_url = mobile_url_for(pc_url)
+        if mobile_url:
             return mobile_url
         
-        # 기타 kt.com 도메인
+        # 규칙이 없는 kt.com 도메인 (event/shop/product.kt.com은 기본 규칙으로 변환)
         if "kt.com" in pc_url and "://m." not in pc_url:
             # https://xxx.kt.com -> https://m.xxx.kt.com 형태로 변환 시도
             import re
@@ -913,6 +1299,10 @@ class DailyCrawlingService:
         
         logger.info(f"🔍 DB batch update start: {total} items")
         
+        if update_menu_links:
+            # 메뉴 관리 화면 등에서 바뀐 menu_links를 색인에 반영한 뒤 정규 URL로 조회 (일괄 반영이라 TTL과 관계없이 동기화)
+            await refresh_menu_link_index(force=True)
+        
         for idx, result in enumerate(crawl_results, start=1):
             input_url: InputUrl = result.get("input_url")
             
@@ -968,6 +1358,10 @@ class DailyCrawlingService:
                             
                             # 결과 수집
                             self._collected_results[task_id].append(json_data)
+                            self._snapshot_entries[task_id].append(self._snapshot_entry(
+                                json_data, input_url,
+                                data.get("html", ""), data.get("markdown", ""), data.get("processed_text", "")
+                            ))
                         
                         # input_urls 상태 업데이트 (한 번만)
                         handler_name = processed_result.get("handler_name")
@@ -987,6 +1381,13 @@ class DailyCrawlingService:
                         
                         # 결과 수집
                         self._collected_results[task_id].append(json_data)
+                        self._snapshot_entries[task_id].append(self._snapshot_entry(
+                            json_data,
+                            input_url,
+                            processed_result.get("html_content", ""),
+                            processed_result.get("markdown", ""),
+                            processed_result.get("processed_text", "")
+                        ))
                         
                         # input_urls 상태 업데이트
                         handler_name = processed_result.get("handler_name")
@@ -1069,11 +1470,20 @@ class DailyCrawlingService:
             try:
                 existing = None
                 
-                # menu_path + pc_url 조합으로 정확히 일치하는 경우에만 업데이트
+                # menu_path + 정규 URL 조합으로 일치하는 경우에만 업데이트 (색인에 없는 행은 pc_url 문자열로 일치)
                 if menu_path and pc_url:
-                    stmt = select(MenuLink).where(
-                        MenuLink.menu_path == menu_path,
-                        MenuLink.pc_url == pc_url
+                    stmt = (
+                        select(MenuLink)
+                        .outerjoin(
+                            CanonicalUrl,
+                            (CanonicalUrl.source == SOURCE_MENU_LINK) & (CanonicalUrl.source_id == MenuLink.id)
+                        )
+                        .where(
+                            MenuLink.menu_path == menu_path,
+                            or_(CanonicalUrl.canonical_hash == canonical_key(pc_url), MenuLink.pc_url == pc_url)
+                        )
+                        .order_by(MenuLink.id.asc())
+                        .limit(1)
                     )
                     result = await session.execute(stmt)
                     existing = result.scalar_one_or_none()
@@ -1081,7 +1491,10 @@ class DailyCrawlingService:
                 if existing:
                     # 업데이트
                     existing.menu_path = menu_path
-                    existing.pc_url = pc_url
+                    # 저장된 메뉴 URL은 유지 (크롤링에 쓴 URL 형태로 덮어쓰면 다음 색인 동기화 때 정규 URL 색인이 다시 바뀜)
+                    if not existing.pc_url:
+                        existing.pc_url = pc_url
+                    await session.merge(index_entry(SOURCE_MENU_LINK, existing.id, existing.pc_url))
                     if mobile_url:
                         existing.mobile_url = mobile_url
                     existing.updated_by = "daily_crawling"
@@ -1103,6 +1516,9 @@ class DailyCrawlingService:
                         created_by="daily_crawling",
                     )
                     session.add(new_record)
+                    await session.flush()
+                    if pc_url:
+                        await session.merge(index_entry(SOURCE_MENU_LINK, new_record.id, pc_url))
                     await session.commit()
                     logger.debug(f"✅ menu_links created: {document_id}")
                     
@@ -1136,44 +1552,322 @@ class DailyCrawlingService:
         return max_num
     
     # ----------------------------------------------------------------------------------
-    # JSON 파일 출력
+    # JSON 출력 및 스냅샷 저장
     # ----------------------------------------------------------------------------------
-    async def _save_json_output(self, task_id: str) -> Optional[Path]:
+    def _document_key(self, url: str, hierarchy: List[str]) -> str:
+        """문서 식별 키 (JSON 비교와 같은 url + hierarchy 조합)"""
+        return f"{url}|{'^'.join(hierarchy or [])}"
+    
+    def _document_fingerprint(self, json_data: Dict[str, Any]) -> str:
+        """문서 내용 지문 (제목/모바일 URL/본문이 같으면 변경 없음)"""
+        return content_hash(json.dumps(
+            [json_data["title"], json_data["murl"], json_data["text"]], ensure_ascii=False
+        ))
+    
+    def _snapshot_entry(
+        self,
+        json_data: Dict[str, Any],
+        input_url: InputUrl,
+        html_content: str,
+        markdown: str,
+        processed_text: str
+    ) -> Dict[str, Any]:
+        """스냅샷 manifest 항목 (내용은 _save_json_output에서 해시로 변환)"""
+        return {
+            "input_url_id": input_url.id,
+            "key": self._document_key(json_data["url"], json_data["hierarchy"]),
+            "fingerprint": self._document_fingerprint(json_data),
+            "url": json_data["url"],
+            "murl": json_data["murl"],
+            "hierarchy": json_data["hierarchy"],
+            "docId": json_data["docId"],
+            "title": json_data["title"],
+            "html": html_content,
+            "markdown": markdown,
+            "processed": processed_text,
+        }
+    
+    def _latest_manifests(self, task_id: str, input_url_ids: Set[int]) -> Dict[int, Dict[str, Any]]:
+        """input URL별 그 URL의 문서를 포함한 가장 최근 실행의 manifest (이번 실행 제외)"""
+        latest: Dict[int, Dict[str, Any]] = {}
+        for manifest in snapshot_store.load_runs("daily"):
+            if manifest["run_id"] == task_id:
+                continue
+            for entry in manifest.get("entries", []):
+                url_id = entry.get("input_url_id")
+                if url_id in input_url_ids and url_id not in latest and entry.get("key"):
+                    latest[url_id] = manifest
+            if len(latest) == len(input_url_ids):
+                break
+        return latest
+    
+    def _latest_entries(self, task_id: str, input_url_ids: Set[int]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """input URL별 가장 최근 실행의 문서 항목 [(manifest, 항목)]"""
+        latest = self._latest_manifests(task_id, input_url_ids)
+        manifests = {manifest["run_id"]: manifest for manifest in latest.values()}
+        return [
+            (manifest, entry)
+            for manifest in manifests.values()
+            for entry in manifest.get("entries", [])
+            if entry.get("key") and latest.get(entry.get("input_url_id")) is manifest
+        ]
+    
+    def _previous_documents(self, task_id: str, input_url_ids: Set[int]) -> Dict[int, Dict[str, Dict[str, Any]]]:
         """
-        수집된 결과를 JSON 파일로 저장
+        input URL별 직전 상태 {input_url_id: {문서 키: manifest 항목}}
         
-        형식: data_YYYY-MM-DD_HHMMSS.json
+        일부 URL만 크롤링한 실행도 있으므로 URL마다 그 URL을 포함한 가장 최근의 완료 실행을 기준으로 합니다.
         """
-        results = self._collected_results.get(task_id, [])
+        previous: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        for _, entry in self._latest_entries(task_id, input_url_ids):
+            previous.setdefault(entry["input_url_id"], {})[entry["key"]] = entry
+        return previous
+    
+    def _exported_documents(self, manifest: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """실행의 JSON 출력 문서 {문서 키: 문서} (출력이 없으면 빈 dict)"""
+        digest = manifest.get("outputs", {}).get("json", {}).get("hash")
+        payload = snapshot_store.get_text(digest) if digest else None
+        if not payload:
+            return {}
+        return {
+            self._document_key(item.get("url") or "", item.get("hierarchy") or []): item
+            for item in json.loads(payload)
+            if item.get("status") != STATUS_DELETED
+        }
+    
+    def _document_from_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """manifest 항목의 저장된 내용으로 JSON 문서 재구성 (이전 출력 파일이 보존 정책으로 삭제된 경우)"""
+        processed_text = snapshot_store.get_text(entry["processed"]) if entry.get("processed") else ""
+        html_content = snapshot_store.get_text(entry["html"]) if entry.get("html") else ""
+        url = entry.get("url") or ""
+        return {
+            "docId": entry.get("docId") or "",
+            "url": url,
+            "murl": entry.get("murl") or "",
+            "hierarchy": entry.get("hierarchy") or [],
+            "title": entry.get("title") or "",
+            "text": unicodedata.normalize('NFC', processed_text or "").replace("\n", "\\n"),
+            "startdate": JSON_START_DATE,
+            "enddate": JSON_END_DATE,
+            "metadata": self._extract_metadata(html_content or "", url),
+        }
+    
+    def _carried_documents(
+        self,
+        task_id: str,
+        input_url_ids: Set[int]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """크롤링하지 않은 input URL의 가장 최근 문서 (JSON 문서 목록, manifest 항목 목록)"""
+        documents: List[Dict[str, Any]] = []
+        entries: List[Dict[str, Any]] = []
+        exported: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for manifest, entry in self._latest_entries(task_id, input_url_ids):
+            if manifest["run_id"] not in exported:
+                exported[manifest["run_id"]] = self._exported_documents(manifest)
+            document = exported[manifest["run_id"]].get(entry["key"]) or self._document_from_entry(entry)
+            documents.append({**document, "status": STATUS_UNCHANGED})
+            entries.append(entry)
+        return documents, entries
+    
+    async def _carry_forward(
+        self,
+        task_id: str,
+        input_url_ids: Set[int],
+        changes: Optional[Dict[str, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        이번 실행에서 크롤링하지 않은 활성 URL의 이전 문서를 unchanged로 출력에 추가
+        
+        재방문 시각 전인 URL을 빼면 출력 파일이 크롤링한 URL의 문서만 담게 되어
+        두 출력 파일을 비교하거나 출력을 전체 문서로 쓰는 곳에서 문서가 삭제된 것처럼 보이므로,
+        가장 최근 실행의 문서(출력 파일 → 없으면 저장된 내용으로 재구성)를 그대로 포함합니다.
+        
+        Returns:
+            이번 실행 manifest에 그대로 기록할 항목 (이미 해시로 저장된 내용, 보존 정책에서 blob 유지)
+        """
+        if not input_url_ids or not self._collected_results.get(task_id):
+            return []
+        try:
+            documents, entries = await asyncio.to_thread(self._carried_documents, task_id, input_url_ids)
+        except Exception as e:
+            logger.error(f"❌ Carry-forward of not-due documents failed: {e}")
+            return []
+        self._collected_results[task_id].extend(documents)
+        if changes is not None:
+            changes[STATUS_UNCHANGED] += len(documents)
+        logger.info(f"📎 Carried forward {len(documents)} documents from {len(input_url_ids)} not-crawled URLs")
+        return entries
+    
+    async def _apply_change_status(self, task_id: str, partial_ids: Set[int]) -> Optional[Dict[str, int]]:
+        """
+        이전 실행과 문서 지문을 비교해 status 결정 후 사라진 문서의 삭제 표시(tombstone) 추가
+        
+        - new: 이전 상태가 없는 문서 / modified: 지문 변경 / unchanged: 지문 동일
+        - deleted: 이번에 크롤링한 URL의 이전 문서 중 이번 결과에 없는 문서
+          (부분 결과로 끝난 URL은 나머지 문서를 수집하지 못했으므로 제외, 실패한 URL은 이번 결과에 없으므로 제외)
         
+        Returns:
+            상태별 문서 수 (비교할 이전 실행이 없으면 None, 모든 문서는 new)
+        """
+        results = self._collected_results.get(task_id, [])
+        entries = self._snapshot_entries.get(task_id, [])
+        input_url_ids = {entry["input_url_id"] for entry in entries}
         if not results:
-            logger.warning(f"⚠️ No results to save: {task_id}")
+            return None
+        try:
+            previous = await asyncio.to_thread(self._previous_documents, task_id, input_url_ids)
+        except Exception as e:
+            logger.warning(f"⚠️ Previous snapshot unavailable, all documents marked new: {e}")
+            return None
+        if not previous:
             return None
         
-        # 결과 디렉토리 생성
-        RESULT_DIR.mkdir(parents=True, exist_ok=True)
+        changes = dict.fromkeys(CHANGE_STATUSES, 0)
+        seen: Dict[int, Set[str]] = {}
+        for json_data, entry in zip(results, entries):
+            url_id = entry["input_url_id"]
+            seen.setdefault(url_id, set()).add(entry["key"])
+            before = previous.get(url_id, {}).get(entry["key"])
+            if before is None:
+                status = STATUS_NEW
+            elif before.get("fingerprint") != entry["fingerprint"]:
+                status = STATUS_MODIFIED
+            else:
+                status = STATUS_UNCHANGED
+            json_data["status"] = status
+            changes[status] += 1
+        
+        for url_id, documents in previous.items():
+            if url_id in partial_ids:
+                continue
+            for key, before in documents.items():
+                if key in seen.get(url_id, set()):
+                    continue
+                results.append({
+                    "docId": before.get("docId") or "",
+                    "url": before.get("url") or "",
+                    "murl": before.get("murl") or "",
+                    "hierarchy": before.get("hierarchy") or [],
+                    "title": before.get("title") or "",
+                    "text": "",
+                    "startdate": JSON_START_DATE,
+                    "enddate": JSON_END_DATE,
+                    "metadata": {},
+                    "status": STATUS_DELETED,
+                })
+                changes[STATUS_DELETED] += 1
+        
+        logger.info(
+            f"🔁 Change detection: {changes[STATUS_NEW]} new, {changes[STATUS_MODIFIED]} modified, "
+            f"{changes[STATUS_UNCHANGED]} unchanged, {changes[STATUS_DELETED]} deleted"
+        )
+        return changes
+    
+    async def _record_revisits(
+        self,
+        task_id: str,
+        crawl_results: List[Dict[str, Any]],
+        partial_ids: Set[int],
+        started_at: datetime
+    ) -> None:
+        """성공한 URL의 내용 지문으로 재방문 주기 갱신 (실패한 URL은 last_status로 다음 실행 대상)"""
+        fingerprints: Dict[int, List[str]] = {}
+        for entry in self._snapshot_entries.get(task_id, []):
+            fingerprints.setdefault(entry["input_url_id"], []).append(entry["fingerprint"])
+        observations = {
+            result["input_url"].id: (
+                None if result["input_url"].id in partial_ids
+                else url_fingerprint(fingerprints.get(result["input_url"].id, []))
+            )
+            for result in crawl_results
+            if result.get("success")
+        }
+        try:
+            await record_observations(observations, started_at)
+        except Exception as e:
+            logger.error(f"❌ Revisit state update failed: {e}")
+    
+    async def _save_json_output(
+        self,
+        task_id: str,
+        delta: bool = False,
+        carried_entries: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        수집된 결과를 JSON 출력 파일로 스냅샷 저장소에 저장
+        
+        형식: data_YYYY-MM-DD_HHMMSS.json (반환값은 다운로드/비교 API에서 사용하는 파일명)
+        delta=True이고 settings.daily_delta_export면 변경 문서(new/modified/deleted)만 담은
+        data_YYYY-MM-DD_HHMMSS_delta.json도 함께 저장
+        carried_entries는 크롤링하지 않고 이전 실행에서 가져온 문서의 manifest 항목 (내용은 이미 해시)
+        
+        Returns:
+            (전체 출력 파일명, 변경분 출력 파일명)
+        """
+        results = self._collected_results.get(task_id, [])
+        
+        if not results:
+            logger.warning(f"⚠️ No results to save: {task_id}")
+            return None, None
         
         # 파일명 생성
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        file_path = RESULT_DIR / f"data_{timestamp}.json"
+        outputs = {"json": (f"data_{timestamp}.json", results)}
+        if delta and settings.daily_delta_export:
+            changed = [item for item in results if item["status"] != STATUS_UNCHANGED]
+            outputs["delta"] = (f"data_{timestamp}_delta.json", changed)
         
         try:
-            # JSON 저장 (한글 유지)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"✅ JSON saved: {file_path} ({len(results)} items)")
-            return file_path
+            # JSON 직렬화 (한글 유지), 압축/해시 계산과 파일 쓰기는 스레드에서 수행
+            payloads = {
+                name: (file_name, json.dumps(items, ensure_ascii=False, indent=2), len(items))
+                for name, (file_name, items) in outputs.items()
+            }
+            await asyncio.to_thread(
+                self._write_snapshot, task_id, payloads, self._snapshot_entries.get(task_id, []), carried_entries or []
+            )
+            for file_name, _, count in payloads.values():
+                logger.info(f"✅ JSON saved: {file_name} ({count} items)")
+            return payloads["json"][0], payloads["delta"][0] if "delta" in payloads else None
             
         except Exception as e:
             logger.error(f"❌ JSON save failed: {e}")
-            return None
+            return None, None
+    
+    def _write_snapshot(
+        self,
+        task_id: str,
+        payloads: Dict[str, Tuple[str, str, int]],
+        entries: List[Dict[str, Any]],
+        carried_entries: List[Dict[str, Any]]
+    ) -> None:
+        """문서별 원본 내용과 JSON 출력을 스냅샷 저장소에 기록 후 보존 정책 적용"""
+        written, deduplicated = snapshot_store.written, snapshot_store.deduplicated
+        manifest_entries = [
+            {
+                **entry,
+                "html": snapshot_store.put(entry["html"]),
+                "markdown": snapshot_store.put(entry["markdown"]),
+                "processed": snapshot_store.put(entry["processed"]),
+            }
+            for entry in entries
+        ] + carried_entries
+        outputs = {
+            name: {"name": file_name, "hash": snapshot_store.put(payload), "items": count}
+            for name, (file_name, payload, count) in payloads.items()
+        }
+        snapshot_store.add_entries(task_id, "daily", manifest_entries, outputs=outputs)
+        logger.info(
+            f"🗄️ Snapshot stored: {snapshot_store.written - written} new blobs, "
+            f"{snapshot_store.deduplicated - deduplicated} unchanged"
+        )
+        snapshot_store.apply_retention()
     
     async def _send_update(self, task_id: str, update_type: str, data: Dict[str, Any]) -> None:
-        """SSE 업데이트 전송"""
-        if task_id in self.task_streams:
-            message = json.dumps({"type": update_type, "data": data})
-            await self.task_streams[task_id].put(message)
+        """SSE 업데이트 전송 (status/progress는 태스크 저장소에도 기록)"""
+        if update_type in {"status", "progress"}:
+            await self.store.record_progress(task_id, data)
+        await task_event_bus.publish(task_id, update_type, data)
 
 
 # 싱글톤 인스턴스
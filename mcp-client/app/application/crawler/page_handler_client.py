@@ -6,6 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from app.application.crawler.page_handlers.fetch_context import record_scrape_result, scrape_arguments
 from app.infrastructure.mcp.mcp_service import mcp_service
 
 logger = logging.getLogger(__name__)
@@ -62,8 +63,9 @@ class CrawlerProxy:
             crawl4ai 결과와 유사한 객체
         """
         logger.debug(f"CrawlerProxy.arun called for: {url}")
-        raw_result = await mcp_service.call_tool("crawl4ai_scrape", {"url": url})
+        raw_result = await mcp_service.call_tool("crawl4ai_scrape", await scrape_arguments(url))
         result = self._normalize_result(raw_result)
+        record_scrape_result(url, result)
 
         return CrawlResult(
             success=result.get("success", False),
@@ -112,8 +114,9 @@ class PageHandlerClient:
         """
         logger.debug(f"PageHandlerClient.scrape called for: {url}")
         try:
-            raw_result = await mcp_service.call_tool("crawl4ai_scrape", {"url": url})
+            raw_result = await mcp_service.call_tool("crawl4ai_scrape", await scrape_arguments(url))
             result = self._normalize_result(raw_result)
+            record_scrape_result(url, result)
             return {
                 "success": result.get("success", False),
                 "markdown": result.get("markdown", ""),
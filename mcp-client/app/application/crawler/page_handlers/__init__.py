@@ -6,13 +6,50 @@ URL 패턴 기반의 페이지별 커스텀 핸들러를 제공합니다.
 
 from app.application.crawler.page_handlers.handler_registry import (
     PageHandlerFunc,
+    HandlerSpec,
+    HandlerPlan,
     URL_PATTERNS,
     register_page_handler,
     get_registered_handlers,
     get_handler_for_url,
+    plan_url,
+    plan_urls,
     route_url,
 )
 
+from app.application.crawler.page_handlers.resource_blocking import (
+    ResourceBlockPolicy,
+    ResourceBlockStats,
+    apply_resource_blocking,
+    launch_browser,
+    start_resource_block_stats,
+    get_resource_block_stats,
+)
+
+from app.application.crawler.page_handlers.fetch_context import (
+    FetchContext,
+    fetch_context,
+    current_fetch_context,
+)
+
+from app.application.crawler.page_handlers.dom_pruning import (
+    prune_page,
+    pruned_content,
+    prune_selectors_for,
+)
+
+from app.application.crawler.page_handlers.deadline import (
+    Deadline,
+    handler_deadline,
+    current_deadline,
+)
+
+from app.application.crawler.page_handlers.wait_strategies import (
+    WAIT_STRATEGIES,
+    wait_until_ready,
+    settle_after,
+)
+
 # 핸들러들을 import하여 자동 등록
 from app.application.crawler.page_handlers.handlers import (
     ktshop,
@@ -27,11 +64,33 @@ from app.application.crawler.page_handler_client import page_handler_client
 
 __all__ = [
     "PageHandlerFunc",
+    "HandlerSpec",
+    "HandlerPlan",
     "URL_PATTERNS",
     "register_page_handler",
     "get_registered_handlers",
     "get_handler_for_url",
+    "plan_url",
+    "plan_urls",
     "route_url",
+    "ResourceBlockPolicy",
+    "ResourceBlockStats",
+    "apply_resource_blocking",
+    "launch_browser",
+    "start_resource_block_stats",
+    "get_resource_block_stats",
+    "FetchContext",
+    "fetch_context",
+    "current_fetch_context",
+    "prune_page",
+    "pruned_content",
+    "prune_selectors_for",
+    "Deadline",
+    "handler_deadline",
+    "current_deadline",
+    "WAIT_STRATEGIES",
+    "wait_until_ready",
+    "settle_after",
     "page_handler_client",
     # 핸들러 모듈
     "ktshop",
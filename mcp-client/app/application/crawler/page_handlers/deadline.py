@@ -0,0 +1,98 @@
+"""
+핸들러 실행 기한 (다중 페이지 핸들러의 부분 결과 반환)
+
+목록/상세를 여러 페이지 순회하는 핸들러는 전체 타임아웃에 걸리면 그때까지 모은 datas까지 모두 잃습니다.
+HandlerSpec.run이 핸들러 실행 구간에 Deadline을 연결하고, 핸들러는 페이지를 넘어갈 때마다 이를 확인해
+예산(budget)이 끝나면 순회를 멈추고 지금까지의 datas와 이어서 처리할 위치(continuation)를 반환합니다.
+
+- 예산: 다중 페이지 핸들러 settings.crawler_multi_page_budget, 단일 페이지 핸들러는 자신의 타임아웃
+- 기한을 확인하는 핸들러(register_page_handler(..., polls_deadline=True))의 전체 타임아웃(Daily Crawling의 wait_for)은
+  예산 + settings.crawler_deadline_grace 로, 핸들러가 현재 페이지를 마무리하고 부분 결과를 반환할 시간을 남겨 둠
+  (기한을 확인하지 않는 다중 페이지 핸들러는 전체 타임아웃 없이 실행)
+- 기한이 연결되지 않은 곳(직접 호출 등)에서는 current_deadline()이 만료되지 않는 기한을 반환
+
+사용 예:
+    deadline = current_deadline()
+    while current_url:
+        if deadline.expired:
+            return deadline.partial({"menus": menus, "datas": datas, ...}, continuation=current_url)
+        result = await asyncio.wait_for(handle_detail(current_url, ...), timeout=deadline.cap(120))
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# 남은 시간이 이보다 적으면 다음 페이지를 시작하지 않음 (초)
+MIN_PAGE_SECONDS = 5.0
+
+
+class Deadline:
+    """핸들러 한 번의 실행 예산 (budget이 None이면 제한 없음)"""
+
+    def __init__(self, budget: Optional[float] = None) -> None:
+        self.budget = budget
+        self.started_at = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간 (초, 제한 없으면 None)"""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - self.elapsed())
+
+    @property
+    def expired(self) -> bool:
+        """다음 페이지를 시작할 시간이 남지 않았는지 여부"""
+        remaining = self.remaining()
+        return remaining is not None and remaining < MIN_PAGE_SECONDS
+
+    def cap(self, timeout: float) -> float:
+        """페이지별 타임아웃을 남은 예산 안으로 제한"""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return max(MIN_PAGE_SECONDS, min(timeout, remaining))
+
+    def partial(self, result: Dict[str, Any], continuation: Any = None) -> Dict[str, Any]:
+        """
+        예산 만료 시 핸들러 반환값 (지금까지의 결과 + 이어서 처리할 위치)
+
+        continuation은 다음에 처리할 상세 URL이나 페이지 번호 등 핸들러가 이어서 시작할 수 있는 값입니다.
+        """
+        collected = len(result.get("datas") or [])
+        logger.warning(
+            f"⏱️ Handler budget exhausted ({self.elapsed():.0f}s/{self.budget:g}s): "
+            f"returning {collected} items, continuation={continuation}"
+        )
+        return {
+            **result,
+            "status": "partial",
+            "continuation": continuation,
+            "message": f"실행 예산({self.budget:g}초) 만료로 {collected}개까지 수집 후 중단",
+        }
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("handler_deadline", default=None)
+
+
+@contextmanager
+def handler_deadline(budget: Optional[float]) -> Iterator[Deadline]:
+    """핸들러 실행 구간에 기한 연결"""
+    deadline = Deadline(budget)
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def current_deadline() -> Deadline:
+    """현재 핸들러의 기한 (연결된 기한이 없으면 제한 없는 기한)"""
+    return _current.get() or Deadline()
@@ -0,0 +1,104 @@
+"""
+브라우저 안 DOM 정리 (page.content() 전에 불필요한 요소 제거)
+
+렌더링된 HTML 전체를 Python으로 가져와 셀렉터마다 BeautifulSoup 순회로 지우는 대신,
+주입 스크립트 한 번으로 브라우저 안에서 제거한 뒤 HTML을 읽습니다.
+브라우저 → Python, 클라이언트 → MCP 서버로 넘어가는 HTML 크기가 줄어듭니다.
+
+- 제거 대상: settings.crawler_prune_selectors (헤더/푸터/공유 버튼/팝업/숨김 요소 등)
+  + script/style/noscript/inline svg (항상 제거)
+- 도메인별 규칙: settings.crawler_prune_rules
+  예) {"shop.kt.com": {"keep": [".banner"], "remove": [".event-timer"]}}
+- prune_page: 현재 문서에서 제거 (핸들러가 이후 DOM을 그대로 읽을 때, selectors로 기본 목록 대신 좁은 목록 지정 가능)
+- pruned_content: 복제본에서 제거한 HTML 반환 (페이지는 그대로, 페치 컨텍스트 저장용)
+"""
+
+import logging
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 제거 스크립트: [셀렉터 목록, clone 여부]
+# clone=false면 현재 문서에서 제거, true면 복제본에서 제거한 HTML도 반환
+PRUNE_DOM_JS = """([selectors, clone]) => {
+    const root = clone ? document.documentElement.cloneNode(true) : document.documentElement;
+    let removed = 0;
+    const drop = (sel) => {
+        let nodes;
+        try { nodes = root.querySelectorAll(sel); } catch (e) { return; }
+        for (const el of nodes) {
+            if (el !== root && root.contains(el)) { el.remove(); removed++; }
+        }
+    };
+    ['script', 'style', 'noscript', 'svg'].forEach(drop);
+    selectors.forEach(drop);
+    if (!clone) return { removed };
+    const doctype = document.doctype ? '<!DOCTYPE ' + document.doctype.name + '>' : '';
+    return { removed, html: doctype + root.outerHTML };
+}"""
+
+
+@lru_cache(maxsize=256)
+def _site_selectors(host: str) -> Tuple[str, ...]:
+    """사이트 호스트에 가장 구체적으로 매칭되는 도메인 규칙을 기본 셀렉터와 합성"""
+    rules = {domain.lower(): rule for domain, rule in settings.crawler_prune_rules.items()}
+    matched = [d for d in rules if host == d or host.endswith('.' + d)]
+    rule = rules[max(matched, key=len)] if matched else {}
+    keep = set(rule.get("keep", []))
+    return tuple(sel for sel in settings.crawler_prune_selectors if sel not in keep) + tuple(rule.get("remove", []))
+
+
+def prune_selectors_for(url: str, extra: Optional[Iterable[str]] = None) -> List[str]:
+    """URL에 적용할 제거 셀렉터 (extra는 핸들러별 추가 셀렉터)"""
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except ValueError:
+        host = ""
+    return list(_site_selectors(host)) + list(extra or [])
+
+
+def _page_url(page) -> str:
+    try:
+        return page.url
+    except Exception:
+        return ""
+
+
+async def prune_page(
+    page,
+    extra: Optional[Iterable[str]] = None,
+    selectors: Optional[Iterable[str]] = None
+) -> Optional[int]:
+    """
+    현재 문서에서 불필요한 요소 제거 (제거 수 반환, 비활성화/실패 시 None)
+
+    이후 page.content()/evaluate로 읽는 DOM이 모두 정리된 상태가 되므로,
+    제거 대상 요소를 클릭하거나 읽어야 하는 핸들러는 그 작업 뒤에 호출합니다.
+    selectors를 주면 기본/도메인 셀렉터 대신 그 목록만 제거합니다 (script/style/noscript/svg는 항상 제거).
+    """
+    if not settings.crawler_dom_pruning:
+        return None
+    if selectors is None:
+        selectors = prune_selectors_for(_page_url(page), extra)
+    try:
+        result = await page.evaluate(PRUNE_DOM_JS, [list(selectors), False])
+        return int(result.get("removed", 0))
+    except Exception as e:
+        logger.debug(f"DOM pruning skipped: {e}")
+        return None
+
+
+async def pruned_content(page, extra: Optional[Iterable[str]] = None) -> Optional[str]:
+    """복제본에서 불필요한 요소를 제거한 HTML (페이지는 변경하지 않음, 비활성화/실패 시 None)"""
+    if not settings.crawler_dom_pruning:
+        return None
+    try:
+        result = await page.evaluate(PRUNE_DOM_JS, [prune_selectors_for(_page_url(page), extra), True])
+        return result.get("html") or None
+    except Exception as e:
+        logger.debug(f"DOM pruning skipped: {e}")
+        return None
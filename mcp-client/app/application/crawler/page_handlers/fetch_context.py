@@ -0,0 +1,166 @@
+"""
+URL 단위 페치 컨텍스트 (한 URL의 페이지 로드를 한 번으로 제한)
+
+전용 핸들러가 결과를 내지 못해 기본 스크래핑(crawl4ai_scrape)으로 폴백하면 같은 페이지를 처음부터 다시 로드하고,
+MCP 서버가 Playwright로 한 번 더 렌더링하기도 합니다. 페치 컨텍스트는 처음 성공한 탐색의 렌더링된 HTML을 보관해
+다음 추출 경로에 넘겨줍니다.
+
+- 핸들러 브라우저(launch_browser로 띄운 브라우저)에서 wait_until_ready로 준비 완료를 확인한 시점의 DOM을 저장
+  (load 시점 DOM은 iframe 처리/렌더링 대기 전이라 저장하지 않음 - 준비 완료 DOM이 없으면 폴백이 새로 로드)
+- 핸들러 브라우저가 대상 URL을 로드한 응답 상태를 기록해, 400 이상인 페이지는 저장하지 않음
+- MCP 스크래핑 결과의 HTML도 저장하므로 핸들러 내부 scrape 후 폴백 시에도 다시 로드하지 않음
+- 기본 스크래핑은 저장된 HTML을 crawl4ai_scrape(html_content=...)로 넘겨 정제만 수행
+- 핸들러 브라우저의 DOM은 복제본에서 불필요한 요소를 제거한 뒤 저장 (dom_pruning.py, MCP 서버 정제 생략)
+
+사용 예:
+    with fetch_context(url):
+        result = await route_url(url, page_handler_client)
+        if not result:
+            result = await crawler_tools.scrape(url)  # 저장된 HTML이 있으면 재로드 없이 정제
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from .dom_pruning import pruned_content
+
+logger = logging.getLogger(__name__)
+
+
+def _same_page(a: str, b: str) -> bool:
+    """스킴/fragment/끝 슬래시를 무시한 URL 비교 (http→https 리다이렉트 허용)"""
+    try:
+        pa, pb = urlsplit(a), urlsplit(b)
+    except ValueError:
+        return False
+    return (
+        (pa.hostname or "").lower() == (pb.hostname or "").lower()
+        and pa.path.rstrip("/") == pb.path.rstrip("/")
+        and pa.query == pb.query
+    )
+
+
+class FetchContext:
+    """한 URL 처리 동안 유지되는 렌더링 결과"""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.html: Optional[str] = None
+        self.title: Optional[str] = None
+        self.source: Optional[str] = None  # ready / scrape
+        self.status: Optional[int] = None  # 핸들러 브라우저에서 대상 URL을 로드한 응답 상태
+        self.pruned = False  # DOM pruning을 거친 HTML 여부
+        self.reused = 0  # 저장된 HTML을 재사용한 횟수
+
+    def matches(self, url: str) -> bool:
+        return _same_page(self.url, url)
+
+    def capture(self, html: str, source: str, title: Optional[str] = None, pruned: bool = False) -> None:
+        """렌더링된 HTML 저장 (처음 저장한 준비 완료(ready)/스크래핑 결과를 유지)"""
+        if not html or self.html is not None:
+            return
+        self.html = html
+        self.title = title or self.title
+        self.source = source
+        self.pruned = pruned
+        logger.debug(f"📸 Captured rendered HTML ({source}, {len(html)} chars): {self.url}")
+
+
+_current: ContextVar[Optional[FetchContext]] = ContextVar("fetch_context", default=None)
+
+
+@contextmanager
+def fetch_context(url: str) -> Iterator[FetchContext]:
+    """URL 처리 구간에 페치 컨텍스트 연결 (구간 안에서 만든 하위 태스크에도 전달)"""
+    context = FetchContext(url)
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def current_fetch_context() -> Optional[FetchContext]:
+    return _current.get()
+
+
+# ----------------------------------------------------------------------------------
+# Playwright 페이지 연결
+# ----------------------------------------------------------------------------------
+async def _capture_page(context: FetchContext, page, source: str) -> None:
+    try:
+        html = await pruned_content(page)
+        pruned = html is not None
+        if html is None:
+            html = await page.content()
+        title = await page.title()
+    except Exception as e:
+        # 핸들러가 이미 브라우저를 닫은 경우 등
+        logger.debug(f"DOM capture skipped ({context.url}): {e}")
+        return
+    context.capture(html, source, title, pruned=pruned)
+
+
+def watch_page(page) -> None:
+    """
+    현재 페치 컨텍스트의 URL을 로드하는 페이지의 응답 상태 기록 (오류 페이지는 DOM을 저장하지 않음)
+
+    Playwright 이벤트는 핸들러의 실행 컨텍스트 밖에서 호출되므로 연결 시점의 컨텍스트를 사용합니다.
+    """
+    context = _current.get()
+    if context is None:
+        return
+
+    def on_response(response) -> None:
+        try:
+            if response.request.is_navigation_request() and response.frame == page.main_frame and context.matches(response.url):
+                context.status = response.status
+        except Exception:
+            pass
+
+    page.on("response", on_response)
+
+
+async def capture_ready_page(page) -> None:
+    """준비 완료된 페이지의 DOM 저장 (wait_until_ready에서 호출, 대상 URL이 아니거나 오류 응답이면 무시)"""
+    context = _current.get()
+    if context is None or context.html is not None:
+        return
+    if context.status is not None and context.status >= 400:
+        return
+    try:
+        page_url = page.url
+    except Exception:
+        return
+    if context.matches(page_url):
+        await _capture_page(context, page, "ready")
+
+
+# ----------------------------------------------------------------------------------
+# MCP 스크래핑 연결
+# ----------------------------------------------------------------------------------
+async def scrape_arguments(url: str) -> Dict[str, Any]:
+    """crawl4ai_scrape 인자 (같은 URL의 렌더링된 HTML이 있으면 함께 전달해 재로드 방지)"""
+    arguments: Dict[str, Any] = {"url": url}
+    context = _current.get()
+    if context is None or not context.matches(url):
+        return arguments
+    if context.html:
+        context.reused += 1
+        arguments["html_content"] = context.html
+        if context.pruned:
+            arguments["html_pruned"] = True
+        logger.info(f"♻️ Reusing rendered HTML ({context.source}) for {url} — no reload")
+    return arguments
+
+
+def record_scrape_result(url: str, result: Dict[str, Any]) -> None:
+    """MCP 스크래핑 결과의 HTML 저장"""
+    context = _current.get()
+    if context is None or not context.matches(url) or not result.get("success"):
+        return
+    # MCP 서버는 DOM pruning을 복제본에만 적용하고 html_content는 원본 그대로 반환
+    context.capture(result.get("html_content") or "", "scrape", result.get("title"))
@@ -3,11 +3,24 @@ Page Handler Registry
 
 URL 패턴과 핸들러 함수를 매핑하고 라우팅하는 기능을 제공합니다.
 모든 핸들러는 비동기(async)로 통일되어 있습니다.
+
+- 등록 시 패턴에서 호스트를 추출해 호스트별 후보 목록(인덱스)을 만들고, 핸들러 시그니처도 미리 확인
+- URL → HandlerPlan 해석 결과는 캐시되어 같은 URL은 정규식을 다시 돌리지 않음
+- 핸들러 메타데이터(multi_page, budget, timeout, expected_duration)는 등록 시 선언하며
+  Daily Crawling은 이를 기준으로 타임아웃/실행 순서를 정함
+- 핸들러 실행 구간에는 실행 예산(budget)의 Deadline이 연결됨 (deadline.py 참고)
 """
 
+import inspect
 import logging
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+from app.config import settings
+from app.application.crawler.page_handlers.deadline import handler_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +30,142 @@ PageHandlerFunc = Callable[[str, Any, Optional[str]], Awaitable[Dict[str, Any]]]
 # URL 패턴과 핸들러 함수를 매핑하는 글로벌 레지스트리
 URL_PATTERNS: List[Tuple[Pattern, PageHandlerFunc]] = []
 
+# 기본 타임아웃 (초): 핸들러 없는 기본 스크래핑 / 단일 페이지 핸들러
+DEFAULT_SCRAPE_TIMEOUT = 300.0
+DEFAULT_HANDLER_TIMEOUT = 180.0
+
+# 예상 소요 시간 기본값 (초, 실행 순서 결정용)
+DEFAULT_PAGE_DURATION = 15.0
+DEFAULT_MULTI_PAGE_DURATION = 120.0
+
+# 패턴 앞부분의 고정 호스트 (예: r'https?://shop\.kt\.com/...' → shop.kt.com)
+_PATTERN_HOST = re.compile(r"^\^?https\??://((?:[A-Za-z0-9-]|\\\.)+)/")
+
+
+@dataclass(frozen=True)
+class HandlerSpec:
+    """등록된 핸들러와 선언된 메타데이터"""
+    pattern: Pattern
+    func: PageHandlerFunc
+    order: int  # 등록 순서 (먼저 등록된 패턴 우선)
+    host: Optional[str]  # 패턴의 고정 호스트 (추출할 수 없으면 None → 모든 호스트 후보)
+    accepts_menu: bool  # (url, fclient, menu) 시그니처 여부
+    multi_page: bool = False  # 목록/상세를 여러 페이지 순회하는 핸들러
+    timeout: Optional[float] = DEFAULT_HANDLER_TIMEOUT  # 전체 실행 제한 시간 (None이면 제한 없음, 페이지별 자체 타임아웃)
+    expected_duration: float = DEFAULT_PAGE_DURATION  # 예상 소요 시간 (초)
+    budget: Optional[float] = None  # 실행 예산 (초, 만료 시 핸들러가 부분 결과 반환, None이면 제한 없음)
+
+    @property
+    def name(self) -> str:
+        return self.func.__name__
+
+    async def run(self, url: str, fclient: Any, menu: Optional[str] = None) -> Dict[str, Any]:
+        with handler_deadline(self.budget):
+            if self.accepts_menu:
+                return await self.func(url, fclient, menu)
+            return await self.func(url, fclient)
+
+
+@dataclass(frozen=True)
+class HandlerPlan:
+    """URL 하나의 처리 계획 (전용 핸들러 또는 기본 스크래핑)"""
+    url: str
+    spec: Optional[HandlerSpec]
+
+    @property
+    def handler_name(self) -> Optional[str]:
+        return self.spec.name if self.spec else None
+
+    @property
+    def multi_page(self) -> bool:
+        return bool(self.spec and self.spec.multi_page)
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self.spec.timeout if self.spec else DEFAULT_SCRAPE_TIMEOUT
+
+    @property
+    def expected_duration(self) -> float:
+        return self.spec.expected_duration if self.spec else DEFAULT_PAGE_DURATION
+
+    @property
+    def budget(self) -> Optional[float]:
+        return self.spec.budget if self.spec else None
+
+
+HANDLER_SPECS: List[HandlerSpec] = []
+_HOST_INDEX: Dict[str, List[HandlerSpec]] = {}
+_ANY_HOST: List[HandlerSpec] = []
+
 
-def register_page_handler(url_pattern: str, handler_func: PageHandlerFunc) -> None:
+def _pattern_host(url_pattern: str) -> Optional[str]:
+    match = _PATTERN_HOST.match(url_pattern)
+    if not match:
+        return None
+    return match.group(1).replace("\\.", ".").lower()
+
+
+def _accepts_menu(handler_func: PageHandlerFunc) -> bool:
+    # 대부분의 핸들러: (url, fclient, menu), 일부 핸들러: (url, fclient)
+    return len(inspect.signature(handler_func).parameters) >= 3
+
+
+def register_page_handler(
+    url_pattern: str,
+    handler_func: PageHandlerFunc,
+    *,
+    multi_page: bool = False,
+    polls_deadline: bool = False,
+    timeout: Optional[float] = None,
+    expected_duration: Optional[float] = None,
+    budget: Optional[float] = None,
+) -> None:
     """
     URL 패턴과 핸들러 함수를 등록
-    
+
     Args:
         url_pattern: 정규식 패턴
         handler_func: 비동기 핸들러 함수
+        multi_page: 여러 페이지를 순회하는 핸들러 여부
+        polls_deadline: 다중 페이지 핸들러가 current_deadline()을 확인해 예산 만료 시 부분 결과를 반환하는지 여부
+        timeout: 전체 실행 제한 시간 (초, 생략 시 단일 페이지 180초 / 기한을 확인하는 다중 페이지 예산 + 유예 시간 /
+                 기한을 확인하지 않는 다중 페이지는 제한 없음 - 수집한 결과를 잃지 않도록 개별 페이지 타임아웃만 적용)
+        expected_duration: 예상 소요 시간 (초, 생략 시 단일 페이지 15초 / 다중 페이지 120초)
+        budget: 실행 예산 (초, 생략 시 단일 페이지 timeout / 다중 페이지 settings.crawler_multi_page_budget)
     """
     compiled_pattern = re.compile(url_pattern)
+    if multi_page:
+        if budget is None:
+            budget = settings.crawler_multi_page_budget
+        if timeout is None and polls_deadline:
+            timeout = budget + settings.crawler_deadline_grace
+    else:
+        if timeout is None:
+            timeout = DEFAULT_HANDLER_TIMEOUT
+        if budget is None:
+            budget = timeout
+    if expected_duration is None:
+        expected_duration = DEFAULT_MULTI_PAGE_DURATION if multi_page else DEFAULT_PAGE_DURATION
+
+    spec = HandlerSpec(
+        pattern=compiled_pattern,
+        func=handler_func,
+        order=len(HANDLER_SPECS),
+        host=_pattern_host(url_pattern),
+        accepts_menu=_accepts_menu(handler_func),
+        multi_page=multi_page,
+        timeout=timeout,
+        expected_duration=expected_duration,
+        budget=budget,
+    )
+    HANDLER_SPECS.append(spec)
     URL_PATTERNS.append((compiled_pattern, handler_func))
+    if spec.host is None:
+        _ANY_HOST.append(spec)
+    else:
+        _HOST_INDEX.setdefault(spec.host, []).append(spec)
+    _candidates.cache_clear()
+    plan_url.cache_clear()
     logger.debug(f"핸들러 등록됨: {url_pattern} -> {handler_func.__name__}")
 
 
@@ -36,70 +174,88 @@ def get_registered_handlers() -> List[Tuple[str, str]]:
     return [(pattern.pattern, func.__name__) for pattern, func in URL_PATTERNS]
 
 
+@lru_cache(maxsize=None)
+def _candidates(host: str) -> Tuple[HandlerSpec, ...]:
+    """호스트의 후보 핸들러 (고정 호스트 + 호스트 미지정 패턴, 등록 순서)"""
+    specs = _HOST_INDEX.get(host, []) + _ANY_HOST
+    return tuple(sorted(specs, key=lambda spec: spec.order))
+
+
+@lru_cache(maxsize=8192)
+def plan_url(url: str) -> HandlerPlan:
+    """URL의 처리 계획 (매칭되는 첫 핸들러, 없으면 기본 스크래핑)"""
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        host = ""
+    for spec in _candidates(host):
+        if spec.pattern.match(url):
+            return HandlerPlan(url=url, spec=spec)
+    return HandlerPlan(url=url, spec=None)
+
+
+def plan_urls(urls: List[str]) -> Dict[str, HandlerPlan]:
+    """URL 목록을 한 번에 처리 계획으로 변환"""
+    return {url: plan_url(url) for url in urls}
+
+
 async def route_url(
-    url: str, 
-    fclient: Any, 
-    menu: Optional[str] = None
+    url: str,
+    fclient: Any,
+    menu: Optional[str] = None,
+    plan: Optional[HandlerPlan] = None
 ) -> Optional[Dict[str, Any]]:
     """
     URL에 맞는 핸들러를 찾아서 실행 (비동기)
-    
+
     Args:
         url: 처리할 URL
         fclient: 스크래핑 클라이언트 (PageHandlerClient 인스턴스)
         menu: 메뉴 정보
-        
+        plan: 미리 계산한 처리 계획 (생략 시 URL로 조회)
+
     Returns:
         Optional[Dict[str, Any]]: 핸들러 결과 또는 None (기본 스크래핑용)
     """
-    for pattern, handler_func in URL_PATTERNS:
-        if pattern.match(url):
-            try:
-                logger.info(f"🎯 URL 매칭됨: {url} -> {handler_func.__name__}")
-                
-                # 핸들러 시그니처에 따라 인자 전달
-                # 대부분의 핸들러: (url, fclient, menu)
-                # 일부 핸들러: (url, fclient)
-                import inspect
-                sig = inspect.signature(handler_func)
-                params = list(sig.parameters.keys())
-                
-                if len(params) >= 3:
-                    result = await handler_func(url, fclient, menu)
-                else:
-                    result = await handler_func(url, fclient)
-                    
-                return result
-            except Exception as e:
-                logger.error(f"❌ 핸들러 실행 중 오류: {handler_func.__name__} - {str(e)}")
-                return None
-    
-    # 핸들러가 없는 경우 None 반환 (기본 스크래핑 실행을 위해)
-    logger.info(f"🔍 URL에 맞는 핸들러가 없어 기본 스크래핑을 실행합니다: {url}")
-    return None
+    spec = (plan or plan_url(url)).spec
+    if spec is None:
+        # 핸들러가 없는 경우 None 반환 (기본 스크래핑 실행을 위해)
+        logger.info(f"🔍 URL에 맞는 핸들러가 없어 기본 스크래핑을 실행합니다: {url}")
+        return None
+
+    try:
+        logger.info(f"🎯 URL 매칭됨: {url} -> {spec.name}")
+        return await spec.run(url, fclient, menu)
+    except Exception as e:
+        logger.error(f"❌ 핸들러 실행 중 오류: {spec.name} - {str(e)}")
+        return None
 
 
 def clear_handlers() -> None:
     """등록된 핸들러 모두 제거 (테스트용)"""
-    global URL_PATTERNS
     URL_PATTERNS.clear()
+    HANDLER_SPECS.clear()
+    _HOST_INDEX.clear()
+    _ANY_HOST.clear()
+    _candidates.cache_clear()
+    plan_url.cache_clear()
     logger.info("모든 핸들러가 제거되었습니다")
 
 
 def get_handler_for_url(url: str) -> Optional[Tuple[str, PageHandlerFunc]]:
     """
     URL에 매칭되는 핸들러 반환 (실행하지 않음)
-    
+
     Args:
         url: 확인할 URL
-        
+
     Returns:
         Optional[Tuple[str, PageHandlerFunc]]: (패턴 문자열, 핸들러 함수) 또는 None
     """
-    for pattern, handler_func in URL_PATTERNS:
-        if pattern.match(url):
-            return (pattern.pattern, handler_func)
-    return None
+    spec = plan_url(url).spec
+    if spec is None:
+        return None
+    return (spec.pattern.pattern, spec.func)
 
 
 def get_handler_count() -> int:
@@ -6,13 +6,17 @@
 
 import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from playwright.async_api import async_playwright
 from markdownify import markdownify as md
+from bs4 import BeautifulSoup
 
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
 from ..utils import to_gigagenie_murl, smart_goto
+from ..wait_strategies import settle_after, wait_until_ready
+from ..xhr_capture import CapturedExchange, PagedEndpoint, discover_paged_endpoint, find_record_list, pick
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +46,7 @@ async def handle_gigagenie_detail(
     logger.info(f"Gigagenie detail page processing started: {url}")
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         page = await browser.new_page()
         response = await smart_goto(page, url, wait_for_selector="#depth2Level", timeout=30000)
         
@@ -66,8 +70,8 @@ async def handle_gigagenie_detail(
                 btn = tab["button"]
                 tab_name = tab["tab_name"]
                 try:
-                    await btn.click()
-                    await page.wait_for_timeout(1200)
+                    async with settle_after(page, max_wait=1200):
+                        await btn.click()
                     content_div = await page.query_selector("div.fjbInnerTabBox[class*='fjbTabCon'][class~='on']")
                     if content_div:
                         html = await content_div.inner_html()
@@ -112,6 +116,45 @@ async def handle_gigagenie_detail(
     }
 
 
+def _parse_faq_items(exchange: CapturedExchange) -> List[Tuple[str, str]]:
+    """
+    직접 호출한 FAQ 목록 응답 파싱 → [(질문, 답변 마크다운)]
+
+    질문은 있는데 답변 필드/요소를 찾지 못하면 응답 형태를 잘못 추정한 것이므로 ValueError를 발생시켜
+    직접 호출을 실패로 처리합니다 (호출 측은 selectFaqList + 클릭 방식으로 전환).
+    """
+    if exchange.is_json:
+        items = []
+        for record in find_record_list(exchange.json()):
+            question = pick(record, 'question', 'faqTitle', 'faqSbj', 'title', 'subject')
+            answer = pick(record, 'answer', 'faqCntn', 'faqContent', 'content', 'contents')
+            if not question:
+                continue
+            if not answer:
+                raise ValueError(f"FAQ answer field not found (keys: {sorted(record)})")
+            items.append((question, md(answer).strip()))
+        return items
+
+    soup = BeautifulSoup(exchange.body, 'html.parser')
+    items = []
+    for qa in soup.select('li'):
+        q_elem = qa.select_one('a.fjbQuestion')
+        if not q_elem:
+            continue
+        a_elem = qa.select_one('div.fjbAnser')
+        if a_elem is None:
+            raise ValueError("FAQ answer element (div.fjbAnser) not found")
+        items.append((q_elem.get_text().strip(), md(a_elem.decode_contents()).strip()))
+    return items
+
+
+async def _fetch_faq_page(endpoint: PagedEndpoint, page, page_num: int) -> List[Tuple[str, str]]:
+    """캡처한 FAQ 목록 엔드포인트로 page_num 페이지 직접 수집 (실패 시 빈 목록)"""
+    async for _, items in endpoint.iter_pages(page, _parse_faq_items, start=page_num, end=page_num):
+        return items
+    return []
+
+
 async def handle_gigagenie_faq_playwright(url: str, fclient: Any) -> Dict[str, Any]:
     """
     기가지니 자주하는질문 전체 페이지 FAQ 추출
@@ -121,7 +164,7 @@ async def handle_gigagenie_faq_playwright(url: str, fclient: Any) -> Dict[str, A
     logger.info(f"Gigagenie FAQ processing started: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         page = await browser.new_page()
         
         response = await page.goto(url, wait_until="domcontentloaded", timeout=60000)
@@ -134,7 +177,7 @@ async def handle_gigagenie_faq_playwright(url: str, fclient: Any) -> Dict[str, A
             logger.info("✅ FAQ list loaded")
         except Exception as e:
             logger.warning(f"⚠️ FAQ list not loaded: {e}")
-        await page.wait_for_timeout(2000)
+        await wait_until_ready(page, max_wait=2000)
         if status_code and status_code >= 400:
             logger.error(f"❌ Gigagenie FAQ ({url}): HTTP {status_code} error")
         
@@ -164,16 +207,41 @@ async def handle_gigagenie_faq_playwright(url: str, fclient: Any) -> Dict[str, A
                 
                 logger.info(f"🔍 Product {product_idx + 1}/{len(product_buttons)} processing: {product_name}")
                 
-                # 상품 버튼 클릭
-                await button.click()
-                await page.wait_for_timeout(2000)
+                # 상품 버튼 클릭 (FAQ 목록 갱신 대기)
+                async with settle_after(page, max_wait=2000):
+                    await button.click()
                 
                 # 페이지네이션 처리
                 page_num = 1
                 max_pages = 50
                 seen_questions = set()
+                endpoint = None  # 2페이지 이동 시 캡처한 FAQ 목록 엔드포인트 (이후 페이지는 직접 호출)
                 
                 while page_num <= max_pages:
+                    if endpoint is not None:
+                        fetched = await _fetch_faq_page(endpoint, page, page_num)
+                        if fetched:
+                            logger.info(f"  Page {page_num}: {len(fetched)} FAQ items fetched directly")
+                            for question, answer in fetched:
+                                if question in seen_questions:
+                                    continue
+                                seen_questions.add(question)
+                                all_qa_list.append({
+                                    "product": product_name,
+                                    "question": question,
+                                    "answer": answer
+                                })
+                            page_num += 1
+                            continue
+                        # 직접 호출 결과가 없으면 selectFaqList로 같은 페이지를 다시 확인
+                        endpoint = None
+                        try:
+                            async with settle_after(page, max_wait=3000):
+                                await page.evaluate(f"selectFaqList({page_num})")
+                        except Exception as e:
+                            logger.info(f"  Page {page_num} navigation failed: {str(e)}")
+                            break
+                    
                     # Q/A 추출
                     qa_items = await page.query_selector_all("ul#faqList li")
                     logger.info(f"  Page {page_num}: {len(qa_items)} FAQ items found")
@@ -193,8 +261,8 @@ async def handle_gigagenie_faq_playwright(url: str, fclient: Any) -> Dict[str, A
                                 seen_questions.add(question)
                                 
                                 # 질문 클릭하여 답변 표시
-                                await q_elem.click()
-                                await page.wait_for_timeout(500)
+                                async with settle_after(page, max_wait=500):
+                                    await q_elem.click()
                                 
                                 # 답변 추출
                                 a_elem = await qa.query_selector("div.fjbAnser")
@@ -213,6 +281,9 @@ async def handle_gigagenie_faq_playwright(url: str, fclient: Any) -> Dict[str, A
                     
                     # 다음 페이지 확인 및 이동 (selectFaqList 함수 사용)
                     next_page_num = page_num + 1
+                    if endpoint is not None:
+                        page_num = next_page_num
+                        continue
                     try:
                         # 1. onclick에 selectFaqList가 있는 링크 찾기
                         next_page_selector = f"a[onclick*='selectFaqList({next_page_num})']"
@@ -220,14 +291,27 @@ async def handle_gigagenie_faq_playwright(url: str, fclient: Any) -> Dict[str, A
                         
                         if next_page_link and await next_page_link.is_visible():
                             logger.info(f"  Navigating to page {next_page_num} (link click)")
-                            await next_page_link.click()
-                            await page.wait_for_timeout(3000)
+                            
+                            async def click_next_link():
+                                async with settle_after(page, max_wait=3000):
+                                    await next_page_link.click()
+                            
+                            if next_page_num == 2:
+                                endpoint = await discover_paged_endpoint(page, click_next_link, page_no=2)
+                            else:
+                                await click_next_link()
                             page_num = next_page_num
                         else:
                             # 2. JavaScript 함수 직접 실행
                             try:
-                                await page.evaluate(f"selectFaqList({next_page_num})")
-                                await page.wait_for_timeout(3000)
+                                async def select_next_page(target_page: int = next_page_num):
+                                    async with settle_after(page, max_wait=3000):
+                                        await page.evaluate(f"selectFaqList({target_page})")
+                                
+                                if next_page_num == 2:
+                                    endpoint = await discover_paged_endpoint(page, select_next_page, page_no=2)
+                                else:
+                                    await select_next_page()
                                 
                                 # 실제로 페이지가 변경되었는지 확인
                                 new_qa_items = await page.query_selector_all("ul#faqList li")
@@ -292,7 +376,8 @@ register_page_handler(
 
 register_page_handler(
     r'https?://gigagenie\.kt\.com/whyGenieFaq\.do.*',
-    handle_gigagenie_faq_playwright
+    handle_gigagenie_faq_playwright,
+    multi_page=True,
 )
 
 
@@ -309,7 +394,7 @@ async def handle_gigagenie_news_list(url: str, fclient: Any, menu: Optional[str]
     logger.info(f"🔗 Gigagenie News List handler entered: url={url}, menu={menu}")
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         page = await browser.new_page()
 
         response = await page.goto(url, wait_until="domcontentloaded", timeout=40000)
@@ -322,7 +407,7 @@ async def handle_gigagenie_news_list(url: str, fclient: Any, menu: Optional[str]
             logger.info("✅ News list loaded")
         except Exception as e:
             logger.warning(f"⚠️ News list not loaded: {e}")
-        await page.wait_for_timeout(2000)
+        await wait_until_ready(page, max_wait=2000)
         if status_code:
             if status_code >= 400:
                 logger.error(f"❌ Gigagenie News List ({url}): HTTP {status_code} error")
@@ -345,12 +430,12 @@ async def handle_gigagenie_news_list(url: str, fclient: Any, menu: Optional[str]
                     logger.info("Load More button disabled, loading complete")
                     break
                 try:
-                    await load_more_button.click()
+                    async with settle_after(page, "selector_stable", max_wait=2000, selector="ul#bloglist li"):
+                        await load_more_button.click()
+                        logger.info("Load More button clicked, waiting for additional posts")
                 except PlaywrightTimeoutError:
                     logger.warning("⚠️ Load More button click timeout, assuming loading complete")
                     break
-                logger.info("Load More button clicked, waiting for additional posts")
-                await page.wait_for_timeout(2000)
         except PlaywrightTimeoutError as timeout_err:
             logger.warning(f"⚠️ Load More button processing timeout: {str(timeout_err)}")
         except Exception as e:
@@ -386,7 +471,7 @@ async def handle_gigagenie_news_list(url: str, fclient: Any, menu: Optional[str]
                         await detail_page.wait_for_selector('.content, .detail-content', timeout=10000)
                     except Exception:
                         pass
-                    await detail_page.wait_for_timeout(2000)
+                    await wait_until_ready(detail_page, max_wait=2000)
                     if detail_status:
                         if detail_status >= 400:
                             logger.error(f"❌ Gigagenie News detail ({detail_url}): HTTP {detail_status} error")
@@ -532,5 +617,6 @@ async def handle_gigagenie_news_list(url: str, fclient: Any, menu: Optional[str]
 
 register_page_handler(
     r'https?://gigagenie\.kt\.com/whyGenieNews\.do',
-    handle_gigagenie_news_list
+    handle_gigagenie_news_list,
+    multi_page=True,
 )
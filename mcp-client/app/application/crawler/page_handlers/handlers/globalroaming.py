@@ -14,6 +14,8 @@ from playwright.async_api import async_playwright
 from markdownify import markdownify as md
 
 from ..handler_registry import register_page_handler
+from ..deadline import current_deadline
+from ..resource_blocking import launch_browser
 from ..utils import (
     sanitize_filename, 
     format_content, 
@@ -37,7 +39,7 @@ async def handle_roaming_notice(
     logger.info(f"🔗 Roaming notice detail: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -244,7 +246,7 @@ async def handle_globalroaming_notice_main(
     cutoff_date = datetime.now() - timedelta(days=365)
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -308,7 +310,14 @@ async def handle_globalroaming_notice_main(
     consecutive_errors = 0
     max_consecutive_errors = 3
     
+    deadline = current_deadline()
+    continuation = None
+    
     for notice in notices:
+        if deadline.expired:
+            # 실행 예산 만료: 지금까지 수집한 결과와 다음에 처리할 상세 URL 반환
+            continuation = notice['href']
+            break
         try:
             date_str = notice['date']
             date_match = re.search(r'(\d{4})[\.\-](\d{1,2})[\.\-](\d{1,2})', date_str)
@@ -318,15 +327,20 @@ async def handle_globalroaming_notice_main(
                 if post_date < cutoff_date:
                     break
             
-            # 개별 상세 페이지에 120초(2분) 타임아웃 적용
+            # 개별 상세 페이지에 최대 120초(2분) 타임아웃 적용 (남은 예산 안으로 제한)
+            detail_timeout = deadline.cap(120)
             try:
                 result = await asyncio.wait_for(
                     handle_roaming_notice(notice['href'], fclient, notice.get('date')),
-                    timeout=120
+                    timeout=detail_timeout
                 )
                 consecutive_errors = 0
             except asyncio.TimeoutError:
-                logger.warning(f"⚠️ Timeout (120s): {notice['href']}")
+                logger.warning(f"⚠️ Timeout ({detail_timeout:.0f}s): {notice['href']}")
+                if deadline.expired:
+                    # 예산 만료로 잘린 상세 페이지부터 이어서 처리
+                    continuation = notice['href']
+                    break
                 consecutive_errors += 1
                 if consecutive_errors >= max_consecutive_errors:
                     logger.error(f"❌ Stopped: {max_consecutive_errors} consecutive failures")
@@ -368,19 +382,24 @@ async def handle_globalroaming_notice_main(
                 break
             continue
     
-    return {
+    summary = {
         "menus": menus,
         "datas": datas,
         "total_processed": total_processed,
         "status": "completed",
         "message": f"총 {total_processed}개 로밍 공지사항 처리 완료"
     }
+    if continuation:
+        return deadline.partial(summary, continuation=continuation)
+    return summary
 
 
 # 핸들러 등록
 register_page_handler(
     r'https?://globalroaming\.kt\.com/news/list\.asp(?:\?.*)?$',
-    handle_globalroaming_notice_main
+    handle_globalroaming_notice_main,
+    multi_page=True,
+    polls_deadline=True,
 )
 
 
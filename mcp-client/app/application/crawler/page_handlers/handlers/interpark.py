@@ -13,6 +13,8 @@ from playwright.async_api import async_playwright
 from markdownify import markdownify as md
 
 from ..handler_registry import register_page_handler
+from ..deadline import current_deadline
+from ..resource_blocking import launch_browser
 from ..utils import sanitize_filename, format_date_show, format_content, create_markdown, smart_goto
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,7 @@ async def handle_show_notice(url: str, fclient: Any) -> Dict[str, Any]:
     logger.info(f"🔗 Show notice detail: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -138,7 +140,7 @@ async def handle_interpark_notice_main(url: str, fclient: Any, menu: Optional[st
     cutoff_date = datetime.now() - timedelta(days=365)
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -254,7 +256,14 @@ async def handle_interpark_notice_main(url: str, fclient: Any, menu: Optional[st
     menus, datas = [], []
     total_processed = 0
     
+    deadline = current_deadline()
+    continuation = None
+    
     for notice in notices:
+        if deadline.expired:
+            # 실행 예산 만료: 지금까지 수집한 결과와 다음에 처리할 상세 URL 반환
+            continuation = notice['fullHref']
+            break
         try:
             date_str = notice['date']
             date_match = re.search(r'(\d{4})\.(\d{1,2})\.(\d{1,2})', date_str)
@@ -293,7 +302,7 @@ async def handle_interpark_notice_main(url: str, fclient: Any, menu: Optional[st
             logger.error(f"❌ Error: {str(e)}")
             continue
     
-    return {
+    summary = {
         "menus": menus,
         "datas": datas,
         "total_processed": total_processed,
@@ -301,12 +310,17 @@ async def handle_interpark_notice_main(url: str, fclient: Any, menu: Optional[st
         "message": f"총 {total_processed}개 공지사항 처리 완료",
         "status_code": status_code
     }
+    if continuation:
+        return deadline.partial(summary, continuation=continuation)
+    return summary
 
 
 # 핸들러 등록
 register_page_handler(
     r'https?://kt\.interpark\.com/Partner/KT/Event/NoticeList\.asp.*',
-    handle_interpark_notice_main
+    handle_interpark_notice_main,
+    multi_page=True,
+    polls_deadline=True,
 )
 
 
@@ -7,15 +7,26 @@ KT 이벤트 관련 핸들러
 import logging
 import re
 from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
 
 from playwright.async_api import async_playwright
 from markdownify import markdownify as md
 from bs4 import BeautifulSoup
 
+from ..dom_pruning import prune_page
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
+from ..wait_strategies import settle_after, wait_until_ready
+from ..xhr_capture import CapturedExchange, PagedEndpoint, discover_paged_endpoint, find_record_list, pick
 
 logger = logging.getLogger(__name__)
 
+# 이벤트 상세 iframe에서 제거할 요소 (본문 영역이라 기본 셀렉터 대신 좁은 목록만 사용)
+IFRAME_PRUNE_SELECTORS = [
+    '.ad', '.banner', '.popup',
+    '.btn-twitter', '.btn-facebook', '.btn-kakao', '.btn-youtube',
+]
+
 
 def _pc_to_mobile_url(pc_url: str) -> str:
     """PC 이벤트 URL을 모바일 URL로 변환 (mblevtno = pcEvtNo + 1)"""
@@ -56,7 +67,7 @@ async def handle_kt_event_detail(
     logger.info(f"KT Event detail processing started: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -65,7 +76,7 @@ async def handle_kt_event_detail(
         
         try:
             response = await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_timeout(3000)
+            await wait_until_ready(page, max_wait=3000)
             
             status_code = response.status if response else None
             if status_code and status_code >= 400:
@@ -133,16 +144,22 @@ async def handle_kt_event_detail(
             # iframe 내용 처리
             iframe_content = ""
             iframe_html = ""
+            iframe_pruned = None
             if event_info.get('iframe_src'):
                 try:
                     logger.info(f"🔍 Event iframe processing: {event_info['iframe_src']}")
                     iframe_page = await context.new_page()
                     await iframe_page.goto(event_info['iframe_src'], wait_until='domcontentloaded', timeout=60000)
-                    await iframe_page.wait_for_timeout(5000)
+                    await wait_until_ready(iframe_page, max_wait=5000)
+                    
+                    # 불필요한 요소는 브라우저 안에서 제거 (script/style/광고/배너/팝업/SNS 버튼)
+                    iframe_pruned = await prune_page(iframe_page, selectors=IFRAME_PRUNE_SELECTORS)
+                    if iframe_pruned is None:
+                        await iframe_page.evaluate("""() => {
+                            document.querySelectorAll('script, style, noscript, .ad, .banner, .popup').forEach(el => el.remove());
+                        }""")
                     
                     iframe_data = await iframe_page.evaluate("""() => {
-                        const elementsToRemove = document.querySelectorAll('script, style, noscript, .ad, .banner, .popup');
-                        elementsToRemove.forEach(el => el.remove());
                         const mainContent = document.querySelector('body') || document.documentElement;
                         return {
                             html: mainContent ? mainContent.innerHTML : '',
@@ -168,13 +185,17 @@ async def handle_kt_event_detail(
             
             if iframe_content:
                 try:
-                    soup = BeautifulSoup(iframe_content, 'html.parser')
-                    for tag in soup(['script', 'style', 'noscript']):
-                        tag.decompose()
-                    for selector in ['.btn-twitter', '.btn-facebook', '.btn-kakao', '.btn-youtube']:
-                        for element in soup.select(selector):
-                            element.decompose()
-                    cleaned_html = str(soup)
+                    if iframe_pruned is not None:
+                        # 브라우저에서 이미 정리된 HTML
+                        cleaned_html = iframe_content
+                    else:
+                        soup = BeautifulSoup(iframe_content, 'html.parser')
+                        for tag in soup(['script', 'style', 'noscript']):
+                            tag.decompose()
+                        for selector in ['.btn-twitter', '.btn-facebook', '.btn-kakao', '.btn-youtube']:
+                            for element in soup.select(selector):
+                                element.decompose()
+                        cleaned_html = str(soup)
                     iframe_markdown = md(cleaned_html)
                     markdown_content += iframe_markdown
                 except Exception as e:
@@ -239,6 +260,64 @@ async def handle_kt_event_detail(
             }
 
 
+
+def _parse_event_list(exchange: CapturedExchange) -> List[Dict[str, Any]]:
+    """직접 호출한 이벤트 목록 응답 파싱 (HTML 조각 또는 JSON, 목록 페이지 DOM 추출과 같은 형태)"""
+    if exchange.is_json:
+        events = []
+        for record in find_record_list(exchange.json()):
+            evt_no = pick(record, 'pcEvtNo', 'evtNo', 'eventNo')
+            if not evt_no:
+                continue
+            start, end = pick(record, 'evtStDt', 'startDate', 'stDt'), pick(record, 'evtEndDt', 'endDate', 'endDt')
+            events.append({
+                'evt_no': evt_no,
+                'apct_url': pick(record, 'apctUrl'),
+                'link_type': pick(record, 'pcEvtLinkType', 'evtLinkType', 'linkType'),
+                'title': pick(record, 'evtNm', 'pcEvtNm', 'evtTitle', 'title'),
+                'date': pick(record, 'evtPeriod', 'period', 'date', default=f"{start} ~ {end}" if start else ''),
+                'type': pick(record, 'evtTypeNm', 'evtCtgNm', 'type'),
+                'img_src': pick(record, 'pcImgUrl', 'imgUrl', 'thumbUrl'),
+                'img_alt': pick(record, 'imgAlt'),
+                'd_day': pick(record, 'dDay', 'dday'),
+                'full_href': '',
+            })
+        return events
+
+    soup = BeautifulSoup(exchange.body, 'html.parser')
+    events = []
+    for link in soup.select('a[data-pcevtno]'):
+        thumb = link.select_one('.thumb')
+        img = thumb.select_one('img') if thumb else None
+        d_day = thumb.select_one('.d-day') if thumb else None
+        summary = link.select_one('.summary')
+
+        def summary_text(selector: str) -> str:
+            el = summary.select_one(selector) if summary else None
+            return el.get_text().strip() if el else ''
+
+        events.append({
+            'evt_no': link.get('data-pcevtno'),
+            'apct_url': link.get('data-apcturl'),
+            'link_type': link.get('data-pcevtlinktype'),
+            'title': summary_text('.title'),
+            'date': summary_text('.date'),
+            'type': summary_text('.type'),
+            'img_src': img.get('src', '') if img else '',
+            'img_alt': img.get('alt', '') if img else '',
+            'd_day': d_day.get_text().strip() if d_day else '',
+            'full_href': urljoin(exchange.url, link.get('href', '')),
+        })
+    return events
+
+
+async def _fetch_event_page(endpoint: PagedEndpoint, page, page_num: int) -> List[Dict[str, Any]]:
+    """캡처한 목록 엔드포인트로 page_num 페이지 이벤트 직접 수집 (실패 시 빈 목록)"""
+    async for _, events in endpoint.iter_pages(page, _parse_event_list, start=page_num, end=page_num):
+        return events
+    return []
+
+
 async def handle_kt_event_main(
     url: str, 
     fclient: Any, 
@@ -250,7 +329,7 @@ async def handle_kt_event_main(
     logger.info(f"🎯 KT Event main processing started: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -271,8 +350,8 @@ async def handle_kt_event_main(
             except Exception as e:
                 logger.warning(f"⚠️ Event links not found after 15s: {e}")
             
-            # 추가 안정화 대기
-            await page.wait_for_timeout(2000)
+            # 추가 안정화 대기 (이벤트 링크 개수가 안정될 때까지)
+            await wait_until_ready(page, "selector_stable", max_wait=2000, selector='a[data-pcevtno]')
             
             # 페이지네이션 정보 추출
             pagination_info = await page.evaluate("""() => {
@@ -294,20 +373,35 @@ async def handle_kt_event_main(
             
             all_events = []
             total_pages = pagination_info.get('total_pages', 1)
+            endpoint = None  # 2페이지 이동 시 캡처한 목록 엔드포인트 (이후 페이지는 직접 호출)
             
             # 모든 페이지 순회
             for page_num in range(1, total_pages + 1):
+                if page_num > 2 and endpoint is not None:
+                    page_events = await _fetch_event_page(endpoint, page, page_num)
+                    if page_events:
+                        all_events.extend(page_events)
+                        logger.info(f"📄 Page {page_num}/{total_pages}: {len(page_events)} events (direct fetch)")
+                        continue
+                    logger.info(f"🔄 Direct fetch returned nothing for page {page_num}, falling back to clicks")
+                    endpoint = None
+
                 if page_num > 1:
                     logger.info(f"🔄 Navigating to page {page_num}...")
                     
-                    await page.evaluate(f"""() => {{
-                        const pageLinks = document.querySelectorAll('a[data-page="{page_num}"]');
-                        if (pageLinks.length > 0) {{
-                            pageLinks[0].click();
-                        }}
-                    }}""")
+                    async def click_page_link(target_page: int = page_num):
+                        async with settle_after(page, max_wait=2000):
+                            await page.evaluate(f"""() => {{
+                                const pageLinks = document.querySelectorAll('a[data-page="{target_page}"]');
+                                if (pageLinks.length > 0) {{
+                                    pageLinks[0].click();
+                                }}
+                            }}""")
                     
-                    await page.wait_for_timeout(2000)
+                    if page_num == 2:
+                        endpoint = await discover_paged_endpoint(page, click_page_link, page_no=2)
+                    else:
+                        await click_page_link()
                 
                 # 현재 페이지의 이벤트 추출
                 page_events = await page.evaluate("""() => {
@@ -470,7 +564,8 @@ async def handle_kt_event_main(
 # 핸들러 등록
 register_page_handler(
     r'https?://event\.kt\.com/html/event/ongoing_event_list\.html',
-    handle_kt_event_main
+    handle_kt_event_main,
+    multi_page=True,
 )
 
 register_page_handler(
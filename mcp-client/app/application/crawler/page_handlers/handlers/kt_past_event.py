@@ -14,11 +14,19 @@ from playwright.async_api import async_playwright
 from markdownify import markdownify as md
 from bs4 import BeautifulSoup
 
+from ..dom_pruning import prune_page
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
 from ..utils import smart_goto
 
 logger = logging.getLogger(__name__)
 
+# 이벤트 상세 iframe에서 제거할 요소 (본문 영역이라 기본 셀렉터 대신 좁은 목록만 사용)
+IFRAME_PRUNE_SELECTORS = [
+    '.ad', '.banner', '.popup',
+    '.btn-twitter', '.btn-facebook', '.btn-kakao', '.btn-youtube',
+]
+
 
 def _pc_to_mobile_url(pc_url: str) -> str:
     """PC 이벤트 URL을 모바일 URL로 변환"""
@@ -54,7 +62,7 @@ async def handle_kt_past_event_detail(
     logger.info(f"KT Past Event detail processing started: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -155,9 +163,13 @@ async def handle_kt_past_event_detail(
                     iframe_page = await context.new_page()
                     await smart_goto(iframe_page, event_info['iframe_src'], timeout=30000, extra_wait=3000)
                     
+                    # 불필요한 요소는 브라우저 안에서 제거 (script/style/광고/배너/팝업/SNS 버튼)
+                    if await prune_page(iframe_page, selectors=IFRAME_PRUNE_SELECTORS) is None:
+                        await iframe_page.evaluate("""() => {
+                            document.querySelectorAll('script, style, noscript, .ad, .banner, .popup').forEach(el => el.remove());
+                        }""")
+                    
                     iframe_data = await iframe_page.evaluate("""() => {
-                        const elementsToRemove = document.querySelectorAll('script, style, noscript, .ad, .banner, .popup');
-                        elementsToRemove.forEach(el => el.remove());
                         const mainContent = document.querySelector('body') || document.documentElement;
                         return {
                             html: mainContent ? mainContent.innerHTML : ''
@@ -253,7 +265,7 @@ async def handle_kt_past_event_main(
     logger.info(f"🎯 KT Past Event main processing started: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
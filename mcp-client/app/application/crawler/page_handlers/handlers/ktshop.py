@@ -15,6 +15,7 @@ from markdownify import markdownify as md
 from bs4 import BeautifulSoup
 
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
 from ..utils import to_mshop_url, sanitize_filename, smart_goto
 
 logger = logging.getLogger(__name__)
@@ -33,7 +34,7 @@ async def handle_ktshop_popup_extractor(
     logger.info(f"🔗 KT Shop popup: {url}")
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -308,7 +309,7 @@ async def handle_mobile_products_list(url: str, fclient: Any, menu: Optional[str
     base_title = sanitize_filename(base_title)
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -577,7 +578,8 @@ You are a DUMB COPIER. Do not think. Do not interpret. Just COPY."""
 
 register_page_handler(
     r'https?://shop\.kt\.com/mobile/products\.do\?category=.*',
-    handle_mobile_products_list
+    handle_mobile_products_list,
+    multi_page=True,
 )
 
 
@@ -629,7 +631,7 @@ async def handle_accessory_detail(url: str, fclient: Any, context=None) -> Optio
         return await _process_detail(context)
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context_local = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -649,7 +651,7 @@ async def handle_accessory_display_list(url: str, fclient: Any, menu: Optional[s
     seen_prodnos: Set[str] = set()
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -768,7 +770,7 @@ ACCESSORY_PATTERNS = [
 ]
 
 for pattern in ACCESSORY_PATTERNS:
-    register_page_handler(pattern, handle_accessory_display_list)
+    register_page_handler(pattern, handle_accessory_display_list, multi_page=True)
 
 
 async def handle_goodbye_phoneview(url: str, fclient: Any, menu: Optional[str] = None) -> Dict[str, Any]:
@@ -777,7 +779,7 @@ async def handle_goodbye_phoneview(url: str, fclient: Any, menu: Optional[str] =
     menus, datas = [], []
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
@@ -898,7 +900,7 @@ async def handle_store_plans_list(url: str, fclient: Any, menu: Optional[str] =
             return ''
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
@@ -1088,9 +1090,11 @@ async def handle_store_plans_list(url: str, fclient: Any, menu: Optional[str] =
 
 register_page_handler(
     r'https?://shop\.kt\.com/display/olhsStore\.do\?dispNo=STOR05&subDispNo=STOR0501.*',
-    handle_store_plans_list
+    handle_store_plans_list,
+    multi_page=True,
 )
 register_page_handler(
     r'https?://shop\.kt\.com/display/olhsStore\.do\?dispNo=STOR05&subDispNo=STOR0503.*',
-    handle_store_plans_list
+    handle_store_plans_list,
+    multi_page=True,
 )
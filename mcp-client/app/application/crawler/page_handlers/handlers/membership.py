@@ -11,6 +11,7 @@ from playwright.async_api import async_playwright
 from markdownify import markdownify as md
 
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
 from ..utils import smart_goto
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ async def handle_membership_partner_list_playwright(url: str, fclient: Any, menu
     logger.info(f"🔗 Partner list: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         page = await browser.new_page()
         response = await smart_goto(page, url, wait_for_selector='#btnMoreData', timeout=30000)
         
@@ -73,7 +74,8 @@ async def handle_membership_partner_list_playwright(url: str, fclient: Any, menu
 # 핸들러 등록
 register_page_handler(
     r'https?://membership\.kt\.com/discount/partner/PartnerList\.do',
-    handle_membership_partner_list_playwright
+    handle_membership_partner_list_playwright,
+    multi_page=True,
 )
 
 
@@ -85,7 +87,7 @@ async def handle_membership_faq_all_playwright(url: str, fclient: Any, menu: Opt
     logger.info(f"🔗 Membership FAQ: {url}")
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         page = await browser.new_page()
         response = await smart_goto(page, url, wait_for_selector='iframe#cpEvent', timeout=30000)
         
@@ -14,6 +14,8 @@ from playwright.async_api import async_playwright
 from markdownify import markdownify as md
 
 from ..handler_registry import register_page_handler
+from ..deadline import current_deadline
+from ..resource_blocking import launch_browser
 from ..utils import sanitize_filename, format_content, create_markdown, smart_goto
 
 logger = logging.getLogger(__name__)
@@ -35,7 +37,7 @@ async def handle_safety_notice_detail(
     metadata = None
     try:
         async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+            browser = await launch_browser(p)
             context = await browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -177,7 +179,7 @@ async def handle_safety_notice_main(
     cutoff_date = datetime.now() - timedelta(days=365)
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -218,19 +220,31 @@ async def handle_safety_notice_main(
     consecutive_errors = 0
     max_consecutive_errors = 3
     
+    deadline = current_deadline()
+    continuation = None
+    
     while current_url and total_processed < 1000:
+        if deadline.expired:
+            # 실행 예산 만료: 지금까지 수집한 결과와 다음에 처리할 상세 URL 반환
+            continuation = current_url
+            break
         try:
             logger.info(f"🔍 Processing {total_processed + 1}: {current_url}")
             
-            # 개별 상세 페이지에 120초(2분) 타임아웃 적용
+            # 개별 상세 페이지에 최대 120초(2분) 타임아웃 적용 (남은 예산 안으로 제한)
+            detail_timeout = deadline.cap(120)
             try:
                 result = await asyncio.wait_for(
                     handle_safety_notice_detail(current_url, fclient, cutoff_date),
-                    timeout=120
+                    timeout=detail_timeout
                 )
                 consecutive_errors = 0
             except asyncio.TimeoutError:
-                logger.warning(f"⚠️ Timeout (120s): {current_url}")
+                logger.warning(f"⚠️ Timeout ({detail_timeout:.0f}s): {current_url}")
+                if deadline.expired:
+                    # 예산 만료로 잘린 상세 페이지부터 이어서 처리
+                    continuation = current_url
+                    break
                 consecutive_errors += 1
                 if consecutive_errors >= max_consecutive_errors:
                     logger.error(f"❌ Stopped: {max_consecutive_errors} consecutive failures")
@@ -279,19 +293,24 @@ async def handle_safety_notice_main(
     
     logger.info(f"✅ Safety notice done: {total_processed} items")
     
-    return {
+    summary = {
         "menus": menus,
         "datas": datas,
         "total_processed": total_processed,
         "status": "completed",
         "message": f"총 {total_processed}개 안전한 통신생활 공지사항 처리 완료"
     }
+    if continuation:
+        return deadline.partial(summary, continuation=continuation)
+    return summary
 
 
 # 핸들러 등록
 register_page_handler(
     r'https?://inside\.kt\.com/html/safety/notice_list\.html',
-    handle_safety_notice_main
+    handle_safety_notice_main,
+    multi_page=True,
+    polls_deadline=True,
 )
 
 
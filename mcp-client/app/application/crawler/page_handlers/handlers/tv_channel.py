@@ -8,16 +8,47 @@ import asyncio
 import html
 import logging
 import re
+import time
 from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import unquote
 
-import requests
+import httpx
 from bs4 import BeautifulSoup, NavigableString
 
+try:
+    from charset_normalizer import from_bytes as detect_charset
+    CHARSET_DETECTION_AVAILABLE = True
+except ImportError:
+    CHARSET_DETECTION_AVAILABLE = False
+
+from app.config import settings
 from ..handler_registry import register_page_handler
 
 logger = logging.getLogger(__name__)
 
+CHANNEL_LIST_URL = "https://tv.kt.com/tv/channel/pChList.asp"
+
+
+def _resolve_encoding(response: httpx.Response) -> str:
+    """Content-Type charset → 본문 자동 감지 → euc-kr 순으로 인코딩 결정"""
+    content_type = response.headers.get("Content-Type", "")
+    if "charset=" in content_type.lower():
+        return content_type.lower().split("charset=")[-1].split(";")[0].strip()
+    if CHARSET_DETECTION_AVAILABLE and response.content:
+        best = detect_charset(response.content).best()
+        if best is not None:
+            return best.encoding
+    return "euc-kr"
+
+
+def _decode_response(response: httpx.Response) -> str:
+    response.encoding = _resolve_encoding(response)
+    return response.text
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
+
 
 async def handle_whygenietv_channel_schedule(
     url: str, 
@@ -33,248 +64,250 @@ async def handle_whygenietv_channel_schedule(
     menus: List[Dict[str, Any]] = []
     datas: List[Dict[str, Any]] = []
 
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        "Referer": url
-    })
-
-    try:
-        response = await asyncio.to_thread(session.get, url, timeout=30)
-    except Exception as e:
-        session.close()
-        logger.error(f"❌ Genie TV Channel Schedule request failed: {e}")
-        return {
-            "menus": [],
-            "datas": [],
-            "total_processed": 0,
-            "status": "failed",
-            "message": f"요청 실패: {e}"
-        }
-
-    status_code = getattr(response, "status_code", None)
-    if not response or not getattr(response, "content", b""):
-        session.close()
-        logger.error("❌ Genie TV Channel Schedule response is empty")
-        return {
-            "menus": [],
-            "datas": [],
-            "total_processed": 0,
-            "status": "failed",
-            "status_code": status_code,
-            "message": "응답이 비어 있습니다."
-        }
-
-    # 인코딩 자동 감지 - apparent_encoding 사용
-    detected_encoding = response.apparent_encoding
-    logger.info(f"📡 Detected encoding: {detected_encoding}")
-    
-    # Content-Type 헤더에서 charset 확인
-    content_type = response.headers.get("Content-Type", "")
-    if "charset=" in content_type.lower():
-        header_charset = content_type.lower().split("charset=")[-1].split(";")[0].strip()
-        logger.info(f"📡 Content-Type charset: {header_charset}")
-        response.encoding = header_charset
-    elif detected_encoding:
-        response.encoding = detected_encoding
-    else:
-        response.encoding = "euc-kr"
-    
-    logger.info(f"📡 Final encoding used: {response.encoding}")
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    channel_guide_el = soup.select_one("div.channel_guide")
-    noti_desc_el = soup.select_one("div.noti_desc")
-
-    def normalize_multiline(text: str) -> str:
-        if not text:
-            return ""
-        lines = [line.strip() for line in text.splitlines()]
-        cleaned = "\n".join(line for line in lines if line)
-        return cleaned.strip()
-
-    channel_guide_text = normalize_multiline(channel_guide_el.get_text("\n", strip=True)) if channel_guide_el else ""
-    noti_desc_text = normalize_multiline(noti_desc_el.get_text("\n", strip=True)) if noti_desc_el else ""
-    channel_guide_html = str(channel_guide_el) if channel_guide_el else ""
-    noti_desc_html = str(noti_desc_el) if noti_desc_el else ""
-
-    super_tab_pattern = re.compile(r"fnSearchChannel\((?P<ch_type>[^,]+),'(?P<prod>[^']*)',\s*(?P<mid>[^)]+)\)")
-    plan_pattern = re.compile(r"fnSearchChannelNoSubmit\('(?P<ch_type>[^']*)','(?P<product_cd>[^']*)',\s*(?P<mid>[^)]+)\)")
-
-    super_tabs: List[Dict[str, Any]] = []
-    for anchor in soup.select(".channel_content .sub-tabs-1st .sub-trigger"):
-        tab_name = (anchor.get_text(" ", strip=True) or "").replace("\xa0", " ").strip()
-        href = (anchor.get("href") or "").strip()
-        if not tab_name or not href:
-            continue
-        match = super_tab_pattern.search(anchor.get("onclick") or "")
-        if not match:
-            continue
-        ch_type = match.group("ch_type").strip() or "3"
-        target = soup.select_one(href)
-        if not target:
-            continue
-        plan_ul = target.select_one("ul.channel_select")
-        if not plan_ul:
-            continue
-        super_tabs.append({
-            "name": tab_name,
-            "ch_type": ch_type,
-            "plan_ul": plan_ul
-        })
-
-    if not super_tabs:
-        plan_container = soup.select_one("div#trigger2-1-1 ul.channel_select.tv_live") or soup.select_one("ul.channel_select.tv_live")
-        if plan_container:
-            super_tabs.append({
-                "name": "지니 TV",
-                "ch_type": "3",
-                "plan_ul": plan_container
-            })
-
-    if not super_tabs:
-        session.close()
-        logger.error("❌ Genie TV tab information not found")
-        return {
-            "menus": [],
-            "datas": [],
-            "total_processed": 0,
-            "status": "failed",
-            "status_code": status_code,
-            "message": "탭 정보를 찾을 수 없습니다."
-        }
-
-    channel_cache: Dict[Tuple[str, str, str], Tuple[int, str]] = {}
-
-    def parse_channel_html(html_text: str) -> List[Dict[str, str]]:
-        if not html_text:
-            return []
-        inner_soup = BeautifulSoup(html_text, "html.parser")
-        channels: List[Dict[str, str]] = []
-        for anchor in inner_soup.select("ul.channel li a"):
-            span = anchor.select_one("span.ch")
-            if not span:
-                continue
-
-            text_parts: List[str] = []
-            for node in span.contents:
-                if isinstance(node, NavigableString):
-                    value = str(node).strip()
-                    if value:
-                        text_parts.append(value)
-
-            channel_text = " ".join(text_parts).replace("\xa0", " ")
-            channel_text = re.sub(r"\s+", " ", channel_text).strip()
-            if not channel_text:
-                continue
-
-            channel_text = html.unescape(unquote(channel_text))
-
-            number = channel_text
-            name = ""
-            number_match = re.match(r"^(\S+)\s+(.*)$", channel_text)
-            if number_match:
-                number = number_match.group(1).strip()
-                name = number_match.group(2).strip()
-
-            alt_text = html.unescape(unquote((anchor.get("alt") or "").strip()))
-
-            channels.append({
-                "channel_number": number,
-                "channel_name": name,
-                "note": alt_text
-            })
-        return channels
-
-    async def fetch_channels(ch_type: str, product_cd: str, parent_menu_id: str) -> Tuple[int, List[Dict[str, str]]]:
-        cache_key = (ch_type, product_cd or "", parent_menu_id or "0")
-        if cache_key in channel_cache:
-            cached_status, cached_html = channel_cache[cache_key]
-            return cached_status, parse_channel_html(cached_html)
-
-        data = {
-            "ch_type": ch_type,
-            "parent_menu_id": parent_menu_id or "0",
-            "product_cd": product_cd or "",
-            "option_cd_list": ""
-        }
-
+    run_started = time.perf_counter()
+    concurrency = max(1, settings.crawler_tv_channel_concurrency)
+
+    # 실행 동안 연결을 재사용하는 비동기 HTTP 클라이언트 (동시 연결 수 = 동시 요청 수)
+    async with httpx.AsyncClient(
+        headers={
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+            "Referer": url
+        },
+        timeout=30,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    ) as client:
         try:
-            resp = await asyncio.to_thread(session.post, "https://tv.kt.com/tv/channel/pChList.asp", data=data, timeout=30)
+            response = await client.get(url)
         except Exception as e:
-            logger.error(f"❌ Channel list request failed (product_cd={product_cd}): {e}")
-            return None, []
-
-        # 인코딩 자동 감지
-        detected_encoding = resp.apparent_encoding
-        content_type = resp.headers.get("Content-Type", "")
-        if "charset=" in content_type.lower():
-            resp.encoding = content_type.lower().split("charset=")[-1].split(";")[0].strip()
-        elif detected_encoding:
-            resp.encoding = detected_encoding
-        else:
-            resp.encoding = "euc-kr"
-        
-        channel_cache[cache_key] = (resp.status_code, resp.text)
-        return resp.status_code, parse_channel_html(resp.text)
-
-    def escape_md(value: str) -> str:
-        if not value:
-            return ""
-        return value.replace("|", "\\|")
-
-    total_plans_processed = 0
-
-    for super_tab in super_tabs:
-        super_name = super_tab["name"]
-        super_ch_type = super_tab["ch_type"]
-        plan_ul = super_tab["plan_ul"]
-
-        seen_codes: Set[str] = set()
-        plan_entries: List[Dict[str, str]] = []
-
-        for anchor in plan_ul.select("li a"):
-            onclick = anchor.get("onclick") or ""
-            match = plan_pattern.search(onclick)
-            if not match:
+            logger.error(f"❌ Genie TV Channel Schedule request failed: {e}")
+            return {
+                "menus": [],
+                "datas": [],
+                "total_processed": 0,
+                "status": "failed",
+                "message": f"요청 실패: {e}"
+            }
+
+        status_code = response.status_code
+        if not response.content:
+            logger.error("❌ Genie TV Channel Schedule response is empty")
+            return {
+                "menus": [],
+                "datas": [],
+                "total_processed": 0,
+                "status": "failed",
+                "status_code": status_code,
+                "message": "응답이 비어 있습니다."
+            }
+
+        # 인코딩 결정 (Content-Type charset → 자동 감지 → euc-kr)
+        page_text = _decode_response(response)
+        logger.info(f"📡 Final encoding used: {response.encoding}")
+        page_fetch_ms = _elapsed_ms(run_started)
+        soup = BeautifulSoup(page_text, "html.parser")
+
+        channel_guide_el = soup.select_one("div.channel_guide")
+        noti_desc_el = soup.select_one("div.noti_desc")
+
+        def normalize_multiline(text: str) -> str:
+            if not text:
+                return ""
+            lines = [line.strip() for line in text.splitlines()]
+            cleaned = "\n".join(line for line in lines if line)
+            return cleaned.strip()
+
+        channel_guide_text = normalize_multiline(channel_guide_el.get_text("\n", strip=True)) if channel_guide_el else ""
+        noti_desc_text = normalize_multiline(noti_desc_el.get_text("\n", strip=True)) if noti_desc_el else ""
+        channel_guide_html = str(channel_guide_el) if channel_guide_el else ""
+        noti_desc_html = str(noti_desc_el) if noti_desc_el else ""
+
+        super_tab_pattern = re.compile(r"fnSearchChannel\((?P<ch_type>[^,]+),'(?P<prod>[^']*)',\s*(?P<mid>[^)]+)\)")
+        plan_pattern = re.compile(r"fnSearchChannelNoSubmit\('(?P<ch_type>[^']*)','(?P<product_cd>[^']*)',\s*(?P<mid>[^)]+)\)")
+
+        super_tabs: List[Dict[str, Any]] = []
+        for anchor in soup.select(".channel_content .sub-tabs-1st .sub-trigger"):
+            tab_name = (anchor.get_text(" ", strip=True) or "").replace("\xa0", " ").strip()
+            href = (anchor.get("href") or "").strip()
+            if not tab_name or not href:
                 continue
-
-            product_cd = match.group("product_cd").strip()
-            parent_menu_id = match.group("mid").strip().strip(";") or "0"
-
-            span = anchor.select_one("span")
-            raw_title = (span.get_text(" ", strip=True) if span else "").replace("\xa0", " ").strip()
-            clean_title = re.sub(r"\([^)]*\)", "", raw_title).strip()
-
-            if not raw_title or not product_cd:
-                continue
-            if not clean_title or clean_title in ("전체",):
+            match = super_tab_pattern.search(anchor.get("onclick") or "")
+            if not match:
                 continue
-            if "선택형" in clean_title:
+            ch_type = match.group("ch_type").strip() or "3"
+            target = soup.select_one(href)
+            if not target:
                 continue
-            if product_cd in seen_codes:
+            plan_ul = target.select_one("ul.channel_select")
+            if not plan_ul:
                 continue
-
-            seen_codes.add(product_cd)
-            plan_entries.append({
-                "title": clean_title,
-                "raw_title": raw_title,
-                "ch_type": super_ch_type,
-                "product_cd": product_cd,
-                "parent_menu_id": parent_menu_id
+            super_tabs.append({
+                "name": tab_name,
+                "ch_type": ch_type,
+                "plan_ul": plan_ul
             })
 
-        if not plan_entries:
-            logger.warning(f"⚠️ No plan information found for '{super_name}'")
-            continue
+        if not super_tabs:
+            plan_container = soup.select_one("div#trigger2-1-1 ul.channel_select.tv_live") or soup.select_one("ul.channel_select.tv_live")
+            if plan_container:
+                super_tabs.append({
+                    "name": "지니 TV",
+                    "ch_type": "3",
+                    "plan_ul": plan_container
+                })
+
+        if not super_tabs:
+            logger.error("❌ Genie TV tab information not found")
+            return {
+                "menus": [],
+                "datas": [],
+                "total_processed": 0,
+                "status": "failed",
+                "status_code": status_code,
+                "message": "탭 정보를 찾을 수 없습니다."
+            }
+
+        # (ch_type, product_cd) → 채널 목록 요청 태스크 (같은 구성의 플랜은 요청 1회를 공유, 진행 중 요청도 공유)
+        channel_cache: Dict[Tuple[str, str], "asyncio.Future[Tuple[Optional[int], List[Dict[str, str]]]]"] = {}
+        request_semaphore = asyncio.Semaphore(concurrency)
+        channel_request_count = 0  # 실제 보낸 채널 목록 요청 수 (실패 후 재시도 포함)
+
+        def parse_channel_html(html_text: str) -> List[Dict[str, str]]:
+            if not html_text:
+                return []
+            inner_soup = BeautifulSoup(html_text, "html.parser")
+            channels: List[Dict[str, str]] = []
+            for anchor in inner_soup.select("ul.channel li a"):
+                span = anchor.select_one("span.ch")
+                if not span:
+                    continue
+
+                text_parts: List[str] = []
+                for node in span.contents:
+                    if isinstance(node, NavigableString):
+                        value = str(node).strip()
+                        if value:
+                            text_parts.append(value)
+
+                channel_text = " ".join(text_parts).replace("\xa0", " ")
+                channel_text = re.sub(r"\s+", " ", channel_text).strip()
+                if not channel_text:
+                    continue
+
+                channel_text = html.unescape(unquote(channel_text))
+
+                number = channel_text
+                name = ""
+                number_match = re.match(r"^(\S+)\s+(.*)$", channel_text)
+                if number_match:
+                    number = number_match.group(1).strip()
+                    name = number_match.group(2).strip()
+
+                alt_text = html.unescape(unquote((anchor.get("alt") or "").strip()))
+
+                channels.append({
+                    "channel_number": number,
+                    "channel_name": name,
+                    "note": alt_text
+                })
+            return channels
+
+        async def request_channels(ch_type: str, product_cd: str, parent_menu_id: str) -> Tuple[Optional[int], List[Dict[str, str]]]:
+            nonlocal channel_request_count
+            channel_request_count += 1
+            data = {
+                "ch_type": ch_type,
+                "parent_menu_id": parent_menu_id or "0",
+                "product_cd": product_cd or "",
+                "option_cd_list": ""
+            }
+
+            async with request_semaphore:
+                try:
+                    resp = await client.post(CHANNEL_LIST_URL, data=data)
+                except Exception as e:
+                    logger.error(f"❌ Channel list request failed (product_cd={product_cd}): {e}")
+                    return None, []
+
+            return resp.status_code, parse_channel_html(_decode_response(resp))
+
+        async def fetch_channels(ch_type: str, product_cd: str, parent_menu_id: str) -> Tuple[Optional[int], List[Dict[str, str]], bool]:
+            """채널 목록 조회 (status, channels, 캐시 사용 여부)"""
+            cache_key = (ch_type, product_cd or "")
+            task = channel_cache.get(cache_key)
+            cache_hit = task is not None
+            if task is None:
+                task = asyncio.ensure_future(request_channels(ch_type, product_cd, parent_menu_id))
+                channel_cache[cache_key] = task
+
+            channel_status, channels = await task
+            if channel_status is None and channel_cache.get(cache_key) is task:
+                # 실패한 요청은 캐시하지 않음 (이후 플랜에서 재시도)
+                del channel_cache[cache_key]
+            return channel_status, [dict(channel) for channel in channels], cache_hit
+
+        def escape_md(value: str) -> str:
+            if not value:
+                return ""
+            return value.replace("|", "\\|")
+
+        # 1) 모든 상위 탭의 플랜 목록 수집
+        plan_jobs: List[Tuple[str, Dict[str, str]]] = []
+
+        for super_tab in super_tabs:
+            super_name = super_tab["name"]
+            super_ch_type = super_tab["ch_type"]
+            plan_ul = super_tab["plan_ul"]
+
+            seen_codes: Set[str] = set()
+            plan_entries: List[Dict[str, str]] = []
+
+            for anchor in plan_ul.select("li a"):
+                onclick = anchor.get("onclick") or ""
+                match = plan_pattern.search(onclick)
+                if not match:
+                    continue
+
+                product_cd = match.group("product_cd").strip()
+                parent_menu_id = match.group("mid").strip().strip(";") or "0"
+
+                span = anchor.select_one("span")
+                raw_title = (span.get_text(" ", strip=True) if span else "").replace("\xa0", " ").strip()
+                clean_title = re.sub(r"\([^)]*\)", "", raw_title).strip()
+
+                if not raw_title or not product_cd:
+                    continue
+                if not clean_title or clean_title in ("전체",):
+                    continue
+                if "선택형" in clean_title:
+                    continue
+                if product_cd in seen_codes:
+                    continue
+
+                seen_codes.add(product_cd)
+                plan_entries.append({
+                    "title": clean_title,
+                    "raw_title": raw_title,
+                    "ch_type": super_ch_type,
+                    "product_cd": product_cd,
+                    "parent_menu_id": parent_menu_id
+                })
+
+            if not plan_entries:
+                logger.warning(f"⚠️ No plan information found for '{super_name}'")
+                continue
+
+            plan_jobs.extend((super_name, plan) for plan in plan_entries)
 
-        for plan in plan_entries:
+        # 2) 플랜별 채널 목록 조회 + 마크다운 생성 (동시 요청 수 제한)
+        async def process_plan(super_name: str, plan: Dict[str, str]) -> Dict[str, Any]:
+            plan_started = time.perf_counter()
             plan_title = plan["title"]
             plan_code = plan["product_cd"]
             plan_ch_type = plan["ch_type"]
             parent_menu_id = plan["parent_menu_id"]
 
-            channel_status, channels = await fetch_channels(plan_ch_type, plan_code, parent_menu_id)
+            channel_status, channels, cache_hit = await fetch_channels(plan_ch_type, plan_code, parent_menu_id)
             channel_count = len(channels)
 
             markdown_lines = [
@@ -297,11 +330,12 @@ async def handle_whygenietv_channel_schedule(
             full_markdown = "\n\n".join(markdown_sections)
 
             menu_path = f"{base_menu}^{super_name}^{plan_title}" if base_menu else f"{super_name}^{plan_title}"
-            menus.append({
-                "menu": menu_path,
-                "url": url
-            })
-            datas.append({
+            elapsed_ms = _elapsed_ms(plan_started)
+            logger.info(
+                f"✅ Channel plan processed: '{super_name}' > '{plan_title}' "
+                f"({channel_count} channels, {elapsed_ms}ms{', cached' if cache_hit else ''})"
+            )
+            return {
                 "menu": menu_path,
                 "title": plan_title,
                 "parent_tab": super_name,
@@ -316,24 +350,50 @@ async def handle_whygenietv_channel_schedule(
                 "noti_desc_text": noti_desc_text,
                 "noti_desc_html": noti_desc_html,
                 "markdown": full_markdown,
-                "status_code": channel_status
-            })
+                "status_code": channel_status,
+                "elapsed_ms": elapsed_ms,
+                "channel_cache_hit": cache_hit
+            }
 
-            total_plans_processed += 1
-            logger.info(f"✅ Channel plan processed: '{super_name}' > '{plan_title}' ({channel_count} channels)")
+        fan_out_started = time.perf_counter()
+        plan_results = await asyncio.gather(*(process_plan(super_name, plan) for super_name, plan in plan_jobs))
+        fan_out_ms = _elapsed_ms(fan_out_started)
 
-    session.close()
+        # 3) 원래 탭/플랜 순서대로 결과 구성
+        for plan_data in plan_results:
+            menus.append({
+                "menu": plan_data["menu"],
+                "url": url
+            })
+            datas.append(plan_data)
+
+        total_plans_processed = len(plan_results)
+        timings = {
+            "page_fetch_ms": page_fetch_ms,
+            "fan_out_ms": fan_out_ms,
+            "total_ms": _elapsed_ms(run_started),
+            "concurrency": concurrency,
+            "channel_requests": channel_request_count,
+            "plans": [
+                {"menu": d["menu"], "elapsed_ms": d["elapsed_ms"], "cache_hit": d["channel_cache_hit"]}
+                for d in plan_results
+            ],
+        }
 
-    logger.info(f"✅ Genie TV Channel Schedule completed: {total_plans_processed} plans")
+        logger.info(
+            f"✅ Genie TV Channel Schedule completed: {total_plans_processed} plans "
+            f"({timings['channel_requests']} channel requests, {timings['total_ms']}ms)"
+        )
 
-    return {
-        "menus": menus,
-        "datas": datas,
-        "total_processed": total_plans_processed,
-        "status": "completed",
-        "status_code": status_code,
-        "message": f"지니 TV 채널 편성표 플랜 {total_plans_processed}건 처리 완료"
-    }
+        return {
+            "menus": menus,
+            "datas": datas,
+            "total_processed": total_plans_processed,
+            "status": "completed",
+            "status_code": status_code,
+            "timings": timings,
+            "message": f"지니 TV 채널 편성표 플랜 {total_plans_processed}건 처리 완료"
+        }
 
 
 # 핸들러 등록
@@ -12,8 +12,12 @@ from urllib.parse import urljoin
 
 from playwright.async_api import async_playwright
 from markdownify import markdownify as md
+from bs4 import BeautifulSoup
 
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
+from ..wait_strategies import settle_after, wait_for_selector_count_stable, wait_until_ready
+from ..xhr_capture import CapturedExchange, discover_paged_endpoint
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +65,7 @@ async def handle_product_detail(
                 extra_wait = 7000
             
             async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
+                browser = await launch_browser(p)
                 page = await browser.new_page()
                 
                 response = await page.goto(url, wait_until=wait_until, timeout=timeout)
@@ -71,7 +75,7 @@ async def handle_product_detail(
                     await page.wait_for_selector('.product-title, .prd-tit, .ui-view-info', timeout=10000)
                 except Exception:
                     pass
-                await page.wait_for_timeout(extra_wait)
+                await wait_until_ready(page, max_wait=extra_wait)
                 
                 status_code = response.status if response else None
                 if status_code and status_code >= 400:
@@ -110,15 +114,15 @@ async def handle_product_detail(
                 if accordion_triggers:
                     for trigger in accordion_triggers:
                         try:
-                            await page.click(f"#{trigger['id']}", timeout=5000)
-                            await page.wait_for_timeout(1000)
+                            async with settle_after(page, max_wait=1000):
+                                await page.click(f"#{trigger['id']}", timeout=5000)
                         except:
                             continue
                 
                 # 추천 컨텐츠 추출
                 recommendations = []
                 try:
-                    await page.wait_for_timeout(3000)
+                    await wait_until_ready(page, max_wait=3000)
                     
                     raw_reco = await page.evaluate("""() => {
                         const abs = (u) => {
@@ -362,6 +366,23 @@ async def handle_product_detail(
                 return None
 
 
+
+def _parse_more_fragment(exchange: CapturedExchange) -> List[str]:
+    """
+    직접 호출한 "더보기" 응답에서 상품 목록 항목(li) 마크업 추출
+
+    목록 스냅샷이 렌더링된 목록 DOM을 그대로 사용하므로 HTML 조각 응답만 사용하고,
+    JSON 응답은 빈 목록을 반환하여 클릭 방식으로 처리합니다.
+    """
+    if exchange.is_json:
+        return []
+    soup = BeautifulSoup(exchange.body, 'html.parser')
+    items = [li for li in soup.find_all('li') if li.find_parent('li') is None]
+    if not any(li.select_one('a[href*="productDetail"]') for li in items):
+        return []
+    return [str(li) for li in items]
+
+
 async def handle_wdic_mobile_list(
     url: str, 
     fclient: Any, 
@@ -412,39 +433,72 @@ async def handle_wdic_mobile_list(
         except Exception as e:
             logger.debug(f"🔍 Snapshot failed: {str(e)}")
 
+    async def _append_more_pages(page, endpoint, start: int) -> int:
+        """캡처한 "더보기" 엔드포인트를 직접 호출하여 응답 항목을 목록 DOM에 붙임 (붙인 페이지 수 반환)"""
+        pages = 0
+        async for page_no, fragments in endpoint.iter_pages(page, _parse_more_fragment, start=start):
+            await page.evaluate("""
+                (fragments) => {
+                    const list = document.querySelector('.plan-list-area .plan-list');
+                    if (!list) return;
+                    list.insertAdjacentHTML('beforeend', fragments.join(''));
+                }
+            """, fragments)
+            pages += 1
+            logger.debug(f"🔍 More page {page_no}: {len(fragments)} items appended (direct fetch)")
+        return pages
+
     async def _click_more_until_exhausted(page) -> int:
         clicks = 0
         guard = 0
+        endpoint = None
         while guard < 50:
             guard += 1
             try:
+                if endpoint is not None:
+                    # 첫 "더보기" 요청을 캡처했으면 나머지 페이지는 직접 호출 (응답이 없을 때만 클릭 방식 유지)
+                    fetched_pages = await _append_more_pages(page, endpoint, start=clicks + 2)
+                    endpoint = None
+                    if fetched_pages:
+                        clicks += fetched_pages
+                        break
+
                 before = await page.evaluate("document.querySelectorAll('.plan-list-area .plan-list li').length")
                 
-                clicked = await page.evaluate(r"""
-                    () => {
-                        const btn = document.querySelector('.btn-more');
-                        if (!btn) return false;
-                        const style = btn.getAttribute('style') || '';
-                        const css = getComputedStyle(btn);
-                        const visible = btn.offsetParent !== null && css.display !== 'none' && css.visibility !== 'hidden' && !/display:\s*none/i.test(style);
-                        if (!visible) return false;
-                        btn.click();
-                        return true;
-                    }
-                """)
+                click_result: List[bool] = []
+
+                async def click_more() -> bool:
+                    click_result.append(await page.evaluate(r"""
+                        () => {
+                            const btn = document.querySelector('.btn-more');
+                            if (!btn) return false;
+                            const style = btn.getAttribute('style') || '';
+                            const css = getComputedStyle(btn);
+                            const visible = btn.offsetParent !== null && css.display !== 'none' && css.visibility !== 'hidden' && !/display:\s*none/i.test(style);
+                            if (!visible) return false;
+                            btn.click();
+                            return true;
+                        }
+                    """))
+                    return click_result[-1]
+
+                if clicks == 0:
+                    endpoint = await discover_paged_endpoint(page, click_more, page_no=2, max_wait=2700)
+                else:
+                    await click_more()
+                clicked = bool(click_result and click_result[-1])
                 
                 if not clicked:
                     break
                 
                 clicks += 1
-                await page.wait_for_timeout(1200)
+                # 새 항목이 붙고 개수가 안정될 때까지 대기 (기존 1200 + 1500ms 대기가 상한)
+                await wait_for_selector_count_stable(
+                    page, '.plan-list-area .plan-list li', max_wait=2700, min_count=before + 1
+                )
 
                 after = await page.evaluate("document.querySelectorAll('.plan-list-area .plan-list li').length")
 
-                if after <= before:
-                    await page.wait_for_timeout(1500)
-                    after = await page.evaluate("document.querySelectorAll('.plan-list-area .plan-list li').length")
-
                 if after <= before:
                     btn_check = await page.evaluate(r"""
                         () => {
@@ -481,7 +535,7 @@ async def handle_wdic_mobile_list(
                 }
             """)
             if changed:
-                await page.wait_for_timeout(600)
+                await wait_until_ready(page, max_wait=600)
         except:
             pass
 
@@ -563,7 +617,7 @@ async def handle_wdic_mobile_list(
         return items or []
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         page = await browser.new_page()
         response = await page.goto(url, wait_until='domcontentloaded', timeout=60000)
         
@@ -573,7 +627,7 @@ async def handle_wdic_mobile_list(
             logger.info("✅ Product list loaded")
         except Exception as e:
             logger.warning(f"⚠️ Product list not loaded: {e}")
-        await page.wait_for_timeout(1200)
+        await wait_until_ready(page, max_wait=1200)
 
         status_code = response.status if response else None
         if status_code and status_code >= 400:
@@ -639,10 +693,10 @@ async def handle_wdic_mobile_list(
                         try:
                             await page.wait_for_load_state('networkidle', timeout=5000)
                         except:
-                            await page.wait_for_timeout(1200)
+                            await wait_until_ready(page, max_wait=1200)
 
                 await _ensure_filter_all(page)
-                await page.wait_for_timeout(800)
+                await wait_until_ready(page, max_wait=800)
 
                 sub_filters = await page.evaluate("""
                     () => {
@@ -678,7 +732,7 @@ async def handle_wdic_mobile_list(
                                     await page.wait_for_load_state('networkidle', timeout=5000)
                                 except:
                                     pass
-                                await page.wait_for_timeout(1500)
+                                await wait_until_ready(page, max_wait=1500)
 
                             clicks = await _click_more_until_exhausted(page)
                             items = await _extract_items(page)
@@ -797,7 +851,8 @@ register_page_handler(
 
 register_page_handler(
     r'https?://product\.kt\.com/wDic/.*index\.do\?CateCode=\d+',
-    handle_wdic_mobile_list
+    handle_wdic_mobile_list,
+    multi_page=True,
 )
 
 
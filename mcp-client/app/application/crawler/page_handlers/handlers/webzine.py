@@ -12,6 +12,7 @@ from playwright.async_api import async_playwright
 from markdownify import markdownify as md
 
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
 from ..utils import to_mshop_url, sanitize_filename, smart_goto
 
 logger = logging.getLogger(__name__)
@@ -32,7 +33,7 @@ async def handle_webzine_list(
     base_title = sanitize_filename(base_title)
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        browser = await launch_browser(p)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
@@ -249,7 +250,8 @@ async def handle_webzine_list(
 # 핸들러 등록
 register_page_handler(
     r'https?://shop\.kt\.com/unify/webzineList\.do.*',
-    handle_webzine_list
+    handle_webzine_list,
+    multi_page=True,
 )
 
 
@@ -6,17 +6,63 @@ KT Shop 당첨자발표 페이지 처리
 
 import asyncio
 import logging
+import re
 from typing import Any, Dict, List, Optional
 
 from playwright.async_api import async_playwright
 from markdownify import markdownify as md
+from bs4 import BeautifulSoup
 
 from ..handler_registry import register_page_handler
+from ..resource_blocking import launch_browser
 from ..utils import to_mshop_url, smart_goto
+from ..xhr_capture import CapturedExchange, discover_paged_endpoint
 
 logger = logging.getLogger(__name__)
 
 
+_EVENT_LIST_VIEW_RE = re.compile(r"eventListView\((\d+),'(\d+)','(\d+)'\)")
+_PERIOD_RE = re.compile(r"(\d{4})\.(\d{2})\.(\d{2})\s*~\s*(\d{4})\.(\d{2})\.(\d{2})")
+
+
+def _parse_winner_rows(exchange: CapturedExchange) -> List[Dict[str, Any]]:
+    """직접 호출한 당첨자발표 목록 응답(HTML 조각) 파싱 - iframe DOM 추출과 같은 형태"""
+    if exchange.is_json:
+        # 목록 API가 JSON이면 행 마크업(onclick)이 없어 게시물 ID를 복원할 수 없음 → 클릭 방식 유지
+        return []
+
+    soup = BeautifulSoup(exchange.body, 'html.parser')
+    table = soup.select_one('table.board_list') or soup
+    posts = []
+    for index, row in enumerate(table.select('tbody tr') or table.select('tr')):
+        cells = row.find_all('td')
+        link = row.find('a', onclick=True)
+        match = _EVENT_LIST_VIEW_RE.search(link.get('onclick', '')) if link else None
+        if not match:
+            continue
+
+        def cell_text(i: int) -> str:
+            return cells[i].get_text().strip() if len(cells) > i else ''
+
+        period_text = cell_text(2)
+        period = _PERIOD_RE.search(period_text)
+        posts.append({
+            'index': index + 1,
+            'number': cell_text(0),
+            'eventName': cell_text(1),
+            'period': period_text,
+            'startdate': f"{period.group(1)}-{period.group(2)}-{period.group(3)}" if period else '',
+            'enddate': f"{period.group(4)}-{period.group(5)}-{period.group(6)}" if period else '',
+            'announcementDate': cell_text(3),
+            'eventId1': match.group(1),
+            'eventId2': match.group(2),
+            'eventId3': match.group(3),
+            'uniqueId': f"{match.group(1)}_{match.group(3)}",
+            'filePath': f"Shop^핫딜/기획전^기획전^당첨자발표^{cell_text(1)}",
+        })
+    return posts
+
+
 async def handle_event_winner_announcements(
     url: str, 
     fclient: Any, 
@@ -38,7 +84,7 @@ async def handle_event_winner_announcements(
         
         # Playwright를 사용하여 페이지 접근
         async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+            browser = await launch_browser(p)
             context = await browser.new_context()
             page = await context.new_page()
             
@@ -68,11 +114,27 @@ async def handle_event_winner_announcements(
             max_pages = 20  # 안전장치
             no_new_posts_count = 0  # 연속으로 새 게시물이 없는 횟수
             
+            endpoint = None  # 2페이지 이동 시 캡처한 목록 엔드포인트 (이후 페이지는 직접 호출)
+            
             while current_page <= max_pages:
                 logger.info(f"📄 Processing page {current_page}...")
                 
+                page_posts = None
+                if endpoint is not None:
+                    async for _, fetched in endpoint.iter_pages(
+                        frame, _parse_winner_rows, start=current_page, end=current_page
+                    ):
+                        page_posts = fetched
+                    if not page_posts:
+                        # 직접 호출 결과가 없으면 클릭 방식으로 같은 페이지를 다시 확인
+                        logger.info(f"📄 Direct fetch returned nothing for page {current_page}, falling back to clicks")
+                        endpoint = None
+                        page_posts = None
+                        await frame.evaluate(f"allListClick({current_page})")
+                        await page.wait_for_timeout(2000)
+                
                 # 현재 페이지의 게시물들 수집 (iframe 내부에서)
-                page_posts = await frame.evaluate("""
+                page_posts = page_posts or await frame.evaluate("""
                     () => {
                         const allTable = document.querySelector('#tabCont01 table.board_list');
                         if (!allTable) return [];
@@ -139,11 +201,18 @@ async def handle_event_winner_announcements(
                 all_posts.extend(new_posts)
                 logger.info(f"📄 Page {current_page}: {len(new_posts)} new posts collected (Total {len(all_posts)} posts)")
                 
-                # 다음 페이지로 이동 시도 (allListClick 함수 사용)
+                # 다음 페이지로 이동 시도 (allListClick 함수 사용, 엔드포인트를 캡처한 뒤에는 직접 호출)
                 try:
                     next_page = current_page + 1
-                    await frame.evaluate(f"allListClick({next_page})")
-                    await page.wait_for_timeout(2000)
+                    if endpoint is None:
+                        async def list_click(target_page: int = next_page):
+                            await frame.evaluate(f"allListClick({target_page})")
+                            await page.wait_for_timeout(2000)
+                        
+                        if next_page == 2:
+                            endpoint = await discover_paged_endpoint(page, list_click, page_no=2)
+                        else:
+                            await list_click()
                     current_page = next_page
                 except Exception as e:
                     logger.info(f"📄 Page navigation failed: {e}. Collection complete.")
@@ -180,7 +249,7 @@ async def handle_event_winner_announcements(
                         
                         # 새로운 브라우저 인스턴스로 상세 페이지 접근
                         async with async_playwright() as p:
-                            browser = await p.chromium.launch(headless=True)
+                            browser = await launch_browser(p)
                             context = await browser.new_context()
                             detail_page = await context.new_page()
                             
@@ -326,5 +395,6 @@ async def handle_event_winner_announcements(
 # 당첨자발표 핸들러 등록
 register_page_handler(
     r'https?://shop\.kt\.com/display/olhsStore\.do\?dispNo=STOR05&subDispNo=STOR0506.*',
-    handle_event_winner_announcements
+    handle_event_winner_announcements,
+    multi_page=True,
 )
@@ -0,0 +1,236 @@
+"""
+Playwright 네트워크 리소스 차단
+
+핸들러가 띄우는 모든 브라우저 컨텍스트에 요청 가로채기(route)를 적용하여
+DOM 텍스트 추출에 필요 없는 이미지/폰트/미디어 요청과 분석·광고 호스트 요청을 차단합니다.
+
+- 전역 규칙: settings.crawler_blocked_resource_types / settings.crawler_blocked_hosts
+- 도메인별 규칙: settings.crawler_resource_rules
+  예) {"shop.kt.com": {"allow_types": ["image"], "block_hosts": ["cdn.example.com"]}}
+- 차단/허용 통계는 실행(run) 단위로 집계 (start_resource_block_stats 참고)
+"""
+
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.config import settings
+from .fetch_context import watch_page
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResourceBlockStats:
+    """실행 단위 리소스 차단 통계"""
+    blocked_requests: int = 0
+    allowed_requests: int = 0
+    transferred_bytes: int = 0  # 허용된 응답의 Content-Length 합계 (차단된 요청은 크기를 알 수 없음)
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+    blocked_by_host: Dict[str, int] = field(default_factory=dict)
+
+    def record_blocked(self, resource_type: str, host: str) -> None:
+        self.blocked_requests += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.blocked_by_host[host] = self.blocked_by_host.get(host, 0) + 1
+
+    def record_response(self, content_length: Optional[str]) -> None:
+        self.allowed_requests += 1
+        if content_length and content_length.isdigit():
+            self.transferred_bytes += int(content_length)
+
+    def to_dict(self, top_hosts: int = 10) -> Dict[str, Any]:
+        """로그/결과 저장용 요약 (차단 호스트는 상위 N개만)"""
+        hosts = sorted(self.blocked_by_host.items(), key=lambda item: item[1], reverse=True)[:top_hosts]
+        return {
+            'blocked_requests': self.blocked_requests,
+            'allowed_requests': self.allowed_requests,
+            'transferred_bytes': self.transferred_bytes,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'blocked_by_host': dict(hosts),
+        }
+
+
+def _host_matches(host: str, domains: FrozenSet[str]) -> bool:
+    """host가 domains 중 하나이거나 그 하위 도메인인지 확인"""
+    if host in domains:
+        return True
+    parts = host.split('.')
+    return any('.'.join(parts[i:]) in domains for i in range(1, len(parts) - 1))
+
+
+class ResourceBlockPolicy:
+    """리소스 타입/호스트 기반 차단 규칙 (사이트 도메인별 규칙이 전역 규칙을 덮어씀)"""
+
+    def __init__(
+        self,
+        blocked_types,
+        blocked_hosts,
+        rules: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        self.blocked_types = frozenset(t.strip().lower() for t in blocked_types if t.strip())
+        self.blocked_hosts = frozenset(h.strip().lower() for h in blocked_hosts if h.strip())
+        self.rules = {domain.lower(): rule for domain, rule in (rules or {}).items()}
+        # 사이트 호스트 → (차단 타입, 차단 호스트, 허용 호스트) 캐시
+        self._site_cache: Dict[str, Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]] = {}
+
+    @classmethod
+    def from_settings(cls) -> "ResourceBlockPolicy":
+        return cls(
+            settings.crawler_blocked_resource_types,
+            settings.crawler_blocked_hosts,
+            settings.crawler_resource_rules,
+        )
+
+    def _resolve_site(self, site_host: str) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+        """사이트 호스트에 가장 구체적으로 매칭되는 도메인 규칙을 전역 규칙과 합성"""
+        resolved = self._site_cache.get(site_host)
+        if resolved is not None:
+            return resolved
+
+        matched = [d for d in self.rules if site_host == d or site_host.endswith('.' + d)]
+        rule = self.rules[max(matched, key=len)] if matched else {}
+
+        def values(key: str) -> FrozenSet[str]:
+            return frozenset(v.strip().lower() for v in rule.get(key, []) if v.strip())
+
+        resolved = (
+            (self.blocked_types - values('allow_types')) | values('block_types'),
+            self.blocked_hosts | values('block_hosts'),
+            values('allow_hosts'),
+        )
+        self._site_cache[site_host] = resolved
+        return resolved
+
+    def decide(self, resource_type: str, request_host: str, site_host: str) -> Optional[str]:
+        """
+        요청 차단 여부 판단
+
+        Returns:
+            차단 사유('host' 또는 'type'), 허용이면 None
+        """
+        # 문서(네비게이션) 요청은 항상 허용
+        if resource_type == 'document':
+            return None
+
+        blocked_types, blocked_hosts, allowed_hosts = self._resolve_site(site_host)
+        if allowed_hosts and _host_matches(request_host, allowed_hosts):
+            return None
+        if blocked_hosts and _host_matches(request_host, blocked_hosts):
+            return 'host'
+        if resource_type in blocked_types:
+            return 'type'
+        return None
+
+
+_policy: Optional[ResourceBlockPolicy] = None
+_global_stats = ResourceBlockStats()
+_run_stats: ContextVar[Optional[ResourceBlockStats]] = ContextVar('resource_block_run_stats', default=None)
+
+
+def get_resource_block_policy() -> ResourceBlockPolicy:
+    """settings 기반 차단 규칙 (최초 사용 시 생성)"""
+    global _policy
+    if _policy is None:
+        _policy = ResourceBlockPolicy.from_settings()
+    return _policy
+
+
+def start_resource_block_stats() -> ResourceBlockStats:
+    """
+    현재 실행 컨텍스트(및 여기서 생성되는 하위 태스크)에 새 통계 객체를 연결
+
+    이후 생성되는 브라우저 컨텍스트의 차단/허용 요청은 반환된 객체에 집계됩니다.
+    """
+    stats = ResourceBlockStats()
+    _run_stats.set(stats)
+    return stats
+
+
+def get_resource_block_stats() -> ResourceBlockStats:
+    """현재 실행의 통계 (실행 단위 통계가 없으면 프로세스 전역 통계)"""
+    return _run_stats.get() or _global_stats
+
+
+def _url_host(url: str) -> str:
+    try:
+        return (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+
+
+def _site_host_for(request) -> str:
+    """요청을 발생시킨 페이지의 호스트 (페이지 URL을 알 수 없으면 요청 URL의 호스트)"""
+    try:
+        page_url = request.frame.page.url
+    except Exception:
+        page_url = ''
+    return _url_host(page_url) if page_url.startswith('http') else _url_host(request.url)
+
+
+async def apply_resource_blocking(target) -> None:
+    """
+    BrowserContext 또는 Page에 리소스 차단 route와 응답 통계 수집 적용
+
+    통계 객체는 적용 시점의 실행 컨텍스트에서 결정되므로 Playwright 이벤트 디스패치 컨텍스트와 무관하게
+    해당 실행으로 집계됩니다.
+    """
+    if not settings.crawler_resource_blocking:
+        return
+
+    policy = get_resource_block_policy()
+    stats = get_resource_block_stats()
+
+    async def handle_route(route) -> None:
+        request = route.request
+        request_host = _url_host(request.url)
+        try:
+            if policy.decide(request.resource_type, request_host, _site_host_for(request)):
+                stats.record_blocked(request.resource_type, request_host)
+                await route.abort('blockedbyclient')
+            else:
+                await route.continue_()
+        except Exception as e:
+            # 페이지/컨텍스트가 이미 닫힌 경우 등은 무시
+            logger.debug(f"리소스 route 처리 실패 (무시): {request.url} - {e}")
+
+    def on_response(response) -> None:
+        try:
+            stats.record_response(response.headers.get('content-length'))
+        except Exception:
+            pass
+
+    await target.route("**/*", handle_route)
+    target.on("response", on_response)
+
+
+async def launch_browser(playwright, headless: bool = True, **launch_kwargs):
+    """
+    Chromium 실행 + 이후 생성되는 모든 컨텍스트/페이지에 리소스 차단 적용
+
+    browser.new_context()/browser.new_page()로 만든 컨텍스트(및 그 안의 모든 페이지, iframe 팝업 페이지 포함)에
+    apply_resource_blocking이 자동으로 적용되므로 핸들러는 launch 호출만 교체하면 됩니다.
+    현재 URL의 페치 컨텍스트가 있으면 대상 URL을 로드한 응답 상태도 기록합니다 (fetch_context.py 참고).
+    """
+    browser = await playwright.chromium.launch(headless=headless, **launch_kwargs)
+
+    original_new_context = browser.new_context
+    original_new_page = browser.new_page
+
+    async def new_context(*args, **kwargs):
+        context = await original_new_context(*args, **kwargs)
+        await apply_resource_blocking(context)
+        context.on("page", watch_page)
+        return context
+
+    async def new_page(*args, **kwargs):
+        page = await original_new_page(*args, **kwargs)
+        await apply_resource_blocking(page.context)
+        watch_page(page)
+        return page
+
+    browser.new_context = new_context
+    browser.new_page = new_page
+    return browser
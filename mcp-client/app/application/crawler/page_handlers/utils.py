@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
+from .wait_strategies import wait_until_ready
+
 logger = logging.getLogger(__name__)
 
 # 글로벌 타임스탬프 변수
@@ -161,22 +163,24 @@ async def smart_goto(
     wait_for_selector: Optional[str] = None,
     timeout: int = 60000,
     selector_timeout: int = 100000,
-    extra_wait: int = 6000
+    extra_wait: int = 6000,
+    wait_strategy: Optional[str] = None
 ):
     """
     효율적인 페이지 로드 함수
     
     - domcontentloaded로 빠르게 로드
     - 필요한 요소만 추가 대기 (없으면 skip)
-    - 불필요한 networkidle 대기 없음
+    - 고정 대기 대신 준비 상태 기반 대기 (extra_wait는 상한)
     
     Args:
         page: Playwright page 객체
         url: 접속할 URL
-        wait_for_selector: 대기할 CSS selector (optional)
+        wait_for_selector: 대기할 CSS selector (optional, selector_stable 전략의 대상)
         timeout: goto 타임아웃 (기본 30초)
         selector_timeout: selector 대기 타임아웃 (기본 10초)
-        extra_wait: 추가 렌더링 대기 (기본 1.5초)
+        extra_wait: JS 렌더링 대기 상한 (ms)
+        wait_strategy: 대기 전략 이름 (None이면 settings.crawler_wait_strategy)
     
     Returns:
         response: Playwright Response 객체
@@ -191,9 +195,9 @@ async def smart_goto(
         except Exception:
             logger.debug(f"🔍 Selector not found, continuing: {wait_for_selector}")
     
-    # 3단계: JS 렌더링 버퍼
+    # 3단계: JS 렌더링 대기 (준비되면 즉시 진행, 최대 extra_wait)
     if extra_wait > 0:
-        await page.wait_for_timeout(extra_wait)
+        await wait_until_ready(page, wait_strategy, max_wait=extra_wait, selector=wait_for_selector)
     
     return response
 
@@ -204,7 +208,8 @@ async def smart_goto_with_status(
     wait_for_selector: Optional[str] = None,
     timeout: int = 30000,
     selector_timeout: int = 10000,
-    extra_wait: int = 1500
+    extra_wait: int = 1500,
+    wait_strategy: Optional[str] = None
 ):
     """
     smart_goto + HTTP 상태 코드 로깅
@@ -217,7 +222,8 @@ async def smart_goto_with_status(
         wait_for_selector=wait_for_selector,
         timeout=timeout,
         selector_timeout=selector_timeout,
-        extra_wait=extra_wait
+        extra_wait=extra_wait,
+        wait_strategy=wait_strategy
     )
     
     status_code = response.status if response else None
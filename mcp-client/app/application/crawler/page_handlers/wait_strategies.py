@@ -0,0 +1,311 @@
+"""
+준비 상태(readiness) 기반 대기 엔진
+
+고정 sleep(wait_for_timeout) 대신 페이지가 실제로 준비되었는지 확인하여 대기합니다.
+모든 전략은 max_wait(ms)를 상한으로 하므로 기존 고정 대기보다 길어지지 않습니다.
+
+전략 이름 (settings.crawler_wait_strategy 기본값, smart_goto/핸들러/MCP 스크래핑 공통):
+- "dom_quiet": DOM 변경(MutationObserver)이 quiet_ms 동안 없으면 준비 완료
+- "network_idle": 무시 목록을 제외한 진행 중 요청이 idle_ms 동안 없으면 준비 완료
+- "selector_stable": selector 매칭 개수가 stable_ms 동안 늘지 않으면 준비 완료
+- "fixed": 기존 방식 (max_wait 만큼 고정 대기)
+- "none": 대기하지 않음
+
+사용 예:
+    await wait_until_ready(page, "dom_quiet", max_wait=2000)
+
+    # 클릭 등 액션이 유발한 변화를 기다릴 때 (액션 전에 감시 시작)
+    async with settle_after(page, "selector_stable", max_wait=2700, selector="ul.list li"):
+        await page.click(".btn-more")
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+from app.config import settings
+from .fetch_context import capture_ready_page
+
+logger = logging.getLogger(__name__)
+
+WAIT_STRATEGIES = ("dom_quiet", "network_idle", "selector_stable", "fixed", "none")
+
+# DOM 변경 감시 상태를 window에 설치하고 조용해졌는지 판단
+# (문서가 새로 로드되어 상태가 없으면 새 문서 자체를 '변경'으로 간주)
+_DOM_QUIET_ARM_JS = """
+() => {
+    let s = window.__cmDomWait;
+    if (!s) {
+        s = window.__cmDomWait = { last: Date.now(), changed: false };
+        new MutationObserver(() => { s.last = Date.now(); s.changed = true; })
+            .observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    }
+    s.last = Date.now();
+    s.changed = false;
+}
+"""
+
+_DOM_QUIET_JS = """
+([quietMs, requireChange]) => {
+    let s = window.__cmDomWait;
+    if (!s) {
+        s = window.__cmDomWait = { last: Date.now(), changed: true };
+        new MutationObserver(() => { s.last = Date.now(); s.changed = true; })
+            .observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    }
+    return (!requireChange || s.changed) && Date.now() - s.last >= quietMs;
+}
+"""
+
+# selector 매칭 개수가 min_count 이상이고 stable_ms 동안 변하지 않았는지 판단
+_SELECTOR_STABLE_JS = """
+([selector, stableMs, minCount]) => {
+    const n = document.querySelectorAll(selector).length;
+    let s = window.__cmCountWait;
+    if (!s || s.selector !== selector) {
+        window.__cmCountWait = { selector, n, since: Date.now() };
+        return false;
+    }
+    if (n !== s.n) {
+        s.n = n;
+        s.since = Date.now();
+        return false;
+    }
+    return n >= minCount && Date.now() - s.since >= stableMs;
+}
+"""
+
+
+def _resolve_strategy(strategy: Optional[str]) -> str:
+    name = (strategy or settings.crawler_wait_strategy or "fixed").lower()
+    if name not in WAIT_STRATEGIES:
+        logger.warning(f"⚠️ Unknown wait strategy '{name}', falling back to 'fixed'")
+        return "fixed"
+    return name
+
+
+async def wait_for_dom_quiet(
+    page,
+    max_wait: int,
+    quiet_ms: Optional[int] = None,
+    require_change: bool = False
+) -> bool:
+    """
+    DOM 변경이 quiet_ms 동안 없을 때까지 대기 (최대 max_wait ms)
+
+    Args:
+        page: Playwright Page 또는 Frame
+        require_change: True면 대기 시작(또는 arm) 이후 변경이 한 번 이상 있어야 완료
+
+    Returns:
+        bool: 조건 충족 여부 (상한 도달 시 False)
+    """
+    quiet = quiet_ms if quiet_ms is not None else settings.crawler_wait_quiet_ms
+    try:
+        await page.wait_for_function(_DOM_QUIET_JS, arg=[quiet, require_change], timeout=max_wait, polling=100)
+        return True
+    except Exception as e:
+        logger.debug(f"🔍 DOM quiet wait ended without readiness: {e}")
+        return False
+
+
+async def wait_for_selector_count_stable(
+    page,
+    selector: str,
+    max_wait: int,
+    stable_ms: Optional[int] = None,
+    min_count: int = 1
+) -> bool:
+    """
+    selector 매칭 개수가 min_count 이상이 되고 stable_ms 동안 늘지 않을 때까지 대기 (최대 max_wait ms)
+
+    "더보기" 클릭 후에는 min_count=클릭 전 개수+1 로 지정하면 새 항목이 붙은 뒤 안정될 때까지 대기합니다.
+    """
+    stable = stable_ms if stable_ms is not None else settings.crawler_wait_quiet_ms
+    try:
+        await page.evaluate("() => { delete window.__cmCountWait; }")
+        await page.wait_for_function(
+            _SELECTOR_STABLE_JS, arg=[selector, stable, min_count], timeout=max_wait, polling=100
+        )
+        return True
+    except Exception as e:
+        logger.debug(f"🔍 Selector count wait ended without readiness ({selector}): {e}")
+        return False
+
+
+class NetworkActivityTracker:
+    """무시 목록을 제외한 진행 중 요청 추적 (page 이벤트 기반)"""
+
+    def __init__(self, page, ignore_patterns: Optional[Iterable[str]] = None):
+        self.page = page
+        patterns = ignore_patterns if ignore_patterns is not None else settings.crawler_wait_network_ignore
+        self.ignore_patterns = tuple(p.lower() for p in patterns if p)
+        self.inflight: Set[Any] = set()
+        self.seen_requests = 0
+        self.last_activity = time.monotonic()
+
+    def _ignored(self, url: str) -> bool:
+        lowered = url.lower()
+        return any(p in lowered for p in self.ignore_patterns)
+
+    def _on_request(self, request) -> None:
+        if not self._ignored(request.url):
+            self.inflight.add(request)
+            self.seen_requests += 1
+            self.last_activity = time.monotonic()
+
+    def _on_done(self, request) -> None:
+        if request in self.inflight:
+            self.inflight.discard(request)
+            self.last_activity = time.monotonic()
+
+    def attach(self) -> "NetworkActivityTracker":
+        self.page.on("request", self._on_request)
+        self.page.on("requestfinished", self._on_done)
+        self.page.on("requestfailed", self._on_done)
+        return self
+
+    def detach(self) -> None:
+        for event, handler in (
+            ("request", self._on_request),
+            ("requestfinished", self._on_done),
+            ("requestfailed", self._on_done),
+        ):
+            try:
+                self.page.remove_listener(event, handler)
+            except Exception:
+                pass
+
+    async def wait_idle(self, max_wait: int, idle_ms: Optional[int] = None, require_activity: bool = False) -> bool:
+        """진행 중 요청이 idle_ms 동안 없을 때까지 대기 (최대 max_wait ms)"""
+        idle = (idle_ms if idle_ms is not None else settings.crawler_wait_quiet_ms) / 1000
+        deadline = time.monotonic() + max_wait / 1000
+        while True:
+            now = time.monotonic()
+            if not self.inflight and now - self.last_activity >= idle and (self.seen_requests or not require_activity):
+                return True
+            if now >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+
+
+async def wait_for_network_idle(
+    page,
+    max_wait: int,
+    idle_ms: Optional[int] = None,
+    ignore_patterns: Optional[Iterable[str]] = None
+) -> bool:
+    """
+    무시 목록(분석/로그/비콘 등)을 제외한 요청이 idle_ms 동안 없을 때까지 대기 (최대 max_wait ms)
+
+    대기 시작 전에 시작된 요청은 추적되지 않으므로, 액션이 유발한 요청을 기다릴 때는 settle_after를 사용합니다.
+    """
+    tracker = NetworkActivityTracker(page, ignore_patterns).attach()
+    try:
+        return await tracker.wait_idle(max_wait, idle_ms)
+    finally:
+        tracker.detach()
+
+
+async def wait_until_ready(
+    page,
+    strategy: Optional[str] = None,
+    max_wait: int = 6000,
+    selector: Optional[str] = None,
+    **options
+) -> bool:
+    """
+    이름 있는 전략으로 페이지 준비 대기 (최대 max_wait ms)
+
+    Args:
+        page: Playwright Page 또는 Frame
+        strategy: WAIT_STRATEGIES 중 하나 (None이면 settings.crawler_wait_strategy)
+        selector: selector_stable 전략의 대상 (없으면 dom_quiet로 대체)
+        **options: quiet_ms / idle_ms / stable_ms / min_count / ignore_patterns
+
+    Returns:
+        bool: 조건 충족 여부 (상한 도달 또는 fixed 전략이면 False)
+    """
+    ready = await _wait_with_strategy(page, strategy, max_wait, selector, options)
+    # 대상 URL 페이지면 준비 완료 시점의 DOM을 페치 컨텍스트에 저장 (폴백 시 재로드 방지)
+    await capture_ready_page(page)
+    return ready
+
+
+async def _wait_with_strategy(
+    page,
+    strategy: Optional[str],
+    max_wait: int,
+    selector: Optional[str],
+    options: Dict[str, Any]
+) -> bool:
+    if max_wait <= 0:
+        return True
+
+    name = _resolve_strategy(strategy)
+    if name == "none":
+        return True
+    if name == "fixed":
+        await page.wait_for_timeout(max_wait)
+        return False
+    if name == "network_idle":
+        return await wait_for_network_idle(
+            page, max_wait, options.get("idle_ms"), options.get("ignore_patterns")
+        )
+    if name == "selector_stable" and selector:
+        return await wait_for_selector_count_stable(
+            page, selector, max_wait, options.get("stable_ms"), options.get("min_count", 1)
+        )
+    return await wait_for_dom_quiet(page, max_wait, options.get("quiet_ms"))
+
+
+@asynccontextmanager
+async def settle_after(
+    page,
+    strategy: Optional[str] = None,
+    max_wait: int = 3000,
+    selector: Optional[str] = None,
+    **options
+) -> AsyncIterator[None]:
+    """
+    클릭/페이지 이동 함수 호출 등 액션을 감싸 액션이 유발한 변화가 안정될 때까지 대기
+
+    액션 전에 감시를 시작하므로 "아직 요청이 시작되지 않아 조용한" 상태를 준비 완료로 오인하지 않습니다.
+    - dom_quiet: 액션 이후 DOM 변경이 한 번 이상 있고 quiet_ms 동안 조용해질 때까지
+    - network_idle: 액션 이후 요청이 한 번 이상 있고 모두 끝난 뒤 idle_ms가 지날 때까지
+    - selector_stable: selector 개수가 액션 전보다 늘어난 뒤 stable_ms 동안 유지될 때까지
+      (min_count 옵션을 주면 그 값 기준)
+    """
+    name = _resolve_strategy(strategy)
+    if name == "selector_stable" and not selector:
+        name = "dom_quiet"
+
+    tracker: Optional[NetworkActivityTracker] = None
+    min_count = options.get("min_count")
+    try:
+        if name == "dom_quiet":
+            await page.evaluate(_DOM_QUIET_ARM_JS)
+        elif name == "network_idle":
+            tracker = NetworkActivityTracker(page, options.get("ignore_patterns")).attach()
+        elif name == "selector_stable" and min_count is None:
+            min_count = await page.evaluate("(sel) => document.querySelectorAll(sel).length", selector) + 1
+    except Exception as e:
+        logger.debug(f"🔍 Failed to arm wait strategy '{name}': {e}")
+
+    try:
+        yield
+        if max_wait <= 0 or name == "none":
+            return
+        if name == "fixed":
+            await page.wait_for_timeout(max_wait)
+        elif name == "network_idle" and tracker is not None:
+            await tracker.wait_idle(max_wait, options.get("idle_ms"), require_activity=True)
+        elif name == "selector_stable":
+            await wait_for_selector_count_stable(page, selector, max_wait, options.get("stable_ms"), min_count or 1)
+        else:
+            await wait_for_dom_quiet(page, max_wait, options.get("quiet_ms"), require_change=True)
+    finally:
+        if tracker is not None:
+            tracker.detach()
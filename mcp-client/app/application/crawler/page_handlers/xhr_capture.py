@@ -0,0 +1,345 @@
+"""
+XHR/fetch 응답 캡처 및 목록 엔드포인트 직접 호출
+
+목록을 JSON/HTML 조각 API로 채우는 페이지에서, 페이지 이동(더보기/페이지 번호 클릭)이 발생시키는
+요청을 캡처한 뒤 이후 페이지는 같은 엔드포인트를 페이지 번호만 바꿔 직접 호출합니다.
+(클릭 + 렌더링 대기 N회 → 가벼운 요청 N회)
+
+- 엔드포인트는 URL 패턴 없이도 "페이지 번호 파라미터 값이 이동한 페이지 번호와 같은 요청"으로 자동 식별
+- 직접 호출은 page.request(APIRequestContext)를 사용하므로 브라우저 컨텍스트의 쿠키/세션을 공유
+- 응답 본문은 JSON이면 json(), HTML 조각이면 text로 핸들러가 직접 파싱
+
+사용 예:
+    endpoint = await discover_paged_endpoint(page, lambda: page.click("a[data-page='2']"), page_no=2)
+    if endpoint:
+        async for page_no, items in endpoint.iter_pages(page, parse_items, start=3, end=total_pages):
+            ...
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 페이지 번호로 사용되는 파라미터 이름 (소문자 비교)
+PAGE_PARAM_NAMES = (
+    "page", "pageno", "pagenum", "pagenumber", "pageindex", "currentpage",
+    "curpage", "cpage", "pg", "nowpage", "currpage",
+)
+
+# 직접 호출 시 복사하지 않는 요청 헤더 (APIRequestContext가 다시 설정)
+_SKIP_REQUEST_HEADERS = frozenset({"content-length", "host", "cookie", "connection", "accept-encoding"})
+
+
+@dataclass
+class CapturedExchange:
+    """캡처된 요청/응답 한 쌍"""
+    url: str
+    method: str
+    status: int
+    content_type: str
+    body: str
+    post_data: Optional[str] = None
+    request_headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_json(self) -> bool:
+        return "json" in self.content_type or self.body.lstrip()[:1] in ("{", "[")
+
+    def json(self) -> Any:
+        """JSON 본문 (파싱 실패 시 None)"""
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            return None
+
+    def _param_sources(self) -> Iterable[Tuple[str, Dict[str, str]]]:
+        yield "query", dict(parse_qsl(urlparse(self.url).query, keep_blank_values=True))
+        if not self.post_data:
+            return
+        if self.post_data.lstrip().startswith("{"):
+            try:
+                body = json.loads(self.post_data)
+                if isinstance(body, dict):
+                    yield "json", {k: str(v) for k, v in body.items() if not isinstance(v, (dict, list))}
+            except ValueError:
+                pass
+        else:
+            yield "form", dict(parse_qsl(self.post_data, keep_blank_values=True))
+
+    def find_page_param(self, page_no: int) -> Optional[Tuple[str, str]]:
+        """
+        값이 page_no인 페이지 번호 파라미터 탐색
+
+        Returns:
+            (위치('query'/'form'/'json'), 파라미터 이름) 또는 None
+        """
+        target = str(page_no)
+        for location, params in self._param_sources():
+            for name, value in params.items():
+                if value == target and name.lower() in PAGE_PARAM_NAMES:
+                    return location, name
+        # 알려진 이름이 없으면 'page'가 들어간 파라미터 허용
+        for location, params in self._param_sources():
+            for name, value in params.items():
+                if value == target and "page" in name.lower():
+                    return location, name
+        return None
+
+    def for_page(self, location: str, name: str, page_no: int) -> Tuple[str, Optional[str]]:
+        """페이지 번호 파라미터만 바꾼 (url, post_data)"""
+        if location == "query":
+            parsed = urlparse(self.url)
+            params = parse_qsl(parsed.query, keep_blank_values=True)
+            query = urlencode([(k, str(page_no) if k == name else v) for k, v in params])
+            return urlunparse(parsed._replace(query=query)), self.post_data
+        if location == "json":
+            body = json.loads(self.post_data)
+            original = body.get(name)
+            body[name] = page_no if isinstance(original, int) else str(page_no)
+            return self.url, json.dumps(body, ensure_ascii=False)
+        params = parse_qsl(self.post_data or "", keep_blank_values=True)
+        return self.url, urlencode([(k, str(page_no) if k == name else v) for k, v in params])
+
+
+class XhrCapture:
+    """page/context의 XHR·fetch 응답 캡처 (url_patterns가 있으면 부분 문자열이 일치하는 요청만)"""
+
+    def __init__(
+        self,
+        target,
+        url_patterns: Optional[Iterable[str]] = None,
+        resource_types: Iterable[str] = ("xhr", "fetch"),
+        ignore_patterns: Optional[Iterable[str]] = None
+    ):
+        self.target = target
+        self.url_patterns = tuple(url_patterns or ())
+        self.resource_types = frozenset(resource_types)
+        patterns = ignore_patterns if ignore_patterns is not None else settings.crawler_wait_network_ignore
+        self.ignore_patterns = tuple(p.lower() for p in patterns if p)
+        self.exchanges: List[CapturedExchange] = []
+        self._pending: set = set()
+
+    def _wanted(self, request) -> bool:
+        if request.resource_type not in self.resource_types:
+            return False
+        lowered = request.url.lower()
+        if any(p in lowered for p in self.ignore_patterns):
+            return False
+        return not self.url_patterns or any(p in request.url for p in self.url_patterns)
+
+    async def _record(self, response) -> None:
+        request = response.request
+        try:
+            headers = response.headers
+            length = headers.get("content-length")
+            if length and length.isdigit() and int(length) > settings.crawler_xhr_capture_max_body:
+                return
+            body = await response.text()
+            if len(body) > settings.crawler_xhr_capture_max_body:
+                return
+            self.exchanges.append(CapturedExchange(
+                url=request.url,
+                method=request.method,
+                status=response.status,
+                content_type=(headers.get("content-type") or "").lower(),
+                body=body,
+                post_data=request.post_data,
+                request_headers=dict(request.headers),
+            ))
+        except Exception as e:
+            # 리다이렉트/닫힌 페이지 등 본문을 읽을 수 없는 응답은 무시
+            logger.debug(f"🔍 XHR capture skipped: {request.url} - {e}")
+
+    def _on_response(self, response) -> None:
+        if not self._wanted(response.request):
+            return
+        task = asyncio.ensure_future(self._record(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def attach(self) -> "XhrCapture":
+        self.target.on("response", self._on_response)
+        return self
+
+    def detach(self) -> None:
+        try:
+            self.target.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+
+    async def drain(self) -> None:
+        """본문 읽기가 진행 중인 응답 처리 완료 대기"""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def find_paged(self, page_no: int) -> Optional["PagedEndpoint"]:
+        """가장 최근에 캡처된 page_no 페이지 요청 (성공 응답만)"""
+        for exchange in reversed(self.exchanges):
+            if exchange.status >= 400:
+                continue
+            found = exchange.find_page_param(page_no)
+            if found:
+                return PagedEndpoint(exchange, found[0], found[1])
+        return None
+
+    async def wait_for_paged(self, page_no: int, max_wait: int) -> Optional["PagedEndpoint"]:
+        """page_no 페이지 요청이 캡처될 때까지 대기 (최대 max_wait ms)"""
+        deadline = asyncio.get_running_loop().time() + max_wait / 1000
+        while True:
+            await self.drain()
+            endpoint = self.find_paged(page_no)
+            if endpoint or asyncio.get_running_loop().time() >= deadline:
+                return endpoint
+            await asyncio.sleep(0.05)
+
+
+@dataclass
+class PagedEndpoint:
+    """페이지 번호 파라미터를 바꿔 직접 호출할 수 있는 목록 엔드포인트"""
+    exchange: CapturedExchange
+    location: str
+    param: str
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            k: v for k, v in self.exchange.request_headers.items()
+            if k.lower() not in _SKIP_REQUEST_HEADERS and not k.startswith(":")
+        }
+
+    async def fetch(self, page, page_no: int) -> CapturedExchange:
+        """
+        page_no 페이지 직접 호출
+
+        Args:
+            page: Playwright Page 또는 Frame (브라우저 컨텍스트 쿠키 공유)
+        """
+        request_context = getattr(page, "request", None) or page.page.request
+        url, post_data = self.exchange.for_page(self.location, self.param, page_no)
+        response = await request_context.fetch(
+            url,
+            method=self.exchange.method,
+            headers=self._headers(),
+            data=post_data,
+        )
+        try:
+            return CapturedExchange(
+                url=url,
+                method=self.exchange.method,
+                status=response.status,
+                content_type=(response.headers.get("content-type") or "").lower(),
+                body=await response.text(),
+                post_data=post_data,
+                request_headers=self.exchange.request_headers,
+            )
+        finally:
+            await response.dispose()
+
+    async def iter_pages(
+        self,
+        page,
+        parse: Callable[[CapturedExchange], List[Any]],
+        start: int,
+        end: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, List[Any]]]:
+        """
+        start 페이지부터 직접 호출하며 (페이지 번호, 파싱 결과) 생성
+
+        오류 응답, 빈 파싱 결과, 직전 페이지와 같은 본문(마지막 페이지 반복)에서 종료합니다.
+        end가 없으면 settings.crawler_xhr_capture_max_pages 까지만 호출합니다.
+        """
+        last_page = end if end is not None else start + settings.crawler_xhr_capture_max_pages - 1
+        previous_digest = hashlib.sha1(self.exchange.body.encode("utf-8", "ignore")).digest()
+        for page_no in range(start, last_page + 1):
+            try:
+                exchange = await self.fetch(page, page_no)
+            except Exception as e:
+                logger.warning(f"⚠️ Direct endpoint fetch failed (page {page_no}): {e}")
+                return
+            if exchange.status >= 400:
+                logger.info(f"📄 Endpoint page {page_no}: HTTP {exchange.status}, stopping")
+                return
+            digest = hashlib.sha1(exchange.body.encode("utf-8", "ignore")).digest()
+            if digest == previous_digest:
+                return
+            previous_digest = digest
+            try:
+                items = parse(exchange)
+            except Exception as e:
+                logger.warning(f"⚠️ Endpoint response parse failed (page {page_no}): {e}")
+                return
+            if not items:
+                return
+            yield page_no, items
+
+
+async def discover_paged_endpoint(
+    page,
+    trigger: Callable[[], Awaitable[Any]],
+    page_no: int,
+    url_patterns: Optional[Iterable[str]] = None,
+    max_wait: int = 3000
+) -> Optional[PagedEndpoint]:
+    """
+    trigger(페이지 이동 액션)가 발생시킨 page_no 페이지 목록 요청을 캡처
+
+    trigger의 원래 효과(DOM 갱신)는 그대로 일어나므로 해당 페이지는 기존 방식대로 추출하면 되고,
+    반환된 엔드포인트로 이후 페이지를 직접 호출합니다. 비활성화되었거나 찾지 못하면 None.
+    trigger가 False를 반환하면(이동할 페이지 없음) 캡처를 기다리지 않습니다.
+
+    Args:
+        page: 응답 이벤트를 받을 Page (iframe 요청도 Page 이벤트로 수신)
+    """
+    if not settings.crawler_xhr_capture:
+        await trigger()
+        return None
+
+    capture = XhrCapture(page, url_patterns).attach()
+    try:
+        if await trigger() is False:
+            return None
+        endpoint = await capture.wait_for_paged(page_no, max_wait)
+    finally:
+        capture.detach()
+
+    if endpoint:
+        logger.info(
+            f"🔗 List endpoint captured: {endpoint.exchange.method} {endpoint.exchange.url} "
+            f"({endpoint.location}:{endpoint.param})"
+        )
+    else:
+        logger.debug(f"🔍 No paged endpoint captured for page {page_no}")
+    return endpoint
+
+
+def find_record_list(payload: Any) -> List[Dict[str, Any]]:
+    """JSON 응답에서 가장 큰 객체 배열(목록 레코드) 탐색"""
+    best: List[Dict[str, Any]] = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            records = [item for item in node if isinstance(item, dict)]
+            if len(records) > len(best):
+                best = records
+            stack.extend(records)
+    return best
+
+
+def pick(record: Dict[str, Any], *names: str, default: str = "") -> str:
+    """후보 키 이름 중 처음으로 값이 있는 항목 (대소문자 무시)"""
+    lowered = {k.lower(): v for k, v in record.items()}
+    for name in names:
+        value = lowered.get(name.lower())
+        if value not in (None, ""):
+            return str(value).strip()
+    return default
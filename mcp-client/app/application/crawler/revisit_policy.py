@@ -0,0 +1,94 @@
+"""
+적응형 재방문 정책 (URL별 변경 빈도에 따른 Daily Crawling 대상 선정)
+
+대부분의 input_urls는 몇 달씩 바뀌지 않는데도 매일 모두 크롤링됩니다.
+URL마다 크롤링 결과의 내용 지문을 이전 결과와 비교해 변경 이력을 쌓고,
+바뀌지 않으면 재방문 주기를 늘리고(x settings.revisit_backoff_factor) 바뀌면 줄여(x settings.revisit_change_factor)
+다음 재방문 시각(next_due_at)을 정합니다. Daily Crawling은 기본적으로 재방문 시각이 된 URL만 크롤링합니다.
+
+- 주기 범위: settings.revisit_min_interval_hours ~ settings.revisit_max_interval_hours
+- 처음 크롤링하는 URL / 마지막 크롤링이 실패한 URL / 재방문 상태가 없는 URL은 항상 대상
+- 재방문 시각이 settings.revisit_due_slack_hours 안에 도래하는 URL도 대상 (실행 시각이 매일 조금씩 달라도 하루씩 밀리지 않도록)
+- priority가 settings.revisit_priority_threshold 이상인 URL은 항상 대상
+- force_recrawl=True면 재방문 시각과 관계없이 모든 활성 URL이 대상
+- 부분 결과로 끝난 URL은 주기를 바꾸지 않고 다음 실행에 다시 대상
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from app.config import settings
+from app.application.crawler.snapshot_store import content_hash
+from app.domains.crawler.entities.url_revisit_state import UrlRevisitState
+from app.domains.crawler.repositories.url_revisit_repository import url_revisit_repository
+
+logger = logging.getLogger(__name__)
+
+
+def url_fingerprint(document_fingerprints: Iterable[str]) -> str:
+    """URL 하나에서 나온 문서 지문들을 합친 지문 (문서 순서와 무관)"""
+    return content_hash("\n".join(sorted(document_fingerprints)))
+
+
+def _clamp_interval(hours: float) -> float:
+    return max(settings.revisit_min_interval_hours, min(settings.revisit_max_interval_hours, hours))
+
+
+def observe(
+    state: Optional[UrlRevisitState],
+    input_url_id: int,
+    fingerprint: Optional[str],
+    checked_at: datetime
+) -> UrlRevisitState:
+    """
+    크롤링 결과 하나를 반영한 재방문 상태
+
+    fingerprint가 None이면(부분 결과) 주기는 그대로 두고 바로 다시 대상이 되도록 합니다.
+    """
+    if state is None:
+        state = UrlRevisitState(
+            input_url_id=input_url_id,
+            check_count=0,
+            change_count=0,
+            interval_hours=settings.revisit_min_interval_hours,
+        )
+
+    if fingerprint is None:
+        state.next_due_at = checked_at
+        return state
+
+    if state.fingerprint is not None:
+        state.check_count += 1
+        if fingerprint != state.fingerprint:
+            state.change_count += 1
+            state.last_changed_at = checked_at
+            state.interval_hours = _clamp_interval(state.interval_hours * settings.revisit_change_factor)
+        else:
+            state.interval_hours = _clamp_interval(state.interval_hours * settings.revisit_backoff_factor)
+    else:
+        state.last_changed_at = checked_at
+
+    state.fingerprint = fingerprint
+    state.last_checked_at = checked_at
+    state.next_due_at = checked_at + timedelta(hours=state.interval_hours)
+    return state
+
+
+async def record_observations(observations: Dict[int, Optional[str]], checked_at: datetime) -> List[UrlRevisitState]:
+    """
+    Daily Crawling 결과로 URL별 재방문 상태 갱신
+
+    Args:
+        observations: {input_url_id: URL 지문 (부분 결과면 None)}
+        checked_at: 실행 시작 시각 (다음 날 같은 시각의 실행에서 바로 대상이 되도록 실행 시작 기준)
+    """
+    states = await url_revisit_repository.get_states(list(observations))
+    updated = [
+        observe(states.get(url_id), url_id, fingerprint, checked_at)
+        for url_id, fingerprint in observations.items()
+    ]
+    await url_revisit_repository.save_states(updated)
+    changed = sum(1 for state in updated if state.last_changed_at == checked_at)
+    logger.info(f"🗓️ Revisit states updated: {len(updated)} URLs ({changed} changed)")
+    return updated
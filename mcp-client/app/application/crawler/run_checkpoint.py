@@ -0,0 +1,180 @@
+"""
+Daily Crawling 실행 체크포인트
+
+실행(run)마다 settings.daily_checkpoint_dir/{task_id}/ 아래에 다음 파일을 기록합니다.
+
+- manifest.json: 실행 옵션, 대상 input_url ID 목록(순서 유지), 상태(running/completed/failed)
+- results.jsonl: URL 하나가 끝날 때마다 크롤링+전처리 결과를 한 줄씩 추가 (append-only)
+
+프로세스가 중간에 죽어도 완료된 URL의 결과는 results.jsonl에 남으므로,
+재개(resume) 시 성공한 URL은 건너뛰고 실패했거나 남은 URL만 크롤링한 뒤 같은 방식으로 DB 업데이트/JSON 출력을 수행합니다.
+마지막 줄이 쓰는 도중 잘린 경우 해당 줄만 무시합니다.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+RESULTS_FILE = "results.jsonl"
+
+# 재개 가능한 실행 상태 (running은 프로세스가 재시작되어 중단된 실행)
+RESUMABLE_STATUSES = {"running", "failed"}
+
+
+class RunCheckpoint:
+    """실행 단위 체크포인트 (manifest + append-only 결과 로그)"""
+
+    def __init__(self, task_id: str, base_dir: Optional[Path] = None) -> None:
+        self.task_id = task_id
+        self.dir = Path(base_dir or settings.daily_checkpoint_dir) / task_id
+        self._lock = asyncio.Lock()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.dir / MANIFEST_FILE
+
+    @property
+    def results_path(self) -> Path:
+        return self.dir / RESULTS_FILE
+
+    # ----------------------------------------------------------------------------------
+    # Manifest
+    # ----------------------------------------------------------------------------------
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Checkpoint manifest unreadable ({self.task_id}): {e}")
+            return None
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        manifest["updated_at"] = datetime.now().isoformat()
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(self.manifest_path)
+
+    async def start(self, options: Dict[str, Any], url_ids: List[int]) -> None:
+        """새 실행의 manifest 작성 (이미 있으면 재개로 보고 상태만 running으로 변경)"""
+        def write() -> None:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            manifest = self.load_manifest()
+            if manifest is None:
+                manifest = {
+                    "task_id": self.task_id,
+                    "created_at": datetime.now().isoformat(),
+                    "options": options,
+                    "url_ids": url_ids,
+                    "resume_count": 0,
+                }
+            else:
+                manifest["resume_count"] = manifest.get("resume_count", 0) + 1
+                self._terminate_partial_line()
+            manifest["status"] = "running"
+            manifest.pop("error", None)
+            self._write_manifest(manifest)
+
+        async with self._lock:
+            await asyncio.to_thread(write)
+
+    def _terminate_partial_line(self) -> None:
+        """중단으로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정"""
+        try:
+            with open(self.results_path, "rb+") as f:
+                f.seek(0, 2)
+                if f.tell() == 0:
+                    return
+                f.seek(-1, 2)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+        except FileNotFoundError:
+            pass
+
+    async def finish(self, status: str, error: Optional[str] = None, **extra: Any) -> None:
+        """실행 종료 상태 기록 (completed면 설정에 따라 결과 로그 삭제)"""
+        def write() -> None:
+            manifest = self.load_manifest()
+            if manifest is None:
+                return
+            manifest["status"] = status
+            manifest["completed_at"] = datetime.now().isoformat()
+            if error:
+                manifest["error"] = error
+            manifest.update(extra)
+            self._write_manifest(manifest)
+            if status == "completed" and not settings.daily_checkpoint_keep_completed:
+                self.results_path.unlink(missing_ok=True)
+
+        async with self._lock:
+            try:
+                await asyncio.to_thread(write)
+            except OSError as e:
+                logger.error(f"❌ Checkpoint finish failed ({self.task_id}): {e}")
+
+    # ----------------------------------------------------------------------------------
+    # Results
+    # ----------------------------------------------------------------------------------
+    async def append(self, input_url_id: int, entry: Dict[str, Any]) -> None:
+        """URL 하나의 결과 추가 ({"success": bool, "processed_result": ...} 또는 {"success": False, "error": ...})"""
+        line = json.dumps({"input_url_id": input_url_id, **entry}, ensure_ascii=False, default=str)
+
+        def write() -> None:
+            with open(self.results_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+
+        async with self._lock:
+            try:
+                await asyncio.to_thread(write)
+            except OSError as e:
+                # 체크포인트 실패는 크롤링을 중단하지 않음 (재개 시 해당 URL만 다시 크롤링)
+                logger.error(f"❌ Checkpoint append failed ({self.task_id}, {input_url_id}): {e}")
+
+    def load_results(self) -> Dict[int, Dict[str, Any]]:
+        """
+        성공한 URL 결과 (input_url_id → entry, 같은 URL이 여러 번 있으면 마지막 성공 기록)
+
+        실패 기록은 복원하지 않으므로 재개 시 해당 URL은 다시 크롤링합니다 (부분 결과는 성공으로 복원).
+        """
+        completed: Dict[int, Dict[str, Any]] = {}
+        try:
+            with open(self.results_path, encoding="utf-8") as f:
+                for line_no, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"⚠️ Checkpoint line {line_no} is truncated, ignored ({self.task_id})")
+                        continue
+                    input_url_id = entry.pop("input_url_id")
+                    if entry.get("success"):
+                        completed[input_url_id] = entry
+        except FileNotFoundError:
+            pass
+        return completed
+
+
+def list_checkpoints(statuses: Optional[set] = None) -> List[Dict[str, Any]]:
+    """체크포인트 manifest 목록 (최근 생성 순, statuses로 상태 필터)"""
+    base_dir = Path(settings.daily_checkpoint_dir)
+    if not base_dir.exists():
+        return []
+
+    manifests = []
+    for path in base_dir.iterdir():
+        if not path.is_dir():
+            continue
+        manifest = RunCheckpoint(path.name, base_dir).load_manifest()
+        if manifest and (statuses is None or manifest.get("status") in statuses):
+            manifests.append(manifest)
+    return sorted(manifests, key=lambda m: m.get("created_at", ""), reverse=True)
@@ -0,0 +1,263 @@
+"""
+크롤링 산출물 스냅샷 저장소 (내용 주소 기반, 압축 저장)
+
+원본 HTML, 마크다운, 전처리 텍스트, Daily Crawling JSON 출력을 내용 해시(sha256)당 한 번만 압축 저장하고,
+실행(run)마다 어떤 URL이 어떤 해시를 가졌는지 manifest에 기록합니다.
+대부분의 페이지는 하루 사이에 바뀌지 않으므로 같은 내용은 다시 쓰지 않습니다.
+
+settings.snapshot_store_dir 아래 구조:
+
+- objects/ab/cdef....zst: 내용 blob (zstandard 미설치 시 .gz)
+- runs/{run_id}.json: 실행 manifest (kind, 생성 시각, URL별 해시 목록, 출력 파일 해시)
+
+보존 정책: kind별 최근 settings.snapshot_keep_runs개 또는 settings.snapshot_keep_days일 이내 실행의 manifest를 남기고,
+어떤 manifest에서도 참조하지 않는 blob은 삭제합니다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+from app.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard 미설치 환경은 gzip으로 저장
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+OBJECTS_DIR = "objects"
+RUNS_DIR = "runs"
+# 저장/조회 시 확인할 blob 확장자 (앞쪽이 새로 쓸 때 사용하는 형식)
+BLOB_SUFFIXES = (".zst", ".gz") if zstandard is not None else (".gz", ".zst")
+
+# manifest 항목에서 blob 해시를 담는 필드
+BLOB_FIELDS = ("html", "markdown", "processed")
+# 참조되지 않아도 최근 이 시간(초) 안에 쓴 blob은 보존 정책에서 제외
+BLOB_GRACE_SECONDS = 3600
+
+
+def content_hash(data: Union[str, bytes]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class SnapshotStore:
+    """내용 주소 기반 스냅샷 저장소 (프로세스당 하나, 파일 I/O는 asyncio.to_thread로 호출)"""
+
+    def __init__(self, base_dir: Optional[Path] = None) -> None:
+        self._base_dir = Path(base_dir) if base_dir else None
+        self.written = 0  # 새로 쓴 blob 수
+        self.deduplicated = 0  # 이미 있어서 쓰지 않은 blob 수
+        self._lock = threading.Lock()  # manifest 갱신/보존 정책 직렬화
+
+    @property
+    def base_dir(self) -> Path:
+        return self._base_dir or Path(settings.snapshot_store_dir)
+
+    @property
+    def objects_dir(self) -> Path:
+        return self.base_dir / OBJECTS_DIR
+
+    @property
+    def runs_dir(self) -> Path:
+        return self.base_dir / RUNS_DIR
+
+    # ----------------------------------------------------------------------------------
+    # Blobs
+    # ----------------------------------------------------------------------------------
+    def _blob_path(self, digest: str, suffix: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest[2:]}{suffix}"
+
+    def _find_blob(self, digest: str) -> Optional[Path]:
+        for suffix in BLOB_SUFFIXES:
+            path = self._blob_path(digest, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _compress(self, data: bytes) -> bytes:
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=settings.snapshot_compression_level).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    def put(self, content: Union[str, bytes, None]) -> Optional[str]:
+        """내용 저장 후 해시 반환 (이미 있으면 쓰지 않음, 빈 내용은 None)"""
+        if not content:
+            return None
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        digest = content_hash(data)
+        existing = self._find_blob(digest)
+        if existing is not None:
+            # 보존 정책의 유예 시간 기준이 되도록 참조 시각 갱신
+            os.utime(existing)
+            self.deduplicated += 1
+            return digest
+
+        path = self._blob_path(digest, BLOB_SUFFIXES[0])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(self._compress(data))
+        tmp_path.replace(path)
+        self.written += 1
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """해시의 원본 내용 (없으면 None)"""
+        path = self._find_blob(digest)
+        if path is None:
+            return None
+        data = path.read_bytes()
+        if path.suffix == ".zst":
+            if zstandard is None:
+                raise RuntimeError("zstandard 패키지가 없어 .zst 스냅샷을 읽을 수 없습니다")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def get_text(self, digest: str) -> Optional[str]:
+        data = self.get(digest)
+        return data.decode("utf-8") if data is not None else None
+
+    # ----------------------------------------------------------------------------------
+    # Runs
+    # ----------------------------------------------------------------------------------
+    def _run_path(self, run_id: str) -> Path:
+        return self.runs_dir / f"{run_id}.json"
+
+    def load_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._run_path(run_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Snapshot manifest unreadable ({run_id}): {e}")
+            return None
+
+    def _write_run(self, manifest: Dict[str, Any]) -> None:
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        manifest["updated_at"] = datetime.now().isoformat()
+        path = self._run_path(manifest["run_id"])
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def add_entries(
+        self,
+        run_id: str,
+        kind: str,
+        entries: List[Dict[str, Any]],
+        outputs: Optional[Dict[str, Dict[str, Any]]] = None,
+        **meta: Any
+    ) -> Dict[str, Any]:
+        """
+        실행 manifest에 항목 추가 (없으면 생성)
+
+        entries: URL별 {"url", "title", "html", "markdown", "processed", ...} (내용 필드는 put()으로 얻은 해시)
+        outputs: 출력 파일 {"json": {"name": "data_....json", "hash": ...}}
+        """
+        with self._lock:
+            manifest = self.load_run(run_id) or {
+                "run_id": run_id,
+                "kind": kind,
+                "created_at": datetime.now().isoformat(),
+                "entries": [],
+                "outputs": {},
+            }
+            manifest["entries"].extend(entries)
+            manifest["outputs"].update(outputs or {})
+            manifest.update(meta)
+            self._write_run(manifest)
+            return manifest
+
+    def _iter_runs(self) -> Iterator[Dict[str, Any]]:
+        if not self.runs_dir.exists():
+            return
+        for path in self.runs_dir.glob("*.json"):
+            manifest = self.load_run(path.stem)
+            if manifest:
+                yield manifest
+
+    def load_runs(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """실행 manifest 전체 (최근 생성 순)"""
+        manifests = [m for m in self._iter_runs() if kind is None or m.get("kind") == kind]
+        return sorted(manifests, key=lambda m: m.get("created_at") or "", reverse=True)
+
+    def list_runs(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """실행 요약 목록 (최근 생성 순)"""
+        return [
+            {
+                "run_id": m["run_id"],
+                "kind": m.get("kind"),
+                "created_at": m.get("created_at"),
+                "entries": len(m.get("entries", [])),
+                "outputs": {name: output.get("name") for name, output in m.get("outputs", {}).items()},
+            }
+            for m in self.load_runs(kind)
+        ]
+
+    def find_output(self, name_or_run_id: str, output: str = "json") -> Optional[Dict[str, Any]]:
+        """출력 파일 이름(data_....json) 또는 실행 ID로 출력 파일 {"name", "hash"} 조회"""
+        manifest = self.load_run(name_or_run_id)
+        if manifest is not None:
+            return manifest.get("outputs", {}).get(output)
+        for manifest in self._iter_runs():
+            for entry in manifest.get("outputs", {}).values():
+                if entry.get("name") == name_or_run_id:
+                    return entry
+        return None
+
+    # ----------------------------------------------------------------------------------
+    # Retention
+    # ----------------------------------------------------------------------------------
+    def apply_retention(self) -> Dict[str, int]:
+        """
+        보존 기간이 지난 manifest 삭제 후 참조되지 않는 blob 정리
+
+        kind별로 최근 snapshot_keep_runs개 실행과 snapshot_keep_days일 이내 실행은 유지합니다.
+        """
+        with self._lock:
+            return self._apply_retention()
+
+    def _apply_retention(self) -> Dict[str, int]:
+        cutoff = (datetime.now() - timedelta(days=settings.snapshot_keep_days)).isoformat()
+        by_kind: Dict[str, List[Dict[str, Any]]] = {}
+        for manifest in self._iter_runs():
+            by_kind.setdefault(manifest.get("kind") or "", []).append(manifest)
+
+        removed_runs = 0
+        referenced: Set[str] = set()
+        for manifests in by_kind.values():
+            manifests.sort(key=lambda m: m.get("created_at") or "", reverse=True)
+            for rank, manifest in enumerate(manifests):
+                if rank >= settings.snapshot_keep_runs and (manifest.get("created_at") or "") < cutoff:
+                    self._run_path(manifest["run_id"]).unlink(missing_ok=True)
+                    removed_runs += 1
+                    continue
+                for entry in manifest.get("entries", []):
+                    referenced.update(entry[field] for field in BLOB_FIELDS if entry.get(field))
+                referenced.update(o["hash"] for o in manifest.get("outputs", {}).values() if o.get("hash"))
+
+        # manifest 기록 전인 진행 중 실행의 blob은 삭제하지 않음
+        written_before = (datetime.now() - timedelta(seconds=BLOB_GRACE_SECONDS)).timestamp()
+        removed_blobs = 0
+        if self.objects_dir.exists():
+            for path in self.objects_dir.glob("*/*"):
+                digest = path.parent.name + path.name.split(".", 1)[0]
+                if digest not in referenced and path.stat().st_mtime < written_before:
+                    path.unlink(missing_ok=True)
+                    removed_blobs += 1
+        if removed_runs or removed_blobs:
+            logger.info(f"🧹 Snapshot retention: {removed_runs} runs, {removed_blobs} blobs removed")
+        return {"removed_runs": removed_runs, "removed_blobs": removed_blobs, "kept_blobs": len(referenced)}
+
+
+# 싱글톤 인스턴스
+snapshot_store = SnapshotStore()
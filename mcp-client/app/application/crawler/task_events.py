@@ -0,0 +1,195 @@
+"""
+크롤링 태스크 이벤트 버스 (SSE 스트림용 in-process pub/sub)
+
+태스크마다 고정 크기 링 버퍼에 최근 이벤트를 보관하고, 구독자(SSE 연결)마다 독립적인 대기열로 팬아웃합니다.
+
+- 이벤트 ID는 태스크 내에서 단조 증가하며 SSE `id:` 필드로 전달 → 재연결 시 Last-Event-ID 이후 이벤트부터 재전송
+- 고빈도 이벤트(settings.task_event_coalesce_types, 기본 "progress")는 직전 같은 타입 이벤트를 덮어써
+  버퍼/구독자 대기열에는 최신 카운터 상태만 남음
+- 버퍼와 구독자 대기열 모두 settings.task_event_buffer_size 로 상한이 있어 URL 수/구독자 수와 무관하게 메모리 일정
+- 태스크 종료 후 settings.task_event_retention 초가 지나면 채널 삭제
+
+사용 예:
+    task_event_bus.open(task_id)
+    await task_event_bus.publish(task_id, "progress", {"current": 3, "total": 100})
+    task_event_bus.close(task_id)
+
+    async for event in task_event_bus.subscribe(task_id, last_event_id, heartbeat=30.0):
+        if event is None:  # heartbeat 시점
+            ...
+        yield event.to_sse()
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Set
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 스트림 종료 이벤트 타입
+TERMINAL_EVENT_TYPES = {"final", "complete", "error"}
+
+
+@dataclass
+class TaskEvent:
+    """태스크 이벤트 (id는 태스크 내 순번)"""
+    id: int
+    type: str
+    data: Dict[str, Any]
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_message(self) -> str:
+        return json.dumps({"type": self.type, "data": self.data, "timestamp": self.timestamp}, ensure_ascii=False)
+
+    def to_sse(self) -> str:
+        return f"id: {self.id}\ndata: {self.to_message()}\n\n"
+
+
+class _Subscriber:
+    """구독자별 대기열 (상한 + 고빈도 이벤트 덮어쓰기)"""
+
+    def __init__(self, max_pending: int) -> None:
+        self.pending: Deque[TaskEvent] = deque(maxlen=max_pending)
+        self.wakeup = asyncio.Event()
+
+    def push(self, event: TaskEvent, coalesce: bool) -> None:
+        if coalesce and self.pending and self.pending[-1].type == event.type:
+            self.pending[-1] = event
+        else:
+            self.pending.append(event)
+        self.wakeup.set()
+
+
+class _Channel:
+    """태스크별 이벤트 채널"""
+
+    def __init__(self, buffer_size: int) -> None:
+        self.buffer: Deque[TaskEvent] = deque(maxlen=buffer_size)
+        self.subscribers: Set[_Subscriber] = set()
+        self.last_id = 0
+        self.closed = False
+        self.cleanup_handle: Optional[asyncio.TimerHandle] = None
+
+
+class TaskEventBus:
+    """태스크 이벤트 버스"""
+
+    def __init__(self) -> None:
+        self._channels: Dict[str, _Channel] = {}
+
+    @property
+    def _coalesce_types(self) -> Set[str]:
+        return set(settings.task_event_coalesce_types)
+
+    def open(self, task_id: str) -> None:
+        """태스크 채널 생성 (열린 채널이 있으면 유지, 종료된 채널이면 이벤트 ID를 이어서 새로 생성)"""
+        channel = self._channels.get(task_id)
+        if channel is not None and not channel.closed:
+            return
+        new_channel = _Channel(settings.task_event_buffer_size)
+        if channel is not None:
+            if channel.cleanup_handle is not None:
+                channel.cleanup_handle.cancel()
+            new_channel.last_id = channel.last_id
+        self._channels[task_id] = new_channel
+
+    def has_channel(self, task_id: str) -> bool:
+        return task_id in self._channels
+
+    def is_closed(self, task_id: str) -> bool:
+        channel = self._channels.get(task_id)
+        return channel is None or channel.closed
+
+    async def publish(self, task_id: str, event_type: str, data: Dict[str, Any]) -> Optional[TaskEvent]:
+        """이벤트 발행 (채널이 없으면 무시)"""
+        channel = self._channels.get(task_id)
+        if channel is None:
+            return None
+
+        channel.last_id += 1
+        event = TaskEvent(id=channel.last_id, type=event_type, data=data)
+        coalesce = event_type in self._coalesce_types
+        if coalesce and channel.buffer and channel.buffer[-1].type == event_type:
+            channel.buffer[-1] = event
+        else:
+            channel.buffer.append(event)
+
+        for subscriber in channel.subscribers:
+            subscriber.push(event, coalesce)
+        return event
+
+    def close(self, task_id: str, retention: Optional[float] = None) -> None:
+        """
+        태스크 종료 표시 (구독자는 남은 이벤트를 받은 뒤 종료)
+
+        재연결/뒤늦은 구독자가 버퍼를 재생할 수 있도록 retention 초 후에 채널을 삭제합니다.
+        """
+        channel = self._channels.get(task_id)
+        if channel is None or channel.closed:
+            return
+        channel.closed = True
+        for subscriber in channel.subscribers:
+            subscriber.wakeup.set()
+
+        delay = settings.task_event_retention if retention is None else retention
+        channel.cleanup_handle = asyncio.get_running_loop().call_later(delay, self._drop, task_id, channel)
+
+    def _drop(self, task_id: str, channel: _Channel) -> None:
+        if self._channels.get(task_id) is channel:
+            logger.info(f"🧹 Task event channel removed: {task_id}")
+            del self._channels[task_id]
+
+    async def subscribe(
+        self,
+        task_id: str,
+        last_event_id: Optional[int] = None,
+        heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[TaskEvent]]:
+        """
+        이벤트 구독 (버퍼 재생 → 실시간 이벤트)
+
+        Args:
+            last_event_id: 클라이언트가 마지막으로 받은 이벤트 ID (이후 이벤트부터 재생, None이면 버퍼 전체)
+            heartbeat: 이 시간(초) 동안 이벤트가 없으면 None을 yield
+
+        채널이 종료되고 남은 이벤트를 모두 전달하면 종료합니다.
+        """
+        channel = self._channels.get(task_id)
+        if channel is None:
+            return
+
+        subscriber = _Subscriber(settings.task_event_buffer_size)
+        after = last_event_id or 0
+        for event in channel.buffer:
+            if event.id > after:
+                subscriber.pending.append(event)
+        channel.subscribers.add(subscriber)
+
+        try:
+            while True:
+                while subscriber.pending:
+                    yield subscriber.pending.popleft()
+                if channel.closed:
+                    return
+
+                subscriber.wakeup.clear()
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            channel.subscribers.discard(subscriber)
+
+    def subscriber_count(self, task_id: str) -> int:
+        channel = self._channels.get(task_id)
+        return len(channel.subscribers) if channel else 0
+
+
+# 싱글톤 인스턴스
+task_event_bus = TaskEventBus()
@@ -0,0 +1,416 @@
+"""
+크롤링 태스크 저장소
+
+RAG/Daily 크롤링 서비스의 태스크 상태(TaskResult)를 프로세스 메모리에 무기한 쌓지 않고
+DB(crawl_tasks 테이블)에 영속화합니다.
+
+- 메모리에는 최근 태스크만 캐시 (실행 중 태스크는 항상 유지, 종료된 태스크는 TTL/LRU로 제거)
+- 진행 상황(progress 이벤트)은 task_store_progress_interval 간격으로 DB에 반영
+- 큰 결과(json_data 등)는 task_store_spill_dir 아래 파일로 분리 저장하고 DB에는 경로만 기록
+- DB를 사용할 수 없으면 저장 실패를 로그로 남기고 메모리 캐시로 계속 동작
+- 이 프로세스에서 실행 중인 태스크는 task_store_heartbeat_interval 간격으로 DB에 heartbeat를 남기고,
+  heartbeat가 task_store_stale_after 이상 끊긴 다른 프로세스의 pending/running 태스크는
+  시작 시와 주기적으로 failed("interrupted")로 정리 (재시작/크래시로 남은 유령 태스크 방지)
+
+백엔드는 settings.task_store_backend로 선택합니다.
+- "database": 앱의 SQLAlchemy 비동기 엔진 사용 (DATABASE_URL에 따라 Postgres 또는 SQLite)
+- "memory": 프로세스 메모리 (테스트/단일 인스턴스용, 최근 태스크만 보관)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from app.config import settings
+from app.models import CrawlingResult, TaskResult, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED}
+
+# 태스크를 실행 중인 프로세스 식별자 (crawl_tasks.owner)
+PROCESS_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+INTERRUPTED_ERROR = "interrupted (프로세스 종료로 중단됨)"
+
+
+class TaskStoreBackend(ABC):
+    """태스크 영속화 백엔드 인터페이스 (행 단위 dict: status/error/created_at/completed_at/progress/result_json/result_path)"""
+
+    @abstractmethod
+    async def save(self, kind: str, task_id: str, row: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    async def save_progress(self, kind: str, task_id: str, progress: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    async def load(self, kind: str, task_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def list_recent(self, kind: str, limit: int) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, kind: str, task_ids: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def fail_interrupted(self, kind: str, stale_before: Optional[datetime]) -> int:
+        pass
+
+
+class SqlTaskStoreBackend(TaskStoreBackend):
+    """crawl_tasks 테이블 백엔드"""
+
+    @staticmethod
+    def _to_row(entity) -> Dict[str, Any]:
+        return {
+            "task_id": entity.task_id,
+            "status": entity.status,
+            "error": entity.error,
+            "created_at": entity.created_at,
+            "completed_at": entity.completed_at,
+            "progress": entity.progress,
+            "result_json": entity.result_json,
+            "result_path": entity.result_path,
+        }
+
+    async def save(self, kind: str, task_id: str, row: Dict[str, Any]) -> None:
+        from app.domains.crawler.repositories.crawl_task_repository import crawl_task_repository
+        await crawl_task_repository.upsert(task_id, kind, row)
+
+    async def save_progress(self, kind: str, task_id: str, progress: Dict[str, Any]) -> None:
+        from app.domains.crawler.repositories.crawl_task_repository import crawl_task_repository
+        await crawl_task_repository.update_progress(task_id, progress)
+
+    async def load(self, kind: str, task_id: str) -> Optional[Dict[str, Any]]:
+        from app.domains.crawler.repositories.crawl_task_repository import crawl_task_repository
+        entity = await crawl_task_repository.get(task_id, kind)
+        return self._to_row(entity) if entity else None
+
+    async def list_recent(self, kind: str, limit: int) -> List[Dict[str, Any]]:
+        from app.domains.crawler.repositories.crawl_task_repository import crawl_task_repository
+        return [self._to_row(entity) for entity in await crawl_task_repository.list_recent(kind, limit)]
+
+    async def heartbeat(self, kind: str, task_ids: List[str]) -> None:
+        from app.domains.crawler.repositories.crawl_task_repository import crawl_task_repository
+        await crawl_task_repository.touch(task_ids, PROCESS_ID)
+
+    async def fail_interrupted(self, kind: str, stale_before: Optional[datetime]) -> int:
+        from app.domains.crawler.repositories.crawl_task_repository import crawl_task_repository
+        return await crawl_task_repository.fail_interrupted(
+            kind, PROCESS_ID, stale_before, INTERRUPTED_ERROR, datetime.now().isoformat()
+        )
+
+
+class MemoryTaskStoreBackend(TaskStoreBackend):
+    """프로세스 메모리 백엔드 (최근 max_rows개 태스크만 보관)"""
+
+    def __init__(self, max_rows: int = 1000) -> None:
+        self.max_rows = max_rows
+        self._rows: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {}
+
+    def _table(self, kind: str) -> "OrderedDict[str, Dict[str, Any]]":
+        return self._rows.setdefault(kind, OrderedDict())
+
+    async def save(self, kind: str, task_id: str, row: Dict[str, Any]) -> None:
+        table = self._table(kind)
+        table[task_id] = {**table.get(task_id, {}), **row, "task_id": task_id}
+        table.move_to_end(task_id)
+        while len(table) > self.max_rows:
+            table.popitem(last=False)
+
+    async def save_progress(self, kind: str, task_id: str, progress: Dict[str, Any]) -> None:
+        row = self._table(kind).get(task_id)
+        if row is not None:
+            row["progress"] = progress
+
+    async def load(self, kind: str, task_id: str) -> Optional[Dict[str, Any]]:
+        row = self._table(kind).get(task_id)
+        return dict(row) if row else None
+
+    async def list_recent(self, kind: str, limit: int) -> List[Dict[str, Any]]:
+        rows = sorted(self._table(kind).values(), key=lambda r: r.get("created_at") or "", reverse=True)
+        return [dict(row) for row in rows[:limit]]
+
+    async def heartbeat(self, kind: str, task_ids: List[str]) -> None:
+        # 프로세스 메모리라 다른 프로세스의 태스크가 없음
+        pass
+
+    async def fail_interrupted(self, kind: str, stale_before: Optional[datetime]) -> int:
+        return 0
+
+
+def create_task_store_backend() -> TaskStoreBackend:
+    """settings.task_store_backend에 따른 백엔드 생성"""
+    name = (settings.task_store_backend or "database").lower()
+    if name == "memory":
+        return MemoryTaskStoreBackend(max_rows=max(1, settings.task_store_max_cached) * 10)
+    if name != "database":
+        logger.warning(f"⚠️ Unknown task store backend '{name}', falling back to 'database'")
+    return SqlTaskStoreBackend()
+
+
+class TaskStore:
+    """
+    종류(kind)별 태스크 저장소 ('rag', 'daily')
+
+    서비스는 상태 전이마다 save()를 호출하고, 스트림 루프처럼 동기 확인이 필요한 곳은 peek()을 사용합니다.
+    API 조회(get/list_recent)는 캐시에 없으면 백엔드에서 읽어옵니다.
+    """
+
+    def __init__(self, kind: str, backend: Optional[TaskStoreBackend] = None) -> None:
+        self.kind = kind
+        self.backend = backend or create_task_store_backend()
+        self._cache: "OrderedDict[str, TaskResult]" = OrderedDict()
+        self._finished_at: Dict[str, float] = {}  # task_id → 종료 시각 (monotonic)
+        self._progress_saved_at: Dict[str, float] = {}
+        self._pending: Set[asyncio.Task] = set()
+        self._write_lock = asyncio.Lock()  # 백그라운드 저장과 상태 전이 저장의 순서 보장
+        self._live: Set[str] = set()  # 이 프로세스에서 실행 중인 태스크 (heartbeat 대상)
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    # ----------------------------------------------------------------------------------
+    # Cache
+    # ----------------------------------------------------------------------------------
+    def _remember(self, task: TaskResult, owned: bool = True) -> None:
+        if task.status in FINISHED_STATUSES:
+            self._live.discard(task.taskId)
+        elif owned:
+            self._live.add(task.taskId)
+        self._cache[task.taskId] = task
+        self._cache.move_to_end(task.taskId)
+        if task.status in FINISHED_STATUSES:
+            self._finished_at.setdefault(task.taskId, time.monotonic())
+        self._evict()
+
+    def _forget(self, task_id: str) -> None:
+        self._cache.pop(task_id, None)
+        self._finished_at.pop(task_id, None)
+        self._progress_saved_at.pop(task_id, None)
+
+    def _evict(self) -> None:
+        """종료된 태스크를 TTL 만료 또는 캐시 상한 초과 시 오래된 순으로 제거 (실행 중 태스크는 유지)"""
+        now = time.monotonic()
+        ttl = settings.task_store_finished_ttl
+        for task_id, finished_at in list(self._finished_at.items()):
+            if now - finished_at >= ttl:
+                self._forget(task_id)
+
+        overflow = len(self._cache) - settings.task_store_max_cached
+        if overflow <= 0:
+            return
+        for task_id in [tid for tid in self._cache if tid in self._finished_at][:overflow]:
+            self._forget(task_id)
+
+    def is_live(self, task_id: str) -> bool:
+        """이 프로세스에서 실행 중인 태스크인지 (스트림을 다시 열 수 있는지)"""
+        task = self._cache.get(task_id)
+        return task_id in self._live and task is not None and task.status not in FINISHED_STATUSES
+
+    def peek(self, task_id: str) -> Optional[TaskResult]:
+        """캐시된 태스크 조회 (백엔드 조회 없음)"""
+        task = self._cache.get(task_id)
+        if task is not None:
+            self._cache.move_to_end(task_id)
+        return task
+
+    # ----------------------------------------------------------------------------------
+    # Persistence
+    # ----------------------------------------------------------------------------------
+    def _spill_path(self, task_id: str) -> Path:
+        return Path(settings.task_store_spill_dir) / self.kind / f"{task_id}.json"
+
+    def _to_row(self, task: TaskResult) -> Dict[str, Any]:
+        row: Dict[str, Any] = {
+            "status": task.status.value,
+            "error": task.error,
+            "created_at": task.createdAt,
+            "completed_at": task.completedAt,
+            "owner": PROCESS_ID,
+            "progress": task.progress,
+            "result_json": None,
+            "result_path": None,
+        }
+        if task.result is None:
+            return row
+
+        result = task.result.model_dump(exclude_none=True)
+        encoded = json.dumps(result, ensure_ascii=False)
+        if len(encoded.encode("utf-8")) <= settings.task_store_spill_threshold:
+            row["result_json"] = result
+            return row
+
+        path = self._spill_path(task.taskId)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(encoded, encoding="utf-8")
+        row["result_path"] = str(path)
+        return row
+
+    def _from_row(self, task_id: str, row: Dict[str, Any]) -> TaskResult:
+        result_data = row.get("result_json")
+        result_path = row.get("result_path")
+        if result_data is None and result_path:
+            try:
+                result_data = json.loads(Path(result_path).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"⚠️ Task result file unreadable ({task_id}): {e}")
+
+        return TaskResult(
+            taskId=task_id,
+            status=TaskStatus(row["status"]),
+            result=CrawlingResult(**result_data) if result_data else None,
+            error=row.get("error"),
+            createdAt=row["created_at"],
+            completedAt=row.get("completed_at"),
+            progress=row.get("progress"),
+        )
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def put(self, task: TaskResult) -> None:
+        """태스크 캐시 등록 + 백그라운드 저장 (동기 컨텍스트용, 실행 중인 이벤트 루프 필요)"""
+        self._remember(task)
+        self._spawn(self._persist(task))
+
+    async def save(self, task: TaskResult) -> None:
+        """상태 전이 후 호출: 캐시 갱신 + 백엔드 저장"""
+        self._remember(task)
+        await self._persist(task)
+
+    async def _persist(self, task: TaskResult) -> None:
+        try:
+            async with self._write_lock:
+                row = await asyncio.to_thread(self._to_row, task)
+                await self.backend.save(self.kind, task.taskId, row)
+        except Exception as e:
+            logger.error(f"❌ Task store save failed ({self.kind}/{task.taskId}): {e}")
+
+    async def record_progress(self, task_id: str, progress: Dict[str, Any]) -> None:
+        """진행 상황 갱신 (캐시는 즉시, 백엔드는 task_store_progress_interval 간격으로)"""
+        task = self._cache.get(task_id)
+        if task is None:
+            return
+        task.progress = progress
+
+        now = time.monotonic()
+        if now - self._progress_saved_at.get(task_id, 0.0) < settings.task_store_progress_interval:
+            return
+        self._progress_saved_at[task_id] = now
+        try:
+            async with self._write_lock:
+                await self.backend.save_progress(self.kind, task_id, progress)
+        except Exception as e:
+            logger.debug(f"Task progress save failed ({self.kind}/{task_id}): {e}")
+
+    # ----------------------------------------------------------------------------------
+    # Queries
+    # ----------------------------------------------------------------------------------
+    async def get(self, task_id: str) -> Optional[TaskResult]:
+        """태스크 조회 (캐시 → 백엔드, 다른 프로세스의 실행 중 태스크는 캐시하지 않음)"""
+        task = self.peek(task_id)
+        if task is not None:
+            return task
+        try:
+            row = await self.backend.load(self.kind, task_id)
+            if row is None:
+                return None
+            task = await asyncio.to_thread(self._from_row, task_id, row)
+        except Exception as e:
+            logger.error(f"❌ Task store load failed ({self.kind}/{task_id}): {e}")
+            return None
+        if task.status in FINISHED_STATUSES:
+            self._remember(task, owned=False)
+        return task
+
+    async def terminal_event(self, task_id: str) -> Dict[str, Any]:
+        """이벤트 채널이 없는 태스크의 SSE 종료 이벤트 (완료/실패/중단/없음)"""
+        task = await self.get(task_id)
+        if task is None:
+            return {"type": "error", "data": {"message": "Task not found"}}
+        if task.status == TaskStatus.COMPLETED:
+            return {"type": "complete", "data": {"message": "Task already completed", "status": "completed"}}
+        if task.status == TaskStatus.FAILED:
+            return {"type": "error", "data": {"message": task.error or "Task failed", "status": "failed"}}
+        return {
+            "type": "error",
+            "data": {"message": "Task is not running on this instance (interrupted)", "status": task.status.value},
+        }
+
+    async def list_recent(self, limit: int = 10) -> List[TaskResult]:
+        """최근 태스크 목록 (생성 시간 역순, 캐시의 최신 상태 우선)"""
+        tasks: Dict[str, TaskResult] = {}
+        try:
+            for row in await self.backend.list_recent(self.kind, limit):
+                # 목록 응답에는 결과 파일을 읽지 않음 (상세 조회에서 로드)
+                tasks[row["task_id"]] = self._from_row(row["task_id"], {**row, "result_path": None})
+        except Exception as e:
+            logger.error(f"❌ Task store list failed ({self.kind}): {e}")
+        tasks.update(self._cache)
+        return sorted(tasks.values(), key=lambda t: t.createdAt, reverse=True)[:limit]
+
+    # ----------------------------------------------------------------------------------
+    # Liveness
+    # ----------------------------------------------------------------------------------
+    async def fail_interrupted(self, immediate: bool = False) -> int:
+        """
+        다른 프로세스의 pending/running 태스크 중 heartbeat가 task_store_stale_after 이상 끊긴 태스크를 실패 처리
+
+        Args:
+            immediate: True면 heartbeat와 관계없이 전부 (시작 시, 단일 인스턴스 기준)
+        """
+        stale_before = None
+        if not immediate:
+            stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.task_store_stale_after)
+        try:
+            count = await self.backend.fail_interrupted(self.kind, stale_before)
+        except Exception as e:
+            logger.error(f"❌ Task store interrupted sweep failed ({self.kind}): {e}")
+            return 0
+        if count:
+            logger.warning(f"⚠️ Marked {count} interrupted {self.kind} task(s) as failed")
+        return count
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.task_store_heartbeat_interval)
+            live = [task_id for task_id in list(self._live) if self.is_live(task_id)]
+            if live:
+                try:
+                    async with self._write_lock:
+                        await self.backend.heartbeat(self.kind, live)
+                except Exception as e:
+                    logger.debug(f"Task heartbeat failed ({self.kind}): {e}")
+            await self.fail_interrupted()
+
+    async def start(self) -> None:
+        """시작 시 중단된 태스크 정리 + heartbeat 루프 시작 (DB 초기화 이후 호출)"""
+        await self.fail_interrupted(immediate=settings.task_store_fail_foreign_on_start)
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def close(self) -> None:
+        """heartbeat 루프 중지 + 대기 중인 백그라운드 저장 완료"""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+from app.application.crawler.page_handlers.fetch_context import record_scrape_result, scrape_arguments
 from app.infrastructure.mcp.mcp_service import mcp_service
 
 logger = logging.getLogger(__name__)
@@ -12,8 +13,10 @@ class CrawlerToolsClient:
     async def scrape(self, url: str) -> Dict[str, Any]:
         """crawl4ai_scrape"""
         logger.debug("Calling crawl4ai_scrape for %s", url)
-        result = await mcp_service.call_tool("crawl4ai_scrape", {"url": url})
-        return self._normalize_result(result)
+        arguments = await scrape_arguments(url)
+        result = self._normalize_result(await mcp_service.call_tool("crawl4ai_scrape", arguments))
+        record_scrape_result(url, result)
+        return result
 
     async def convert_to_json(
         self,
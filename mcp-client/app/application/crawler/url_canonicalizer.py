@@ -0,0 +1,201 @@
+"""
+URL 정규화 (같은 페이지의 여러 표기를 하나의 키로)
+
+input_urls, menu_links, 핸들러 datas, LLM 도구 호출로 들어오는 URL은 쿼리 파라미터 순서, 추적 파라미터,
+끝 슬래시, PC/모바일 호스트가 제각각이라 문자열 비교로는 같은 페이지를 두 번 크롤링하거나 메뉴 매핑을 놓칩니다.
+canonicalize_url은 비교/색인용 정규 URL을 만듭니다 (크롤링은 원래 URL로 수행).
+
+- 스킴은 https, 호스트는 소문자, 기본 포트(80/443) 제거
+- 추적 파라미터 제거 (settings.url_canonical_drop_params, "utm_*"처럼 접두사 패턴 가능), 나머지는 키 순 정렬
+- 끝 슬래시 제거 (루트 제외), 빈 경로는 "/"
+- fragment 제거 (해시 라우팅 "#/", "#!"는 유지)
+- 호스트별 규칙 (settings.url_canonical_rules, 호스트 이름 기준):
+  {"m.product.kt.com": {"canonical_host": "product.kt.com", "path_rewrites": [["/mDic/", "/wDic/"]]},
+   "product.kt.com": {"mobile_host": "m.product.kt.com", "mobile_path_rewrites": [["/wDic/", "/mDic/"]]},
+   "www.example.com": {"drop_params": ["sessionid"], "keep_params": ["id"], "case_insensitive_path": true}}
+  path_rewrites/mobile_path_rewrites는 경로 접두사 치환
+
+정규 URL 색인(canonical_urls 테이블)은 menu_links.pc_url의 정규 URL 해시를 저장해
+메뉴 매핑을 URL 표기와 관계없이 해시 하나로 조회합니다 (sync_index / refresh_menu_link_index).
+색인 동기화는 settings.url_canonical_index_ttl 간격으로만 수행하고, 메뉴 관리 화면에서 menu_links를 수정하면
+invalidate_menu_link_index로 다음 조회 때 다시 동기화합니다. input_urls 중복 제거는 색인 없이 메모리에서 비교합니다.
+"""
+
+import hashlib
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.config import settings
+from app.domains.crawler.entities.canonical_url import CanonicalUrl
+from app.domains.crawler.repositories.canonical_url_repository import (
+    SOURCE_MENU_LINK,
+    canonical_url_repository,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_PORTS = {"80", "443"}
+ROUTE_FRAGMENT_PREFIXES = ("/", "!")
+
+_menu_link_index_synced_at: Optional[float] = None  # 마지막 menu_links 색인 동기화 시각 (monotonic)
+
+
+def _rule(host: str) -> Dict[str, Any]:
+    return settings.url_canonical_rules.get(host, {})
+
+
+def _param_dropped(name: str, patterns: Iterable[str]) -> bool:
+    name = name.lower()
+    for pattern in patterns:
+        pattern = pattern.lower()
+        if pattern.endswith("*") and name.startswith(pattern[:-1]) or name == pattern:
+            return True
+    return False
+
+
+def _rewrite_prefix(path: str, rewrites: Sequence[Sequence[str]]) -> str:
+    for old, new in rewrites:
+        if path.startswith(old):
+            return new + path[len(old):]
+    return path
+
+
+@lru_cache(maxsize=16384)
+def canonicalize_url(url: str) -> str:
+    """비교/색인용 정규 URL (http(s) URL이 아니면 공백만 제거해 그대로 반환)"""
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip(".")
+    rule = _rule(host)
+    path = parts.path or "/"
+    if rule.get("canonical_host"):
+        host = rule["canonical_host"]
+        port = None
+    path = _rewrite_prefix(path, rule.get("path_rewrites", []))
+    if rule.get("case_insensitive_path"):
+        path = path.lower()
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    netloc = host if port is None or str(port) in DEFAULT_PORTS else f"{host}:{port}"
+
+    drop = list(settings.url_canonical_drop_params) + list(rule.get("drop_params", []))
+    keep = rule.get("keep_params")
+    params = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _param_dropped(key, drop) and (keep is None or key in keep)
+    ]
+    # 같은 키의 값 순서는 유지 (안정 정렬)
+    params.sort(key=lambda item: item[0])
+
+    fragment = parts.fragment if parts.fragment.startswith(ROUTE_FRAGMENT_PREFIXES) else ""
+    return urlunsplit(("https", netloc, path, urlencode(params), fragment))
+
+
+def canonical_key(url: str) -> str:
+    """정규 URL의 해시 (DB 색인 키)"""
+    return hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+
+
+def mobile_url_for(pc_url: str) -> Optional[str]:
+    """호스트 규칙(mobile_host)으로 만든 모바일 URL (규칙이 없으면 None)"""
+    try:
+        parts = urlsplit((pc_url or "").strip())
+    except ValueError:
+        return None
+    rule = _rule((parts.hostname or "").lower())
+    if not rule.get("mobile_host"):
+        return None
+    path = _rewrite_prefix(parts.path, rule.get("mobile_path_rewrites", []))
+    return urlunsplit((parts.scheme or "https", rule["mobile_host"], path, parts.query, parts.fragment))
+
+
+def group_by_canonical(items: Iterable[T], url_of: Callable[[T], str]) -> List[List[T]]:
+    """
+    정규 URL이 같은 항목끼리 묶음
+
+    Returns:
+        정규 URL별 항목 목록 (그룹 순서와 그룹 안의 순서는 처음 나온 순서)
+    """
+    groups: Dict[str, List[T]] = {}
+    for item in items:
+        groups.setdefault(canonicalize_url(url_of(item)), []).append(item)
+    return list(groups.values())
+
+
+def index_entry(source: str, source_id: int, url: str) -> CanonicalUrl:
+    """색인 행 (원본 URL의 정규 URL과 해시)"""
+    canonical = canonicalize_url(url)
+    return CanonicalUrl(
+        source=source,
+        source_id=source_id,
+        url=url,
+        canonical_url=canonical,
+        canonical_hash=canonical_key(canonical),
+    )
+
+
+async def sync_index(source: str, urls: Dict[int, str], prune: bool = False) -> int:
+    """
+    원본 행 {source_id: URL}을 색인에 반영 (URL이나 정규화 규칙이 바뀐 행만 저장)
+
+    Args:
+        prune: True면 urls에 없는 기존 색인 행을 삭제 (urls가 source 전체일 때만 사용)
+
+    Returns:
+        저장/삭제한 행 수
+    """
+    indexed = await canonical_url_repository.get_indexed(source)
+    changed = [
+        index_entry(source, source_id, url)
+        for source_id, url in urls.items()
+        if indexed.get(source_id) != (url, canonicalize_url(url))
+    ]
+    stale = [source_id for source_id in indexed if source_id not in urls] if prune else []
+    await canonical_url_repository.save_entries(changed)
+    await canonical_url_repository.delete_entries(source, stale)
+    if changed or stale:
+        logger.info(f"🔗 Canonical URL index ({source}): {len(changed)} updated, {len(stale)} removed")
+    return len(changed) + len(stale)
+
+
+def invalidate_menu_link_index() -> None:
+    """menu_links가 바뀌었음을 표시 (다음 refresh_menu_link_index에서 TTL과 관계없이 동기화)"""
+    global _menu_link_index_synced_at
+    _menu_link_index_synced_at = None
+
+
+async def refresh_menu_link_index(force: bool = False) -> int:
+    """
+    menu_links 전체를 색인에 반영 (메뉴 관리 화면 등 다른 경로의 변경 포함)
+
+    Args:
+        force: True면 settings.url_canonical_index_ttl 안에 동기화했더라도 다시 동기화
+
+    Returns:
+        저장/삭제한 행 수 (동기화를 건너뛰면 0)
+    """
+    global _menu_link_index_synced_at
+    now = time.monotonic()
+    if (
+        not force
+        and _menu_link_index_synced_at is not None
+        and now - _menu_link_index_synced_at < settings.url_canonical_index_ttl
+    ):
+        return 0
+    count = await sync_index(SOURCE_MENU_LINK, await canonical_url_repository.get_menu_link_urls(), prune=True)
+    _menu_link_index_synced_at = now
+    return count
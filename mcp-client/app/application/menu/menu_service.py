@@ -1,7 +1,8 @@
 """Menu application service - orchestrates use cases"""
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.crawler.url_canonicalizer import invalidate_menu_link_index
 from app.domains.menu.entities.menu_link import MenuLink
 from app.domains.menu.entities.menu_manager import MenuManagerInfo
 from app.domains.menu.repositories.menu_repository import MenuRepository
@@ -40,6 +41,7 @@ class MenuApplicationService:
             
             # Save through repository
             created_menu_link = await self.repository.create_menu_link(menu_link)
+            invalidate_menu_link_index()
             
             return MenuLinkResponse.model_validate(created_menu_link)
             
@@ -117,6 +119,8 @@ class MenuApplicationService:
                 setattr(menu_link, field, value)
             
             updated_menu_link = await self.repository.update_menu_link(menu_link)
+            if 'pc_url' in update_data:
+                invalidate_menu_link_index()
             return MenuLinkResponse.model_validate(updated_menu_link)
             
         except Exception as e:
@@ -129,6 +133,7 @@ class MenuApplicationService:
             success = await self.repository.delete_menu_link(menu_link_id)
             
             if success:
+                invalidate_menu_link_index()
                 return MenuLinkDeleteResponse(
                     success=True,
                     message="Menu link deleted successfully",
@@ -186,6 +191,14 @@ class MenuApplicationService:
         
         return MenuManagerInfoResponse.model_validate(manager_info)
     
+    async def get_manager_infos_by_pc_urls(self, pc_urls: List[str]) -> Dict[str, MenuManagerInfoResponse]:
+        """Get manager info for many PC URLs in batched queries"""
+        manager_infos = await self.repository.get_manager_infos_by_pc_urls(pc_urls)
+        return {
+            pc_url: MenuManagerInfoResponse.model_validate(manager_info)
+            for pc_url, manager_info in manager_infos.items()
+        }
+    
     async def get_manager_info_list(
         self, 
         skip: int = 0, 
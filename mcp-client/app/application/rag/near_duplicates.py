@@ -0,0 +1,125 @@
+"""
+근사 중복 문서 병합 (임베딩/색인 전 SimHash 기반)
+
+종료 이벤트 배너, 공통 푸터, 반복되는 공지 템플릿처럼 본문 대부분이 같은 문서가 많으면
+모두 청크/임베딩(Qdrant)과 색인(OpenSearch)을 거쳐 비용과 검색 노이즈가 늘어납니다.
+업로드 전에 근사 중복 그룹을 찾아 대표 문서 하나만 저장하고, 나머지 문서는 대표 문서의
+metadata["aliases"]에 {docId, url, title}로 남깁니다.
+
+- 지문: 단어 3-gram shingle 빈도 가중 64bit SimHash
+- 후보: 지문을 (거리 + 1)개 구간으로 나눠 같은 구간 값을 가진 문서끼리만 비교
+  (해밍 거리가 settings.rag_near_duplicate_distance 이하면 적어도 한 구간은 반드시 같음)
+- 그룹: 본문이 긴 문서부터 대표 문서로 정하고, 아직 그룹이 없는 문서 중 대표 문서와의 해밍 거리가
+  settings.rag_near_duplicate_distance 이하인 문서만 묶음 (A~B~C처럼 이어진 문서가 연쇄로 합쳐지지 않도록
+  항상 대표 문서와 직접 비교)
+- 대표 문서: 그룹에서 본문이 가장 긴 문서 (같으면 먼저 나온 문서)
+- 본문이 settings.rag_near_duplicate_min_tokens 단어 미만인 짧은 문서는 비교하지 않음
+"""
+
+import hashlib
+import logging
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from app.config import settings
+from app.domains.rag.entities.document import Document
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> List[str]:
+    # Daily Crawling 출력의 본문은 개행이 "\\n" 문자열로 저장됨
+    return _TOKEN_PATTERN.findall(text.replace("\\n", " ").lower())
+
+
+def simhash(tokens: List[str]) -> int:
+    """단어 shingle 빈도 가중 SimHash"""
+    if len(tokens) < SHINGLE_SIZE:
+        shingles = Counter([" ".join(tokens)])
+    else:
+        shingles = Counter(" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1))
+
+    # shingle 해시를 비트 문자열로 펼친 뒤 자리별 1의 개수를 세어 과반인 비트를 1로 설정
+    bit_rows = []
+    for shingle, count in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        bit_rows.extend([f"{int.from_bytes(digest, 'big'):064b}"] * count)
+    half = len(bit_rows) / 2
+    return int("".join("1" if column.count("1") > half else "0" for column in zip(*bit_rows)), 2)
+
+
+def _bands(fingerprint: int, band_count: int) -> List[Tuple[int, int]]:
+    """지문을 band_count개 구간으로 나눈 (구간 번호, 구간 값)"""
+    width = -(-SIMHASH_BITS // band_count)
+    mask = (1 << width) - 1
+    return [(band, fingerprint >> (band * width) & mask) for band in range(band_count)]
+
+
+def find_near_duplicate_groups(documents: List[Document]) -> List[List[int]]:
+    """근사 중복 그룹 (문서 인덱스 목록, 2개 이상인 그룹만, 원래 순서)"""
+    max_distance = settings.rag_near_duplicate_distance
+    band_count = max_distance + 1
+
+    fingerprints: Dict[int, int] = {}
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    for idx, document in enumerate(documents):
+        tokens = _tokens(document.content or "")
+        if len(tokens) < settings.rag_near_duplicate_min_tokens:
+            continue
+        fingerprints[idx] = simhash(tokens)
+        for band in _bands(fingerprints[idx], band_count):
+            buckets.setdefault(band, []).append(idx)
+
+    # 본문이 긴 문서부터 대표 문서로 정하고 대표 문서와 가까운 문서만 그룹에 넣음
+    assigned = set()
+    groups: List[List[int]] = []
+    for canonical_idx in sorted(fingerprints, key=lambda idx: (-len(documents[idx].content or ""), idx)):
+        if canonical_idx in assigned:
+            continue
+        assigned.add(canonical_idx)
+        members = [canonical_idx]
+        for band in _bands(fingerprints[canonical_idx], band_count):
+            for idx in buckets[band]:
+                if idx in assigned:
+                    continue
+                if bin(fingerprints[canonical_idx] ^ fingerprints[idx]).count("1") <= max_distance:
+                    assigned.add(idx)
+                    members.append(idx)
+        if len(members) > 1:
+            groups.append(sorted(members))
+    return sorted(groups)
+
+
+def collapse_near_duplicates(documents: List[Document]) -> Tuple[List[Document], int]:
+    """
+    근사 중복 문서를 대표 문서 하나로 병합
+
+    Returns:
+        (저장할 문서 목록 (원래 순서 유지), 병합되어 제외된 문서 수)
+    """
+    groups = find_near_duplicate_groups(documents)
+    if not groups:
+        return documents, 0
+
+    dropped = set()
+    for members in groups:
+        canonical_idx = max(members, key=lambda idx: (len(documents[idx].content or ""), -idx))
+        canonical = documents[canonical_idx]
+        aliases = [
+            {"docId": documents[idx].id, "url": documents[idx].url, "title": documents[idx].title}
+            for idx in members
+            if idx != canonical_idx
+        ]
+        canonical.metadata = {**(canonical.metadata or {}), "aliases": aliases}
+        dropped.update(idx for idx in members if idx != canonical_idx)
+        logger.debug(f"🧬 Near-duplicate group: {canonical.id} <- {[alias['docId'] for alias in aliases]}")
+
+    kept = [document for idx, document in enumerate(documents) if idx not in dropped]
+    logger.info(f"🧬 Near-duplicates: {len(groups)} groups, {len(dropped)} documents merged into canonical documents")
+    return kept, len(dropped)
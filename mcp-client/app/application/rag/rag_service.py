@@ -1,10 +1,13 @@
 """RAG Application Service - orchestrates RAG operations"""
+import asyncio
 import json
 import logging
 import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from app.config import settings
+from app.application.rag.near_duplicates import collapse_near_duplicates
 from app.domains.rag.entities.document import Document
 from app.domains.rag.schemas.rag_schemas import (
     RagUploadResponse, RagQueryRequest, RagQueryResponse, DocumentChunk
@@ -50,7 +53,23 @@ class RagApplicationService:
         try:
             # Convert JSON data to Document entities
             documents = []
+            deleted_ids = []
+            modified_ids = []
+            unchanged_ids = set()
             for i, item in enumerate(json_data):
+                # Daily Crawling 출력의 status: 삭제 표시(tombstone)는 색인에서 제거, 변경 없는 문서는 다시 임베딩하지 않음
+                # (근사 중복 병합을 쓰면 그룹을 다시 계산해야 하므로 변경 없는 문서도 파싱)
+                status = item.get("status")
+                if status == "deleted":
+                    if item.get("docId"):
+                        deleted_ids.append(item["docId"])
+                    continue
+                if status == "unchanged":
+                    unchanged_ids.add(item.get("docId"))
+                    if not settings.rag_near_duplicate_detection:
+                        continue
+                if status == "modified" and item.get("docId"):
+                    modified_ids.append(item["docId"])
                 try:
                     document = Document.from_json_data(item)
                     documents.append(document)
@@ -69,10 +88,62 @@ class RagApplicationService:
                     logger.warning(f"Failed to parse document {item.get('docId', 'unknown')}: {e}")
             
             logger.info(f"Successfully parsed {len(documents)} documents from JSON")
+            parsed_count = len(documents)
+            
+            # 근사 중복 문서는 대표 문서 하나만 저장 (나머지는 metadata.aliases)
+            merged_count = 0
+            merged_ids = []
+            if settings.rag_near_duplicate_detection:
+                documents, merged_count = await asyncio.to_thread(collapse_near_duplicates, documents)
+                merged_ids = [
+                    alias["docId"]
+                    for document in documents
+                    for alias in (document.metadata or {}).get("aliases", [])
+                ]
             
             # Store in both Qdrant and OpenSearch
             qdrant_service, opensearch_service = self._get_services()
             
+            # 변경 없는 문서는 색인에 저장된 별칭 목록이 이번 그룹과 같을 때만 건너뜀
+            # (이전에 다른 문서의 별칭이라 색인에 없던 문서, 별칭이 늘거나 줄어든 대표 문서는 다시 저장)
+            refreshed_ids = []
+            unchanged_count = len(unchanged_ids)
+            if unchanged_ids and settings.rag_near_duplicate_detection:
+                unchanged_docs = [document for document in documents if document.id in unchanged_ids]
+                stored_aliases = await opensearch_service.get_document_aliases([document.id for document in unchanged_docs])
+                if stored_aliases is None:
+                    logger.warning("Could not read stored aliases, re-storing unchanged documents")
+                    stored_aliases = {}
+                skipped_ids = set()
+                for document in unchanged_docs:
+                    aliases = sorted(alias["docId"] for alias in (document.metadata or {}).get("aliases", []))
+                    if stored_aliases.get(document.id) == aliases:
+                        skipped_ids.add(document.id)
+                    else:
+                        refreshed_ids.append(document.id)
+                documents = [document for document in documents if document.id not in skipped_ids]
+                unchanged_count = len(skipped_ids)
+            if unchanged_count:
+                logger.info(f"Skipped {unchanged_count} unchanged documents")
+            
+            # 삭제된 문서와 이번 업로드에서 다른 문서의 별칭으로 병합된 문서는 두 저장소에서 제거
+            # (Qdrant는 청크 ID가 매번 새로 생성되므로 수정되었거나 다시 저장하는 문서의 기존 청크도 제거 후 다시 저장)
+            deleted_count = 0
+            delete_failed = []
+            removed_ids = list(dict.fromkeys(deleted_ids + merged_ids))
+            replaced_ids = modified_ids + refreshed_ids
+            if removed_ids or replaced_ids:
+                qdrant_delete = await qdrant_service.delete_documents(list(dict.fromkeys(removed_ids + replaced_ids)))
+                opensearch_delete = await opensearch_service.delete_documents(removed_ids)
+                delete_failed = list(set(
+                    qdrant_delete["failed_documents"] + opensearch_delete["failed_documents"]
+                ) & set(removed_ids))
+                deleted_count = len(set(deleted_ids) - set(delete_failed))
+                logger.info(
+                    f"Removed {deleted_count} deleted documents and {len(merged_ids)} merged near-duplicates "
+                    f"({len(replaced_ids)} documents replaced)"
+                )
+            
             logger.info("Starting Qdrant storage...")
             qdrant_result = await qdrant_service.store_documents(documents)
             logger.info(f"Qdrant storage completed: {qdrant_result}")
@@ -87,12 +158,15 @@ class RagApplicationService:
             total_success = total_processed - total_failed
             
             failed_docs = list(set(
-                qdrant_result["failed_documents"] + opensearch_result["failed_documents"]
+                qdrant_result["failed_documents"] + opensearch_result["failed_documents"] + delete_failed
             ))
             
             processing_time = time.time() - start_time
             logger.info(f"📊 Document upload completed in {processing_time:.2f}s:")
-            logger.info(f"   📄 Original documents: {len(documents)}")
+            logger.info(f"   📄 Original documents: {parsed_count}")
+            logger.info(f"   🧬 Merged near-duplicates: {merged_count}")
+            logger.info(f"   🗑️  Deleted: {deleted_count}")
+            logger.info(f"   ⏭️  Unchanged (skipped): {unchanged_count}")
             logger.info(f"   ✅ Successfully processed: {total_success}")
             logger.info(f"   ❌ Failed: {total_failed}")
             logger.info(f"   🔍 Qdrant chunks: {qdrant_result.get('success_count', 0)}")
@@ -103,7 +177,10 @@ class RagApplicationService:
                 message=f"Documents uploaded successfully in {processing_time:.2f} seconds",
                 processed_count=total_success,
                 failed_count=total_failed,
-                failed_documents=failed_docs
+                failed_documents=failed_docs,
+                merged_count=merged_count,
+                deleted_count=deleted_count,
+                unchanged_count=unchanged_count
             )
             
         except Exception as e:
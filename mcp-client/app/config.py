@@ -1,6 +1,6 @@
 """Configuration management for MCP Client"""
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     mcp_server_url: str = "http://127.0.0.1:4200/my-custom-path/"
     mcp_connection_timeout: int = 30
     mcp_retry_attempts: int = 3
+    mcp_server_urls: List[str] = []  # 여러 MCP 서버에 분산할 때의 엔드포인트 목록 (비어 있으면 mcp_server_url만 사용)
+    mcp_pool_size: int = 2  # 엔드포인트별 MCP 세션 수 (호출은 진행 중 요청이 가장 적은 세션으로 분배)
+    mcp_health_check_interval: float = 30.0  # 세션 상태 점검 간격 (초, 끊어진 세션은 교체)
     
     # CORS Configuration
     cors_origins: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -57,6 +60,130 @@ class Settings(BaseSettings):
     # Feature Flags
     allow_daily_crawling: bool = True
     
+    # RAG Near-duplicate Configuration (업로드 전 근사 중복 문서 병합, application/rag/near_duplicates.py 참고)
+    rag_near_duplicate_detection: bool = True  # 근사 중복 문서를 대표 문서 하나로 병합 후 저장
+    rag_near_duplicate_distance: int = 1  # 대표 문서와 같은 그룹으로 볼 SimHash 최대 해밍 거리 (64bit 중)
+    rag_near_duplicate_min_tokens: int = 100  # 이보다 단어 수가 적은 문서는 비교하지 않음 (짧은 문서는 공통 템플릿만으로 지문이 같아짐)
+    
+    # ARI Processing Configuration
+    ari_process_workers: int = 0  # 다중 HTML 파일 병렬 처리 워커 수 (0이면 CPU 코어 수)
+    ari_upload_chunk_size: int = 1024 * 1024  # 업로드 파일을 디스크로 스트리밍 저장할 청크 크기 (bytes)
+    
+    # Crawler Resource Blocking Configuration (Playwright 요청 가로채기)
+    crawler_resource_blocking: bool = True  # 핸들러 브라우저의 불필요한 리소스 요청 차단 여부
+    crawler_blocked_resource_types: List[str] = ["image", "media", "font"]  # 차단할 Playwright resource_type
+    crawler_blocked_hosts: List[str] = [  # 차단할 호스트 (하위 도메인 포함)
+        "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+        "googlesyndication.com", "googleadservices.com", "facebook.net",
+        "analytics.tiktok.com", "wcs.naver.net",
+    ]
+    crawler_resource_rules: Dict[str, Dict[str, List[str]]] = {}  # 사이트 도메인별 allow_types/block_types/allow_hosts/block_hosts
+    
+    # Crawler DOM Pruning Configuration (page.content() 전 브라우저 안에서 요소 제거, page_handlers/dom_pruning.py 참고)
+    crawler_dom_pruning: bool = True  # 페치 컨텍스트 저장/핸들러 HTML 추출 전에 불필요한 요소를 브라우저 안에서 제거할지 여부
+    crawler_prune_selectors: List[str] = [  # 제거할 CSS 셀렉터 (script/style/noscript/inline svg는 항상 제거, MCP 서버 기본값과 동일)
+        "#cfmClHeader", "#cfmClFooter", "#cfmClSkip",
+        ".header", ".footer", ".header-area", ".footer-area",
+        ".nav", ".navigation", ".sidebar", ".advertisement",
+        ".banner", ".popup", ".modal", ".overlay", ".sns-share", ".sns-list",
+        ".sns.twitter", ".sns.facebook", ".sns.kakao", ".sns.youtube",
+        ".swiper-controls-wrapper", ".opage-hashtag-arrow", ".swiper-button-next", ".swiper-button-prev",
+        ".icon.kakao", ".icon.facebook", ".icon.twitter", ".icon.youtube",
+        ".btn-twitter", ".btn-facebook", ".btn-kakao", ".btn-youtube",
+        ".location", ".sns-area", ".opener", "a[onclick*='KT_trackClicks']",
+        ".find-center",
+        ".N-compare-suggest-list", ".top-three-box",
+        "#kt_mb", ".kt_mb", ".sticky", ".quickMenu", "#kt-head", ".kt-head",
+        ".bnr_info", ".share_wrap", "#popupVideo", "#popupVideoNo", "#popupShortsNo", "#popupDownload", "#popupConsulting",
+        "[style*='display:none']", ".invisible", ".layerPop",
+    ]
+    crawler_prune_rules: Dict[str, Dict[str, List[str]]] = {}  # 사이트 도메인별 keep(제외할 기본 셀렉터)/remove(추가 셀렉터)
+    
+    # Crawler Wait Configuration (준비 상태 기반 대기, page_handlers/wait_strategies.py 참고)
+    crawler_wait_strategy: str = "dom_quiet"  # dom_quiet / network_idle / selector_stable / fixed / none
+    crawler_wait_quiet_ms: int = 500  # DOM/네트워크/selector 개수가 이 시간 동안 변하지 않으면 준비 완료
+    crawler_wait_network_ignore: List[str] = [  # network_idle 판단에서 제외할 URL 부분 문자열 (분석/로그/롱폴링)
+        "google-analytics", "googletagmanager", "doubleclick", "wcs.naver",
+        "/collect", "beacon", "/log", "polling",
+    ]
+    
+    # Crawler XHR Capture Configuration (목록 API 응답 캡처 후 직접 재호출, page_handlers/xhr_capture.py 참고)
+    crawler_xhr_capture: bool = True  # 목록 핸들러의 페이지 이동을 캡처한 엔드포인트 직접 호출로 대체할지 여부
+    crawler_xhr_capture_max_pages: int = 50  # 엔드포인트 직접 호출로 수집할 최대 페이지 수
+    crawler_xhr_capture_max_body: int = 5 * 1024 * 1024  # 캡처할 응답 본문 최대 크기 (bytes)
+    
+    # Crawler Handler Fan-out Configuration
+    crawler_tv_channel_concurrency: int = 6  # 지니 TV 채널 편성표 플랜별 채널 목록 동시 요청 수
+    
+    # Crawler Handler Deadline Configuration (다중 페이지 핸들러 부분 결과, page_handlers/deadline.py 참고)
+    crawler_multi_page_budget: float = 1800.0  # 다중 페이지 핸들러 기본 실행 예산 (초, 만료 시 수집한 만큼 부분 결과 반환)
+    crawler_deadline_grace: float = 120.0  # 예산 만료 후 부분 결과 반환까지 허용할 추가 시간 (초, 전체 타임아웃 = 예산 + 이 값)
+    
+    # Crawl Scheduler Configuration (크롤링 경로 공통 우선순위 스케줄러, application/crawler/crawl_scheduler.py 참고)
+    crawl_scheduler_capacity: int = 8  # 전체 동시 크롤링 수 (MCP 서버/브라우저 용량 기준)
+    crawl_scheduler_class_limits: Dict[str, int] = {  # 우선순위 클래스별 최대 동시 실행 수 (batch 상한을 낮춰 interactive 몫 확보)
+        "interactive": 8, "llm_tool": 4, "batch": 6,
+    }
+    crawl_scheduler_llm_tools: List[str] = ["crawl4ai_scrape", "crawl_urls_sequential"]  # 스케줄러를 거칠 LLM 도구 (브라우저 사용 도구)
+    
+    # Task Store Configuration (크롤링 태스크 상태 영속화, application/crawler/task_store.py 참고)
+    task_store_backend: str = "database"  # database (crawl_tasks 테이블) / memory
+    task_store_max_cached: int = 200  # 메모리에 캐시할 최대 태스크 수 (실행 중 태스크는 제외하고 오래된 종료 태스크부터 제거)
+    task_store_finished_ttl: int = 3600  # 종료된 태스크를 메모리에 유지할 시간 (초)
+    task_store_spill_threshold: int = 256 * 1024  # 이 크기(bytes)를 넘는 결과는 DB 대신 파일로 저장
+    task_store_spill_dir: str = "data/task_results"  # 큰 결과 파일 저장 경로
+    task_store_progress_interval: float = 2.0  # 진행 상황을 DB에 반영하는 최소 간격 (초)
+    task_store_heartbeat_interval: float = 60.0  # 실행 중 태스크 heartbeat 및 중단 태스크 정리 간격 (초)
+    task_store_stale_after: float = 300.0  # heartbeat가 이 시간(초) 이상 끊긴 다른 프로세스의 태스크는 중단으로 처리
+    task_store_fail_foreign_on_start: bool = False  # 시작 시 다른 프로세스 소유의 pending/running 태스크를 즉시 중단 처리 (단일 인스턴스 전용, 여러 인스턴스가 DB를 공유하면 heartbeat 만료 정리에 맡김)
+    
+    # Task Event Bus Configuration (SSE 스트림 팬아웃/재연결, application/crawler/task_events.py 참고)
+    task_event_buffer_size: int = 256  # 태스크별 재전송용 링 버퍼 및 구독자별 대기열 크기 (이벤트 수)
+    task_event_retention: float = 300.0  # 태스크 종료 후 이벤트 채널 보관 시간 (초)
+    task_event_coalesce_types: List[str] = ["progress"]  # 최신 상태만 유지할 고빈도 이벤트 타입
+    
+    # Crawl Work Queue Configuration (Daily Crawling mode="queue", application/crawler/crawl_worker.py 참고)
+    crawl_queue_worker_enabled: bool = False  # 다른 인스턴스가 만든 작업 큐 실행에도 워커로 참여할지 여부
+    crawl_queue_worker_concurrency: int = 3  # 백그라운드 워커의 동시 처리 수
+    crawl_queue_lease_seconds: int = 600  # 작업 lease 유효 시간 (초, 워커가 죽으면 만료 후 재처리)
+    crawl_queue_heartbeat_interval: float = 60.0  # 처리 중 lease 연장 간격 (초)
+    crawl_queue_max_attempts: int = 3  # lease 만료로 인한 최대 재시도 횟수
+    crawl_queue_poll_interval: float = 5.0  # 진행 중 실행/남은 작업 확인 간격 (초)
+    crawl_queue_coordinator_lease_seconds: int = 300  # 실행 조정 프로세스의 lease 유효 시간 (초, 만료된 실행은 실패 처리되어 워커가 더 이상 처리하지 않음)
+    
+    # Daily Crawling Checkpoint Configuration (실행 재개, application/crawler/run_checkpoint.py 참고)
+    daily_checkpoint_dir: str = "data/daily_checkpoints"  # 실행별 manifest/결과 로그 저장 경로
+    daily_checkpoint_keep_completed: bool = False  # 완료된 실행의 결과 로그(results.jsonl) 보존 여부
+    
+    # Snapshot Store Configuration (크롤링 산출물 내용 주소 기반 압축 저장, application/crawler/snapshot_store.py 참고)
+    snapshot_store_dir: str = "data/snapshots"  # blob(objects/)과 실행 manifest(runs/) 저장 위치
+    snapshot_keep_runs: int = 30  # kind(daily/rag)별로 항상 유지할 최근 실행 수
+    snapshot_keep_days: int = 30  # 이 기간(일) 이내 실행은 개수와 관계없이 유지
+    snapshot_compression_level: int = 10  # zstandard 압축 레벨 (미설치 시 gzip)
+    daily_delta_export: bool = True  # Daily Crawling 출력과 함께 변경 문서(new/modified/deleted)만 담은 _delta.json 저장
+    
+    # Adaptive Revisit Configuration (URL별 변경 빈도 기반 재방문 주기, application/crawler/revisit_policy.py 참고)
+    revisit_min_interval_hours: float = 24.0  # 최소 재방문 주기 (시간, 처음 크롤링한 URL의 주기)
+    revisit_max_interval_hours: float = 336.0  # 최대 재방문 주기 (시간, 14일)
+    revisit_backoff_factor: float = 2.0  # 내용이 바뀌지 않았을 때 주기 배수
+    revisit_change_factor: float = 0.5  # 내용이 바뀌었을 때 주기 배수
+    revisit_priority_threshold: int = 10  # priority가 이 값 이상인 URL은 매 실행 크롤링
+    revisit_due_slack_hours: float = 2.0  # 재방문 시각이 이 시간 안에 도래하는 URL도 대상 (실행 시각 편차로 하루씩 밀리는 것 방지)
+    
+    # URL Canonicalization Configuration (중복 크롤링 방지/메뉴 매핑용 정규 URL, application/crawler/url_canonicalizer.py 참고)
+    url_canonical_drop_params: List[str] = [  # 정규 URL에서 제거할 추적 파라미터 ("*"로 끝나면 접두사 일치)
+        "utm_*", "gclid", "fbclid", "msclkid", "_ga", "_gl", "NaPm",
+    ]
+    url_canonical_rules: Dict[str, Dict[str, Any]] = {  # 호스트별 규칙 (canonical_host/path_rewrites/drop_params/keep_params/mobile_host/mobile_path_rewrites)
+        "m.shop.kt.com": {"canonical_host": "shop.kt.com", "path_rewrites": [["/m/", "/"]]},
+        "m.product.kt.com": {"canonical_host": "product.kt.com", "path_rewrites": [["/mDic/", "/wDic/"]]},
+        "m.globalroaming.kt.com": {"canonical_host": "globalroaming.kt.com"},
+        "event.kt.com": {"mobile_host": "m.kt.com"},
+        "shop.kt.com": {"mobile_host": "m.shop.kt.com"},
+        "product.kt.com": {"mobile_host": "m.product.kt.com", "mobile_path_rewrites": [["/wDic/", "/mDic/"]]},
+    }
+    url_canonical_index_ttl: float = 300.0  # menu_links 정규 URL 색인을 다시 동기화하는 최소 간격 (초, 메뉴 관리 화면에서 수정하면 즉시)
+    
     # Application Configuration
     app_title: str = "MCP FastAPI Server"
     app_version: str = "1.0.0"
@@ -1,4 +1,9 @@
 """Crawler domain entities"""
 from .input_url import InputUrl
+from .crawl_task import CrawlTask
+from .crawl_run import CrawlRun
+from .crawl_work_item import CrawlWorkItem
+from .url_revisit_state import UrlRevisitState
+from .canonical_url import CanonicalUrl
 
-__all__ = ["InputUrl"]
+__all__ = ["InputUrl", "CrawlTask", "CrawlRun", "CrawlWorkItem", "UrlRevisitState", "CanonicalUrl"]
@@ -0,0 +1,22 @@
+"""CanonicalUrl Entity - menu_links URL의 정규 URL 색인"""
+from sqlalchemy import Column, BigInteger, String, Text, DateTime
+from sqlalchemy.sql import func
+from app.shared.database.base import Base
+
+
+class CanonicalUrl(Base):
+    """원본 행(source, source_id)별 정규 URL 색인 테이블 (정규 URL 기준 메뉴 매핑 조회)"""
+    __tablename__ = "canonical_urls"
+
+    # 원본: 'menu_link' (menu_links.pc_url)
+    source = Column(String(20), primary_key=True)
+    source_id = Column(BigInteger, primary_key=True)
+
+    url = Column(Text, nullable=False)  # 원본 URL (원본이 바뀌었는지 확인용)
+    canonical_url = Column(Text, nullable=False)
+    canonical_hash = Column(String(64), nullable=False, index=True)  # sha256(canonical_url)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<CanonicalUrl(source='{self.source}', source_id={self.source_id}, canonical_url='{self.canonical_url}')>"
@@ -0,0 +1,31 @@
+"""CrawlRun Entity - 작업 큐 모드 Daily Crawling 실행 기록"""
+from sqlalchemy import Column, String, Text, DateTime, Integer
+from sqlalchemy.sql import func
+from app.shared.database.base import Base
+
+
+class CrawlRun(Base):
+    """여러 워커가 나눠 처리하는 Daily Crawling 실행(run) 테이블"""
+    __tablename__ = "crawl_runs"
+    
+    run_id = Column(String(36), primary_key=True)  # Daily Crawling task_id
+    status = Column(String(20), nullable=False, index=True)  # 'running', 'completed', 'failed'
+    
+    # 진행 집계 (워커가 작업 완료 시 증가)
+    total = Column(Integer, nullable=False, default=0)
+    success = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    
+    # 실행을 조정하는 프로세스 (결과 수집/DB 반영 담당, lease가 만료되면 실행 실패 처리)
+    coordinator = Column(String(100), nullable=True)
+    coordinator_lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # 출력
+    output_path = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<CrawlRun(run_id='{self.run_id}', status='{self.status}', {self.success + self.failed}/{self.total})>"
@@ -0,0 +1,33 @@
+"""CrawlTask Entity - 크롤링 태스크 상태 저장"""
+from sqlalchemy import Column, String, Text, DateTime, JSON
+from sqlalchemy.sql import func
+from app.shared.database.base import Base
+
+
+class CrawlTask(Base):
+    """RAG/Daily 크롤링 태스크 메타데이터 및 진행 상황 테이블"""
+    __tablename__ = "crawl_tasks"
+    
+    task_id = Column(String(36), primary_key=True)
+    kind = Column(String(20), nullable=False, index=True)  # 'rag', 'daily'
+    
+    # 상태 (TaskResult와 동일한 값)
+    status = Column(String(20), nullable=False, index=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(String(40), nullable=False, index=True)  # ISO 문자열 (TaskResult.createdAt)
+    completed_at = Column(String(40), nullable=True)
+    
+    # 실행 중인 프로세스 (task_store.PROCESS_ID, updated_at을 heartbeat로 갱신)
+    owner = Column(String(100), nullable=True)
+    
+    # 진행 상황 (마지막 progress 이벤트)
+    progress = Column(JSON, nullable=True)
+    
+    # 결과: 작은 결과는 result_json, 큰 결과는 디스크 파일(result_path)로 분리 저장
+    result_json = Column(JSON, nullable=True)
+    result_path = Column(Text, nullable=True)
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<CrawlTask(task_id='{self.task_id}', kind='{self.kind}', status='{self.status}')>"
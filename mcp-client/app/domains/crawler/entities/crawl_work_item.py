@@ -0,0 +1,34 @@
+"""CrawlWorkItem Entity - 작업 큐의 URL 단위 작업"""
+from sqlalchemy import Column, BigInteger, String, Text, DateTime, Integer, JSON, Index
+from sqlalchemy.sql import func
+from app.shared.database.base import Base
+
+
+class CrawlWorkItem(Base):
+    """실행(run)에 속한 URL별 작업 테이블 (워커가 lease하여 처리)"""
+    __tablename__ = "crawl_work_items"
+    __table_args__ = (
+        Index("ix_crawl_work_items_run_status", "run_id", "status"),
+    )
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    run_id = Column(String(36), nullable=False, index=True)
+    input_url_id = Column(BigInteger, nullable=False)
+    priority = Column(Integer, nullable=False, default=0)
+    
+    # 상태: 'queued' → 'leased' → 'done' / 'failed'
+    status = Column(String(20), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    
+    # lease (만료되면 다른 워커가 다시 가져감)
+    lease_owner = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # 결과: 성공 시 전처리 결과, 실패 시 에러
+    result_json = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<CrawlWorkItem(id={self.id}, run_id='{self.run_id}', input_url_id={self.input_url_id}, status='{self.status}')>"
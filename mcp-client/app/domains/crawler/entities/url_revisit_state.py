@@ -0,0 +1,29 @@
+"""UrlRevisitState Entity - URL별 변경 이력과 다음 재방문 시각"""
+from sqlalchemy import Column, BigInteger, String, DateTime, Integer, Float
+from sqlalchemy.sql import func
+from app.shared.database.base import Base
+
+
+class UrlRevisitState(Base):
+    """input_urls별 재방문 상태 테이블 (Daily Crawling 적응형 재방문 주기)"""
+    __tablename__ = "url_revisit_states"
+
+    input_url_id = Column(BigInteger, primary_key=True)
+
+    # 마지막 크롤링 결과의 내용 지문 (URL에서 나온 문서 지문 전체의 해시)
+    fingerprint = Column(String(64), nullable=True)
+
+    # 변경 이력
+    check_count = Column(Integer, nullable=False, default=0)  # 지문을 비교한 횟수
+    change_count = Column(Integer, nullable=False, default=0)  # 그중 내용이 바뀐 횟수
+    last_checked_at = Column(DateTime(timezone=True), nullable=True)
+    last_changed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # 재방문 주기
+    interval_hours = Column(Float, nullable=False)
+    next_due_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<UrlRevisitState(input_url_id={self.input_url_id}, interval_hours={self.interval_hours}, next_due_at={self.next_due_at})>"
@@ -1,6 +1,14 @@
 """Crawler domain repositories"""
 from .input_url_repository import InputUrlRepository, input_url_repository
+from .crawl_task_repository import CrawlTaskRepository, crawl_task_repository
+from .crawl_work_queue_repository import CrawlWorkQueueRepository, crawl_work_queue_repository
+from .url_revisit_repository import UrlRevisitRepository, url_revisit_repository
+from .canonical_url_repository import CanonicalUrlRepository, canonical_url_repository
 
-__all__ = ["InputUrlRepository", "input_url_repository"]
-
-
+__all__ = [
+    "InputUrlRepository", "input_url_repository",
+    "CrawlTaskRepository", "crawl_task_repository",
+    "CrawlWorkQueueRepository", "crawl_work_queue_repository",
+    "UrlRevisitRepository", "url_revisit_repository",
+    "CanonicalUrlRepository", "canonical_url_repository",
+]
@@ -0,0 +1,85 @@
+"""CanonicalUrl Repository - 정규 URL 색인 저장소"""
+import logging
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, select
+
+from app.shared.database.base import get_database_session
+from app.domains.crawler.entities.canonical_url import CanonicalUrl
+from app.domains.menu.entities.menu_link import MenuLink
+
+logger = logging.getLogger(__name__)
+
+SOURCE_MENU_LINK = "menu_link"
+
+
+class CanonicalUrlRepository:
+    """canonical_urls 테이블 저장소"""
+
+    async def get_indexed(self, source: str) -> Dict[int, Tuple[str, str]]:
+        """source의 색인 상태 {source_id: (원본 URL, 정규 URL)}"""
+        async for session in get_database_session():
+            stmt = select(CanonicalUrl.source_id, CanonicalUrl.url, CanonicalUrl.canonical_url).where(
+                CanonicalUrl.source == source
+            )
+            result = await session.execute(stmt)
+            return {row.source_id: (row.url, row.canonical_url) for row in result.all()}
+        return {}
+
+    async def get_menu_link_urls(self) -> Dict[int, str]:
+        """색인 대상 menu_links {id: pc_url} (pc_url이 있는 행만)"""
+        async for session in get_database_session():
+            stmt = select(MenuLink.id, MenuLink.pc_url).where(MenuLink.pc_url.isnot(None), MenuLink.pc_url != "")
+            result = await session.execute(stmt)
+            return {row.id: row.pc_url for row in result.all()}
+        return {}
+
+    async def save_entries(self, entries: List[CanonicalUrl]) -> None:
+        """색인 일괄 저장 (없으면 생성)"""
+        if not entries:
+            return
+        async for session in get_database_session():
+            for entry in entries:
+                await session.merge(entry)
+            await session.commit()
+            logger.debug(f"✅ Canonical URLs saved: {len(entries)}")
+            break
+
+    async def delete_entries(self, source: str, source_ids: List[int]) -> None:
+        """원본 행이 없어진 색인 삭제"""
+        if not source_ids:
+            return
+        async for session in get_database_session():
+            stmt = delete(CanonicalUrl).where(
+                CanonicalUrl.source == source,
+                CanonicalUrl.source_id.in_(source_ids)
+            )
+            await session.execute(stmt)
+            await session.commit()
+            logger.debug(f"🗑️ Canonical URLs deleted: {len(source_ids)}")
+            break
+
+    async def find_menu_links(self, canonical_hashes: List[str]) -> Dict[str, List[MenuLink]]:
+        """정규 URL 해시별 menu_links (id 순)"""
+        if not canonical_hashes:
+            return {}
+        async for session in get_database_session():
+            stmt = (
+                select(CanonicalUrl.canonical_hash, MenuLink)
+                .join(MenuLink, MenuLink.id == CanonicalUrl.source_id)
+                .where(
+                    CanonicalUrl.source == SOURCE_MENU_LINK,
+                    CanonicalUrl.canonical_hash.in_(list(set(canonical_hashes)))
+                )
+                .order_by(MenuLink.id.asc())
+            )
+            result = await session.execute(stmt)
+            links: Dict[str, List[MenuLink]] = {}
+            for canonical_hash, menu_link in result.all():
+                links.setdefault(canonical_hash, []).append(menu_link)
+            return links
+        return {}
+
+
+# 싱글톤 인스턴스
+canonical_url_repository = CanonicalUrlRepository()
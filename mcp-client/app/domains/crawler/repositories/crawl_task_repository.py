@@ -0,0 +1,115 @@
+"""CrawlTask Repository - 크롤링 태스크 상태 저장소"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, update, func, or_
+
+from app.shared.database.base import get_database_session
+from app.domains.crawler.entities.crawl_task import CrawlTask
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlTaskRepository:
+    """crawl_tasks 테이블 저장소"""
+
+    async def upsert(self, task_id: str, kind: str, values: Dict[str, Any]) -> None:
+        """
+        태스크 저장 (없으면 생성, 있으면 갱신)
+
+        Args:
+            task_id: 태스크 ID
+            kind: 'rag' 또는 'daily'
+            values: CrawlTask 컬럼 값 (status, error, created_at, completed_at, owner, result_json, result_path)
+        """
+        async for session in get_database_session():
+            await session.merge(CrawlTask(task_id=task_id, kind=kind, **values))
+            await session.commit()
+            break
+
+    async def update_progress(self, task_id: str, progress: Dict[str, Any]) -> None:
+        """진행 상황만 갱신"""
+        async for session in get_database_session():
+            stmt = (
+                update(CrawlTask)
+                .where(CrawlTask.task_id == task_id)
+                .values(progress=progress)
+            )
+            await session.execute(stmt)
+            await session.commit()
+            break
+
+    async def touch(self, task_ids: List[str], owner: str) -> None:
+        """실행 중인 태스크의 heartbeat (updated_at 갱신)"""
+        if not task_ids:
+            return
+        async for session in get_database_session():
+            stmt = (
+                update(CrawlTask)
+                .where(CrawlTask.task_id.in_(task_ids))
+                .values(owner=owner, updated_at=func.now())
+            )
+            await session.execute(stmt)
+            await session.commit()
+            break
+
+    async def fail_interrupted(
+        self,
+        kind: str,
+        owner: str,
+        stale_before: Optional[datetime],
+        error: str,
+        completed_at: str
+    ) -> int:
+        """
+        다른 프로세스 소유이면서 heartbeat가 끊긴 pending/running 태스크를 실패로 변경
+
+        Args:
+            stale_before: 이 시각 이전에 갱신된 태스크만 (None이면 갱신 시각과 관계없이 전부)
+
+        Returns:
+            실패로 변경한 태스크 수
+        """
+        async for session in get_database_session():
+            conditions = [
+                CrawlTask.kind == kind,
+                CrawlTask.status.in_(["pending", "running"]),
+                or_(CrawlTask.owner.is_(None), CrawlTask.owner != owner),
+            ]
+            if stale_before is not None:
+                conditions.append(CrawlTask.updated_at < stale_before)
+            stmt = (
+                update(CrawlTask)
+                .where(*conditions)
+                .values(status="failed", error=error, completed_at=completed_at)
+            )
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount or 0
+        return 0
+
+    async def get(self, task_id: str, kind: str) -> Optional[CrawlTask]:
+        """ID로 조회"""
+        async for session in get_database_session():
+            stmt = select(CrawlTask).where(CrawlTask.task_id == task_id, CrawlTask.kind == kind)
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none()
+        return None
+
+    async def list_recent(self, kind: str, limit: int = 10) -> List[CrawlTask]:
+        """최근 태스크 목록 (생성 시간 역순)"""
+        async for session in get_database_session():
+            stmt = (
+                select(CrawlTask)
+                .where(CrawlTask.kind == kind)
+                .order_by(CrawlTask.created_at.desc())
+                .limit(limit)
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+        return []
+
+
+# 싱글톤 인스턴스
+crawl_task_repository = CrawlTaskRepository()
@@ -0,0 +1,327 @@
+"""CrawlWorkQueue Repository - DB lease 기반 Daily Crawling 작업 큐"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, update, func, or_, and_
+
+from app.shared.database.base import get_database_session
+from app.domains.crawler.entities.crawl_run import CrawlRun
+from app.domains.crawler.entities.crawl_work_item import CrawlWorkItem
+from app.domains.crawler.entities.input_url import InputUrl
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _leasable(now: datetime):
+    """대기 중이거나 lease가 만료된 작업"""
+    return or_(
+        CrawlWorkItem.status == "queued",
+        and_(CrawlWorkItem.status == "leased", CrawlWorkItem.lease_expires_at < now),
+    )
+
+
+def _run_is_running():
+    """작업이 속한 실행이 아직 진행 중 (실패/완료 처리된 실행의 작업은 lease하지 않음)"""
+    return select(CrawlRun.run_id).where(
+        CrawlRun.run_id == CrawlWorkItem.run_id,
+        CrawlRun.status == "running",
+    ).exists()
+
+
+class CrawlWorkQueueRepository:
+    """
+    crawl_runs / crawl_work_items 테이블 저장소
+
+    여러 프로세스/파드의 워커가 같은 실행(run)의 URL 작업을 나눠 가져갈 수 있도록
+    행 단위 lease(SELECT ... FOR UPDATE SKIP LOCKED + lease 만료 시각)를 사용합니다.
+    SKIP LOCKED를 지원하지 않는 DB(SQLite)에서는 조건부 UPDATE로 중복 lease를 막습니다.
+    실행(run)에도 조정 프로세스(coordinator)의 lease를 두어, 조정 프로세스가 죽은 실행은 실패로 정리합니다.
+    """
+
+    async def create_run(self, run_id: str, urls: List[InputUrl], coordinator: str, lease_seconds: int) -> None:
+        """실행 기록과 URL별 작업 생성"""
+        async for session in get_database_session():
+            session.add(CrawlRun(
+                run_id=run_id,
+                status="running",
+                total=len(urls),
+                success=0,
+                failed=0,
+                coordinator=coordinator,
+                coordinator_lease_expires_at=_utcnow() + timedelta(seconds=lease_seconds),
+            ))
+            session.add_all([
+                CrawlWorkItem(
+                    run_id=run_id,
+                    input_url_id=url.id,
+                    priority=url.priority or 0,
+                    status="queued",
+                    attempts=0,
+                )
+                for url in urls
+            ])
+            await session.commit()
+            logger.info(f"📥 Work queue run created: {run_id} ({len(urls)} items)")
+            break
+
+    async def reopen_run(self, run_id: str, coordinator: str, lease_seconds: int) -> bool:
+        """중단/실패한 실행을 다시 진행 중으로 변경 (완료된 작업은 유지, 실행이 없으면 False)"""
+        async for session in get_database_session():
+            result = await session.execute(
+                update(CrawlRun)
+                .where(CrawlRun.run_id == run_id)
+                .values(
+                    status="running",
+                    error=None,
+                    completed_at=None,
+                    coordinator=coordinator,
+                    coordinator_lease_expires_at=_utcnow() + timedelta(seconds=lease_seconds),
+                )
+            )
+            await session.commit()
+            return bool(result.rowcount)
+        return False
+
+    async def renew_coordinator(self, run_id: str, coordinator: str, lease_seconds: int) -> bool:
+        """조정 프로세스 lease 연장 (실행이 이미 실패 처리되었거나 다른 프로세스가 가져갔으면 False)"""
+        async for session in get_database_session():
+            result = await session.execute(
+                update(CrawlRun)
+                .where(
+                    CrawlRun.run_id == run_id,
+                    CrawlRun.status == "running",
+                    CrawlRun.coordinator == coordinator,
+                )
+                .values(coordinator_lease_expires_at=_utcnow() + timedelta(seconds=lease_seconds))
+            )
+            await session.commit()
+            return bool(result.rowcount)
+        return False
+
+    async def fail_expired_runs(self) -> int:
+        """조정 프로세스 lease가 만료된 진행 중 실행을 실패 처리 (실패 처리한 실행 수 반환)"""
+        now = _utcnow()
+        async for session in get_database_session():
+            result = await session.execute(
+                update(CrawlRun)
+                .where(
+                    CrawlRun.status == "running",
+                    or_(
+                        CrawlRun.coordinator_lease_expires_at.is_(None),
+                        CrawlRun.coordinator_lease_expires_at < now,
+                    ),
+                )
+                .values(status="failed", error="coordinator lease expired", completed_at=now)
+            )
+            await session.commit()
+            if result.rowcount:
+                logger.warning(f"⚠️ Work queue runs failed (coordinator lease expired): {result.rowcount}")
+            return result.rowcount or 0
+        return 0
+
+    async def lease(
+        self,
+        run_id: str,
+        worker_id: str,
+        batch_size: int,
+        lease_seconds: int,
+        max_attempts: int
+    ) -> List[CrawlWorkItem]:
+        """
+        작업 lease (우선순위 높은 순)
+
+        재시도 한도(max_attempts)를 넘긴 채 lease가 만료된 작업은 실패로 처리합니다.
+        실행(run)이 진행 중(running)이 아니면(조정 프로세스 lease 만료 등) 작업을 lease하지 않습니다.
+
+        Returns:
+            이 워커가 lease한 작업 목록 (없으면 빈 목록)
+        """
+        now = _utcnow()
+        async for session in get_database_session():
+            # 1. 재시도 한도 초과 + lease 만료 → 실패 처리
+            exhausted = await session.execute(
+                update(CrawlWorkItem)
+                .where(
+                    CrawlWorkItem.run_id == run_id,
+                    CrawlWorkItem.status == "leased",
+                    CrawlWorkItem.lease_expires_at < now,
+                    CrawlWorkItem.attempts >= max_attempts,
+                )
+                .values(status="failed", error=f"lease expired after {max_attempts} attempts")
+            )
+            if exhausted.rowcount:
+                await session.execute(
+                    update(CrawlRun)
+                    .where(CrawlRun.run_id == run_id)
+                    .values(failed=CrawlRun.failed + exhausted.rowcount)
+                )
+
+            # 2. 후보 행 잠금 (진행 중인 실행의 작업만, 다른 워커가 잠근 행은 건너뜀)
+            candidates = await session.execute(
+                select(CrawlWorkItem.id)
+                .join(CrawlRun, CrawlRun.run_id == CrawlWorkItem.run_id)
+                .where(CrawlWorkItem.run_id == run_id, CrawlRun.status == "running", _leasable(now))
+                .order_by(CrawlWorkItem.priority.desc(), CrawlWorkItem.id.asc())
+                .limit(batch_size)
+                .with_for_update(skip_locked=True, of=CrawlWorkItem)
+            )
+            ids = list(candidates.scalars().all())
+            if not ids:
+                await session.commit()
+                return []
+
+            # 3. lease 설정 (같은 조건을 다시 걸어 행 잠금이 없는 DB에서도 중복 lease 방지)
+            await session.execute(
+                update(CrawlWorkItem)
+                .where(CrawlWorkItem.id.in_(ids), _leasable(now), _run_is_running())
+                .values(
+                    status="leased",
+                    lease_owner=worker_id,
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    attempts=CrawlWorkItem.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+            leased = await session.execute(
+                select(CrawlWorkItem).where(
+                    CrawlWorkItem.id.in_(ids),
+                    CrawlWorkItem.lease_owner == worker_id,
+                    CrawlWorkItem.status == "leased",
+                )
+            )
+            return list(leased.scalars().all())
+        return []
+
+    async def heartbeat(self, worker_id: str, item_ids: List[int], lease_seconds: int) -> int:
+        """처리 중인 작업의 lease 연장 (연장된 작업 수 반환)"""
+        if not item_ids:
+            return 0
+        async for session in get_database_session():
+            result = await session.execute(
+                update(CrawlWorkItem)
+                .where(
+                    CrawlWorkItem.id.in_(item_ids),
+                    CrawlWorkItem.lease_owner == worker_id,
+                    CrawlWorkItem.status == "leased",
+                )
+                .values(lease_expires_at=_utcnow() + timedelta(seconds=lease_seconds))
+            )
+            await session.commit()
+            return result.rowcount or 0
+        return 0
+
+    async def complete(
+        self,
+        item_id: int,
+        worker_id: str,
+        success: bool,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        작업 완료 기록 + 실행 집계 갱신
+
+        lease를 잃은 경우(만료 후 다른 워커가 가져감) 결과를 버리고 False를 반환합니다.
+        """
+        async for session in get_database_session():
+            updated = await session.execute(
+                update(CrawlWorkItem)
+                .where(
+                    CrawlWorkItem.id == item_id,
+                    CrawlWorkItem.lease_owner == worker_id,
+                    CrawlWorkItem.status == "leased",
+                )
+                .values(
+                    status="done" if success else "failed",
+                    result_json=result,
+                    error=error,
+                    lease_expires_at=None,
+                )
+            )
+            if not updated.rowcount:
+                await session.rollback()
+                logger.warning(f"⚠️ Work item {item_id} lease lost by {worker_id}, result discarded")
+                return False
+
+            run_id = (await session.execute(
+                select(CrawlWorkItem.run_id).where(CrawlWorkItem.id == item_id)
+            )).scalar_one()
+            counter = CrawlRun.success if success else CrawlRun.failed
+            await session.execute(
+                update(CrawlRun)
+                .where(CrawlRun.run_id == run_id)
+                .values({counter.key: counter + 1})
+            )
+            await session.commit()
+            return True
+        return False
+
+    async def get_run(self, run_id: str) -> Optional[CrawlRun]:
+        """실행 기록 조회"""
+        async for session in get_database_session():
+            result = await session.execute(select(CrawlRun).where(CrawlRun.run_id == run_id))
+            return result.scalar_one_or_none()
+        return None
+
+    async def count_remaining(self, run_id: str) -> int:
+        """아직 끝나지 않은(queued/leased) 작업 수"""
+        async for session in get_database_session():
+            result = await session.execute(
+                select(func.count(CrawlWorkItem.id)).where(
+                    CrawlWorkItem.run_id == run_id,
+                    CrawlWorkItem.status.in_(["queued", "leased"]),
+                )
+            )
+            return result.scalar() or 0
+        return 0
+
+    async def list_open_run_ids(self) -> List[str]:
+        """진행 중인 실행 ID 목록 (오래된 순, 조정 프로세스 lease가 만료된 실행은 실패 처리 후 제외)"""
+        await self.fail_expired_runs()
+        async for session in get_database_session():
+            result = await session.execute(
+                select(CrawlRun.run_id)
+                .where(CrawlRun.status == "running")
+                .order_by(CrawlRun.created_at.asc())
+            )
+            return list(result.scalars().all())
+        return []
+
+    async def get_items(self, run_id: str) -> List[CrawlWorkItem]:
+        """실행의 전체 작업 (결과 포함)"""
+        async for session in get_database_session():
+            result = await session.execute(
+                select(CrawlWorkItem)
+                .where(CrawlWorkItem.run_id == run_id)
+                .order_by(CrawlWorkItem.priority.desc(), CrawlWorkItem.id.asc())
+            )
+            return list(result.scalars().all())
+        return []
+
+    async def finish_run(
+        self,
+        run_id: str,
+        status: str,
+        output_path: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """실행 종료 기록"""
+        async for session in get_database_session():
+            await session.execute(
+                update(CrawlRun)
+                .where(CrawlRun.run_id == run_id)
+                .values(status=status, output_path=output_path, error=error, completed_at=_utcnow())
+            )
+            await session.commit()
+            break
+
+
+# 싱글톤 인스턴스
+crawl_work_queue_repository = CrawlWorkQueueRepository()
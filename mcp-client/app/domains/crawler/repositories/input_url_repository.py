@@ -1,17 +1,34 @@
 """InputUrl Repository - 크롤링 대상 URL 저장소"""
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.shared.database.base import get_database_session
 from app.domains.crawler.entities.input_url import InputUrl
+from app.domains.crawler.entities.url_revisit_state import UrlRevisitState
 
 logger = logging.getLogger(__name__)
 
 
+def _due_condition(now: datetime):
+    """
+    재방문 대상 조건 (revisit_policy.py 참고)
+
+    처음/실패/재방문 상태 없음/재방문 시각 도래(revisit_due_slack_hours 이내 포함)/높은 우선순위
+    """
+    return or_(
+        InputUrl.last_status.is_(None),
+        InputUrl.last_status != 'success',
+        UrlRevisitState.next_due_at.is_(None),
+        UrlRevisitState.next_due_at <= now + timedelta(hours=settings.revisit_due_slack_hours),
+        InputUrl.priority >= settings.revisit_priority_threshold,
+    )
+
+
 class InputUrlRepository:
     """InputUrl 테이블 저장소"""
     
@@ -24,7 +41,8 @@ class InputUrlRepository:
         활성화된 크롤링 대상 URL 조회
         
         Args:
-            force_recrawl: True면 이미 성공한 URL도 포함
+            force_recrawl: True면 재방문 시각과 관계없이 모든 활성 URL,
+                False면 재방문 시각이 된 URL만 (처음/실패/높은 우선순위 URL 포함)
             limit: 최대 조회 개수
             
         Returns:
@@ -34,10 +52,10 @@ class InputUrlRepository:
             stmt = select(InputUrl).where(InputUrl.is_active == True)
             
             if not force_recrawl:
-                # 성공한 URL 제외 (last_status != 'success' 또는 NULL)
-                stmt = stmt.where(
-                    (InputUrl.last_status != 'success') | 
-                    (InputUrl.last_status.is_(None))
+                # 재방문 시각이 되지 않은 성공 URL 제외
+                stmt = (
+                    stmt.outerjoin(UrlRevisitState, UrlRevisitState.input_url_id == InputUrl.id)
+                    .where(_due_condition(datetime.now()))
                 )
             
             stmt = stmt.order_by(InputUrl.priority.desc(), InputUrl.id.asc())
@@ -153,12 +171,22 @@ class InputUrlRepository:
             failed_result = await session.execute(failed_stmt)
             failed = failed_result.scalar() or 0
             
+            # 재방문 대상 개수
+            due_stmt = (
+                select(func.count(InputUrl.id))
+                .outerjoin(UrlRevisitState, UrlRevisitState.input_url_id == InputUrl.id)
+                .where(InputUrl.is_active == True, _due_condition(datetime.now()))
+            )
+            due_result = await session.execute(due_stmt)
+            due = due_result.scalar() or 0
+            
             return {
                 "total": total,
                 "active": active,
                 "success": success,
                 "failed": failed,
-                "pending": active - success - failed
+                "pending": active - success - failed,
+                "due": due
             }
         
         return {}
@@ -0,0 +1,39 @@
+"""UrlRevisit Repository - URL별 재방문 상태 저장소"""
+import logging
+from typing import Dict, List
+
+from sqlalchemy import select
+
+from app.shared.database.base import get_database_session
+from app.domains.crawler.entities.url_revisit_state import UrlRevisitState
+
+logger = logging.getLogger(__name__)
+
+
+class UrlRevisitRepository:
+    """url_revisit_states 테이블 저장소"""
+
+    async def get_states(self, input_url_ids: List[int]) -> Dict[int, UrlRevisitState]:
+        """input_url_id별 재방문 상태 (상태가 없는 URL은 제외)"""
+        if not input_url_ids:
+            return {}
+        async for session in get_database_session():
+            stmt = select(UrlRevisitState).where(UrlRevisitState.input_url_id.in_(input_url_ids))
+            result = await session.execute(stmt)
+            return {state.input_url_id: state for state in result.scalars().all()}
+        return {}
+
+    async def save_states(self, states: List[UrlRevisitState]) -> None:
+        """재방문 상태 일괄 저장 (없으면 생성)"""
+        if not states:
+            return
+        async for session in get_database_session():
+            for state in states:
+                await session.merge(state)
+            await session.commit()
+            logger.debug(f"✅ Revisit states saved: {len(states)}")
+            break
+
+
+# 싱글톤 인스턴스
+url_revisit_repository = UrlRevisitRepository()
@@ -6,8 +6,8 @@ from typing import Optional, Literal, List
 class DailyCrawlRequest(BaseModel):
     """Daily Crawling 요청 스키마"""
     force_recrawl: bool = Field(
-        default=True,
-        description="이미 성공한 URL도 재크롤링 여부 (Daily Crawling은 기본 True)"
+        default=False,
+        description="재방문 주기와 관계없이 모든 활성 URL 재크롤링 여부 (기본 False: 재방문 시각이 된 URL만)"
     )
     limit: Optional[int] = Field(
         default=None,
@@ -17,9 +17,9 @@ class DailyCrawlRequest(BaseModel):
         default=[],
         description="테스트용: 특정 input_urls ID 목록 (지정 시 해당 ID만 크롤링)"
     )
-    mode: Literal["sequential", "parallel"] = Field(
+    mode: Literal["sequential", "parallel", "queue"] = Field(
         default="parallel",
-        description="실행 모드 (sequential: 순차, parallel: 병렬)"
+        description="실행 모드 (sequential: 순차, parallel: 병렬, queue: DB 작업 큐로 여러 워커가 분산 처리)"
     )
     concurrency: int = Field(
         default=3,
@@ -47,4 +47,16 @@ class DailyCrawlStats(BaseModel):
     success: int = Field(..., description="성공한 URL 수")
     failed: int = Field(..., description="실패한 URL 수")
     pending: int = Field(..., description="대기 중인 URL 수")
+    due: int = Field(0, description="재방문 시각이 된 URL 수 (force_recrawl=False 실행 대상)")
+
 
+class DailyCrawlCheckpoint(BaseModel):
+    """재개 가능한 Daily Crawling 실행 스키마"""
+    task_id: str = Field(..., description="태스크 ID")
+    status: str = Field(..., description="체크포인트 상태 (running: 중단됨, failed: 실패)")
+    total_urls: int = Field(..., description="실행 대상 URL 수")
+    mode: Optional[str] = Field(None, description="실행 모드")
+    resume_count: int = Field(0, description="재개 횟수")
+    error: Optional[str] = Field(None, description="실패 사유")
+    created_at: Optional[str] = Field(None, description="최초 실행 시각")
+    updated_at: Optional[str] = Field(None, description="마지막 갱신 시각")
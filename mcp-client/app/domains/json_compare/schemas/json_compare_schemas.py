@@ -8,8 +8,10 @@ class JsonComparisonRequest(BaseModel):
     """JSON 비교 요청 스키마"""
     file1_name: str = Field(..., description="첫 번째 JSON 파일명")
     file2_name: str = Field(..., description="두 번째 JSON 파일명")
-    file1_content: str = Field(..., description="첫 번째 JSON 파일 내용")
-    file2_content: str = Field(..., description="두 번째 JSON 파일 내용")
+    file1_content: Optional[str] = Field(None, description="첫 번째 JSON 파일 내용 (생략 시 file1_snapshot 사용)")
+    file2_content: Optional[str] = Field(None, description="두 번째 JSON 파일 내용 (생략 시 file2_snapshot 사용)")
+    file1_snapshot: Optional[str] = Field(None, description="첫 번째 Daily Crawling 출력 파일명(data_....json) 또는 실행 ID")
+    file2_snapshot: Optional[str] = Field(None, description="두 번째 Daily Crawling 출력 파일명(data_....json) 또는 실행 ID")
 
 
 class JsonComparisonResponse(BaseModel):
@@ -1,5 +1,4 @@
 """JSON Compare Service"""
-import json
 import os
 import tempfile
 import uuid
@@ -22,6 +21,8 @@ class JsonCompareService:
         self.temp_dir = Path(temp_dir)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         self.tasks: Dict[str, JsonComparisonTask] = {}
+        # 작업별 담당자 조회 결과 캐시 (작업 상태 폴링마다 DB를 다시 조회하지 않도록)
+        self.empty_url_items_cache: Dict[str, List[EmptyUrlItem]] = {}
         
     def create_comparison_task(self, request: JsonComparisonRequest) -> str:
         """JSON 비교 작업 생성"""
@@ -205,106 +206,86 @@ class JsonCompareService:
         if not task:
             return []
         
+        cached_items = self.empty_url_items_cache.get(task_id)
+        if cached_items is not None:
+            return cached_items
+        
         try:
-            # JSON 파일 로드
-            with open(task.file1_path, 'r', encoding='utf-8') as f:
-                data1 = json.load(f)
-            with open(task.file2_path, 'r', encoding='utf-8') as f:
-                data2 = json.load(f)
-            
-            # 두 파일의 모든 객체를 합쳐서 URL이 비어있는 항목들 찾기
-            all_objects = []
-            if isinstance(data1, list):
-                all_objects.extend(data1)
-            if isinstance(data2, list):
-                all_objects.extend(data2)
+            from app.infrastructure.json_compare.json_compare import URLBasedComparator
+            comparator = URLBasedComparator()
+            
+            # 두 파일을 스트리밍하며 murl 필드가 비어있는 항목만 수집
+            empty_murl_objects = []
+            object_count = 0
+            for file_path in [task.file1_path, task.file2_path]:
+                for obj in comparator.iter_json_array(file_path):
+                    object_count += 1
+                    if isinstance(obj, dict) and not obj.get('murl', ''):
+                        empty_murl_objects.append(obj)
+            
+            logger.info(f"Processed {object_count} objects, found {len(empty_murl_objects)} empty murl items")
+            
+            # 고유 URL만 모아 한 번에 담당자 정보 조회
+            unique_urls = list(dict.fromkeys(obj.get('url', '') for obj in empty_murl_objects if obj.get('url', '')))
+            manager_infos = await self._get_manager_infos_by_urls(unique_urls)
+            logger.info(f"Resolved manager info for {len(manager_infos)}/{len(unique_urls)} unique URLs")
             
             empty_url_items = []
-            logger.info(f"Processing {len(all_objects)} objects to find empty murl items")
-            
-            for obj in all_objects:
-                if isinstance(obj, dict):
-                    url = obj.get('url', '')
-                    murl = obj.get('murl', '')
-                    
-                    # murl 필드가 비어있는 경우만 처리
-                    if not murl:
-                        logger.info(f"Found empty murl item: url={url[:50]}..., murl={murl}")
-                        title = obj.get('title', '제목 없음')
-                        hierarchy = obj.get('hierarchy', {})
-                        
-                        # hierarchy를 문자열로 변환
-                        if isinstance(hierarchy, list):
-                            hierarchy_str = ' > '.join([str(item) for item in hierarchy])
-                        elif isinstance(hierarchy, dict):
-                            hierarchy_str = ' > '.join([str(v) for k, v in sorted(hierarchy.items()) if v])
-                        else:
-                            hierarchy_str = str(hierarchy) if hierarchy else '경로 없음'
-                        
-                        # URL이 있는 경우에만 담당자 정보 조회
-                        manager_info = None
-                        if url:
-                            logger.info(f"Looking up manager info for URL: {url[:50]}...")
-                            manager_info = await self._get_manager_info_by_url(url)
-                            if manager_info:
-                                logger.info(f"Found manager info: {manager_info.team_name} - {manager_info.manager_names}")
-                            else:
-                                logger.info(f"No manager info found for URL: {url[:50]}...")
-                        
-                        # 담당자 정보가 있는 경우에만 리스트에 추가
-                        if manager_info:
-                            empty_url_items.append(EmptyUrlItem(
-                                url=url,
-                                title=title,
-                                hierarchy=hierarchy_str,
-                                manager_info=manager_info
-                            ))
+            for obj in empty_murl_objects:
+                url = obj.get('url', '')
+                manager_info = manager_infos.get(url) if url else None
+                
+                # 담당자 정보가 있는 경우에만 리스트에 추가
+                if not manager_info:
+                    continue
+                
+                hierarchy = obj.get('hierarchy', {})
+                
+                # hierarchy를 문자열로 변환
+                if isinstance(hierarchy, list):
+                    hierarchy_str = ' > '.join([str(item) for item in hierarchy])
+                elif isinstance(hierarchy, dict):
+                    hierarchy_str = ' > '.join([str(v) for k, v in sorted(hierarchy.items()) if v])
+                else:
+                    hierarchy_str = str(hierarchy) if hierarchy else '경로 없음'
+                
+                empty_url_items.append(EmptyUrlItem(
+                    url=url,
+                    title=obj.get('title', '제목 없음'),
+                    hierarchy=hierarchy_str,
+                    manager_info=manager_info
+                ))
             
             logger.info(f"Found {len(empty_url_items)} items with empty murl fields")
+            self.empty_url_items_cache[task_id] = empty_url_items
             return empty_url_items
             
         except Exception as e:
             logger.error(f"Failed to get empty URL items: {e}")
             return []
     
-    async def _get_manager_info_by_url(self, url: str) -> Optional[ManagerInfo]:
-        """URL로 담당자 정보 조회"""
-        try:
-            from app.shared.database.base import get_database_session
-            from app.application.menu.menu_service import MenuApplicationService
-            from app.domains.menu.entities.menu_link import MenuLink
-            from sqlalchemy import select
-            
-            async for session in get_database_session():
-                # menu_links 테이블에서 pc_url로 검색 (첫 번째 것만 가져오기)
-                result = await session.execute(
-                    select(MenuLink).where(MenuLink.pc_url == url).limit(1)
-                )
-                menu_link = result.scalar_one_or_none()
-                
-                if not menu_link:
-                    logger.info(f"No menu_link found for URL: {url[:50]}...")
-                    return None
-                
-                logger.info(f"Found menu_link with ID {menu_link.id} for URL: {url[:50]}...")
-                
-                # 메뉴 서비스를 사용하여 담당자 정보 조회
-                menu_service = MenuApplicationService(session)
-                manager_info = await menu_service.get_manager_info_by_menu_id(menu_link.id)
-                
-                if not manager_info:
-                    logger.info(f"No manager_info found for menu_id {menu_link.id}")
-                    return None
-                
-                logger.info(f"Found manager_info: {manager_info.team_name} - {manager_info.manager_names}")
-                return ManagerInfo(
+    async def _get_manager_infos_by_urls(self, urls: List[str]) -> Dict[str, ManagerInfo]:
+        """여러 URL의 담당자 정보를 하나의 세션에서 IN 쿼리로 일괄 조회"""
+        if not urls:
+            return {}
+        
+        from app.shared.database.base import get_database_session
+        from app.application.menu.menu_service import MenuApplicationService
+        
+        async for session in get_database_session():
+            # menu_links.pc_url ↔ menu_manager_info 조인
+            menu_service = MenuApplicationService(session)
+            manager_infos = await menu_service.get_manager_infos_by_pc_urls(urls)
+            
+            return {
+                url: ManagerInfo(
                     team_name=manager_info.team_name,
                     manager_names=manager_info.manager_names
                 )
-                
-        except Exception as e:
-            logger.error(f"Failed to get manager info for URL {url}: {e}")
-            return None
+                for url, manager_info in manager_infos.items()
+            }
+        
+        return {}
     
     def cleanup_task(self, task_id: str):
         """작업 정리"""
@@ -326,6 +307,7 @@ class JsonCompareService:
             
             # 작업 삭제
             del self.tasks[task_id]
+            self.empty_url_items_cache.pop(task_id, None)
             
             logger.info(f"Cleaned up task: {task_id}")
             
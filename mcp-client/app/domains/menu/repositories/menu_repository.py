@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_
 from sqlalchemy.orm import selectinload
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.domains.menu.entities.menu_link import MenuLink
 from app.domains.menu.entities.menu_manager import MenuManagerInfo
@@ -53,6 +53,11 @@ class IMenuRepository(ABC):
         """Get manager info by menu ID"""
         pass
     
+    @abstractmethod
+    async def get_manager_infos_by_pc_urls(self, pc_urls: List[str]) -> Dict[str, MenuManagerInfo]:
+        """Get manager info keyed by menu link PC URL"""
+        pass
+    
     @abstractmethod
     async def update_manager_info(self, manager_info: MenuManagerInfo) -> MenuManagerInfo:
         """Update manager info"""
@@ -67,6 +72,9 @@ class IMenuRepository(ABC):
 class MenuRepository(IMenuRepository):
     """Menu repository implementation"""
     
+    # IN (...) 절 하나에 넣을 최대 URL 수
+    IN_CLAUSE_CHUNK_SIZE = 500
+    
     def __init__(self, session: AsyncSession):
         self.session = session
     
@@ -209,6 +217,30 @@ class MenuRepository(IMenuRepository):
         )
         return result.scalar_one_or_none()
     
+    async def get_manager_infos_by_pc_urls(self, pc_urls: List[str]) -> Dict[str, MenuManagerInfo]:
+        """Get manager info keyed by menu link PC URL (one IN query per chunk)"""
+        unique_urls = list(dict.fromkeys(url for url in pc_urls if url))
+        manager_infos: Dict[str, MenuManagerInfo] = {}
+        
+        for start in range(0, len(unique_urls), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = unique_urls[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            result = await self.session.execute(
+                select(MenuLink.pc_url, MenuManagerInfo)
+                .outerjoin(MenuManagerInfo, MenuManagerInfo.menu_id == MenuLink.id)
+                .where(MenuLink.pc_url.in_(chunk))
+                .order_by(MenuLink.id)
+            )
+            # 같은 pc_url의 메뉴가 여러 개면 가장 먼저 등록된 메뉴 하나만 사용 (그 메뉴에 담당자가 없으면 제외)
+            seen_urls = set()
+            for pc_url, manager_info in result.all():
+                if pc_url in seen_urls:
+                    continue
+                seen_urls.add(pc_url)
+                if manager_info is not None:
+                    manager_infos[pc_url] = manager_info
+        
+        return manager_infos
+    
     async def get_manager_info_list(self, skip: int = 0, limit: int = 100, search: str = None) -> Tuple[List[MenuManagerInfo], int]:
         """Get manager info list with pagination and search by menu path"""
         query = select(MenuManagerInfo).join(MenuLink, MenuManagerInfo.menu_id == MenuLink.id).options(selectinload(MenuManagerInfo.menu_link))
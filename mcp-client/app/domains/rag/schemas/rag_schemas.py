@@ -9,6 +9,9 @@ class RagUploadResponse(BaseModel):
     processed_count: int
     failed_count: int
     failed_documents: List[str] = []
+    merged_count: int = 0
+    deleted_count: int = 0
+    unchanged_count: int = 0
 
 
 class RagQueryRequest(BaseModel):
@@ -1,13 +1,23 @@
 import json
 import argparse
 import sys
+import codecs
+import hashlib
+import unicodedata
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Iterator
 from datetime import datetime
 import os
 import html
 import re
 
+# 대용량 JSON 스트리밍 파서는 선택적으로 import (없으면 json.load로 대체)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # PDF 관련 라이브러리는 선택적으로 import
 try:
     from reportlab.lib.pagesizes import letter, A4
@@ -26,6 +36,11 @@ except ImportError:
 
 
 class URLBasedComparator:
+    # 변경 여부를 판단하는 비교 대상 필드
+    COMPARE_FIELDS = ('text', 'murl')
+    # 추가/삭제 리포트에 필요한 필드 (본문은 보관하지 않음)
+    SUMMARY_FIELDS = ('url', 'title', 'hierarchy')
+
     def __init__(self):
         self.changes = {
             'modified': [],     # 수정된 객체들
@@ -96,17 +111,12 @@ class URLBasedComparator:
     
     def normalize_for_comparison(self, value: Any) -> Any:
         """비교를 위한 정규화: 문자열 공백, 개행, 유니코드 정규화."""
-        import unicodedata
-        import re
-        
         if isinstance(value, str):
-            # 유니코드 정규화 (NFC 형식으로 통일)
-            normalized = unicodedata.normalize('NFC', value)
-            # 연속된 공백을 하나로 통일
-            normalized = re.sub(r'\s+', ' ', normalized)
-            # 앞뒤 공백 제거
-            normalized = normalized.strip()
-            return normalized
+            # 유니코드 정규화 (NFC 형식으로 통일, 이미 NFC인 경우 생략)
+            if not unicodedata.is_normalized('NFC', value):
+                value = unicodedata.normalize('NFC', value)
+            # 연속된 공백을 하나로 통일하고 앞뒤 공백 제거 (re.sub(r'\s+', ' ').strip()과 동일)
+            return ' '.join(value.split())
         elif isinstance(value, dict):
             # 딕셔너리의 모든 값을 재귀적으로 정규화
             return {k: self.normalize_for_comparison(v) for k, v in value.items()}
@@ -166,6 +176,102 @@ class URLBasedComparator:
                 logger.warning(f"dict가 아닌 객체 발견: {str(item)[:100]}...")
         return mapping
     
+    def iter_json_array(self, filepath: str) -> Iterator[Any]:
+        """최상위 JSON 배열의 요소를 하나씩 스트리밍합니다. UTF-8 BOM을 자동으로 처리합니다.
+
+        ijson이 설치되어 있으면 파일 전체를 메모리에 올리지 않고 증분 파싱하며,
+        없으면 load_json으로 전체를 로드한 뒤 순회합니다.
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        if not IJSON_AVAILABLE:
+            data = self.load_json(filepath)
+            if not isinstance(data, list):
+                error_msg = "오류: JSON 파일의 최상위는 배열이어야 합니다."
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+            yield from data
+            return
+        
+        try:
+            f = open(filepath, 'rb')
+        except FileNotFoundError:
+            error_msg = f"오류: 파일 '{filepath}'를 찾을 수 없습니다."
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+        
+        with f:
+            # UTF-8 BOM 건너뛰기
+            if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+                f.seek(0)
+            start = f.tell()
+            
+            # 최상위가 배열인지 첫 번째 유효 문자로 확인
+            first_char = f.read(1)
+            while first_char and first_char.isspace():
+                first_char = f.read(1)
+            if first_char != b'[':
+                error_msg = "오류: JSON 파일의 최상위는 배열이어야 합니다."
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+            f.seek(start)
+            
+            try:
+                yield from ijson.items(f, 'item', use_float=True)
+            except ijson.JSONError as e:
+                error_msg = f"오류: '{filepath}' 파일의 JSON 형식이 올바르지 않습니다. 상세 오류: {e}"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+    
+    def iter_documents(self, filepath: str) -> Iterator[Any]:
+        """iter_json_array에서 Daily Crawling 삭제 표시(status=deleted) 객체를 제외하고 순회합니다.
+
+        삭제 표시는 이전 실행에 있던 문서이므로 비교에서는 파일에 없는 것으로 취급합니다.
+        """
+        for item in self.iter_json_array(filepath):
+            if isinstance(item, dict) and item.get('status') == 'deleted':
+                continue
+            yield item
+    
+    def create_fingerprint(self, obj: Dict[str, Any]) -> bytes:
+        """비교 대상 필드를 정규화한 뒤 해시한 지문을 생성합니다.
+
+        지문이 같으면 find_object_changes 결과도 변경 없음이므로 깊은 비교를 생략할 수 있습니다.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for field in self.COMPARE_FIELDS:
+            value = self.normalize_for_comparison(obj.get(field))
+            if isinstance(value, str):
+                hasher.update(b's')
+                hasher.update(value.encode('utf-8', 'surrogatepass'))
+            else:
+                hasher.update(b'j')
+                hasher.update(json.dumps(value, sort_keys=True, ensure_ascii=False,
+                                         separators=(',', ':'), default=str).encode('utf-8', 'surrogatepass'))
+            hasher.update(b'\x1f')
+        return hasher.digest()
+    
+    def create_object_summary(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """추가/삭제 리포트용으로 식별 정보만 남긴 객체를 생성합니다."""
+        return {field: obj[field] for field in self.SUMMARY_FIELDS if field in obj}
+    
+    def build_fingerprint_index(self, filepath: str) -> Dict[str, bytes]:
+        """파일을 스트리밍하며 객체 키별 지문 인덱스를 생성합니다."""
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        index = {}
+        for item in self.iter_documents(filepath):
+            if isinstance(item, dict):
+                key = self.create_object_key(item)
+                if key in index:
+                    logger.warning(f"중복 키 발견: {key[:100]}...")
+                index[key] = self.create_fingerprint(item)
+            else:
+                logger.warning(f"dict가 아닌 객체 발견: {str(item)[:100]}...")
+        return index
+    
     def format_hierarchy_for_display(self, hierarchy: Any) -> str:
         """hierarchy를 읽기 쉬운 형태로 포맷팅합니다."""
         if not hierarchy:
@@ -348,7 +454,7 @@ class URLBasedComparator:
         changes = []
         
         # 비교할 필드들 정의 (text와 murl 필드만 비교)
-        compare_fields = ['text', 'murl']
+        compare_fields = list(self.COMPARE_FIELDS)
         
         for field in compare_fields:
             old_value = old_obj.get(field)
@@ -403,43 +509,80 @@ class URLBasedComparator:
         return changes
     
     def compare_json(self, file1: str, file2: str, file1_name: str = None, file2_name: str = None) -> Dict[str, Any]:
-        """두 JSON 파일을 URL 기반으로 비교합니다."""
+        """두 JSON 파일을 URL 기반으로 비교합니다.
+
+        두 파일을 스트리밍으로 읽어 객체별 지문만 메모리에 유지하고,
+        지문이 다른 객체에 대해서만 find_object_changes로 깊은 비교를 수행합니다.
+        """
         import logging
         logger = logging.getLogger(__name__)
         
-        logger.info("JSON 파일 로딩 중...")
-        data1 = self.load_json(file1)
-        data2 = self.load_json(file2)
+        logger.info("JSON 파일 스트리밍 비교 시작...")
+        logger.info(f"   - 파일1: {os.path.getsize(file1):,} bytes")
+        logger.info(f"   - 파일2: {os.path.getsize(file2):,} bytes")
         
-        logger.info(f"파일 로딩 완료")
-        logger.info(f"   - 파일1: {len(str(data1)):,} characters")
-        logger.info(f"   - 파일2: {len(str(data2)):,} characters")
+        # 1단계: 이전 파일의 객체 키 → 지문 인덱스 (url + hierarchy)
+        logger.info("이전 파일 지문 인덱스 생성 중...")
+        old_index = self.build_fingerprint_index(file1)
+        logger.info(f"   - 이전 파일 유효 객체: {len(old_index):,}개")
         
-        if not isinstance(data1, list) or not isinstance(data2, list):
-            error_msg = "오류: JSON 파일의 최상위는 배열이어야 합니다."
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        # 2단계: 현재 파일을 스트리밍하며 추가/변경 후보 분류 및 JavaScript 검출
+        logger.info("현재 파일 스트리밍 분석 중...")
+        new_keys: Set[str] = set()
+        added_objects: Dict[str, Dict[str, Any]] = {}
+        candidate_objects: Dict[str, Dict[str, Any]] = {}
+        javascript_pages: Dict[str, Dict[str, Any]] = {}
         
-        logger.info(f"객체 키 기반 매핑 생성 중...")
-        logger.info(f"   - 이전 파일: {len(data1):,}개 객체")
-        logger.info(f"   - 현재 파일: {len(data2):,}개 객체")
+        for item in self.iter_documents(file2):
+            if not isinstance(item, dict):
+                logger.warning(f"dict가 아닌 객체 발견: {str(item)[:100]}...")
+                continue
+            
+            obj_key = self.create_object_key(item)
+            if obj_key in new_keys:
+                logger.warning(f"중복 키 발견: {obj_key[:100]}...")
+            new_keys.add(obj_key)
+            
+            # 중복 키는 마지막 객체가 유효하므로 이전 분류를 덮어씀
+            js_info = self.analyze_javascript_in_page(item)
+            if js_info:
+                javascript_pages[obj_key] = js_info
+            else:
+                javascript_pages.pop(obj_key, None)
+            
+            old_fingerprint = old_index.get(obj_key)
+            if old_fingerprint is None:
+                added_objects[obj_key] = self.create_object_summary(item)
+            elif old_fingerprint != self.create_fingerprint(item):
+                candidate_objects[obj_key] = item
+            else:
+                candidate_objects.pop(obj_key, None)
+        
+        logger.info(f"   - 현재 파일 유효 객체: {len(new_keys):,}개")
         
-        # 객체 키 기반 매핑 생성 (url + hierarchy)
-        old_mapping = self.create_object_mapping(data1)
-        new_mapping = self.create_object_mapping(data2)
+        removed_keys = old_index.keys() - new_keys
+        common_count = len(new_keys) - len(added_objects)
         
-        logger.info(f"   - 이전 파일 유효 객체: {len(old_mapping):,}개")
-        logger.info(f"   - 현재 파일 유효 객체: {len(new_mapping):,}개")
+        # 3단계: 이전 파일을 다시 스트리밍하며 삭제/변경 후보 객체만 수집
+        removed_objects: Dict[str, Dict[str, Any]] = {}
+        old_candidates: Dict[str, Dict[str, Any]] = {}
+        if removed_keys or candidate_objects:
+            logger.info(f"지문 불일치 객체 수집 중... ({len(candidate_objects):,}개)")
+            for item in self.iter_documents(file1):
+                if not isinstance(item, dict):
+                    continue
+                obj_key = self.create_object_key(item)
+                if obj_key in removed_keys:
+                    removed_objects[obj_key] = self.create_object_summary(item)
+                elif obj_key in candidate_objects:
+                    old_candidates[obj_key] = item
         
-        old_keys = set(old_mapping.keys())
-        new_keys = set(new_mapping.keys())
+        del old_index
         
         logger.info("객체 변경사항 분석 중...")
         
         # 삭제된 객체들
-        removed_keys = old_keys - new_keys
-        for obj_key in removed_keys:
-            obj = old_mapping[obj_key]
+        for obj_key, obj in removed_objects.items():
             self.changes['removed'].append({
                 'object_key': obj_key,
                 'url': obj.get('url', ''),
@@ -447,22 +590,18 @@ class URLBasedComparator:
             })
         
         # 추가된 객체들
-        added_keys = new_keys - old_keys
-        for obj_key in added_keys:
-            obj = new_mapping[obj_key]
+        for obj_key, obj in added_objects.items():
             self.changes['added'].append({
                 'object_key': obj_key,
                 'url': obj.get('url', ''),
                 'object': obj
             })
         
-        # 공통 객체들 - 변경사항 확인 (murl, title, text, metadata만 비교)
-        common_keys = old_keys & new_keys
+        # 지문이 다른 공통 객체들만 깊은 비교 (text, murl)
         modified_count = 0
         
-        for obj_key in common_keys:
-            old_obj = old_mapping[obj_key]
-            new_obj = new_mapping[obj_key]
+        for obj_key, new_obj in candidate_objects.items():
+            old_obj = old_candidates[obj_key]
             
             # 특정 필드만 비교해서 변경 여부 확인
             field_changes = self.find_object_changes(old_obj, new_obj, obj_key)
@@ -488,22 +627,16 @@ class URLBasedComparator:
                             new_val = str(change['new_value'])[:100]
                             logger.debug(f"      이전: {old_val}...")
                             logger.debug(f"      현재: {new_val}...")
-            else:
-                self.changes['unchanged'] += 1
         
-        # JavaScript 검출 분석
-        logger.info("JavaScript 문구 검출 중...")
-        all_pages = list(new_mapping.values())  # 현재 파일의 모든 페이지
-        for page in all_pages:
-            js_info = self.analyze_javascript_in_page(page)
-            if js_info:
-                self.javascript_stats['pages_with_javascript'].append(js_info)
+        self.changes['unchanged'] = common_count - modified_count
         
+        # JavaScript 검출 결과 (현재 파일의 모든 페이지)
+        self.javascript_stats['pages_with_javascript'].extend(javascript_pages.values())
         self.javascript_stats['page_count'] = len(self.javascript_stats['pages_with_javascript'])
         
         logger.info(f"분석 완료!")
         logger.info(f"   - 삭제된 객체: {len(removed_keys):,}개")
-        logger.info(f"   - 추가된 객체: {len(added_keys):,}개")
+        logger.info(f"   - 추가된 객체: {len(added_objects):,}개")
         logger.info(f"   - 수정된 객체: {modified_count:,}개")
         logger.info(f"   - 변경없는 객체: {self.changes['unchanged']:,}개")
         logger.info(f"   - JavaScript 검출: {self.javascript_stats['page_count']:,}개 페이지")
@@ -512,13 +645,13 @@ class URLBasedComparator:
         stats = {
             'file1': file1_name if file1_name else Path(file1).name,
             'file2': file2_name if file2_name else Path(file2).name,
-            'total_objects_1': len(old_mapping),
-            'total_objects_2': len(new_mapping),
+            'total_objects_1': len(removed_keys) + common_count,
+            'total_objects_2': len(new_keys),
             'objects_removed': len(removed_keys),
-            'objects_added': len(added_keys),
+            'objects_added': len(added_objects),
             'objects_modified': modified_count,
             'objects_unchanged': self.changes['unchanged'],
-            'total_changes': len(removed_keys) + len(added_keys) + modified_count,
+            'total_changes': len(removed_keys) + len(added_objects) + modified_count,
             'javascript_pages': self.javascript_stats['page_count']
         }
         
@@ -260,6 +260,16 @@ class LLMService:
                 formatted_tools.append(formatted_tool)
         return formatted_tools
     
+    async def _call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """MCP 도구 호출 (브라우저를 쓰는 크롤링 도구는 전역 크롤링 스케줄러의 llm_tool 슬롯에서 실행)"""
+        if name not in settings.crawl_scheduler_llm_tools:
+            return await mcp_service.call_tool(name, arguments)
+        
+        # application 레이어 모듈이므로 호출 시점에 import
+        from app.application.crawler.crawl_scheduler import LLM_TOOL, crawl_scheduler
+        async with crawl_scheduler.slot(LLM_TOOL):
+            return await mcp_service.call_tool(name, arguments)
+    
     # (삭제됨) 상단 중복 정의된 _filter_tools_by_intent — 클래스의 하단 정의만 사용
     
     async def query(self, question: str, available_tools: List[Dict[str, Any]]) -> str:
@@ -326,7 +336,7 @@ Response policy:
                 
                 try:
                     # Call your MCP service
-                    tool_result = await mcp_service.call_tool(function_name, function_args)
+                    tool_result = await self._call_tool(function_name, function_args)
                     
                     # Format the result
                     if hasattr(tool_result, 'structured_content'):
@@ -669,7 +679,7 @@ Response policy:
             if isinstance(args, str):
                 args = json.loads(args)
             
-            result = await mcp_service.call_tool(call.name, args)
+            result = await self._call_tool(call.name, args)
 
             # 호출 자체를 메시지 배열에 추가
             next_input.append(call)
@@ -747,7 +757,7 @@ Response policy:
         for call in tool_calls:
             try:
                 args = json.loads(call['arguments']) if call['arguments'] else {}
-                result = await mcp_service.call_tool(call['name'], args)
+                result = await self._call_tool(call['name'], args)
                 
                 # Tool 실행 결과를 스트림으로 전송 (원본 결과 전달)
                 tool_message = f"Tool '{call['name']}' 실행 완료"
@@ -1,148 +1,326 @@
 """MCP Client Service - Handles all MCP server interactions"""
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import asyncio
 import logging
+import time
 from fastmcp import Client
 from app.config import settings
 from app.shared.exceptions.base import MCPConnectionError, MCPToolExecutionError
 
 logger = logging.getLogger(__name__)
 
+
+class _PooledSession:
+    """A single MCP session in the pool"""
+
+    def __init__(self, endpoint: str, client: Client):
+        self.endpoint = endpoint
+        self.client = client
+        self.in_flight: int = 0  # 진행 중인 호출 수 (least-loaded 분배 기준)
+        self.total_calls: int = 0
+        self.retired: bool = False  # 풀에서 제외됨 (진행 중 호출이 끝나면 종료)
+        self.opened_at: float = time.monotonic()
+
+    @property
+    def usable(self) -> bool:
+        return not self.retired and self.client.is_connected()
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "connected": self.usable,
+            "in_flight": self.in_flight,
+            "total_calls": self.total_calls,
+            "age_seconds": round(time.monotonic() - self.opened_at, 1),
+        }
+
+
 class MCPService:
-    """Service class for managing MCP client operations"""
-    
+    """
+    Service class for managing MCP client operations
+
+    엔드포인트(settings.mcp_server_urls, 없으면 mcp_server_url)마다 settings.mcp_pool_size 개의 세션을 열고,
+    호출은 진행 중 요청이 가장 적은 세션으로 분배합니다.
+    끊어진 세션은 해당 세션만 풀에서 제외한 뒤 교체하므로 다른 세션의 호출은 영향을 받지 않습니다.
+    """
+
     def __init__(self):
-        self._client: Optional[Client] = None
+        self._sessions: List[_PooledSession] = []
         self._tools_cache: List[Dict[str, Any]] = []
         self._connection_lock = asyncio.Lock()
+        self._replenish_lock = asyncio.Lock()
+        self._monitor_task: Optional[asyncio.Task] = None
         self._tool_usage_stats: Dict[str, int] = {}  # 도구 사용 통계
         self._max_retries: int = 3  # 최대 재시도 횟수
         self._retry_delay: float = 2.0  # 재시도 대기 시간 (초)
-        
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Configured MCP server endpoints"""
+        return list(settings.mcp_server_urls) or [settings.mcp_server_url]
+
+    def _missing_slots(self) -> List[str]:
+        """Endpoints (one entry per missing session) needed to fill the pool"""
+        pool_size = max(1, settings.mcp_pool_size)
+        missing = []
+        for endpoint in self.endpoints:
+            open_count = sum(1 for s in self._sessions if s.endpoint == endpoint and not s.retired)
+            missing.extend([endpoint] * max(0, pool_size - open_count))
+        return missing
+
+    async def _open_session(self, endpoint: str) -> _PooledSession:
+        client = Client(endpoint)
+        await asyncio.wait_for(client.__aenter__(), timeout=settings.mcp_connection_timeout)
+        return _PooledSession(endpoint, client)
+
+    async def _open_sessions(self, endpoints: List[str]) -> Tuple[List[_PooledSession], List[Exception]]:
+        results = await asyncio.gather(*(self._open_session(e) for e in endpoints), return_exceptions=True)
+        sessions = [r for r in results if isinstance(r, _PooledSession)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        return sessions, errors
+
+    async def _close_session(self, session: _PooledSession) -> None:
+        try:
+            await session.client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Error while closing MCP session ({session.endpoint}): {e}")
+
     async def initialize(self) -> None:
-        """Initialize MCP client connection with retry logic"""
+        """Initialize MCP session pool with retry logic"""
         async with self._connection_lock:
-            if self._client is not None:
+            if any(s.usable for s in self._sessions):
                 return
-            
+
             last_error = None
             for attempt in range(self._max_retries):
-                try:
-                    logger.info(f"🔄 Attempting to connect to MCP Server (attempt {attempt + 1}/{self._max_retries})...")
-                    
-                    self._client = Client(settings.mcp_server_url)
-                    await self._client.__aenter__()
-                    
-                    # Cache available tools
-                    await self._refresh_tools_cache()
-                    
-                    logger.info(f"✅ MCP Client connected to {settings.mcp_server_url}")
-                    logger.info(f"📋 Available tools: {[tool['name'] for tool in self._tools_cache]}")
-                    return
-                    
-                except Exception as e:
-                    last_error = e
-                    logger.warning(f"⚠️ Connection attempt {attempt + 1} failed: {e}")
-                    self._client = None
-                    
-                    if attempt < self._max_retries - 1:
-                        wait_time = self._retry_delay * (attempt + 1)  # Exponential backoff
-                        logger.info(f"⏳ Waiting {wait_time}s before retry...")
-                        await asyncio.sleep(wait_time)
-            
+                logger.info(f"🔄 Attempting to connect to MCP Server (attempt {attempt + 1}/{self._max_retries})...")
+
+                sessions, errors = await self._open_sessions(self._missing_slots())
+                self._sessions.extend(sessions)
+                if sessions:
+                    try:
+                        # Cache available tools
+                        await self._refresh_tools_cache()
+                    except MCPConnectionError as e:
+                        errors.append(e)
+                    else:
+                        if errors:
+                            logger.warning(f"⚠️ {len(errors)} MCP session(s) failed to open, will retry in background: {errors[0]}")
+                        logger.info(f"✅ MCP Client connected to {self.endpoints} ({len(self._sessions)} sessions)")
+                        logger.info(f"📋 Available tools: {[tool['name'] for tool in self._tools_cache]}")
+                        self._start_monitor()
+                        return
+
+                last_error = errors[-1] if errors else None
+                logger.warning(f"⚠️ Connection attempt {attempt + 1} failed: {last_error}")
+                for session in self._sessions:
+                    await self._close_session(session)
+                self._sessions = []
+
+                if attempt < self._max_retries - 1:
+                    wait_time = self._retry_delay * (attempt + 1)  # Exponential backoff
+                    logger.info(f"⏳ Waiting {wait_time}s before retry...")
+                    await asyncio.sleep(wait_time)
+
             # All retries failed
             logger.error(f"❌ Failed to initialize MCP client after {self._max_retries} attempts")
             raise MCPConnectionError(f"MCP client initialization failed after {self._max_retries} attempts: {str(last_error)}")
-    
+
     async def shutdown(self) -> None:
-        """Cleanup MCP client connection"""
-        if self._client:
+        """Cleanup MCP session pool"""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
             try:
-                await self._client.__aexit__(None, None, None)
-                logger.info("MCP Client connection closed")
-            except Exception as e:
-                logger.error(f"Error during MCP client shutdown: {e}")
-            finally:
-                self._client = None
-                self._tools_cache = []
-    
+                await self._monitor_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._monitor_task = None
+
+        sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.retired = True
+            await self._close_session(session)
+        self._tools_cache = []
+        if sessions:
+            logger.info(f"MCP Client connections closed ({len(sessions)} sessions)")
+
     async def _refresh_tools_cache(self) -> None:
         """Refresh the cached tools list"""
-        if not self._client:
+        session = next((s for s in self._sessions if s.usable), None)
+        if session is None:
             raise MCPConnectionError("MCP client not initialized")
-            
+
         try:
             from app.shared.utils.schema_converter import to_openai_schema
-            
-            mcp_tools = await self._client.list_tools()
+
+            mcp_tools = await session.client.list_tools()
             self._tools_cache = [to_openai_schema(tool) for tool in mcp_tools]
-            
+
         except Exception as e:
             logger.error(f"Failed to refresh tools cache: {e}")
             raise MCPConnectionError(f"Failed to get tools list: {str(e)}")
-    
+
+    # ----------------------------------------------------------------------------------
+    # Pool maintenance
+    # ----------------------------------------------------------------------------------
+    def _retire(self, session: _PooledSession, reason: str) -> None:
+        """Remove a broken session from the pool and schedule a replacement"""
+        if session.retired:
+            return
+        session.retired = True
+        if session in self._sessions:
+            self._sessions.remove(session)
+        logger.warning(f"♻️ MCP session retired ({session.endpoint}): {reason}")
+
+        # 진행 중인 호출이 있으면 마지막 호출이 끝날 때 종료
+        if session.in_flight == 0:
+            asyncio.create_task(self._close_session(session))
+        asyncio.create_task(self._replenish())
+
+    async def _replenish(self) -> None:
+        """Open sessions for empty pool slots"""
+        async with self._replenish_lock:
+            missing = self._missing_slots()
+            if not missing:
+                return
+            sessions, errors = await self._open_sessions(missing)
+            self._sessions.extend(sessions)
+            if sessions:
+                logger.info(f"🔌 Opened {len(sessions)} replacement MCP session(s)")
+            if errors:
+                logger.warning(f"⚠️ {len(errors)} MCP session(s) could not be opened: {errors[0]}")
+            if sessions and not self._tools_cache:
+                try:
+                    await self._refresh_tools_cache()
+                except MCPConnectionError:
+                    pass
+
+    async def _check_sessions(self) -> None:
+        """Ping idle sessions and retire the ones that are disconnected"""
+        for session in list(self._sessions):
+            if session.retired:
+                continue
+            if not session.client.is_connected():
+                self._retire(session, "disconnected")
+                continue
+            if session.in_flight:
+                # 사용 중인 세션은 호출 결과로 판단
+                continue
+            try:
+                alive = await asyncio.wait_for(session.client.ping(), timeout=settings.mcp_connection_timeout)
+            except Exception as e:
+                self._retire(session, f"ping failed: {e}")
+                continue
+            if alive is False:
+                self._retire(session, "ping returned false")
+
+        await self._replenish()
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(settings.mcp_health_check_interval)
+            try:
+                await self._check_sessions()
+            except Exception as e:
+                logger.error(f"MCP session health check failed: {e}")
+
+    def _start_monitor(self) -> None:
+        if settings.mcp_health_check_interval > 0 and (self._monitor_task is None or self._monitor_task.done()):
+            self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def _acquire(self) -> _PooledSession:
+        """Pick the least-loaded usable session"""
+        candidates = [s for s in self._sessions if s.usable]
+        if not candidates:
+            logger.warning("⚠️ MCP client not connected, attempting to reconnect...")
+            try:
+                if self._monitor_task is None:
+                    await self.initialize()
+                else:
+                    await self._replenish()
+            except MCPConnectionError:
+                raise MCPConnectionError("MCP client not connected and reconnection failed")
+            candidates = [s for s in self._sessions if s.usable]
+            if not candidates:
+                raise MCPConnectionError("MCP client not connected and reconnection failed")
+        return min(candidates, key=lambda s: (s.in_flight, s.total_calls))
+
+    async def _call_on(self, session: _PooledSession, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        session.in_flight += 1
+        session.total_calls += 1
+        try:
+            return await session.client.call_tool(tool_name, arguments)
+        finally:
+            session.in_flight -= 1
+            if session.retired and session.in_flight == 0:
+                asyncio.create_task(self._close_session(session))
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return isinstance(error, ConnectionError) or "connection" in message or "disconnect" in message
+
+    def _record_usage(self, tool_name: str) -> None:
+        # 사용 통계 업데이트
+        self._tool_usage_stats[tool_name] = self._tool_usage_stats.get(tool_name, 0) + 1
+
     @property
     def is_connected(self) -> bool:
-        """Check if MCP client is connected"""
-        return self._client is not None and self._client.is_connected()
-    
+        """Check if at least one MCP session is connected"""
+        return any(s.usable for s in self._sessions)
+
     @property
     def available_tools(self) -> List[Dict[str, Any]]:
         """Get list of available tools"""
         return self._tools_cache.copy()
-    
+
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        """Execute a tool on the MCP server with automatic reconnection"""
-        if not self.is_connected:
-            logger.warning("⚠️ MCP client not connected, attempting to reconnect...")
-            try:
-                await self.initialize()
-            except MCPConnectionError:
-                raise MCPConnectionError("MCP client not connected and reconnection failed")
-        
+        """Execute a tool on the least-loaded MCP session with automatic failover"""
+        session = await self._acquire()
+
         try:
-            logger.info(f"🚀 Calling MCP tool: {tool_name} with args: {arguments}")
-            result = await self._client.call_tool(tool_name, arguments)
-            
-            # 사용 통계 업데이트
-            self._tool_usage_stats[tool_name] = self._tool_usage_stats.get(tool_name, 0) + 1
-            
+            logger.info(f"🚀 Calling MCP tool: {tool_name} with args: {arguments} (session {session.endpoint}, in-flight {session.in_flight})")
+            result = await self._call_on(session, tool_name, arguments)
+            self._record_usage(tool_name)
+
             logger.info(f"✅ Tool '{tool_name}' executed successfully")
             logger.debug(f"📄 Full result: {result}")  # 디버그 레벨로 변경
             logger.info(f"📊 Tool usage count for '{tool_name}': {self._tool_usage_stats[tool_name]}")
             return result
-            
+
         except Exception as e:
             logger.error(f"❌ Tool execution failed - {tool_name}: {e}")
-            
-            # 연결이 끊어진 경우 재연결 시도
-            if "connection" in str(e).lower() or "disconnect" in str(e).lower():
-                logger.warning("🔄 Connection lost, attempting to reconnect and retry...")
-                self._client = None
-                
+
+            # 연결이 끊어진 경우 해당 세션만 교체하고 다른 세션으로 재시도
+            if self._is_connection_error(e):
+                logger.warning("🔄 Connection lost, retrying on another session...")
+                self._retire(session, str(e))
+
                 try:
-                    await self.initialize()
-                    # 재연결 후 한 번 더 시도
-                    result = await self._client.call_tool(tool_name, arguments)
-                    self._tool_usage_stats[tool_name] = self._tool_usage_stats.get(tool_name, 0) + 1
-                    logger.info(f"✅ Tool '{tool_name}' executed successfully after reconnection")
+                    retry_session = await self._acquire()
+                    result = await self._call_on(retry_session, tool_name, arguments)
+                    self._record_usage(tool_name)
+                    logger.info(f"✅ Tool '{tool_name}' executed successfully after failover")
                     return result
                 except Exception as retry_error:
                     logger.error(f"❌ Retry after reconnection failed: {retry_error}")
                     raise MCPToolExecutionError(f"Failed to execute tool '{tool_name}' even after reconnection: {str(retry_error)}")
-            
+
             raise MCPToolExecutionError(f"Failed to execute tool '{tool_name}': {str(e)}")
-    
+
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on MCP connection"""
         return {
             "connected": self.is_connected,
             "server_url": settings.mcp_server_url,
+            "server_urls": self.endpoints,
+            "pool_size": max(1, settings.mcp_pool_size),
+            "sessions": [session.describe() for session in self._sessions],
             "tools_available": len(self._tools_cache),
             "tools": [tool["name"] for tool in self._tools_cache],
             "tool_usage_stats": self._tool_usage_stats.copy()
         }
-    
+
     def get_usage_stats(self) -> Dict[str, int]:
         """Get tool usage statistics"""
         return self._tool_usage_stats.copy()
@@ -285,6 +285,73 @@ class OpenSearchService:
             logger.error(f"Failed to search documents: {e}")
             return []
     
+    async def delete_documents(self, document_ids: List[str]) -> Dict[str, Any]:
+        """Delete documents by id with bulk operations (ids that do not exist count as deleted)"""
+        deleted = 0
+        failed_documents = []
+        batch_size = 100
+        loop = asyncio.get_event_loop()
+        for i in range(0, len(document_ids), batch_size):
+            batch = [{"delete": {"_index": self.index_name, "_id": doc_id}} for doc_id in document_ids[i:i + batch_size]]
+            try:
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self.client.bulk(body=batch, refresh=False)
+                )
+                for item in response.get('items', []):
+                    result = item.get('delete', {})
+                    if result.get('status', 200) >= 400 and result.get('status') != 404:
+                        failed_documents.append(result.get('_id', 'unknown'))
+                        logger.error(f"Failed to delete document {result.get('_id')}: {result.get('error', 'Unknown error')}")
+                    else:
+                        deleted += 1
+            except Exception as e:
+                logger.error(f"Bulk delete failed: {e}")
+                failed_documents.extend(action["delete"]["_id"] for action in batch)
+        
+        if deleted:
+            try:
+                await loop.run_in_executor(None, lambda: self.client.indices.refresh(index=self.index_name))
+            except Exception as e:
+                logger.warning(f"Failed to refresh OpenSearch index: {e}")
+        
+        logger.info(f"OpenSearch delete completed: {deleted} documents, {len(failed_documents)} failed")
+        return {
+            "deleted_count": deleted,
+            "failed_count": len(failed_documents),
+            "failed_documents": failed_documents
+        }
+    
+    async def get_document_aliases(self, document_ids: List[str]) -> Optional[Dict[str, List[str]]]:
+        """
+        Stored near-duplicate alias ids of the given documents ({document id: sorted alias ids})
+
+        Documents that are not in the index are left out. Returns None when the lookup fails.
+        """
+        aliases: Dict[str, List[str]] = {}
+        batch_size = 500
+        loop = asyncio.get_event_loop()
+        for i in range(0, len(document_ids), batch_size):
+            batch = document_ids[i:i + batch_size]
+            try:
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self.client.mget(
+                        index=self.index_name,
+                        body={"ids": batch},
+                        _source_includes=["metadata.aliases"]
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Failed to get stored aliases: {e}")
+                return None
+            for doc in response.get('docs', []):
+                if not doc.get('found'):
+                    continue
+                stored = ((doc.get('_source') or {}).get('metadata') or {}).get('aliases') or []
+                aliases[doc['_id']] = sorted(alias.get('docId') for alias in stored if alias.get('docId'))
+        return aliases
+
     async def delete_all_documents(self) -> Dict[str, Any]:
         """Delete all documents from the index"""
         try:
@@ -588,6 +588,32 @@ class QdrantService:
             logger.error(f"Failed to search documents: {e}")
             return []
     
+    async def delete_documents(self, document_ids: List[str]) -> Dict[str, Any]:
+        """Delete all chunks of the given documents (matched by payload original_id)"""
+        deleted = 0
+        failed_documents = []
+        batch_size = 100
+        for i in range(0, len(document_ids), batch_size):
+            batch = [str(doc_id) for doc_id in document_ids[i:i + batch_size]]
+            try:
+                response = await self.client.post(
+                    f"{self.base_url}/collections/{self.collection_name}/points/delete",
+                    params={"wait": "true"},
+                    json={"filter": {"must": [{"key": "original_id", "match": {"any": batch}}]}}
+                )
+                response.raise_for_status()
+                deleted += len(batch)
+            except Exception as e:
+                logger.error(f"Failed to delete Qdrant points for {len(batch)} documents: {e}")
+                failed_documents.extend(batch)
+        
+        logger.info(f"Qdrant delete completed: {deleted} documents, {len(failed_documents)} failed")
+        return {
+            "deleted_count": deleted,
+            "failed_count": len(failed_documents),
+            "failed_documents": failed_documents
+        }
+    
     async def delete_all_documents(self) -> Dict[str, Any]:
         """Delete all documents from the collection"""
         try:
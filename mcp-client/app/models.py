@@ -53,14 +53,25 @@ class FailedItem(BaseModel):
     url: str
     error: str
 
+class PartialItem(BaseModel):
+    """Crawling item finished with partial results (handler budget exhausted)"""
+    id: Optional[int] = None
+    url: str
+    collected: int = Field(0, description="Number of items collected before the budget expired")
+    continuation: Optional[Any] = Field(None, description="Position where the handler stopped (next detail URL, page, ...)")
+
 class CrawlingResult(BaseModel):
     """Crawling result model"""
     json_data: Optional[List[Dict[str, Any]]] = Field(None, description="RAG JSON formatted data")
     json_file: Optional[str] = Field(None, description="Path to saved JSON file")
+    delta_file: Optional[str] = Field(None, description="Saved JSON file with changed (new/modified/deleted) documents only")
+    changes: Optional[Dict[str, int]] = Field(None, description="Document count per change status compared with the previous run")
     success: Optional[int] = Field(None, description="Number of successful items")
     failed: Optional[int] = Field(None, description="Number of failed items")
     total: Optional[int] = Field(None, description="Total number of items")
     failed_items: Optional[List[FailedItem]] = Field(None, description="List of failed item details")
+    partial: Optional[int] = Field(None, description="Number of items finished with partial results")
+    partial_items: Optional[List[PartialItem]] = Field(None, description="List of partially finished item details")
 
 class TaskResult(BaseModel):
     """Task result model"""
@@ -70,6 +81,7 @@ class TaskResult(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
     createdAt: str = Field(..., description="Task creation timestamp")
     completedAt: Optional[str] = Field(None, description="Task completion timestamp")
+    progress: Optional[Dict[str, Any]] = Field(None, description="Latest progress update")
 
 # ARI API Models
 class StructuredTableRow(BaseModel):
@@ -105,4 +117,5 @@ class AriCrawlResponse(BaseModel):
     message: str = Field(..., description="Processing result message")
     total_files: int = Field(..., description="Number of processed files")
     total_size: int = Field(..., description="Total file size in bytes")
+    errors: List[Dict[str, Any]] = Field(default_factory=list, description="Per-file errors ({filename, error}) for files that failed")
 
@@ -13,6 +13,7 @@ from app.domains.json_compare.schemas.json_compare_schemas import (
     JsonComparisonResultResponse
 )
 from app.domains.json_compare.services.json_compare_service import json_compare_service
+from app.application.crawler.snapshot_store import snapshot_store
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,12 @@ router = APIRouter(prefix="/json-compare", tags=["json-compare"])
 async def create_comparison(request: JsonComparisonRequest):
     """JSON 파일 비교 작업 생성"""
     try:
+        # 내용 대신 스냅샷(Daily Crawling 출력)을 지정한 경우 저장소에서 로드
+        if request.file1_content is None:
+            request.file1_content = await load_snapshot_content(request.file1_snapshot)
+        if request.file2_content is None:
+            request.file2_content = await load_snapshot_content(request.file2_snapshot)
+        
         # JSON 유효성 검사
         try:
             json.loads(request.file1_content)
@@ -49,6 +56,17 @@ async def create_comparison(request: JsonComparisonRequest):
         raise HTTPException(status_code=500, detail=f"비교 작업 생성 중 오류: {str(e)}")
 
 
+async def load_snapshot_content(name: Optional[str]) -> str:
+    """Daily Crawling 출력 파일명 또는 실행 ID로 스냅샷 저장소의 JSON 내용 조회"""
+    if not name:
+        raise HTTPException(status_code=400, detail="파일 내용 또는 스냅샷 이름이 필요합니다")
+    output = await asyncio.to_thread(snapshot_store.find_output, name)
+    content = await asyncio.to_thread(snapshot_store.get_text, output["hash"]) if output and output.get("hash") else None
+    if content is None:
+        raise HTTPException(status_code=404, detail=f"스냅샷을 찾을 수 없습니다: {name}")
+    return content
+
+
 async def process_comparison_async(task_id: str):
     """비동기 비교 처리"""
     try:
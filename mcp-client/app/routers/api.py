@@ -1,9 +1,11 @@
 """API routes for MCP Client"""
-from fastapi import APIRouter, HTTPException, Query, Depends, Path, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Query, Depends, Path, UploadFile, File, Form, Request
 from fastapi.responses import StreamingResponse, Response
+import asyncio
+import json
 import logging
 import math
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -15,6 +17,8 @@ from app.models import (
 from app.infrastructure.mcp.mcp_service import mcp_service
 from app.infrastructure.llm.llm_service import llm_service  
 from app.application.crawler.crawling_service import crawling_service
+from app.application.crawler.crawl_scheduler import crawl_scheduler
+from app.application.crawler.snapshot_store import snapshot_store
 from app.shared.exceptions.base import MCPConnectionError, LLMQueryError
 from app.shared.database.base import get_database_session
 from app.application.menu.menu_service import MenuApplicationService
@@ -160,6 +164,10 @@ async def get_tool_usage_stats():
         logger.error(f"Failed to get usage stats: {e}")
         raise HTTPException(status_code=500, detail=f"통계 조회 중 오류: {str(e)}")
 
+@router.get("/stats/crawl-scheduler", tags=["monitoring"])
+async def get_crawl_scheduler_stats():
+    """전역 크롤링 스케줄러의 클래스별 실행 수/대기열 길이/대기 시간"""
+    return crawl_scheduler.stats()
 
 
 # ===== MENU LINKS API (Legacy Compatibility) =====
@@ -452,7 +460,7 @@ async def create_rag_crawl_task(request: RAGCrawlRequest):
 async def get_rag_crawl_task(task_id: str = Path(..., description="Task ID")):
     """Get RAG crawling task status and result"""
     try:
-        task = crawling_service.get_task(task_id)
+        task = await crawling_service.get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
         
@@ -464,18 +472,29 @@ async def get_rag_crawl_task(task_id: str = Path(..., description="Task ID")):
         logger.error(f"RAG task retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=f"RAG 작업 조회 실패: {str(e)}")
 
+def _parse_last_event_id(request: Request) -> Optional[int]:
+    """SSE 재연결 시 브라우저가 보내는 Last-Event-ID 헤더 (또는 lastEventId 쿼리) 파싱"""
+    value = request.headers.get("last-event-id") or request.query_params.get("lastEventId")
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
 @router.get("/rag-crawl/{task_id}/stream", tags=["rag-crawling"])
-async def stream_rag_crawl_task(task_id: str = Path(..., description="Task ID")):
+async def stream_rag_crawl_task(
+    request: Request,
+    task_id: str = Path(..., description="Task ID")
+):
     """Stream RAG crawling task updates via Server-Sent Events"""
     try:
-        task = crawling_service.get_task(task_id)
+        task = await crawling_service.get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
         
         logger.info(f"🎯 RAG SSE stream requested for task: {task_id}")
         
         return StreamingResponse(
-            crawling_service.get_task_stream(task_id),
+            crawling_service.get_task_stream(task_id, _parse_last_event_id(request)),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -493,6 +512,29 @@ async def stream_rag_crawl_task(task_id: str = Path(..., description="Task ID"))
 
 # === ARI HTML Processing Endpoints ===
 
+def _build_ari_result(info: dict) -> dict:
+    """ARI 완전 처리 결과를 응답용 구조로 변환"""
+    processed_data = info.get('processed_data', {})
+    metadata = processed_data.get('metadata', {})
+    
+    return {
+        'title': processed_data.get('title', ''),
+        'breadcrumbs': processed_data.get('breadcrumbs', []),
+        'content': {
+            'contents': info['contents']
+        },
+        'metadata': {
+            'img': metadata.get('img', []),
+            'urls': metadata.get('urls', []),
+            'pagetree': metadata.get('pagetree', []),
+            'content_length': metadata.get('content_length', 0),
+            'extracted_at': metadata.get('extracted_at', ''),
+            'markdown_length': metadata.get('markdown_length', 0),
+            'contents_count': metadata.get('contents_count', 0)
+        }
+    }
+
+
 @router.post("/ari/crawl", response_model=AriCrawlResponse, tags=["ari"])
 async def ari_crawl_endpoint(
     files: List[UploadFile] = File(..., description="HTML 파일들 (복수 파일 지원)")
@@ -508,27 +550,7 @@ async def ari_crawl_endpoint(
             raise HTTPException(status_code=500, detail=result['message'])
 
         # 새로운 구조로 응답 데이터 구성
-        structured_results = []
-        for info in result['processed_files']:
-            processed_data = info.get('processed_data', {})
-            metadata = processed_data.get('metadata', {})
-            
-            structured_results.append({
-                'title': processed_data.get('title', ''),
-                'breadcrumbs': processed_data.get('breadcrumbs', []),
-                'content': {
-                    'contents': info['contents']
-                },
-                'metadata': {
-                    'img': metadata.get('img', []),
-                    'urls': metadata.get('urls', []),
-                    'pagetree': metadata.get('pagetree', []),
-                    'content_length': metadata.get('content_length', 0),
-                    'extracted_at': metadata.get('extracted_at', ''),
-                    'markdown_length': metadata.get('markdown_length', 0),
-                    'contents_count': metadata.get('contents_count', 0)
-                }
-            })
+        structured_results = [_build_ari_result(info) for info in result['processed_files']]
 
         response_data = AriCrawlResponse(
             taskId=f"ari_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -539,7 +561,11 @@ async def ari_crawl_endpoint(
             completedAt=datetime.now().isoformat(),
             message=result['message'],
             total_files=result['total_files'],
-            total_size=result['total_size']
+            total_size=result['total_size'],
+            errors=[
+                {'filename': failed['original_filename'], 'error': failed['error']}
+                for failed in result.get('failed_files', [])
+            ]
         )
         
         logger.info(f"✅ ARI HTML 완전 처리 완료: {result['total_files']}개 파일, {result['total_size']} bytes")
@@ -553,6 +579,92 @@ async def ari_crawl_endpoint(
         raise HTTPException(status_code=500, detail=f"ARI HTML 처리 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.post("/ari/crawl/stream", tags=["ari"])
+async def ari_crawl_stream_endpoint(
+    files: List[UploadFile] = File(..., description="HTML 파일들 (복수 파일 지원)")
+):
+    """
+    HTML 파일들을 처리하면서 파일별 결과를 완료되는 순서대로 NDJSON으로 스트리밍합니다.
+    - 각 줄: {"type": "result", "filename", "success", "result" | "error"}
+    - 마지막 줄: {"type": "complete", "total_files", "succeeded", "failed", "total_size"}
+    
+    스트리밍되는 것은 처리 결과뿐입니다. multipart 본문은 핸들러 실행 전에 Starlette가 모두 받아
+    파싱하므로 업로드가 끝나기 전에는 결과가 나오지 않습니다. 업로드 자체를 스트리밍하려면
+    파일별로 POST /ari/upload (raw bytes)를 호출하세요.
+    """
+    if not files:
+        raise HTTPException(status_code=400, detail="업로드할 HTML 파일이 없습니다")
+    
+    async def event_stream():
+        succeeded = failed = total_size = 0
+        async for info in ari_service.iter_html_files_complete(files):
+            if info['success']:
+                succeeded += 1
+                total_size += info['size']
+                line = {
+                    'type': 'result',
+                    'filename': info['original_filename'],
+                    'success': True,
+                    'result': _build_ari_result(info)
+                }
+            else:
+                failed += 1
+                line = {
+                    'type': 'result',
+                    'filename': info['original_filename'],
+                    'success': False,
+                    'error': info['error']
+                }
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+        
+        logger.info(f"✅ ARI HTML 스트리밍 처리 완료: 성공 {succeeded}개, 실패 {failed}개, {total_size} bytes")
+        yield json.dumps({
+            'type': 'complete',
+            'total_files': succeeded + failed,
+            'succeeded': succeeded,
+            'failed': failed,
+            'total_size': total_size
+        }, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+@router.post("/ari/upload", tags=["ari"])
+async def ari_upload_endpoint(
+    request: Request,
+    filename: str = Query(..., description="원본 HTML 파일명")
+):
+    """
+    HTML 파일 한 건을 요청 본문(raw bytes, multipart/base64 인코딩 없음)으로 받아 처리합니다.
+    - 본문은 청크 단위로 디스크에 저장되어 전체 파일을 메모리에 올리지 않음
+    - 여러 파일은 파일별로 개별 요청하여 먼저 끝난 파일의 결과부터 받을 수 있음
+    """
+    try:
+        if not filename.endswith('.html'):
+            raise HTTPException(status_code=400, detail="HTML 파일만 업로드할 수 있습니다")
+        
+        info = await ari_service.save_upload_stream(filename, request.stream())
+        if info['size'] == 0:
+            raise HTTPException(status_code=400, detail="업로드할 HTML 내용이 비어있습니다")
+        
+        processed = await ari_service.process_saved_file(info)
+        return {
+            'success': True,
+            'filename': filename,
+            'size': info['size'],
+            'result': _build_ari_result(processed)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"ARI 업로드 처리 중 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"ARI HTML 처리 중 오류가 발생했습니다: {str(e)}")
+
+
 class AriProcessRequest(BaseModel):
     """HTML 콘텐츠 기반 ARI 처리 요청 (내부망: URL 크롤링 비사용)"""
     htmls: List[str] = Field(..., description="직접 전달할 HTML 콘텐츠 목록")
@@ -654,6 +766,7 @@ from app.domains.crawler.schemas.daily_crawl_schemas import (
     DailyCrawlRequest,
     DailyCrawlTaskResponse,
     DailyCrawlStats,
+    DailyCrawlCheckpoint,
 )
 from app.domains.crawler.repositories.input_url_repository import input_url_repository
 
@@ -671,8 +784,8 @@ async def create_daily_crawl_task(request: DailyCrawlRequest = None):
         if not mcp_service.is_connected:
             raise HTTPException(status_code=503, detail="MCP 서버에 연결되지 않음")
         
-        # 기본값 처리 (Daily Crawling은 매일 전체 병렬 크롤링)
-        force_recrawl = request.force_recrawl if request else True
+        # 기본값 처리 (Daily Crawling은 매일 재방문 시각이 된 URL 병렬 크롤링)
+        force_recrawl = request.force_recrawl if request else False
         limit = request.limit if request else None
         url_ids = request.url_ids if request else []
         mode = request.mode if request else "parallel"
@@ -703,7 +816,7 @@ async def create_daily_crawl_task(request: DailyCrawlRequest = None):
             update_menu_links=update_menu_links
         )
         
-        mode_text = "병렬" if mode == "parallel" else "순차"
+        mode_text = {"parallel": "병렬", "queue": "작업 큐"}.get(mode, "순차")
         db_text = "" if update_menu_links else ", DB 업데이트 스킵"
         test_text = f" [테스트: ID {url_ids}]" if url_ids else ""
         logger.info(f"✅ Daily Crawling task created: {task_id} ({len(urls)} URLs, {mode_text} 모드{db_text}{test_text})")
@@ -737,13 +850,25 @@ async def get_daily_crawl_stats():
 
 @router.get("/daily-crawling/download", tags=["daily-crawling"])
 async def download_daily_crawl_result(file: str = Query(..., description="JSON 파일 경로")):
-    """Daily Crawling 결과 JSON 파일 다운로드"""
+    """Daily Crawling 결과 JSON 파일 다운로드 (스냅샷 저장소 우선, 이전 result 디렉토리 파일 호환)"""
     from pathlib import Path
     from fastapi.responses import FileResponse
     
     try:
         if not settings.allow_daily_crawling:
             raise HTTPException(status_code=403, detail="비활성화된 기능입니다.")
+        
+        # 스냅샷 저장소: 파일명(data_....json) 또는 실행 ID로 조회
+        file_name = Path(file).name
+        output = await asyncio.to_thread(snapshot_store.find_output, file_name)
+        if output and output.get("hash"):
+            content = await asyncio.to_thread(snapshot_store.get, output["hash"])
+            if content is not None:
+                return Response(
+                    content=content,
+                    media_type="application/json",
+                    headers={"Content-Disposition": f'attachment; filename="{output.get("name") or file_name}"'}
+                )
             
         # 보안: 경로 검증 (result 디렉토리 내 파일만 허용)
         result_dir = Path(__file__).parent.parent / "application" / "crawler" / "result"
@@ -784,18 +909,44 @@ async def get_daily_crawl_tasks(limit: int = Query(10, ge=1, le=100)):
     try:
         if not settings.allow_daily_crawling:
             raise HTTPException(status_code=403, detail="비활성화된 기능입니다.")
-        return daily_crawling_service.get_tasks(limit=limit)
+        return await daily_crawling_service.get_tasks(limit=limit)
     except Exception as e:
         logger.error(f"Daily Crawling tasks retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=f"태스크 목록 조회 실패: {str(e)}")
 
 
+@router.get("/daily-crawling/checkpoints", response_model=List[DailyCrawlCheckpoint], tags=["daily-crawling"])
+async def get_daily_crawl_checkpoints():
+    """재개 가능한(실패/중단된) Daily Crawling 실행 목록"""
+    try:
+        if not settings.allow_daily_crawling:
+            raise HTTPException(status_code=403, detail="비활성화된 기능입니다.")
+        return [
+            DailyCrawlCheckpoint(
+                task_id=manifest["task_id"],
+                status=manifest.get("status", ""),
+                total_urls=len(manifest.get("url_ids", [])),
+                mode=manifest.get("options", {}).get("mode"),
+                resume_count=manifest.get("resume_count", 0),
+                error=manifest.get("error"),
+                created_at=manifest.get("created_at"),
+                updated_at=manifest.get("updated_at"),
+            )
+            for manifest in daily_crawling_service.get_resumable_runs()
+        ]
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Daily Crawling checkpoints retrieval failed: {e}")
+        raise HTTPException(status_code=500, detail=f"체크포인트 목록 조회 실패: {str(e)}")
+
+
 # Dynamic paths (/{task_id}) must come AFTER static paths
 @router.get("/daily-crawling/{task_id}", response_model=TaskResult, tags=["daily-crawling"])
 async def get_daily_crawl_task(task_id: str = Path(..., description="Task ID")):
     """Daily Crawling 태스크 상태 조회"""
     try:
-        task = daily_crawling_service.get_task(task_id)
+        task = await daily_crawling_service.get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
         
@@ -808,18 +959,50 @@ async def get_daily_crawl_task(task_id: str = Path(..., description="Task ID")):
         raise HTTPException(status_code=500, detail=f"Daily Crawling 작업 조회 실패: {str(e)}")
 
 
+@router.post("/daily-crawling/{task_id}/resume", response_model=DailyCrawlTaskResponse, tags=["daily-crawling"])
+async def resume_daily_crawl_task(task_id: str = Path(..., description="Task ID")):
+    """실패했거나 중단된 Daily Crawling 실행 재개 (체크포인트에 완료된 URL은 건너뜀)"""
+    try:
+        if not settings.allow_daily_crawling:
+            raise HTTPException(status_code=403, detail="데일리 크롤링 기능은 이 환경에서 비활성화되어 있습니다.")
+        
+        if not mcp_service.is_connected:
+            raise HTTPException(status_code=503, detail="MCP 서버에 연결되지 않음")
+        
+        try:
+            resumed = await daily_crawling_service.resume_task(task_id)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        
+        remaining = resumed["total_urls"] - resumed["restored_urls"]
+        return DailyCrawlTaskResponse(
+            task_id=task_id,
+            total_urls=resumed["total_urls"],
+            message=f"Daily Crawling 재개: {resumed['restored_urls']}개 URL 복원, {remaining}개 URL 크롤링"
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Daily Crawling resume failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Daily Crawling 재개 실패: {str(e)}")
+
+
 @router.get("/daily-crawling/{task_id}/stream", tags=["daily-crawling"])
-async def stream_daily_crawl_task(task_id: str = Path(..., description="Task ID")):
+async def stream_daily_crawl_task(
+    request: Request,
+    task_id: str = Path(..., description="Task ID")
+):
     """Daily Crawling 태스크 SSE 스트림"""
     try:
-        task = daily_crawling_service.get_task(task_id)
+        task = await daily_crawling_service.get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
         
         logger.info(f"🎯 Daily Crawling SSE stream requested: {task_id}")
         
         return StreamingResponse(
-            daily_crawling_service.get_task_stream(task_id),
+            daily_crawling_service.get_task_stream(task_id, _parse_last_event_id(request)),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -834,3 +1017,32 @@ async def stream_daily_crawl_task(task_id: str = Path(..., description="Task ID"
     except Exception as e:
         logger.error(f"Daily Crawling SSE stream failed: {e}")
         raise HTTPException(status_code=500, detail=f"Daily Crawling 스트림 생성 실패: {str(e)}")
+
+
+# === Snapshot Endpoints ===
+
+@router.get("/snapshots/runs", tags=["snapshots"])
+async def get_snapshot_runs(kind: Optional[str] = Query(None, description="daily / rag")):
+    """스냅샷 저장소의 실행 목록 (최근 순)"""
+    return await asyncio.to_thread(snapshot_store.list_runs, kind)
+
+
+@router.get("/snapshots/runs/{run_id}", tags=["snapshots"])
+async def get_snapshot_run(run_id: str = Path(..., pattern=r"^[A-Za-z0-9_-]+$")):
+    """실행 manifest 조회 (URL별 html/markdown/processed 해시 포함)"""
+    manifest = await asyncio.to_thread(snapshot_store.load_run, run_id)
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="스냅샷 실행을 찾을 수 없습니다")
+    return manifest
+
+
+@router.get("/snapshots/blobs/{digest}", tags=["snapshots"])
+async def get_snapshot_blob(digest: str = Path(..., pattern=r"^[0-9a-f]{64}$")):
+    """해시로 저장된 원본 내용 조회"""
+    try:
+        content = await asyncio.to_thread(snapshot_store.get, digest)
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if content is None:
+        raise HTTPException(status_code=404, detail="스냅샷을 찾을 수 없습니다")
+    return Response(content=content, media_type="text/plain; charset=utf-8")
@@ -47,6 +47,11 @@ async def init_database():
     from app.domains.menu.entities.menu_link import MenuLink
     from app.domains.menu.entities.menu_manager import MenuManagerInfo
     from app.domains.crawler.entities.input_url import InputUrl
+    from app.domains.crawler.entities.crawl_task import CrawlTask
+    from app.domains.crawler.entities.crawl_run import CrawlRun
+    from app.domains.crawler.entities.crawl_work_item import CrawlWorkItem
+    from app.domains.crawler.entities.url_revisit_state import UrlRevisitState
+    from app.domains.crawler.entities.canonical_url import CanonicalUrl
     
     async with engine.begin() as conn:
         # Create tables if they don't exist
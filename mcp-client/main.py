@@ -10,6 +10,10 @@ from app.infrastructure.mcp.mcp_service import mcp_service
 from app.routers.api import router as api_router
 from app.shared.database.base import init_database, close_database
 from app.application.rag.rag_service import rag_service
+from app.application.ari.ari_service import ari_service
+from app.application.crawler.crawling_service import crawling_service
+from app.application.crawler.daily_crawling_service import daily_crawling_service
+from app.domains.crawler.repositories.crawl_work_queue_repository import crawl_work_queue_repository
 
 # Setup logging
 setup_logging()
@@ -25,6 +29,13 @@ async def lifespan(app: FastAPI):
         await init_database()
         logger.info("Database initialized successfully")
         
+        # 이전 프로세스에서 중단된 태스크 정리 + 실행 중 태스크 heartbeat 시작
+        await crawling_service.store.start()
+        await daily_crawling_service.store.start()
+        
+        # 조정 프로세스가 죽은 작업 큐 실행 정리 (워커가 더 이상 처리하지 않도록)
+        await crawl_work_queue_repository.fail_expired_runs()
+        
         # Initialize MCP service
         await mcp_service.initialize()
         logger.info("MCP service initialized successfully")
@@ -32,6 +43,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize core services: {e}")
     
+    # Daily Crawling 작업 큐 워커 (다른 인스턴스가 만든 실행에도 참여)
+    if settings.allow_daily_crawling and settings.crawl_queue_worker_enabled:
+        daily_crawling_service.queue_worker.start()
+    
     # Initialize RAG service separately (optional)
     try:
         logger.info("Starting RAG service initialization...")
@@ -58,6 +73,16 @@ async def lifespan(app: FastAPI):
         await mcp_service.shutdown()
         logger.info("MCP service shutdown completed")
         
+        ari_service.shutdown()
+        logger.info("ARI process pool shutdown completed")
+        
+        await daily_crawling_service.queue_worker.stop()
+        logger.info("Crawl queue worker stopped")
+        
+        await crawling_service.store.close()
+        await daily_crawling_service.store.close()
+        logger.info("Crawl task stores flushed")
+        
         await close_database()
         logger.info("Database connections closed")
     except Exception as e:
@@ -7,6 +7,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import httpx
 import logging
+import os
 from urllib.parse import urljoin, urlparse
 import re
 
@@ -62,6 +63,488 @@ def health_check() -> Dict[str, Any]:
     }
 
 
+# ============================================================================
+# NETWORK RESOURCE BLOCKING (Playwright / crawl4ai 공용 요청 가로채기)
+# ============================================================================
+# CRAWLER_RESOURCE_BLOCKING=false 로 비활성화
+# CRAWLER_BLOCKED_RESOURCE_TYPES / CRAWLER_BLOCKED_HOSTS: 콤마 구분 목록
+# CRAWLER_RESOURCE_RULES: 사이트 도메인별 JSON 규칙
+#   예) {"shop.kt.com": {"allow_types": ["image"], "block_hosts": ["cdn.example.com"]}}
+
+def _env_list(name: str, default: str) -> frozenset:
+    return frozenset(v.strip().lower() for v in os.getenv(name, default).split(',') if v.strip())
+
+
+_RESOURCE_BLOCKING_ENABLED = os.getenv("CRAWLER_RESOURCE_BLOCKING", "true").lower() not in ("false", "0", "no")
+_BLOCKED_RESOURCE_TYPES = _env_list("CRAWLER_BLOCKED_RESOURCE_TYPES", "image,media,font")
+_BLOCKED_HOSTS = _env_list(
+    "CRAWLER_BLOCKED_HOSTS",
+    "google-analytics.com,googletagmanager.com,doubleclick.net,googlesyndication.com,"
+    "googleadservices.com,facebook.net,analytics.tiktok.com,wcs.naver.net",
+)
+try:
+    _RESOURCE_RULES: Dict[str, Dict[str, List[str]]] = {
+        domain.lower(): rule for domain, rule in json.loads(os.getenv("CRAWLER_RESOURCE_RULES") or "{}").items()
+    }
+except ValueError as e:
+    logger.warning(f"CRAWLER_RESOURCE_RULES 파싱 실패, 도메인별 규칙 미사용: {e}")
+    _RESOURCE_RULES = {}
+_resource_site_cache: Dict[str, Any] = {}
+
+
+def _resource_host_matches(host: str, domains: frozenset) -> bool:
+    if host in domains:
+        return True
+    parts = host.split('.')
+    return any('.'.join(parts[i:]) in domains for i in range(1, len(parts) - 1))
+
+
+def _resource_site_rules(site_host: str):
+    """사이트 호스트에 가장 구체적으로 매칭되는 도메인 규칙을 전역 규칙과 합성 (차단 타입, 차단 호스트, 허용 호스트)"""
+    resolved = _resource_site_cache.get(site_host)
+    if resolved is None:
+        matched = [d for d in _RESOURCE_RULES if site_host == d or site_host.endswith('.' + d)]
+        rule = _RESOURCE_RULES[max(matched, key=len)] if matched else {}
+        values = lambda key: frozenset(v.strip().lower() for v in rule.get(key, []) if v.strip())
+        resolved = (
+            (_BLOCKED_RESOURCE_TYPES - values('allow_types')) | values('block_types'),
+            _BLOCKED_HOSTS | values('block_hosts'),
+            values('allow_hosts'),
+        )
+        _resource_site_cache[site_host] = resolved
+    return resolved
+
+
+def _resource_block_reason(resource_type: str, request_host: str, site_host: str) -> Optional[str]:
+    if resource_type == 'document':
+        return None
+    blocked_types, blocked_hosts, allowed_hosts = _resource_site_rules(site_host)
+    if allowed_hosts and _resource_host_matches(request_host, allowed_hosts):
+        return None
+    if blocked_hosts and _resource_host_matches(request_host, blocked_hosts):
+        return 'host'
+    if resource_type in blocked_types:
+        return 'type'
+    return None
+
+
+def _new_resource_stats() -> Dict[str, Any]:
+    return {"blocked_requests": 0, "allowed_requests": 0, "transferred_bytes": 0, "blocked_by_type": {}}
+
+
+async def _apply_resource_blocking(target, stats: Dict[str, Any]) -> None:
+    """BrowserContext 또는 Page에 리소스 차단 route와 응답 통계 수집 적용"""
+    if not _RESOURCE_BLOCKING_ENABLED:
+        return
+
+    def host_of(u: str) -> str:
+        try:
+            return (urlparse(u).hostname or '').lower()
+        except ValueError:
+            return ''
+
+    async def handle_route(route):
+        request = route.request
+        try:
+            try:
+                page_url = request.frame.page.url
+            except Exception:
+                page_url = ''
+            site_host = host_of(page_url) if page_url.startswith('http') else host_of(request.url)
+            if _resource_block_reason(request.resource_type, host_of(request.url), site_host):
+                stats["blocked_requests"] += 1
+                by_type = stats["blocked_by_type"]
+                by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+                await route.abort('blockedbyclient')
+            else:
+                await route.continue_()
+        except Exception as e:
+            logger.debug(f"리소스 route 처리 실패 (무시): {request.url} - {e}")
+
+    def on_response(response):
+        try:
+            stats["allowed_requests"] += 1
+            content_length = response.headers.get('content-length')
+            if content_length and content_length.isdigit():
+                stats["transferred_bytes"] += int(content_length)
+        except Exception:
+            pass
+
+    await target.route("**/*", handle_route)
+    target.on("response", on_response)
+
+
+
+# ============================================================================
+# READINESS WAIT (고정 delay 대신 준비 상태 기반 대기)
+# ============================================================================
+# CRAWL_WAIT_STRATEGY: dom_quiet | network_idle | selector_stable | fixed | none
+# CRAWL_WAIT_QUIET_MS: 변경/요청이 없어야 하는 시간 (ms)
+# CRAWL_WAIT_NETWORK_IGNORE: network_idle에서 무시할 URL 부분 문자열 (콤마 구분)
+# 모든 전략은 기존 고정 delay를 상한으로 하므로 기존보다 느려지지 않습니다.
+
+_WAIT_STRATEGIES = ("dom_quiet", "network_idle", "selector_stable", "fixed", "none")
+_WAIT_DEFAULT_STRATEGY = os.getenv("CRAWL_WAIT_STRATEGY", "dom_quiet").lower()
+_WAIT_QUIET_MS = int(os.getenv("CRAWL_WAIT_QUIET_MS", "500"))
+_WAIT_NETWORK_IGNORE = sorted(_env_list(
+    "CRAWL_WAIT_NETWORK_IGNORE",
+    "google-analytics,googletagmanager,doubleclick,/log,beacon,/collect,polling",
+))
+
+# crawl4ai wait_for("js:...")용 조건 함수 (100ms 간격으로 호출됨)
+# 상한(capMs)에 도달하면 true를 반환하여 타임아웃 오류 없이 진행합니다.
+_WAIT_PREDICATE_JS = """() => {
+    const [mode, capMs, quietMs, selector, ignore] = %s;
+    let s = window.__cmReadyWait;
+    if (!s) {
+        s = window.__cmReadyWait = { start: Date.now(), last: Date.now(), n: -1 };
+        if (mode === 'dom_quiet') {
+            new MutationObserver(() => { s.last = Date.now(); })
+                .observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+        }
+    }
+    const now = Date.now();
+    if (now - s.start >= capMs) return true;
+    if (mode === 'dom_quiet') return now - s.last >= quietMs;
+    let n;
+    if (mode === 'network_idle') {
+        n = performance.getEntriesByType('resource')
+            .filter(e => !ignore.some(p => e.name.toLowerCase().includes(p))).length;
+    } else {
+        n = document.querySelectorAll(selector).length;
+    }
+    if (n !== s.n) { s.n = n; s.last = now; return false; }
+    return (mode === 'network_idle' || n > 0) && now - s.last >= quietMs;
+}"""
+
+
+def _resolve_wait_strategy(strategy: Optional[str], selector: Optional[str]) -> str:
+    name = (strategy or _WAIT_DEFAULT_STRATEGY or "fixed").lower()
+    if name not in _WAIT_STRATEGIES:
+        logger.warning(f"알 수 없는 wait_strategy '{name}', 'fixed'로 대체")
+        return "fixed"
+    if name == "selector_stable" and not selector:
+        return "dom_quiet"
+    return name
+
+
+def _wait_run_options(strategy: str, cap_seconds: float, selector: Optional[str] = None) -> Dict[str, Any]:
+    """
+    CrawlerRunConfig 대기 옵션 생성 (wait_for / delay_before_return_html)
+
+    fixed는 기존 고정 delay, none은 대기 없음, 나머지는 JS 조건 함수로 최대 cap_seconds까지 대기합니다.
+    """
+    if strategy == "fixed":
+        return {"delay_before_return_html": cap_seconds}
+    if strategy == "none" or cap_seconds <= 0:
+        return {"delay_before_return_html": 0}
+    args = json.dumps([strategy, int(cap_seconds * 1000), _WAIT_QUIET_MS, selector or "", _WAIT_NETWORK_IGNORE])
+    return {
+        "wait_for": "js:" + _WAIT_PREDICATE_JS % args,
+        "delay_before_return_html": 0,
+    }
+
+
+# ============================================================================
+# DOM PRUNING (브라우저 안에서 문서 복제본의 불필요한 요소 제거)
+# ============================================================================
+# CRAWLER_DOM_PRUNING=false 로 비활성화 (Python 정제로 대체)
+# CRAWLER_PRUNE_SELECTORS: 제거할 CSS 셀렉터 (콤마 구분, 기본값은 아래 목록)
+# CRAWLER_PRUNE_RULES: 사이트 도메인별 JSON 규칙
+#   예) {"shop.kt.com": {"keep": [".banner"], "remove": [".event-timer"]}}
+# script/style/noscript/inline svg는 항상 제거합니다.
+# 주입 스크립트 한 번으로 제거하므로 정제(_clean_html_to_markdown)에서 셀렉터별 BeautifulSoup 순회를 생략합니다.
+# 페이지 자체는 바꾸지 않으므로 응답의 html_content(메타데이터 추출용)는 원본 그대로이고,
+# include_selector 영역과 그 상위 요소는 제거하지 않습니다.
+
+_DEFAULT_PRUNE_SELECTORS = (
+    "#cfmClHeader,#cfmClFooter,#cfmClSkip,"
+    ".header,.footer,.header-area,.footer-area,"
+    ".nav,.navigation,.sidebar,.advertisement,"
+    ".banner,.popup,.modal,.overlay,.sns-share,.sns-list,"
+    ".sns.twitter,.sns.facebook,.sns.kakao,.sns.youtube,"
+    ".swiper-controls-wrapper,.opage-hashtag-arrow,.swiper-button-next,.swiper-button-prev,"
+    ".icon.kakao,.icon.facebook,.icon.twitter,.icon.youtube,"
+    ".btn-twitter,.btn-facebook,.btn-kakao,.btn-youtube,"
+    ".location,.sns-area,.opener,a[onclick*='KT_trackClicks'],"
+    ".find-center,"
+    ".N-compare-suggest-list,.top-three-box,"
+    "#kt_mb,.kt_mb,.sticky,.quickMenu,#kt-head,.kt-head,"
+    ".bnr_info,.share_wrap,#popupVideo,#popupVideoNo,#popupShortsNo,#popupDownload,#popupConsulting,"
+    "[style*='display:none'],.invisible,.layerPop"
+)
+_DOM_PRUNING_ENABLED = os.getenv("CRAWLER_DOM_PRUNING", "true").lower() not in ("false", "0", "no")
+# 셀렉터 안의 콤마(:is(a, b) 등)는 지원하지 않음 - 셀렉터 단위로 분리
+_PRUNE_SELECTORS = [
+    sel.strip() for sel in os.getenv("CRAWLER_PRUNE_SELECTORS", _DEFAULT_PRUNE_SELECTORS).split(',') if sel.strip()
+]
+try:
+    _PRUNE_RULES: Dict[str, Dict[str, List[str]]] = {
+        domain.lower(): rule for domain, rule in json.loads(os.getenv("CRAWLER_PRUNE_RULES") or "{}").items()
+    }
+except ValueError as e:
+    logger.warning(f"CRAWLER_PRUNE_RULES 파싱 실패, 도메인별 규칙 미사용: {e}")
+    _PRUNE_RULES = {}
+_prune_site_cache: Dict[str, List[str]] = {}
+
+# 제거 스크립트: [셀렉터 목록, include 셀렉터] - 문서 복제본에서 제거하고 제거 수와 정리된 HTML 반환 (페이지는 그대로)
+# include 영역이 있으면 그 영역을 감싸거나 그 안에 있는 요소는 셀렉터 규칙으로 제거하지 않음
+_PRUNE_DOM_JS = """([selectors, include]) => {
+    const root = document.documentElement.cloneNode(true);
+    let region = null;
+    if (include) { try { region = root.querySelector(include); } catch (e) { region = null; } }
+    let removed = 0;
+    const drop = (sel, guarded) => {
+        let nodes;
+        try { nodes = root.querySelectorAll(sel); } catch (e) { return; }
+        for (const el of nodes) {
+            if (el === root || !root.contains(el)) continue;
+            if (guarded && region && (el.contains(region) || region.contains(el))) continue;
+            el.remove(); removed++;
+        }
+    };
+    ['script', 'style', 'noscript', 'svg'].forEach((sel) => drop(sel, false));
+    selectors.forEach((sel) => drop(sel, true));
+    const doctype = document.doctype ? '<!DOCTYPE ' + document.doctype.name + '>' : '';
+    return { removed, html: doctype + root.outerHTML };
+}"""
+
+
+def _include_css(include_selector: Optional[str]) -> Optional[str]:
+    """include_selector를 CSS 셀렉터로 변환 (셀렉터 형태가 아니면 id로 간주)"""
+    if not include_selector:
+        return None
+    return include_selector if include_selector.startswith(('#', '.', '[', ':')) else f"#{include_selector}"
+
+
+def _prune_selectors_for(url: str) -> List[str]:
+    """사이트 호스트에 가장 구체적으로 매칭되는 도메인 규칙을 기본 셀렉터와 합성"""
+    host = (urlparse(url).hostname or "").lower()
+    selectors = _prune_site_cache.get(host)
+    if selectors is None:
+        matched = [d for d in _PRUNE_RULES if host == d or host.endswith('.' + d)]
+        rule = _PRUNE_RULES[max(matched, key=len)] if matched else {}
+        keep = set(rule.get("keep", []))
+        selectors = [sel for sel in _PRUNE_SELECTORS if sel not in keep] + list(rule.get("remove", []))
+        _prune_site_cache[host] = selectors
+    return selectors
+
+
+async def _prune_page(page, url: str, include_selector: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    문서 복제본에서 불필요한 요소 제거 ({removed, html} 반환, 비활성화/실패 시 None)
+
+    페이지는 변경하지 않으므로 호출자에게 돌려주는 html_content는 원본 그대로 유지됩니다.
+    include_selector 영역과 그 상위 요소는 제거하지 않습니다.
+    실패하면 Python 정제가 같은 셀렉터를 처리합니다.
+    """
+    if not _DOM_PRUNING_ENABLED:
+        return None
+    try:
+        result = await page.evaluate(_PRUNE_DOM_JS, [_prune_selectors_for(url), _include_css(include_selector)])
+        return {"removed": int(result.get("removed", 0)), "html": result.get("html") or ""}
+    except Exception as e:
+        logger.warning(f"DOM pruning 실패 (Python 정제로 진행): {e}")
+        return None
+
+
+# ============================================================================
+# BOILERPLATE TEMPLATE LEARNING (호스트별 반복 DOM 서브트리 학습/제거)
+# ============================================================================
+# 같은 호스트의 여러 페이지에서 그대로 반복되는 서브트리(GNB/푸터/퀵메뉴/공유 영역 등)를
+# 구조 해시로 찾아 한 번의 순회로 제거합니다. 셀렉터 목록에 없는 영역이나 레이아웃이 바뀐 뒤에도 동작합니다.
+# 학습 결과에 따라 같은 페이지의 추출 결과가 달라질 수 있어 기본은 비활성화 (CRAWLER_TEMPLATE_LEARNING=true 로 활성화)
+# CRAWLER_TEMPLATE_DIR: 호스트별 학습 결과 저장 경로 (실행 간 유지)
+# CRAWLER_TEMPLATE_WINDOW: 호스트별로 기억할 최근 페이지(URL) 수
+# CRAWLER_TEMPLATE_MIN_PAGES: 제거를 시작할 최소 페이지 수
+# CRAWLER_TEMPLATE_RATIO: 최근 페이지 중 이 비율 이상에 나타난 서브트리를 템플릿으로 판단
+
+_TEMPLATE_LEARNING_ENABLED = os.getenv("CRAWLER_TEMPLATE_LEARNING", "false").lower() in ("true", "1", "yes")
+_TEMPLATE_DIR = os.getenv("CRAWLER_TEMPLATE_DIR", "data/boilerplate_templates")
+_TEMPLATE_WINDOW = int(os.getenv("CRAWLER_TEMPLATE_WINDOW", "50"))
+_TEMPLATE_MIN_PAGES = int(os.getenv("CRAWLER_TEMPLATE_MIN_PAGES", "3"))
+_TEMPLATE_RATIO = float(os.getenv("CRAWLER_TEMPLATE_RATIO", "0.6"))
+_TEMPLATE_MIN_TEXT = 20  # 후보 서브트리 최소 텍스트 길이 (짧은 제목/버튼 단독은 제외)
+_TEMPLATE_MAX_STRIP_RATIO = 0.8  # 제거될 텍스트가 이 비율을 넘으면 오탐으로 보고 제거하지 않음
+_TEMPLATE_SAVE_EVERY = 10  # 새 페이지 N개마다 디스크에 저장
+_TEMPLATE_PROTECTED_TAGS = frozenset({"html", "head", "body", "title", "main", "article"})
+
+
+def _subtree_hashes(root) -> Dict[int, tuple]:
+    """
+    서브트리 구조 해시 (post-order 한 번 순회)
+
+    태그명/id/class/텍스트와 자식 해시로 계산하므로 내용까지 같은 서브트리만 같은 해시를 가집니다.
+    반환: id(tag) → (해시, 텍스트 길이, 요소 수)
+    """
+    import hashlib
+    from bs4 import Comment, NavigableString, Tag
+
+    info: Dict[int, tuple] = {}
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if not visited:
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children if isinstance(child, Tag))
+            continue
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(f"<{node.name}#{node.get('id') or ''}.{'.'.join(node.get('class') or [])}>".encode())
+        text_len, elements = 0, 1
+        for child in node.children:
+            if isinstance(child, Tag):
+                child_hash, child_text, child_elements = info[id(child)]
+                digest.update(child_hash)
+                text_len += child_text
+                elements += child_elements
+            elif isinstance(child, NavigableString) and not isinstance(child, Comment):
+                text = " ".join(child.split())
+                if text:
+                    digest.update(text.encode())
+                    text_len += len(text)
+        info[id(node)] = (digest.digest(), text_len, elements)
+    return info
+
+
+def _is_template_candidate(tag, text_len: int, elements: int) -> bool:
+    return tag.name not in _TEMPLATE_PROTECTED_TAGS and text_len >= _TEMPLATE_MIN_TEXT and elements >= 2
+
+
+class _HostTemplate:
+    """호스트 하나의 최근 페이지별 후보 해시와 해시별 등장 페이지 수"""
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.pages: Dict[str, List[str]] = {}  # URL → 후보 해시(hex) 목록 (삽입 순서 = 최근 순서)
+        self.counts: Dict[str, int] = {}
+        self.unsaved = 0
+        self._template: Optional[frozenset] = None
+
+    @property
+    def path(self) -> str:
+        return os.path.join(_TEMPLATE_DIR, f"{re.sub(r'[^A-Za-z0-9.-]', '_', self.host)}.json")
+
+    def _add(self, url: str, hashes: List[str]) -> None:
+        for h in hashes:
+            self.counts[h] = self.counts.get(h, 0) + 1
+        self.pages[url] = hashes
+
+    def _remove(self, url: str) -> None:
+        for h in self.pages.pop(url, []):
+            remaining = self.counts.get(h, 0) - 1
+            if remaining > 0:
+                self.counts[h] = remaining
+            else:
+                self.counts.pop(h, None)
+
+    def observe(self, url: str, hashes: List[str]) -> None:
+        """페이지 후보 해시 기록 (같은 URL은 최신 결과로 교체, 오래된 페이지는 창 밖으로 제거)"""
+        self._remove(url)
+        self._add(url, hashes)
+        while len(self.pages) > _TEMPLATE_WINDOW:
+            self._remove(next(iter(self.pages)))
+        self._template = None
+        self.unsaved += 1
+
+    def template(self) -> frozenset:
+        """최근 페이지의 _TEMPLATE_RATIO 이상에 나타난 해시 (페이지가 부족하면 빈 집합)"""
+        if self._template is None:
+            pages = len(self.pages)
+            if pages < _TEMPLATE_MIN_PAGES:
+                self._template = frozenset()
+            else:
+                threshold = max(2, _TEMPLATE_RATIO * pages)
+                self._template = frozenset(h for h, count in self.counts.items() if count >= threshold)
+        return self._template
+
+    def load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"boilerplate 템플릿 로드 실패 ({self.host}): {e}")
+            return
+        for url, hashes in list(data.get("pages", {}).items())[-_TEMPLATE_WINDOW:]:
+            self._add(url, hashes)
+
+    def save(self) -> None:
+        try:
+            os.makedirs(_TEMPLATE_DIR, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"host": self.host, "updated_at": datetime.now().isoformat(), "pages": self.pages}, f)
+            os.replace(tmp_path, self.path)
+            self.unsaved = 0
+        except OSError as e:
+            logger.warning(f"boilerplate 템플릿 저장 실패 ({self.host}): {e}")
+
+
+_host_templates: Dict[str, _HostTemplate] = {}
+
+
+def _host_template(host: str) -> _HostTemplate:
+    template = _host_templates.get(host)
+    if template is None:
+        template = _HostTemplate(host)
+        template.load()
+        _host_templates[host] = template
+    return template
+
+
+def _save_host_templates() -> None:
+    """저장되지 않은 학습 결과 저장 (종료 시)"""
+    for template in _host_templates.values():
+        if template.unsaved:
+            template.save()
+
+
+def _strip_learned_boilerplate(soup, url: str) -> int:
+    """
+    soup에서 호스트 템플릿과 일치하는 서브트리 제거 (제거 수 반환)
+
+    이 페이지의 후보 해시를 먼저 학습에 반영한 뒤, 템플릿과 일치하는 가장 바깥 서브트리만 제거합니다.
+    """
+    from bs4 import Tag
+
+    host = (urlparse(url).hostname or "").lower()
+    if not _TEMPLATE_LEARNING_ENABLED or not host:
+        return 0
+    root = soup.body or soup
+    info = _subtree_hashes(root)
+    candidates = {
+        info[id(tag)][0].hex()
+        for tag in root.find_all(True)
+        if _is_template_candidate(tag, info[id(tag)][1], info[id(tag)][2])
+    }
+    page_key = url.split("#", 1)[0]
+    template = _host_template(host)
+    template.observe(page_key, sorted(candidates))
+    if template.unsaved >= _TEMPLATE_SAVE_EVERY:
+        template.save()
+    learned = template.template()
+    if not learned:
+        return 0
+
+    # 템플릿과 일치하는 가장 바깥 서브트리 수집 (일치하면 하위는 탐색하지 않음)
+    matched, stack = [], [child for child in root.children if isinstance(child, Tag)]
+    while stack:
+        tag = stack.pop()
+        digest, text_len, elements = info[id(tag)]
+        if digest.hex() in learned and _is_template_candidate(tag, text_len, elements):
+            matched.append((tag, text_len))
+        else:
+            stack.extend(child for child in tag.children if isinstance(child, Tag))
+    stripped_text = sum(text_len for _, text_len in matched)
+    total_text = info[id(root)][1]
+    if total_text and stripped_text > _TEMPLATE_MAX_STRIP_RATIO * total_text:
+        logger.info(f"boilerplate 제거 생략 ({host}): 텍스트 {stripped_text}/{total_text}자가 템플릿과 일치 (오탐 의심)")
+        return 0
+    for tag, _ in matched:
+        tag.decompose()
+    return len(matched)
+
 async def _crawl_with_playwright(url: str) -> Dict[str, Any]:
     """
     Playwright를 사용한 폴백 크롤링 함수
@@ -72,35 +555,28 @@ async def _crawl_with_playwright(url: str) -> Dict[str, Any]:
             browser = await p.chromium.launch(headless=True)
             try:
                 page = await browser.new_page()
+                resource_stats = _new_resource_stats()
+                await _apply_resource_blocking(page.context, resource_stats)
                 await page.goto(url, wait_until="domcontentloaded", timeout=30000)
                 
+                # 불필요한 요소는 브라우저 안에서 문서 복제본으로 제거 (원본 HTML은 그대로 반환)
+                pruned = await _prune_page(page, url)
+                pruned_elements = pruned["removed"] if pruned else None
+                
                 # 기본 정보 추출
                 title = await page.title()
                 html_content = await page.content()
                 
                 # markdownify를 사용한 마크다운 변환
-                markdown_text = ""
-                try:
-                    from bs4 import BeautifulSoup
-                    from markdownify import markdownify as md
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # 불필요한 요소 제거
-                    for sel in [
-                        "#cfmClHeader", "#cfmClFooter", "#cfmClSkip", ".header", ".footer",
-                        ".navigation", ".sidebar", ".banner", ".popup", ".overlay", ".sns-area",
-                    ]:
-                        for el in soup.select(sel):
-                            el.decompose()
-                    for t in soup(["script", "style", "noscript"]):
-                        t.decompose()
-                    
-                    cleaned_html = str(soup)
-                    markdown_text = md(cleaned_html, heading_style="ATX")
-                except Exception as me:
-                    logger.warning(f"Playwright markdown 변환 실패: {me}")
+                if pruned:
+                    markdown_text = _clean_html_to_markdown(pruned["html"], None, None, url)
+                else:
+                    markdown_text = _clean_html_to_markdown(html_content, None, _prune_selectors_for(url), url)
                 
-                logger.info(f"[MCP] Playwright 크롤링 완료: html={len(html_content)} chars, markdown={len(markdown_text)} chars")
+                logger.info(
+                    f"[MCP] Playwright 크롤링 완료: html={len(html_content)} chars, markdown={len(markdown_text)} chars, "
+                    f"blocked={resource_stats['blocked_requests']} requests"
+                )
                 return {
                     "success": True,
                     "url": url,
@@ -108,6 +584,8 @@ async def _crawl_with_playwright(url: str) -> Dict[str, Any]:
                     "html_content": html_content,
                     "markdown": markdown_text,
                     "status_code": 200,
+                    "resource_stats": resource_stats,
+                    "pruned_elements": pruned_elements,
                 }
             finally:
                 await browser.close()
@@ -120,21 +598,125 @@ async def _crawl_with_playwright(url: str) -> Dict[str, Any]:
             "error": f"Playwright 크롤링 실패: {str(e)}"
         }
 
+def _clean_html_to_markdown(
+    html_content: str,
+    include_selector: Optional[str] = None,
+    prune_selectors: Optional[List[str]] = None,
+    url: Optional[str] = None
+) -> str:
+    """
+    RAG용 정제: 헤더/푸터/네비게이션 등 제거 후 markdownify로 변환
+    (crawl4ai_scrape의 페이지 로드 결과와 호출자가 넘긴 렌더링 HTML에 공통 사용)
+
+    prune_selectors: 브라우저에서 제거하지 못한 HTML일 때 Python으로 제거할 셀렉터
+                     (None이면 DOM pruning으로 이미 정리된 HTML로 보고 변환만 수행)
+    url: 주면 호스트별로 학습한 반복 서브트리(boilerplate)도 제거
+    """
+    markdown_text = ""
+    try:
+        from bs4 import BeautifulSoup
+        from markdownify import markdownify as md
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # include_selector가 주어지면 해당 영역만 변환 대상으로 제한
+        if include_selector:
+            selected = soup.select_one(_include_css(include_selector))
+            if selected:
+                soup = BeautifulSoup(str(selected), 'html.parser')
+        
+        if prune_selectors is not None:
+            # 브라우저 DOM pruning과 같은 셀렉터 (숨김 요소/레이어 팝업 포함)
+            for sel in prune_selectors:
+                try:
+                    elements = soup.select(sel)
+                except Exception:
+                    continue
+                for el in elements:
+                    el.decompose()
+            for t in soup(["script", "style", "noscript", "svg"]):
+                t.decompose()
+        if url:
+            stripped = _strip_learned_boilerplate(soup, url)
+            if stripped:
+                logger.info(f"[MCP] 학습된 boilerplate {stripped}개 영역 제거: {url}")
+        cleaned_html = str(soup)
+        markdown_text = md(cleaned_html, heading_style="ATX")
+    except Exception as me:
+        logger.warning(f"markdown 변환 실패(무시): {me}")
+    return markdown_text
+
+
+def _scrape_payload_from_html(
+    url: str,
+    html_content: str,
+    include_selector: Optional[str] = None,
+    source: str = "provided",
+    pruned: bool = False,
+    status_code: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    페이지 로드 없이 주어진 HTML로 crawl4ai_scrape 결과 구성 (source: provided / partial)
+
+    pruned: 브라우저에서 DOM pruning을 거친 HTML 여부 (아니면 Python으로 같은 셀렉터 제거)
+    source가 partial이면 결과에 partial: True를 표시 (대기 조건 실패 등으로 완전히 렌더링되지 않았을 수 있음)
+    """
+    title = None
+    try:
+        from bs4 import BeautifulSoup
+        title_tag = BeautifulSoup(html_content, 'html.parser').title
+        title = title_tag.get_text(strip=True) if title_tag else None
+    except Exception as te:
+        logger.debug(f"title 추출 실패(무시): {te}")
+
+    prune_selectors = None if pruned else _prune_selectors_for(url)
+    markdown_text = _clean_html_to_markdown(html_content, include_selector, prune_selectors, url)
+    logger.info(
+        f"[MCP] crawl4ai_scrape reused {source} HTML without reload: "
+        f"html={len(html_content)} chars, markdown={len(markdown_text)} chars"
+    )
+    payload = {
+        "success": True,
+        "url": url,
+        "title": title,
+        "html_content": html_content,
+        "markdown": markdown_text,
+        "status_code": status_code,
+        "html_source": source,
+    }
+    if source == "partial":
+        payload["partial"] = True
+    return payload
+
+
 # ============================================================================
 # RAG CRAWLING TOOLS (일반 웹페이지 크롤링 및 정제)
 # ============================================================================
 
 @mcp.tool
-async def crawl4ai_scrape(url: str, include_selector: Optional[str] = None) -> Dict[str, Any]:
+async def crawl4ai_scrape(
+    url: str,
+    include_selector: Optional[str] = None,
+    wait_strategy: Optional[str] = None,
+    wait_selector: Optional[str] = None,
+    html_content: Optional[str] = None,
+    html_pruned: bool = False,
+) -> Dict[str, Any]:
     """
     RAG용 웹 크롤링: 불필요한 요소 제거 및 마크다운 변환
     - 헤더/푸터/네비게이션 등 제거하여 본문만 추출
     - markdownify로 깔끔한 텍스트 변환
     - 타임아웃 시 자동 재시도
+    - wait_strategy: dom_quiet | network_idle | selector_stable(wait_selector 필요) | fixed | none
+      (미지정 시 CRAWL_WAIT_STRATEGY, 기존 고정 delay가 대기 상한)
+    - html_content: 호출자가 이미 렌더링한 HTML (주면 페이지를 다시 로드하지 않고 정제만 수행)
+    - html_pruned: html_content가 호출자 브라우저에서 DOM pruning을 거쳤는지 여부
+    - 불필요한 요소는 브라우저 안에서 문서 복제본으로 제거해 마크다운 변환에 사용 (CRAWLER_DOM_PRUNING, html_content는 원본)
     - 성공 시: { success, url, title, html_content, markdown, status_code }
     - 실패 시: { success: False, url, error }
     """
     logger.info(f"[MCP] crawl4ai_scrape called for URL: {url}")
+    if html_content:
+        return _scrape_payload_from_html(url, html_content, include_selector, source="provided", pruned=html_pruned)
     try:
         try:
             from crawl4ai import AsyncWebCrawler
@@ -152,6 +734,30 @@ async def crawl4ai_scrape(url: str, include_selector: Optional[str] = None) -> D
         )
 
         crawler = AsyncWebCrawler(config=browser_config)
+        
+        # 페이지 컨텍스트 생성 시 리소스 차단 적용 (crawl4ai hook)
+        resource_stats = _new_resource_stats()
+        
+        async def on_page_context_created(page, context, **kwargs):
+            await _apply_resource_blocking(context, resource_stats)
+            return page
+        
+        # HTML을 읽기 직전 브라우저 안에서 복제본으로 불필요한 요소 제거 (crawl4ai hook, 정리된 HTML을 기록)
+        prune_state: Dict[str, Optional[Dict[str, Any]]] = {"pruned": None}
+        
+        async def before_retrieve_html(page, context=None, **kwargs):
+            prune_state["pruned"] = await _prune_page(page, url, include_selector)
+            return page
+        
+        try:
+            crawler.crawler_strategy.set_hook("on_page_context_created", on_page_context_created)
+        except Exception as he:
+            logger.warning(f"crawl4ai 리소스 차단 hook 설정 실패 (차단 없이 진행): {he}")
+        try:
+            crawler.crawler_strategy.set_hook("before_retrieve_html", before_retrieve_html)
+        except Exception as he:
+            logger.warning(f"crawl4ai DOM pruning hook 설정 실패 (Python 정제로 진행): {he}")
+        
         await crawler.start()
         try:
             # JavaScript 의존 사이트 감지 (확장된 목록)
@@ -161,6 +767,7 @@ async def crawl4ai_scrape(url: str, include_selector: Optional[str] = None) -> D
                 "linkedin.com", "reddit.com"
             ]
             is_js_heavy = any(d in url.lower() for d in js_heavy_domains)
+            strategy = _resolve_wait_strategy(wait_strategy, wait_selector)
             
             # 확장된 제외 셀렉터
             excluded_selector = (
@@ -185,7 +792,7 @@ async def crawl4ai_scrape(url: str, include_selector: Optional[str] = None) -> D
                 excluded_tags=['form', 'header', 'footer', 'nav'],
                 excluded_selector=excluded_selector,
                 wait_until="networkidle" if is_js_heavy else "domcontentloaded",
-                delay_before_return_html=12 if is_js_heavy else 6,
+                **_wait_run_options(strategy, 12 if is_js_heavy else 6, wait_selector),
                 simulate_user=is_js_heavy,
                 override_navigator=is_js_heavy,
                 page_timeout=120000,
@@ -213,18 +820,27 @@ async def crawl4ai_scrape(url: str, include_selector: Optional[str] = None) -> D
                         excluded_tags=['form', 'header', 'footer', 'nav'],
                         excluded_selector=excluded_selector,
                         wait_until="domcontentloaded",  # networkidle 대신 사용
-                        delay_before_return_html=3,  # 대기 시간 단축
+                        **_wait_run_options(strategy, 3, wait_selector),  # 대기 시간 단축
                         simulate_user=False,
                         override_navigator=False,
                         page_timeout=180000,  # 3분으로 타임아웃 증가
                     )
                     
+                    prune_state["pruned"] = None
                     result = await crawler.arun(url=url, config=retry_config)
                     if result.success:
                         logger.info(f"[MCP] 재시도 성공: {url}")
                 
             if not result.success:
                 logger.error(f"[MCP] crawl4ai 실패: {result.error_message}")
+                # 대기 조건 실패 등 HTTP 이외의 실패로 정상 응답(status < 400) 페이지 HTML을 받았으면
+                # 다시 렌더링하지 않고 사용 (HTTP 오류/응답 없음은 기존처럼 Playwright 폴백)
+                partial_html = result.html if isinstance(result.html, str) else ""
+                failed_status = getattr(result, 'status_code', None)
+                if partial_html.strip() and failed_status is not None and failed_status < 400:
+                    return _scrape_payload_from_html(
+                        url, partial_html, include_selector, source="partial", status_code=failed_status
+                    )
                 # 폴백: Playwright 시도
                 try:
                     return await _crawl_with_playwright(url)
@@ -248,54 +864,15 @@ async def crawl4ai_scrape(url: str, include_selector: Optional[str] = None) -> D
             if meta is not None:
                 title = getattr(meta, 'title', None)
 
-            markdown_text = ""
-            try:
-                from bs4 import BeautifulSoup
-                from markdownify import markdownify as md
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # include_selector가 주어지면 해당 영역만 변환 대상으로 제한
-                if include_selector:
-                    sel = include_selector if include_selector.startswith(('#', '.', '[', ':')) else f"#{include_selector}"
-                    selected = soup.select_one(sel)
-                    if selected:
-                        soup = BeautifulSoup(str(selected), 'html.parser')
-                
-                # 확장된 제외 셀렉터 목록 (crawl4ai_engine.py 참고)
-                excluded_selectors = [
-                    "#cfmClHeader", "#cfmClFooter", "#cfmClSkip",
-                    ".header", ".footer", ".header-area", ".footer-area",
-                    ".nav", ".navigation", ".sidebar", ".advertisement",
-                    ".banner", ".popup", ".modal", ".overlay", ".sns-share", ".sns-list",
-                    ".sns.twitter", ".sns.facebook", ".sns.kakao", ".sns.youtube",
-                    ".swiper-controls-wrapper", ".opage-hashtag-arrow", ".swiper-button-next", ".swiper-button-prev",
-                    ".icon.kakao", ".icon.facebook", ".icon.twitter", ".icon.youtube",
-                    ".btn-twitter", ".btn-facebook", ".btn-kakao", ".btn-youtube",
-                    ".location", ".sns-area", ".opener", "a[onclick*='KT_trackClicks']",
-                    ".find-center",
-                    ".N-compare-suggest-list", ".top-three-box",
-                    "#kt_mb", ".kt_mb", ".sticky", ".quickMenu", "#kt-head", ".kt-head",
-                    ".bnr_info", ".share_wrap", "#popupVideo", "#popupVideoNo", "#popupShortsNo", "#popupDownload", "#popupConsulting",
-                ]
-                for sel in excluded_selectors:
-                    for el in soup.select(sel):
-                        el.decompose()
-                
-                # 숨겨진 요소들 제거
-                for tag in soup.select('[style*="display:none"]'):
-                    tag.decompose()
-                for tag in soup.select('.invisible'):
-                    tag.decompose()
-                # 레이어 팝업 제거
-                for tag in soup.select('.layerPop'):
-                    tag.decompose()
-                    
-                for t in soup(["script", "style", "noscript"]):
-                    t.decompose()
-                cleaned_html = str(soup)
-                markdown_text = md(cleaned_html, heading_style="ATX")
-            except Exception as me:
-                logger.warning(f"markdown 변환 실패(무시): {me}")
+            # 마크다운은 브라우저에서 정리한 복제본으로 변환하고, html_content는 원본 그대로 반환
+            # include_selector가 있으면 브라우저는 그 영역을 건드리지 않으므로 영역 안은 Python으로 정리
+            pruned = prune_state["pruned"]
+            pruned_elements = pruned["removed"] if pruned else None
+            if pruned:
+                prune_selectors = _prune_selectors_for(url) if include_selector else None
+                markdown_text = _clean_html_to_markdown(pruned["html"], include_selector, prune_selectors, url)
+            else:
+                markdown_text = _clean_html_to_markdown(html_content, include_selector, _prune_selectors_for(url), url)
 
             payload = {
                 "success": True,
@@ -304,8 +881,13 @@ async def crawl4ai_scrape(url: str, include_selector: Optional[str] = None) -> D
                 "html_content": html_content,
                 "markdown": markdown_text,
                 "status_code": status_code,
+                "resource_stats": resource_stats,
+                "pruned_elements": pruned_elements,
             }
-            logger.info(f"[MCP] crawl4ai_scrape completed: html={len(html_content)} chars, markdown={len(markdown_text)} chars, title='{title}'")
+            logger.info(
+                f"[MCP] crawl4ai_scrape completed: html={len(html_content)} chars, markdown={len(markdown_text)} chars, "
+                f"title='{title}', blocked={resource_stats['blocked_requests']} requests, pruned={pruned_elements} elements"
+            )
             return payload
         finally:
             try:
@@ -721,61 +1303,93 @@ def _ari_extract_pagetree(pagetree_element) -> List[Dict[str, Any]]:
     return result
 
 
-def _ari_extract_clean_html(html_content: str) -> str:
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html_content, 'html.parser')
-    elements_to_remove = [
-        'header', 'footer', 'nav', 'aside', 'sidebar',
-        '.header', '.footer', '.nav', '.aside', '.sidebar',
-        '.navigation', '.menu',
-        'div.aui-page-header-actions', 'div.page-actions', 'div.aui-toolbar2',
-        'div.comment-container', 'div.like-button-container', 'div.page-labels',
-        'div.comment-actions', 'span.st-table-filter', 'svg',
-        'div.confluence-information-macro', 'div.aui-message', 'div.page-metadata-modification-info',
-        '.aui-page-header-actions', '.like-button-container', '.page-labels',
-        'div#page-metadata-banner', 'ul.banner',
-    ]
-    for selector in elements_to_remove:
-        for el in soup.select(selector):
+_ARI_ELEMENTS_TO_REMOVE = [
+    'header', 'footer', 'nav', 'aside', 'sidebar',
+    '.header', '.footer', '.nav', '.aside', '.sidebar',
+    '.navigation', '.menu',
+    'div.aui-page-header-actions', 'div.page-actions', 'div.aui-toolbar2',
+    'div.comment-container', 'div.like-button-container', 'div.page-labels',
+    'div.comment-actions', 'span.st-table-filter', 'svg',
+    'div.confluence-information-macro', 'div.aui-message', 'div.page-metadata-modification-info',
+    '.aui-page-header-actions', '.like-button-container', '.page-labels',
+    'div#page-metadata-banner', 'ul.banner',
+]
+# 셀렉터를 하나로 합쳐 트리를 한 번만 순회
+_ARI_ELEMENTS_TO_REMOVE_SELECTOR = ', '.join(_ARI_ELEMENTS_TO_REMOVE)
+
+
+def _ari_remove_excluded_elements(soup) -> None:
+    for el in soup.select(_ARI_ELEMENTS_TO_REMOVE_SELECTOR):
+        # 이미 제거된 상위 요소에 포함된 경우 건너뜀
+        if not el.decomposed:
             el.decompose()
 
-    result_parts: List[str] = []
-    title_element = soup.find('h1', {'id': 'title-text'})
-    if title_element:
-        result_parts.append(f"<h1>{title_element.decode_contents()}</h1>")
-    breadcrumb_element = soup.find('ol', {'id': 'breadcrumbs'})
-    if breadcrumb_element:
-        result_parts.append(f"<nav aria-label='이동 경로'>{breadcrumb_element.decode_contents()}</nav>")
-    else:
-        breadcrumb_alt = soup.find('div', class_='breadcrumbs')
-        if breadcrumb_alt:
-            result_parts.append(f"<nav aria-label='이동 경로'>{breadcrumb_alt.decode_contents()}</nav>")
 
+def _ari_find_main_content(soup):
     main_content = soup.find('div', {'id': 'main-content'})
     if not main_content:
         main_content = soup.find('div', {'class': 'wiki-content'})
     if not main_content:
         main_content = soup.find('main') or soup.find('body') or soup
-    if main_content:
-        try:
-            main_html = main_content.decode_contents() if hasattr(main_content, 'decode_contents') else str(main_content)
-            result_parts.append(main_html)
-        except Exception:
-            result_parts.append(str(main_content))
-    return '\n'.join(result_parts)
+    return main_content
 
 
-def _ari_parse_tables(root) -> Dict[str, Any]:
+def _ari_build_clean_fragment(soup):
+    """exclude 요소가 제거된 soup에서 제목/브레드크럼/main-content 정제 DOM 생성 (노드를 이동하므로 soup 변경)"""
+    import copy
     from bs4 import BeautifulSoup
+    fragment = BeautifulSoup('', 'html.parser')
+    parts = []
+    title_element = soup.find('h1', {'id': 'title-text'})
+    if title_element:
+        h1 = fragment.new_tag('h1')
+        h1.extend(list(copy.copy(title_element).contents))
+        parts.append(h1)
+    breadcrumb_element = soup.find('ol', {'id': 'breadcrumbs'})
+    if not breadcrumb_element:
+        breadcrumb_element = soup.find('div', class_='breadcrumbs')
+    if breadcrumb_element:
+        nav = fragment.new_tag('nav', attrs={'aria-label': '이동 경로'})
+        nav.extend(list(copy.copy(breadcrumb_element).contents))
+        parts.append(nav)
+    for part in parts:
+        fragment.append(part)
+        fragment.append('\n')
+    main_content = _ari_find_main_content(soup)
+    for child in list(main_content.contents):
+        fragment.append(child)
+    return fragment
+
+
+def _ari_extract_clean_html(html_content: str) -> str:
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_content, 'html.parser')
+    _ari_remove_excluded_elements(soup)
+    return _ari_build_clean_fragment(soup).decode()
+
+
+def _ari_parse_tables(root) -> Dict[str, Any]:
+    """셀 정보를 한 번만 읽는 배열 기반 그리드로 테이블 구조화 + 마크다운 생성 (AriService._parse_tables와 동일)"""
     structured: List[Dict[str, Any]] = []
     markdowns: List[str] = []
 
+    cell_cache: Dict[int, tuple] = {}
+    header_cell_cache: Dict[int, bool] = {}
+
     def extract_text(el) -> str:
         text = el.get_text(separator=' ', strip=True) or ''
         return text.strip()
 
-    def limit_text(text: str, limit: int = None) -> str:
-        return text if text else ""
+    def read_cell(cell) -> tuple:
+        info = cell_cache.get(id(cell))
+        if info is None:
+            info = (
+                extract_text(cell),
+                int(cell.get('rowspan', 1) or 1),
+                int(cell.get('colspan', 1) or 1),
+            )
+            cell_cache[id(cell)] = info
+        return info
 
     def get_table_rows(table_el) -> List[Any]:
         rows: List[Any] = []
@@ -785,241 +1399,241 @@ def _ari_parse_tables(root) -> Dict[str, Any]:
         rows.extend(table_el.find_all('tr', recursive=False))
         return rows
 
-    def build_grid(table_el) -> Dict[str, Any]:
-        rows = get_table_rows(table_el)
+    def build_grid(rows: List[Any]) -> Dict[str, Any]:
         grid: List[List[str]] = []
-        span_map: Dict[tuple, Dict[str, int]] = {}
+        cover_until: List[int] = []
         max_cols = 0
+
         for r_idx, tr in enumerate(rows):
-            if len(grid) <= r_idx:
-                grid.append([])
-            c_idx = 0
-            while (r_idx, c_idx) in span_map:
-                grid[r_idx].append('')
-                span_map[(r_idx, c_idx)]['remaining_rowspan'] -= 1
-                if span_map[(r_idx, c_idx)]['remaining_rowspan'] > 0:
-                    span_map[(r_idx + 1, c_idx)] = span_map[(r_idx, c_idx)].copy()
-                del span_map[(r_idx, c_idx)]
-                c_idx += 1
+            row: List[str] = []
+
+            while len(row) < len(cover_until) and cover_until[len(row)] >= r_idx:
+                row.append('')
+
             for cell in tr.find_all(['td', 'th'], recursive=False):
-                cell_text = extract_text(cell)
-                rowspan = int(cell.get('rowspan', 1) or 1)
-                colspan = int(cell.get('colspan', 1) or 1)
-                grid[r_idx].append(cell_text)
-                c_idx += 1
-                for _ in range(colspan - 1):
-                    grid[r_idx].append('')
-                    c_idx += 1
-                if rowspan > 1:
-                    for rs in range(1, rowspan):
-                        for cs in range(colspan):
-                            span_map[(r_idx + rs, (c_idx - colspan) + cs)] = {
-                                'text': cell_text,
-                                'remaining_rowspan': rowspan - rs
-                            }
-            max_cols = max(max_cols, len(grid[r_idx]))
-        for r in grid:
-            if len(r) < max_cols:
-                r.extend([''] * (max_cols - len(r)))
-        col_count = max_cols
-        used: List[bool] = [False] * col_count
+                cell_text, rowspan, colspan = read_cell(cell)
+                start = len(row)
+                row.append(cell_text)
+                if colspan > 1:
+                    row.extend([''] * (colspan - 1))
+
+                if rowspan > 1 and colspan > 0:
+                    last_row = r_idx + rowspan - 1
+                    end = start + colspan
+                    if len(cover_until) < end:
+                        cover_until.extend([-1] * (end - len(cover_until)))
+                    for c in range(start, end):
+                        if cover_until[c] < last_row:
+                            cover_until[c] = last_row
+
+            grid.append(row)
+            if len(row) > max_cols:
+                max_cols = len(row)
+
         for row in grid:
-            for idx, val in enumerate(row):
-                if idx < col_count and (val or '').strip():
-                    used[idx] = True
-        keep_indices = [i for i, u in enumerate(used) if u]
-        if keep_indices:
-            grid = [[row[i] for i in keep_indices] for row in grid]
+            if len(row) < max_cols:
+                row.extend([''] * (max_cols - len(row)))
+
+        columns = list(zip(*grid))
+        keep_indices = [i for i, column in enumerate(columns) if any(column)]
+        if keep_indices and len(keep_indices) < max_cols:
+            grid = [list(row) for row in zip(*[columns[i] for i in keep_indices])]
             max_cols = len(keep_indices)
+
         return {'grid': grid, 'cols': max_cols}
 
     def is_header_cell(cell) -> bool:
+        """셀이 헤더인지 판단 (셀별 캐시)"""
+        cached = header_cell_cache.get(id(cell))
+        if cached is not None:
+            return cached
+
+        result = False
         if cell.name == 'th':
-            return True
-        if cell.name == 'td':
+            result = True
+        elif cell.name == 'td':
             strong_tags = cell.find_all(['strong', 'b'])
             if strong_tags:
-                cell_text = extract_text(cell).strip()
-                strong_text = ' '.join(extract_text(tag).strip() for tag in strong_tags)
+                cell_text = read_cell(cell)[0]
+                strong_text = ' '.join(extract_text(tag) for tag in strong_tags)
                 if strong_text and len(strong_text) >= len(cell_text) * 0.7:
-                    return True
-            cell_classes = cell.get('class', [])
-            if any('highlight' in str(cls) for cls in cell_classes):
-                return True
-        return False
+                    result = True
+
+            if not result:
+                cell_classes = cell.get('class', [])
+                result = any('highlight' in str(cls) for cls in cell_classes)
 
-    def detect_headers(table_el, grid_obj) -> Dict[str, Any]:
+        header_cell_cache[id(cell)] = result
+        return result
+
+    def expand_header_row(cells) -> List[str]:
+        expanded: List[str] = []
+        for cell in cells:
+            info = cell_cache.get(id(cell))
+            if info is not None:
+                txt, span = info[0], info[2]
+            else:
+                txt, span = extract_text(cell), int(cell.get('colspan', 1) or 1)
+            if txt == '　':
+                txt = ''
+            expanded.extend([txt] * max(1, span))
+        return expanded
+
+    def detect_headers(table_el, thead, grid_obj) -> Dict[str, Any]:
         header_rows: List[List[str]] = []
-        thead = table_el.find('thead')
-        if thead and thead.find_all('tr'):
+
+        if thead is not None and thead.find('tr') is not None:
             for tr in thead.find_all('tr', recursive=False):
-                if tr.find_all(['th', 'td']):
-                    expanded: List[str] = []
-                    for cell in tr.find_all(['th', 'td'], recursive=False):
-                        txt = extract_text(cell)
-                        span = int(cell.get('colspan', 1) or 1)
-                        expanded.extend([txt] * max(1, span))
-                    header_rows.append(expanded)
+                if tr.find(['th', 'td']) is not None:
+                    header_rows.append(expand_header_row(tr.find_all(['th', 'td'], recursive=False)))
         else:
             body_rows: List[Any] = []
             for tbody in table_el.find_all('tbody', recursive=False):
                 body_rows.extend(tbody.find_all('tr', recursive=False))
             if not body_rows:
                 body_rows = table_el.find_all('tr', recursive=False)
-            max_scan = min(3, len(body_rows))
+
             collected = 0
-            for i, tr in enumerate(body_rows[:max_scan]):
+            for i, tr in enumerate(body_rows[:3]):
                 cells = tr.find_all(['th', 'td'], recursive=False)
                 if not cells:
                     continue
-                is_likely_header = False
-                if any(is_header_cell(c) for c in cells):
-                    is_likely_header = True
-                elif i == 0 and any(int(c.get('rowspan', 1) or 1) > 1 or int(c.get('colspan', 1) or 1) > 1 for c in cells):
-                    is_likely_header = True
+
+                is_likely_header = any(is_header_cell(c) for c in cells) or (
+                    i == 0 and any(read_cell(c)[1] > 1 or read_cell(c)[2] > 1 for c in cells)
+                )
+
                 if is_likely_header and collected < 3:
-                    expanded: List[str] = []
-                    for cell in cells:
-                        txt = extract_text(cell).strip()
-                        if txt == '　' or not txt:
-                            txt = ''
-                        span = int(cell.get('colspan', 1) or 1)
-                        expanded.extend([txt] * max(1, span))
-                    header_rows.append(expanded)
+                    header_rows.append(expand_header_row(cells))
                     collected += 1
                 elif collected > 0:
                     break
+
         cols = grid_obj['cols']
+
         if not header_rows:
-            headers = [f"컬럼{i+1}" for i in range(cols)]
-            return {'headers': headers, 'header_rows_count': 0}
-        norm_rows: List[List[str]] = []
-        for row in header_rows:
-            row = row[:cols] + [''] * max(0, cols - len(row))
-            norm_rows.append(row)
-        headers: List[str] = []
-        for c in range(cols):
-            name_parts: List[str] = []
-            for r in range(len(norm_rows)):
-                if norm_rows[r][c] and norm_rows[r][c].strip():
-                    name_parts.append(norm_rows[r][c].strip())
-            if name_parts:
-                unique_parts: List[str] = []
-                for part in name_parts:
-                    if part not in unique_parts:
-                        unique_parts.append(part)
-                if len(unique_parts) == 1:
-                    name = unique_parts[0]
-                else:
-                    name = ' > '.join(unique_parts)
-            else:
-                name = f"컬럼{c+1}"
-            headers.append(name)
+            return {'headers': [f"컬럼{i+1}" for i in range(cols)], 'header_rows_count': 0}
+
+        norm_rows = [row[:cols] + [''] * max(0, cols - len(row)) for row in header_rows]
+        headers = []
+        for c, column in enumerate(zip(*norm_rows)):
+            unique_parts = list(dict.fromkeys(part.strip() for part in column if part and part.strip()))
+            headers.append(' > '.join(unique_parts) if unique_parts else f"컬럼{c+1}")
+
         return {'headers': headers, 'header_rows_count': len(norm_rows)}
 
-    def preprocess_markdown_text(text: str) -> str:
-        if not text:
-            return text
-        text = text.replace('|', '\\|')
-        text = text.replace('*', '\\*')
-        text = text.replace('_', '\\_')
-        text = text.replace('#', '\\#')
-        text = text.replace('[', '\\[')
-        text = text.replace(']', '\\]')
-        text = text.replace('`', '\\`')
-        return text
-
-    def grid_to_markdown(grid_obj, headers: List[str], header_rows_count: int, title: Optional[str]) -> str:
-        lines: List[str] = []
+    markdown_escape = str.maketrans({
+        '|': '\\|', '*': '\\*', '_': '\\_', '#': '\\#',
+        '[': '\\[', ']': '\\]', '`': '\\`',
+    })
+
+    def emit_table(grid_obj, headers: List[str], header_rows_count: int, title: Optional[str]) -> tuple:
+        """마크다운 문자열과 구조화 JSON을 한 번에 생성"""
+        lines = []
         if title:
             lines.append(f"### {title}")
             lines.append("")
-        processed_headers = [preprocess_markdown_text(h) for h in headers]
-        lines.append('|' + '|'.join(processed_headers) + '|')
-        lines.append('|' + '|'.join(' --- ' for _ in headers) + '|')
-        data_rows = grid_obj['grid'][header_rows_count if header_rows_count > 0 else 1:]
-        for row in data_rows:
-            preview_vals = [preprocess_markdown_text(limit_text(str(v))) for v in row[:len(headers)]]
-            if all(v.strip() == '' for v in preview_vals):
-                continue
-            lines.append('|' + '|'.join(preview_vals) + '|')
+
+        width = len(headers)
+        lines.append('|' + '|'.join([h.translate(markdown_escape) for h in headers]) + '|')
+        lines.append('|' + '|'.join([' --- '] * width) + '|')
+
+        data_rows = [row[:width] for row in grid_obj['grid'][header_rows_count if header_rows_count > 0 else 1:]]
+        data_rows = [row for row in data_rows if any(row)]
+        lines.extend(['|' + '|'.join([v.translate(markdown_escape) for v in row]) + '|' for row in data_rows])
+
         lines.append("")
-        return '\n'.join(lines)
+        return '\n'.join(lines), {'title': title, 'headers': headers, 'rows': data_rows}
+
+    tables: List[Any] = []
+    first_descendant: Dict[str, Dict[int, Any]] = {'thead': {}, 'caption': {}}
+    for el in root.find_all(['table', 'thead', 'caption']):
+        if el.name == 'table':
+            tables.append(el)
+            continue
+        owners = first_descendant[el.name]
+        for parent in el.parents:
+            if parent.name == 'table' and id(parent) not in owners:
+                owners[id(parent)] = el
 
     table_index = 0
-    for tbl in root.find_all('table'):
+    for tbl in tables:
         try:
             table_index += 1
-            grid_obj = build_grid(tbl)
-            header_info = detect_headers(tbl, grid_obj)
-            headers = header_info['headers']
-            header_rows_count = header_info['header_rows_count']
+            grid_obj = build_grid(get_table_rows(tbl))
+            header_info = detect_headers(tbl, first_descendant['thead'].get(id(tbl)), grid_obj)
+
             table_name = f"테이블 {table_index}"
-            caption = tbl.find('caption')
+            caption = first_descendant['caption'].get(id(tbl))
             if caption:
                 cap = extract_text(caption)
                 if cap:
                     table_name = cap
-            markdowns.append(grid_to_markdown(grid_obj, headers, header_rows_count, table_name))
+
+            table_markdown, table_json = emit_table(
+                grid_obj, header_info['headers'], header_info['header_rows_count'], table_name
+            )
+            markdowns.append(table_markdown)
+            structured.append(table_json)
+
         except Exception as e:
             logger.warning(f"Table parse failed at index {table_index}: {e}")
             continue
+
     return {'structured': structured, 'markdown': markdowns}
 
 
 def _ari_extract_markdown(html_content: str) -> str:
-    import tempfile
     from bs4 import BeautifulSoup
-    cleaned_html = _ari_extract_clean_html(html_content)
-    soup = BeautifulSoup(cleaned_html, 'html.parser')
+    soup = BeautifulSoup(html_content, 'html.parser')
+    _ari_remove_excluded_elements(soup)
+    return _ari_fragment_to_markdown(_ari_build_clean_fragment(soup))
+
+
+def _ari_fragment_to_markdown(fragment) -> str:
+    """정제 DOM을 마크다운으로 변환 (테이블 노드가 제거되어 fragment 변경)"""
     table_markdowns: List[str] = []
     try:
-        parsed_tables = _ari_parse_tables(soup)
+        parsed_tables = _ari_parse_tables(fragment)
         table_markdowns = parsed_tables.get('markdown', [])
     except Exception as e:
         logger.warning(f"Table parsing failed: {e}")
-    for table in soup.find_all('table'):
-        table.decompose()
-    remaining_html = str(soup)
+    for table in fragment.find_all('table'):
+        if not table.decomposed:
+            table.decompose()
+    # 재파싱 결과와 동일하도록 인접 텍스트 노드 병합
+    fragment.smooth()
     remaining_markdown = ""
     try:
         import pymupdf4llm  # type: ignore
+        import fitz  # type: ignore
+        remaining_html = fragment.decode()
         if remaining_html.strip():
             try:
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_html:
-                    full_html = f"""<!DOCTYPE html>\n<html>\n<head>\n    <meta charset=\"UTF-8\">\n</head>\n<body>\n    {remaining_html}\n</body>\n</html>"""
-                    temp_html.write(full_html)
-                    temp_html_path = temp_html.name
-                markdown_result = pymupdf4llm.to_markdown(temp_html_path)
+                # 임시 파일 없이 메모리 스트림으로 문서 생성
+                full_html = f"""<!DOCTYPE html>\n<html>\n<head>\n    <meta charset=\"UTF-8\">\n</head>\n<body>\n    {remaining_html}\n</body>\n</html>"""
+                doc = fitz.open(stream=full_html.encode('utf-8'), filetype='html')
                 try:
-                    import os as _os
-                    _os.unlink(temp_html_path)
-                except Exception:
-                    pass
+                    markdown_result = pymupdf4llm.to_markdown(doc)
+                finally:
+                    doc.close()
                 if markdown_result and str(markdown_result).strip():
                     remaining_markdown = str(markdown_result)
             except Exception as e:
                 logger.warning(f"pymupdf4llm conversion failed: {e}")
-                try:
-                    if 'temp_html_path' in locals():
-                        import os as _os
-                        _os.unlink(temp_html_path)
-                except Exception:
-                    pass
     except Exception:
         pass
     if not remaining_markdown:
         try:
-            from markdownify import markdownify as md_convert
-            remaining_markdown = md_convert(remaining_html, heading_style="ATX", strip=['style', 'script'])
+            from markdownify import MarkdownConverter
+            remaining_markdown = MarkdownConverter(heading_style="ATX", strip=['style', 'script']).convert_soup(fragment)
         except Exception as e:
             logger.warning(f"markdownify failed: {e}")
     if not remaining_markdown:
         try:
-            soup_remaining = BeautifulSoup(remaining_html, 'html.parser')
-            remaining_markdown = soup_remaining.get_text('\n', strip=True)
+            remaining_markdown = fragment.get_text('\n', strip=True)
         except Exception:
-            remaining_markdown = remaining_html
+            remaining_markdown = fragment.decode()
     result_parts: List[str] = []
     if remaining_markdown.strip():
         result_parts.append(remaining_markdown.strip())
@@ -1034,6 +1648,11 @@ def _ari_extract_markdown(html_content: str) -> str:
 def _ari_extract_main_content(html_content: str) -> Dict[str, Any]:
     from bs4 import BeautifulSoup
     soup = BeautifulSoup(html_content, 'html.parser')
+    return _ari_extract_document_info(soup)
+
+
+def _ari_extract_document_info(soup) -> Dict[str, Any]:
+    """제목/브레드크럼/페이지 트리/URL/본문 텍스트 추출 (exclude 요소를 제거하므로 soup 변경)"""
     page_title = ""
     breadcrumbs: List[Dict[str, str]] = []
     urls: List[Dict[str, str]] = []
@@ -1056,36 +1675,11 @@ def _ari_extract_main_content(html_content: str) -> Dict[str, Any]:
     pagetree_element = soup.find('div', {'class': 'ia-secondary-content'})
     if pagetree_element:
         pagetree = _ari_extract_pagetree(pagetree_element)
-    main_content = soup.find('div', {'id': 'main-content'})
-    if not main_content:
-        main_content = soup.find('div', {'class': 'wiki-content'})
-    if not main_content:
-        main_content = soup.find('main') or soup.find('body') or soup
+    main_content = _ari_find_main_content(soup)
     if main_content:
         urls = _ari_extract_urls(main_content)
-    elements_to_remove = [
-        'header', 'footer', 'nav', 'aside', 'sidebar',
-        '.header', '.footer', '.nav', '.aside', '.sidebar',
-        '.navigation', '.menu',
-        'div.aui-page-header-actions', 'div.page-actions', 'div.aui-toolbar2',
-        'div.comment-container', 'div.like-button-container', 'div.page-labels',
-        'div.comment-actions', 'span.st-table-filter', 'svg',
-        'div.confluence-information-macro', 'div.aui-message', 'div.page-metadata-modification-info',
-        '.aui-page-header-actions', '.like-button-container', '.page-labels',
-        'div#page-metadata-banner', 'ul.banner',
-    ]
-    for selector in elements_to_remove:
-        for element in soup.select(selector):
-            element.decompose()
-    main_content = soup.find('div', {'id': 'main-content'})
-    if not main_content:
-        main_content = soup.find('div', {'class': 'wiki-content'})
-    if not main_content:
-        main_content = soup.find('main')
-    if not main_content:
-        main_content = soup.find('body')
-    if not main_content:
-        main_content = soup
+    _ari_remove_excluded_elements(soup)
+    main_content = _ari_find_main_content(soup)
     text_content = main_content.get_text(separator=' ', strip=True)
     title = soup.find('title')
     title_text = title.get_text(strip=True) if title else ""
@@ -1117,6 +1711,88 @@ def _ari_extract_main_content(html_content: str) -> Dict[str, Any]:
     return result
 
 
+def _ari_process_document(html_content: Any) -> Dict[str, Any]:
+    """HTML 한 건(문자열 또는 파일 객체)을 한 번만 파싱하여 본문 추출 + 마크다운 + JSON 구조화 (프로세스 풀 워커)"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_content, 'html.parser')
+    basic_data = _ari_extract_document_info(soup)
+    markdown_content = _ari_fragment_to_markdown(_ari_build_clean_fragment(soup))
+    json_result = _ari_markdown_to_json(markdown_content)
+    contents = json_result.get('contents', []) if json_result.get('success') else []
+    if not contents:
+        contents = [{"id": 1, "type": "text", "title": "", "data": markdown_content}]
+    processed_data = {
+        'title': basic_data.get('title', ''),
+        'breadcrumbs': basic_data.get('breadcrumbs', []),
+        'content': {
+            'text': basic_data['content']['text'],
+            'markdown': markdown_content,
+            'contents': contents
+        },
+        'metadata': {
+            **basic_data.get('metadata', {}),
+            'markdown_length': len(markdown_content),
+            'contents_count': len(contents)
+        }
+    }
+    return {'processed_data': processed_data, 'contents': contents, 'markdown': markdown_content}
+
+
+def _ari_process_document_file(file_path: str) -> Dict[str, Any]:
+    """임시 파일에 저장된 HTML 한 건을 워커에서 직접 읽어 처리 (요청 프로세스는 본문 전체를 메모리에 올리지 않음)"""
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return _ari_process_document(f)
+
+
+_ari_process_pool = None
+
+
+def _ari_get_process_pool():
+    global _ari_process_pool
+    if _ari_process_pool is None:
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+        max_workers = int(os.getenv("ARI_PROCESS_WORKERS", "0")) or None
+        _ari_process_pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _ari_process_pool
+
+
+def _ari_reset_process_pool() -> None:
+    """깨진 프로세스 풀 종료 후 참조 제거 (다음 요청에서 새로 생성)"""
+    global _ari_process_pool
+    if _ari_process_pool is not None:
+        _ari_process_pool.shutdown(wait=False, cancel_futures=True)
+        _ari_process_pool = None
+
+
+async def _ari_process_documents(html_contents: List[str]) -> List[Any]:
+    """여러 HTML 문서를 프로세스 풀에서 병렬 처리 (파일별 예외는 결과 자리에 반환)"""
+    from concurrent.futures.process import BrokenProcessPool
+    if len(html_contents) <= 1:
+        return await _ari_process_documents_sequential(html_contents)
+    loop = asyncio.get_running_loop()
+    pool = _ari_get_process_pool()
+    results = await asyncio.gather(*[
+        loop.run_in_executor(pool, _ari_process_document, html_content)
+        for html_content in html_contents
+    ], return_exceptions=True)
+    if any(isinstance(r, BrokenProcessPool) for r in results):
+        logger.error("ARI 프로세스 풀 오류, 순차 처리로 전환")
+        _ari_reset_process_pool()
+        return await _ari_process_documents_sequential(html_contents)
+    return results
+
+
+async def _ari_process_documents_sequential(html_contents: List[str]) -> List[Any]:
+    results: List[Any] = []
+    for html_content in html_contents:
+        try:
+            results.append(_ari_process_document(html_content))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
 def _ari_markdown_to_json(markdown_content: str) -> Dict[str, Any]:
     import re as _re
     try:
@@ -1220,61 +1896,126 @@ def ari_markdown_to_json(markdown_content: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def _ari_build_file_result(filename: str, size: int, document: Any) -> Dict[str, Any]:
+    import uuid as _uuid
+    if isinstance(document, BaseException):
+        logger.error(f"파일 처리 실패 {filename}: {document}")
+        return {'original_filename': filename, 'error': str(document), 'success': False}
+    return {
+        'original_filename': filename,
+        'file_id': str(_uuid.uuid4()),
+        'size': size,
+        'processed_data': document['processed_data'],
+        'contents': document['contents'],
+        'markdown': document['markdown'],
+        'upload_time': datetime.now().isoformat()
+    }
+
+
+async def _ari_process_single(html_content: str) -> Any:
+    """HTML 한 건을 프로세스 풀에서 처리 (예외는 결과로 반환)"""
+    return await _ari_run_in_pool(_ari_process_document, html_content)
+
+
+async def _ari_run_in_pool(worker, argument: Any) -> Any:
+    """워커 함수 한 건을 프로세스 풀에서 실행 (풀이 깨지면 현재 프로세스에서 실행, 예외는 결과로 반환)"""
+    from concurrent.futures.process import BrokenProcessPool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_ari_get_process_pool(), worker, argument)
+    except BrokenProcessPool:
+        logger.error("ARI 프로세스 풀 오류, 현재 프로세스에서 처리")
+        _ari_reset_process_pool()
+    except Exception as e:
+        return e
+    try:
+        return worker(argument)
+    except Exception as e:
+        return e
+
+
+@mcp.tool
+async def ari_process_html_file(filename: str, html_content: str) -> Dict[str, Any]:
+    """
+    HTML 파일 한 건(원문 텍스트, Base64 인코딩 없음)을 완전 처리(본문 추출 + 마크다운 + JSON 구조화)
+    여러 파일은 파일별로 호출하면 먼저 끝난 파일의 결과부터 받을 수 있음
+    """
+    try:
+        size = len(html_content.encode('utf-8'))
+        document = await _ari_process_single(html_content)
+        result = _ari_build_file_result(filename or 'unknown.html', size, document)
+        return {'success': 'error' not in result, **result}
+    except Exception as e:
+        logger.error(f"ari_process_html_file 실패: {e}")
+        return {'success': False, 'original_filename': filename, 'error': str(e)}
+
+
+@mcp.custom_route("/ari/files", methods=["POST"])
+async def ari_upload_html_file(request):
+    """
+    HTML 파일 한 건을 요청 본문(raw bytes)으로 받아 완전 처리 (?filename=원본파일명)
+    본문은 청크 단위로 임시 파일에 저장하고, 프로세스 풀 워커가 그 파일을 직접 읽어 파싱 (요청 프로세스에 본문 전체를 올리지 않음)
+    """
+    import os
+    import tempfile
+    from starlette.responses import JSONResponse
+    filename = request.query_params.get('filename') or 'unknown.html'
+    file_path = None
+    try:
+        with tempfile.NamedTemporaryFile(prefix='ari_', suffix='.html', delete=False) as spool:
+            file_path = spool.name
+            size = 0
+            async for chunk in request.stream():
+                spool.write(chunk)
+                size += len(chunk)
+        document = await _ari_run_in_pool(_ari_process_document_file, file_path)
+        result = _ari_build_file_result(filename, size, document)
+        return JSONResponse({'success': 'error' not in result, **result})
+    except Exception as e:
+        logger.error(f"ari_upload_html_file 실패: {e}")
+        return JSONResponse({'success': False, 'original_filename': filename, 'error': str(e)}, status_code=500)
+    finally:
+        if file_path:
+            try:
+                os.unlink(file_path)
+            except OSError:
+                pass
+
+
 @mcp.tool
 async def ari_process_html_files_complete(files: List[Dict[str, str]]) -> Dict[str, Any]:
     """
-    여러 HTML 파일(Base64) 입력을 받아 완전 처리(본문 추출 + 마크다운 + JSON 구조화) 결과 반환
-    files: [{"filename": str, "content_base64": str}]
+    여러 HTML 파일 입력을 받아 완전 처리(본문 추출 + 마크다운 + JSON 구조화) 결과 반환
+    files: [{"filename": str, "content": str}] 또는 [{"filename": str, "content_base64": str}]
+    content(원문 텍스트)를 주면 Base64 인코딩/디코딩 없이 처리하며, 대용량 배치는 ari_process_html_file 또는 /ari/files 사용 권장
+    파일별로 HTML을 한 번만 파싱하며, 여러 파일은 프로세스 풀에서 병렬 처리
     """
     import base64 as _b64
-    import uuid as _uuid
     processed_files: List[Dict[str, Any]] = []
     total_size = 0
     try:
+        decoded_files: List[Dict[str, Any]] = []
         for file in files or []:
             try:
                 filename = file.get('filename') or 'unknown.html'
-                b64 = file.get('content_base64') or ''
-                raw_bytes = _b64.b64decode(b64) if b64 else b''
-                total_size += len(raw_bytes)
-                html_content = raw_bytes.decode('utf-8', errors='ignore')
-                file_id = str(_uuid.uuid4())
-                basic_data = _ari_extract_main_content(html_content)
-                markdown_content = _ari_extract_markdown(html_content)
-                json_result = _ari_markdown_to_json(markdown_content)
-                contents = json_result.get('contents', []) if json_result.get('success') else []
-                if not contents:
-                    contents = [{"id": 1, "type": "text", "title": "", "data": markdown_content}]
-                processed_data = {
-                    'title': basic_data.get('title', ''),
-                    'breadcrumbs': basic_data.get('breadcrumbs', []),
-                    'content': {
-                        'text': basic_data['content']['text'],
-                        'markdown': markdown_content,
-                        'contents': contents
-                    },
-                    'metadata': {
-                        **basic_data.get('metadata', {}),
-                        'markdown_length': len(markdown_content),
-                        'contents_count': len(contents)
-                    }
-                }
-                processed_files.append({
-                    'original_filename': filename,
-                    'file_id': file_id,
-                    'size': len(raw_bytes),
-                    'processed_data': processed_data,
-                    'contents': contents,
-                    'markdown': markdown_content,
-                    'upload_time': datetime.now().isoformat()
-                })
+                if file.get('content') is not None:
+                    html_content = file['content']
+                    size = len(html_content.encode('utf-8'))
+                else:
+                    b64 = file.get('content_base64') or ''
+                    raw_bytes = _b64.b64decode(b64) if b64 else b''
+                    size = len(raw_bytes)
+                    html_content = raw_bytes.decode('utf-8', errors='ignore')
+                total_size += size
+                decoded_files.append({'filename': filename, 'size': size, 'html_content': html_content})
             except Exception as fe:
-                logger.error(f"파일 처리 실패 {file}: {fe}")
-                processed_files.append({
-                    'original_filename': file.get('filename'),
-                    'error': str(fe),
-                    'success': False
-                })
+                logger.error(f"파일 디코딩 실패 {file.get('filename')}: {fe}")
+                decoded_files.append({'filename': file.get('filename'), 'error': fe})
+        html_contents = [f.pop('html_content') for f in decoded_files if 'error' not in f]
+        documents = iter(await _ari_process_documents(html_contents))
+        for decoded in decoded_files:
+            document = decoded['error'] if 'error' in decoded else next(documents)
+            processed_files.append(_ari_build_file_result(decoded['filename'], decoded.get('size', 0), document))
         return {
             'success': True,
             'processed_files': processed_files,
@@ -1293,13 +2034,16 @@ async def ari_process_html_files_complete(files: List[Dict[str, str]]) -> Dict[s
 async def main():
     # Start MCP server
     logger.info("🚀 Starting MCP Server on 0.0.0.0:4200")
-    await mcp.run_async(
-        transport="http",
-        host="0.0.0.0",
-        port=4200,
-        path="/my-custom-path",
-        log_level="debug",
-    )
+    try:
+        await mcp.run_async(
+            transport="http",
+            host="0.0.0.0",
+            port=4200,
+            path="/my-custom-path",
+            log_level="debug",
+        )
+    finally:
+        _save_host_templates()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file